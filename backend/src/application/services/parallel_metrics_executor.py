@@ -0,0 +1,267 @@
+"""
+Parallel Metrics Executor - Application Layer
+
+Runs the three stages of MetricsCalculator across a process pool:
+- physical metrics: partitioned by player (row-balanced ranges of players)
+- pitch control: partitioned by time (contiguous blocks of sampled frames)
+- event inference: partitioned by period (possession never spans halftime)
+
+Input columns are published once in shared memory; workers attach to them
+by name instead of receiving pickled copies. Object columns (player ids,
+object types, team ids) are shared as integer codes plus small lookup lists.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from src.domain.entities.player_trajectory import PhysicalMetrics
+from src.domain.services.physical_metrics_engine import PhysicalMetricsEngine
+from src.domain.services.pitch_control_engine import FrameTensor, PitchControlEngine
+from src.domain.value_objects.tracking_table import TrackingTable, factorize
+
+# (shared memory block name, shape, dtype) per array
+ArraySpec = Dict[str, Tuple[str, Tuple[int, ...], str]]
+
+_NUMERIC_COLUMNS = ("frame_id", "x", "y", "timestamp", "confidence", "period")
+_CODED_COLUMNS = ("player_id", "object_type", "team_id")
+
+
+class SharedArrays:
+    """
+    Owner of a set of NumPy arrays copied into shared memory blocks.
+
+    Use as a context manager in the parent process; blocks are unlinked on
+    exit. Workers call `attach` with `spec`.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self.spec: ArraySpec = {}
+        self.arrays: Dict[str, np.ndarray] = {}
+        try:
+            for name, array in arrays.items():
+                array = np.ascontiguousarray(array)
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                self._blocks.append(block)
+                view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+                view[...] = array
+                self.spec[name] = (block.name, array.shape, array.dtype.str)
+                self.arrays[name] = view
+        except BaseException:
+            self.close()
+            raise
+
+    @staticmethod
+    def attach(spec: ArraySpec) -> Tuple[Dict[str, np.ndarray], List[shared_memory.SharedMemory]]:
+        """
+        Map shared arrays into the current process.
+
+        Returns:
+            (arrays by name, blocks); keep the blocks referenced while the
+            arrays are in use and close them afterwards
+        """
+        arrays: Dict[str, np.ndarray] = {}
+        blocks: List[shared_memory.SharedMemory] = []
+        for name, (block_name, shape, dtype) in spec.items():
+            block = shared_memory.SharedMemory(name=block_name)
+            blocks.append(block)
+            arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        return arrays, blocks
+
+    def close(self) -> None:
+        """Release and unlink every block."""
+        self.arrays = {}
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self) -> "SharedArrays":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+@dataclass(frozen=True)
+class _TrackingLayout:
+    """Picklable description of a TrackingTable published in shared memory."""
+    spec: ArraySpec
+    lookups: Dict[str, List[Any]]
+
+
+def _share_tracking(tracking: TrackingTable) -> Tuple[SharedArrays, _TrackingLayout]:
+    """Publish a TrackingTable: numeric columns as-is, object columns as codes."""
+    arrays = {name: getattr(tracking, name) for name in _NUMERIC_COLUMNS}
+    lookups: Dict[str, List[Any]] = {}
+    for name in _CODED_COLUMNS:
+        lookups[name], arrays[name] = factorize(getattr(tracking, name))
+    shared = SharedArrays(arrays)
+    return shared, _TrackingLayout(spec=shared.spec, lookups=lookups)
+
+
+def _load_rows(layout: _TrackingLayout, select: Any) -> TrackingTable:
+    """Rebuild the TrackingTable rows picked by `select` from shared memory."""
+    arrays, blocks = SharedArrays.attach(layout.spec)
+    try:
+        mask = select(arrays)
+        columns: Dict[str, np.ndarray] = {
+            name: arrays[name][mask] for name in _NUMERIC_COLUMNS
+        }
+        for name in _CODED_COLUMNS:
+            lookup = np.empty(len(layout.lookups[name]), dtype=object)
+            lookup[:] = layout.lookups[name]
+            columns[name] = lookup[arrays[name][mask]]
+    finally:
+        del arrays
+        for block in blocks:
+            block.close()
+    return TrackingTable(**columns)
+
+
+def _physical_worker(
+    layout: _TrackingLayout,
+    code_lo: int,
+    code_hi: int
+) -> Dict[Any, PhysicalMetrics]:
+    """Physical metrics for the players whose codes are in [code_lo, code_hi)."""
+    rows = _load_rows(
+        layout, lambda a: (a["player_id"] >= code_lo) & (a["player_id"] < code_hi)
+    )
+    return PhysicalMetricsEngine().calculate(rows)
+
+
+def _pitch_control_worker(
+    spec: ArraySpec,
+    engine: PitchControlEngine,
+    start: int,
+    end: int
+) -> None:
+    """Pitch control for frames [start, end), written into the shared output."""
+    arrays, blocks = SharedArrays.attach(spec)
+    try:
+        arrays["home"][start:end] = engine.compute(
+            arrays["positions"][start:end], arrays["teams"][start:end]
+        )
+    finally:
+        del arrays
+        for block in blocks:
+            block.close()
+
+
+def _events_worker(layout: _TrackingLayout, period: int) -> List[Dict[str, Any]]:
+    """Inferred events for one period."""
+    # Imported here: the use case module imports this one
+    from src.application.use_cases.metrics_calculator import infer_event_data
+
+    return infer_event_data(_load_rows(layout, lambda a: a["period"] == period))
+
+
+class ParallelMetricsExecutor:
+    """
+    Service computing MetricsCalculator's stages on a process pool.
+
+    Results are identical to the serial path; only the scheduling differs.
+    """
+
+    def __init__(self, max_workers: int):
+        """
+        Initialize executor.
+
+        Args:
+            max_workers: Number of worker processes
+        """
+        self.max_workers = max_workers
+
+    def physical_metrics(self, tracking: TrackingTable) -> Dict[Any, PhysicalMetrics]:
+        """
+        Physical metrics for every player, partitioned by player.
+
+        Returns:
+            Mapping player_id -> PhysicalMetrics, in first-appearance order
+        """
+        if len(tracking) == 0:
+            return {}
+
+        shared, layout = _share_tracking(tracking)
+        with shared, ProcessPoolExecutor(self.max_workers) as pool:
+            bounds = self._player_ranges(shared.arrays["player_id"])
+            futures = [
+                pool.submit(_physical_worker, layout, lo, hi)
+                for lo, hi in zip(bounds[:-1], bounds[1:])
+                if hi > lo
+            ]
+            # Codes follow first appearance, so range order is output order
+            result: Dict[Any, PhysicalMetrics] = {}
+            for future in futures:
+                result.update(future.result())
+        return result
+
+    def pitch_control(
+        self,
+        frames: FrameTensor,
+        engine: PitchControlEngine
+    ) -> np.ndarray:
+        """
+        Home pitch control for every frame, partitioned into time blocks.
+
+        Returns:
+            (F, H, W) float32 array, as PitchControlEngine.compute
+        """
+        n_frames = len(frames.frame_ids)
+        out_shape = (n_frames, engine.grid_height, engine.grid_width)
+        with SharedArrays({
+            "positions": frames.positions,
+            "teams": frames.teams,
+            "home": np.zeros(out_shape, dtype=np.float32),
+        }) as shared:
+            block = max(1, -(-n_frames // self.max_workers))
+            with ProcessPoolExecutor(self.max_workers) as pool:
+                futures = [
+                    pool.submit(
+                        _pitch_control_worker, shared.spec, engine, start, min(start + block, n_frames)
+                    )
+                    for start in range(0, n_frames, block)
+                ]
+                for future in futures:
+                    future.result()
+            return shared.arrays["home"].copy()
+
+    def infer_events(self, tracking: TrackingTable) -> List[Dict[str, Any]]:
+        """
+        Heuristic events inferred from tracking, one period per task.
+
+        Returns:
+            Event dicts of all periods, in period order
+        """
+        periods = np.unique(tracking.period)
+        if len(periods) == 0:
+            return []
+
+        shared, layout = _share_tracking(tracking)
+        with shared, ProcessPoolExecutor(min(self.max_workers, len(periods))) as pool:
+            futures = [pool.submit(_events_worker, layout, int(p)) for p in periods]
+            return [event for future in futures for event in future.result()]
+
+    def _player_ranges(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Split player codes into contiguous ranges with similar row counts.
+
+        Returns:
+            (max_workers + 1,) range boundaries over the codes
+        """
+        cumulative = np.cumsum(np.bincount(codes))
+        targets = cumulative[-1] * np.arange(1, self.max_workers) / self.max_workers
+        inner = np.searchsorted(cumulative, targets, side="left") + 1
+        return np.r_[0, np.minimum(inner, len(cumulative)), len(cumulative)]
+
+
+def can_fork_workers() -> bool:
+    """Daemonic processes (e.g. multiprocessing pool workers) cannot spawn children."""
+    import multiprocessing
+
+    return not multiprocessing.current_process().daemon
+
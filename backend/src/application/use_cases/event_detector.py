@@ -3,12 +3,22 @@ Heuristic Event Detector - Application Layer
 
 Infers semantic events (Possession, Pass, Pressure) from tracking data.
 Uses rule-based heuristics based on player-ball proximity and velocity.
+
+Detection runs on a dense (frames x objects) layout of the tracking data:
+ball distances, closest players and pressure checks are array operations
+over all frames at once, and the possession state machine runs over the
+per-frame arrays of ball touches. Long matches can be streamed block by
+block with the possession state carried between blocks.
 """
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from enum import Enum
 
+import numpy as np
+
+from src.domain.services.spatial_index import FrameSpatialIndex
 from src.domain.services.trajectory_smoother import TrajectoryPoint
+from src.domain.value_objects.tracking_table import TrackingTable, factorize
 
 
 class InferredEventType(Enum):
@@ -53,6 +63,83 @@ class DetectorConfig:
     pass_min_distance: float = 3.0  # min meters for pass vs dribble
 
 
+@dataclass(frozen=True)
+class FrameObjects:
+    """
+    Dense per-frame layout of tracked objects.
+
+    Objects are packed into slots per frame in input order; unused slots
+    have NaN positions and code -1. `object_code` indexes `objects` and
+    `type_code` indexes `object_types`.
+    """
+    frame_ids: np.ndarray  # (F,) int64, ascending
+    x: np.ndarray  # (F, S) float64
+    y: np.ndarray  # (F, S) float64
+    object_code: np.ndarray  # (F, S) int64
+    type_code: np.ndarray  # (F, S) int64
+    objects: List[Any]  # object ids
+    object_types: List[Any]  # object types ("ball", team proxies, ...)
+
+    @classmethod
+    def from_columns(
+        cls,
+        frame_id: np.ndarray,
+        object_id: np.ndarray,
+        x: np.ndarray,
+        y: np.ndarray,
+        object_type: np.ndarray
+    ) -> "FrameObjects":
+        """Pack parallel per-point columns (any frame order)."""
+        frame_id = np.asarray(frame_id, dtype=np.int64)
+        order = np.argsort(frame_id, kind="stable")
+        frame_ids, frame_index = np.unique(frame_id[order], return_inverse=True)
+        n_frames = len(frame_ids)
+
+        frame_start = np.searchsorted(frame_index, np.arange(n_frames))
+        slot = np.arange(len(order)) - frame_start[frame_index]
+        n_slots = int(slot.max()) + 1 if len(slot) else 0
+
+        def dense(values: np.ndarray, fill: Any, dtype: Any) -> np.ndarray:
+            out = np.full((n_frames, n_slots), fill, dtype=dtype)
+            out[frame_index, slot] = values[order]
+            return out
+
+        objects, object_code = factorize(np.asarray(object_id, dtype=object))
+        object_types, type_code = factorize(np.asarray(object_type, dtype=object))
+        return cls(
+            frame_ids=frame_ids,
+            x=dense(np.asarray(x, dtype=np.float64), np.nan, np.float64),
+            y=dense(np.asarray(y, dtype=np.float64), np.nan, np.float64),
+            object_code=dense(object_code, -1, np.int64),
+            type_code=dense(type_code, -1, np.int64),
+            objects=objects,
+            object_types=object_types
+        )
+
+    @classmethod
+    def from_points(cls, points: List[TrajectoryPoint]) -> "FrameObjects":
+        """Pack TrajectoryPoints."""
+        n = len(points)
+        return cls.from_columns(
+            frame_id=np.fromiter((p.frame_id for p in points), dtype=np.int64, count=n),
+            object_id=np.array([p.object_id for p in points], dtype=object),
+            x=np.fromiter((p.x for p in points), dtype=np.float64, count=n),
+            y=np.fromiter((p.y for p in points), dtype=np.float64, count=n),
+            object_type=np.array([p.object_type for p in points], dtype=object)
+        )
+
+    @classmethod
+    def from_tracking(cls, tracking: TrackingTable) -> "FrameObjects":
+        """Pack a TrackingTable (player_id is the object id)."""
+        return cls.from_columns(
+            tracking.frame_id, tracking.player_id, tracking.x, tracking.y, tracking.object_type
+        )
+
+    def type_code_of(self, object_type: Any) -> int:
+        """Code of an object type, or -1 if absent."""
+        return self.object_types.index(object_type) if object_type in self.object_types else -1
+
+
 class HeuristicEventDetector:
     """
     Infers match events from tracking data using heuristics.
@@ -79,169 +166,226 @@ class HeuristicEventDetector:
         """
         if not tracking_points:
             return []
+        return self.detect_frame_events(FrameObjects.from_points(tracking_points))
+    
+    def detect_tracking_events(self, tracking: TrackingTable) -> List[InferredEvent]:
+        """
+        Detect events from a columnar TrackingTable without building
+        per-point objects.
+        """
+        if len(tracking) == 0:
+            return []
+        return self.detect_frame_events(FrameObjects.from_tracking(tracking))
+    
+    def detect_frame_events(self, frames: FrameObjects) -> List[InferredEvent]:
+        """
+        Detect events from a dense frame layout.
         
-        # Group by frame
-        frames = self._group_by_frame(tracking_points)
-        
-        events = []
-        possession = PossessionState()
+        The object type is used as the team proxy. In each frame the first
+        ball observation is the ball, and the closest non-ball object is
+        on the ball within `ball_proximity_threshold`. Possession starts
+        with the first touch and changes at the next touch by a different
+        player: to a teammate at least `pass_min_distance` away from where
+        the possession started it is a pass, to an opponent a loss. From
+        the first touch on, opponents within `pressure_distance` of that
+        possession's start location press the carrier.
         
-        for frame_id in sorted(frames.keys()):
-            frame_data = frames[frame_id]
-            
-            # Find ball position
-            ball = self._find_ball(frame_data)
-            if not ball:
-                continue
-            
-            # Find closest player to ball
-            closest = self._find_closest_player(frame_data, ball)
-            if not closest:
-                continue
-            
-            player_id, distance, player_point = closest
-            
-            # Check possession
-            if distance <= self.config.ball_proximity_threshold:
-                if possession.player_id is None:
-                    # New possession
-                    possession = PossessionState(
-                        player_id=player_id,
-                        team_id=player_point.object_type,  # Using object_type as team proxy
-                        start_frame=frame_id,
-                        x=player_point.x,
-                        y=player_point.y
-                    )
-                elif possession.player_id != player_id:
-                    # Possession changed
-                    # Check if same team (pass) or different team (loss)
-                    if possession.team_id == player_point.object_type:
-                        # Same team = Pass
-                        pass_distance = (
-                            (player_point.x - possession.x) ** 2 +
-                            (player_point.y - possession.y) ** 2
-                        ) ** 0.5
-                        
-                        if pass_distance >= self.config.pass_min_distance:
-                            events.append(InferredEvent(
-                                frame_start=possession.start_frame,
-                                frame_end=frame_id,
-                                event_type=InferredEventType.PASS_COMPLETE,
-                                actors=[possession.player_id, player_id],
-                                team_id=possession.team_id or "unknown",
-                                location=(possession.x, possession.y)
-                            ))
-                    else:
-                        # Different team = Loss of possession
-                        events.append(InferredEvent(
-                            frame_start=possession.start_frame,
-                            frame_end=frame_id,
-                            event_type=InferredEventType.LOSS_OF_POSSESSION,
-                            actors=[possession.player_id, player_id],
-                            team_id=possession.team_id or "unknown",
-                            location=(possession.x, possession.y)
-                        ))
-                    
-                    # New possession
-                    possession = PossessionState(
-                        player_id=player_id,
-                        team_id=player_point.object_type,
-                        start_frame=frame_id,
-                        x=player_point.x,
-                        y=player_point.y
-                    )
+        Args:
+            frames: Dense per-frame objects
             
-            # Check for pressure events
-            if possession.player_id is not None:
-                pressure_events = self._detect_pressure(
-                    frame_data, possession, frame_id
-                )
-                events.extend(pressure_events)
-        
+        Returns:
+            Inferred events in frame order (possession changes before
+            pressure events of the same frame)
+        """
+        events, _ = self._detect_block(frames, PossessionState())
         return events
     
-    def _group_by_frame(
-        self, 
-        points: List[TrajectoryPoint]
-    ) -> Dict[int, List[TrajectoryPoint]]:
-        """Group tracking points by frame_id."""
-        frames: Dict[int, List[TrajectoryPoint]] = {}
-        for point in points:
-            if point.frame_id not in frames:
-                frames[point.frame_id] = []
-            frames[point.frame_id].append(point)
-        return frames
-    
-    def _find_ball(
-        self, 
-        frame_data: List[TrajectoryPoint]
-    ) -> Optional[TrajectoryPoint]:
-        """Find ball in frame data."""
-        for point in frame_data:
-            if point.object_type == "ball":
-                return point
-        return None
-    
-    def _find_closest_player(
-        self, 
-        frame_data: List[TrajectoryPoint],
-        ball: TrajectoryPoint
-    ) -> Optional[Tuple[int, float, TrajectoryPoint]]:
-        """Find closest player to ball."""
-        closest = None
-        min_distance = float('inf')
+    def detect_tracking_block(
+        self,
+        tracking: TrackingTable,
+        possession: Optional[PossessionState] = None
+    ) -> Tuple[List[InferredEvent], PossessionState]:
+        """
+        Detect events in one block of whole frames, continuing from
+        `possession`.
         
-        for point in frame_data:
-            if point.object_type == "ball":
-                continue
-            
-            distance = (
-                (point.x - ball.x) ** 2 + 
-                (point.y - ball.y) ** 2
-            ) ** 0.5
-            
-            if distance < min_distance:
-                min_distance = distance
-                closest = (point.object_id, distance, point)
+        For callers that keep the possession state between blocks
+        themselves (e.g. persisted with incremental metrics state) rather
+        than holding a `stream_events` generator open.
         
-        return closest
+        Args:
+            tracking: Tracking rows of whole frames, after earlier blocks
+            possession: State after the previous block (None: no possession)
+            
+        Returns:
+            (events, possession state after the block's last frame)
+        """
+        possession = possession or PossessionState()
+        if len(tracking) == 0:
+            return [], possession
+        return self._detect_block(FrameObjects.from_tracking(tracking), possession)
     
-    def _detect_pressure(
-        self,
-        frame_data: List[TrajectoryPoint],
-        possession: PossessionState,
-        frame_id: int
-    ) -> List[InferredEvent]:
-        """Detect pressure events on ball carrier."""
-        events = []
+    def stream_events(self, blocks: Iterable[TrackingTable]) -> Iterator[InferredEvent]:
+        """
+        Detect events over a stream of tracking blocks.
         
-        for point in frame_data:
-            # Skip ball and possessing player
-            if point.object_type == "ball" or point.object_id == possession.player_id:
-                continue
+        Yields the same events as `detect_tracking_events` on the whole
+        match, block by block: the possession state is carried from one
+        block to the next, so memory is bounded by the block size. Blocks
+        (parquet row groups, batches from a live source) must arrive in
+        frame order; a frame may be split across consecutive blocks.
+        
+        Args:
+            blocks: TrackingTable blocks in frame order
             
-            # Skip same team
-            if point.object_type == possession.team_id:
+        Yields:
+            Inferred events as soon as their frame is complete
+        """
+        possession = PossessionState()
+        pending: Optional[TrackingTable] = None
+        for block in blocks:
+            if pending is not None:
+                block = TrackingTable.concat([pending, block])
+            if len(block) == 0:
                 continue
-            
-            # Check distance to ball carrier
-            distance = (
-                (point.x - possession.x) ** 2 +
-                (point.y - possession.y) ** 2
-            ) ** 0.5
-            
-            if distance <= self.config.pressure_distance:
-                events.append(InferredEvent(
-                    frame_start=frame_id,
-                    frame_end=frame_id,
-                    event_type=InferredEventType.PRESSURE,
-                    actors=[point.object_id, possession.player_id],
-                    team_id=point.object_type,
-                    location=(point.x, point.y),
-                    confidence=0.8
-                ))
+            # The last frame may continue in the next block: hold it back
+            last = block.frame_id == block.frame_id.max()
+            pending = block.take(last)
+            complete = block.take(~last)
+            if len(complete):
+                events, possession = self._detect_block(FrameObjects.from_tracking(complete), possession)
+                yield from events
+        if pending is not None and len(pending):
+            events, _ = self._detect_block(FrameObjects.from_tracking(pending), possession)
+            yield from events
+    
+    def _detect_block(
+        self,
+        frames: FrameObjects,
+        possession: PossessionState
+    ) -> Tuple[List[InferredEvent], PossessionState]:
+        """
+        Detect events in consecutive frames, continuing from `possession`.
         
-        return events
+        Returns:
+            (events, possession state after the last frame)
+        """
+        n_frames = len(frames.frame_ids)
+        if n_frames == 0:
+            return [], possession
+        rows = np.arange(n_frames)
+        occupied = frames.object_code >= 0
+        is_ball = occupied & (frames.type_code == frames.type_code_of("ball"))
+        is_player = occupied & ~is_ball
+        
+        # First ball observation of each frame
+        has_ball = is_ball.any(axis=1)
+        ball_slot = np.argmax(is_ball, axis=1)
+        ball_x = frames.x[rows, ball_slot]
+        ball_y = frames.y[rows, ball_slot]
+        
+        # Closest player (first one on ties) and its ball distance
+        index = FrameSpatialIndex(np.stack((frames.x, frames.y), axis=2))
+        closest, closest_distance = index.nearest(np.column_stack((ball_x, ball_y)), mask=is_player)
+        closest, closest_distance = closest[:, 0], closest_distance[:, 0]
+        valid = has_ball & (closest >= 0)
+        
+        # Possession runs: consecutive touches by the same player
+        touches = np.flatnonzero(valid & (closest_distance <= self.config.ball_proximity_threshold))
+        touch_player = frames.object_code[touches, closest[touches]]
+        run_start = np.ones(len(touches), dtype=bool)
+        run_start[1:] = touch_player[1:] != touch_player[:-1]
+        starts = touches[run_start]
+        start_slots = closest[starts]
+        objects = list(frames.objects)
+        object_types = list(frames.object_types)
+        run_player = frames.object_code[starts, start_slots]
+        run_team = frames.type_code[starts, start_slots]
+        run_x = frames.x[starts, start_slots]
+        run_y = frames.y[starts, start_slots]
+        run_frame = frames.frame_ids[starts]
+        
+        # Possession carried over from earlier frames is a run starting before row 0
+        if possession.player_id is not None:
+            carried_player = self._code_of(objects, possession.player_id)
+            if len(touches) and touch_player[0] == carried_player:
+                # The first run continues the carried possession
+                run_frame = run_frame.copy()
+                run_frame[0] = possession.start_frame
+                run_x, run_y = run_x.copy(), run_y.copy()
+                run_x[0], run_y[0] = possession.x, possession.y
+                starts = starts.copy()
+                starts[0] = -1
+            else:
+                starts = np.concatenate(([-1], starts))
+                run_player = np.concatenate(([carried_player], run_player))
+                run_team = np.concatenate(([self._code_of(object_types, possession.team_id)], run_team))
+                run_x = np.concatenate(([possession.x], run_x))
+                run_y = np.concatenate(([possession.y], run_y))
+                run_frame = np.concatenate(([possession.start_frame], run_frame))
+        
+        events: List[Tuple[int, int, int, InferredEvent]] = []
+        
+        # Possession changes
+        same_team = run_team[1:] == run_team[:-1]
+        moved = np.sqrt((run_x[1:] - run_x[:-1]) ** 2 + (run_y[1:] - run_y[:-1]) ** 2)
+        is_pass = same_team & (moved >= self.config.pass_min_distance)
+        for j in np.flatnonzero(is_pass | ~same_team):
+            row = int(starts[j + 1])
+            events.append((row, 0, 0, InferredEvent(
+                frame_start=int(run_frame[j]),
+                frame_end=int(frames.frame_ids[row]),
+                event_type=(
+                    InferredEventType.PASS_COMPLETE if is_pass[j]
+                    else InferredEventType.LOSS_OF_POSSESSION
+                ),
+                actors=[objects[run_player[j]], objects[run_player[j + 1]]],
+                team_id=object_types[run_team[j]] or "unknown",
+                location=(float(run_x[j]), float(run_y[j]))
+            )))
+        
+        # Pressure: opponents near the carrier's possession location
+        run_of_frame = np.searchsorted(starts, rows, side="right") - 1
+        pressed = np.flatnonzero(valid & (run_of_frame >= 0))
+        run = run_of_frame[pressed]
+        opponents = (
+            is_player[pressed]
+            & (frames.object_code[pressed] != run_player[run, None])
+            & (frames.type_code[pressed] != run_team[run, None])
+        )
+        presses = index.take(pressed).within(
+            np.column_stack((run_x[run], run_y[run])), self.config.pressure_distance, mask=opponents
+        )
+        for i, slot in zip(*np.nonzero(presses)):
+            row = int(pressed[i])
+            events.append((row, 1, int(slot), InferredEvent(
+                frame_start=int(frames.frame_ids[row]),
+                frame_end=int(frames.frame_ids[row]),
+                event_type=InferredEventType.PRESSURE,
+                actors=[objects[frames.object_code[row, slot]], objects[run_player[run[i]]]],
+                team_id=object_types[frames.type_code[row, slot]],
+                location=(float(frames.x[row, slot]), float(frames.y[row, slot])),
+                confidence=0.8
+            )))
+        
+        events.sort(key=lambda item: item[:3])
+        if len(starts):
+            possession = PossessionState(
+                player_id=objects[run_player[-1]],
+                team_id=object_types[run_team[-1]],
+                start_frame=int(run_frame[-1]),
+                x=float(run_x[-1]),
+                y=float(run_y[-1])
+            )
+        return [event for *_, event in events], possession
+    
+    @staticmethod
+    def _code_of(values: List[Any], value: Any) -> int:
+        """Code of a value in a block's lookup list, appending it if absent."""
+        if value in values:
+            return values.index(value)
+        values.append(value)
+        return len(values) - 1
     
     def detect_events_with_names(
         self,
@@ -259,17 +403,24 @@ class HeuristicEventDetector:
             List of inferred events with player names
         """
         # Import here to avoid circular dependency
-        from src.infrastructure.api.endpoints.lineup import get_player_name
+        from src.infrastructure.api.endpoints.lineup import get_lineup
         
         events = self.detect_events(tracking_points)
+        if not events:
+            return events
         
-        # Resolve player names for each event
-        for event in events:
-            names = []
-            for actor_id in event.actors:
-                name = get_player_name(match_id, actor_id)
-                names.append(name if name else f"Player {actor_id}")
-            event.actor_names = names
+        # Resolve each distinct actor once, then map names back to events
+        lineup = get_lineup(match_id)
+        actors = np.array([actor for event in events for actor in event.actors], dtype=object)
+        actor_ids, actor_code = factorize(actors)
+        names = np.array([
+            (lineup[actor_id].player_name if actor_id in lineup else None) or f"Player {actor_id}"
+            for actor_id in actor_ids
+        ], dtype=object)
+        resolved = names[actor_code].tolist()
+        
+        bounds = np.cumsum([0] + [len(event.actors) for event in events])
+        for event, start, end in zip(events, bounds[:-1], bounds[1:]):
+            event.actor_names = resolved[start:end]
         
         return events
-
@@ -0,0 +1,176 @@
+"""
+LeaguePatternTrainer - Application Layer
+
+Use Case for maintaining league-level tactical patterns across matches.
+Follows "Feature + Action + er" naming convention.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+import logging
+
+import numpy as np
+
+from src.domain.entities.event import Event
+from src.domain.entities.possession_sequence import PossessionSequence
+from src.domain.entities.sequence_extractor import SequenceExtractor
+from src.domain.ports.league_pattern_model_port import LeaguePatternModelPort
+from src.domain.ports.match_repository import MatchRepository
+from src.domain.ports.pattern_usage_repository import PatternUsageRepository
+from src.domain.value_objects.pattern_usage import PatternUsage
+from src.domain.value_objects.sequence_features import SequenceFeatures
+
+logger = logging.getLogger(__name__)
+
+# Frame rate PossessionSequence durations assume
+FPS = 25.0
+
+
+@dataclass
+class LeaguePatternUpdateResult:
+    """Result of feeding matches to the league pattern model."""
+    model_version: int
+    matches_used: int
+    sequences_used: int
+    matches_added: int = 0  # Matches the clusters were updated with
+
+
+class LeaguePatternTrainer:
+    """
+    Use Case: Update league patterns and per-match pattern usage.
+
+    Orchestrates:
+    1. Loading each match's events via MatchRepository and extracting
+       possession sequences.
+    2. Updating the league model incrementally (optional) with the
+       matches it has not seen yet.
+    3. Assigning every match's sequences to the final clusters and
+       replacing its per-team usage via PatternUsageRepository.
+
+    Matches update the model one at a time, so the cost of adding a
+    match does not grow with the number already seen. Usage of matches
+    outside a run keeps the model version it was assigned with, so
+    league-wide counts can mix versions until those matches are
+    re-assigned (e.g. by a run over the whole competition).
+    """
+
+    def __init__(
+        self,
+        model: LeaguePatternModelPort,
+        usage_repository: PatternUsageRepository,
+        match_repository: MatchRepository
+    ):
+        """
+        Initialize with injected ports.
+
+        Args:
+            model: League pattern clustering model
+            usage_repository: Port for per-match pattern usage
+            match_repository: Port for reading ingested matches
+        """
+        self.model = model
+        self.usage_repository = usage_repository
+        self.match_repository = match_repository
+        self.sequence_extractor = SequenceExtractor()
+
+    def execute(self, match_ids: List[str], update_model: bool = True) -> LeaguePatternUpdateResult:
+        """
+        Feed new matches to the league model and store every match's usage.
+
+        Matches the model has already learned from are not fed again,
+        only re-assigned. All usage of the run is stored after the last
+        update, so it shares one model version.
+
+        Args:
+            match_ids: Matches to process, in order
+            update_model: Update the clusters with unseen matches before
+                assigning (False: assign to the current clusters only)
+
+        Returns:
+            LeaguePatternUpdateResult with the resulting model version
+
+        Raises:
+            ValueError: If the model is unfitted and update_model is False
+        """
+        if not update_model and not self.model.is_fitted():
+            raise ValueError("League pattern model is not fitted")
+
+        # An unfitted model needs at least n_clusters sequences in its
+        # first batch; hold matches back until there are enough
+        loaded: Dict[str, Tuple[List[str], List[SequenceFeatures], np.ndarray]] = {}
+        pending: List[str] = []
+        matches_used = sequences_used = matches_added = 0
+
+        for match_id in match_ids:
+            if match_id in loaded:
+                continue
+            sequences = self._load_sequences(match_id)
+            if not sequences:
+                continue
+            sequence_features = [seq.extract_features() for seq in sequences]
+            vectors = np.array([f.to_vector() for f in sequence_features])
+            loaded[match_id] = ([seq.team_id for seq in sequences], sequence_features, vectors)
+            matches_used += 1
+            sequences_used += len(sequences)
+
+            if not update_model or self.model.has_seen(match_id):
+                continue
+            pending.append(match_id)
+            batch = np.vstack([loaded[pending_id][2] for pending_id in pending])
+            if not self.model.is_fitted() and len(batch) < self.model.n_clusters:
+                continue
+            self.model.partial_fit(batch, match_ids=pending)
+            matches_added += len(pending)
+            pending = []
+
+        if pending:
+            logger.warning(
+                f"Not enough sequences to initialise {self.model.n_clusters} league patterns; "
+                f"{len(pending)} matches left unassigned"
+            )
+            for match_id in pending:
+                del loaded[match_id]
+
+        for match_id, (team_ids, sequence_features, vectors) in loaded.items():
+            self._store_usage(match_id, team_ids, sequence_features, vectors)
+
+        logger.info(
+            f"League patterns at version {self.model.version} after "
+            f"{matches_used} matches ({sequences_used} sequences, {matches_added} new)"
+        )
+        return LeaguePatternUpdateResult(
+            model_version=self.model.version,
+            matches_used=matches_used,
+            sequences_used=sequences_used,
+            matches_added=matches_added
+        )
+
+    def _load_sequences(self, match_id: str) -> List[PossessionSequence]:
+        match = self.match_repository.get_match(match_id)
+        if match is None:
+            logger.warning(f"Match {match_id} not found, skipping")
+            return []
+        events = [self._event_dict(event) for event in match.events]
+        return self.sequence_extractor.extract(events, match_id) if events else []
+
+    @staticmethod
+    def _event_dict(event: Event) -> dict:
+        """Event in the dict shape SequenceExtractor and PossessionSequence read."""
+        event_type = getattr(event.event_type, "value", event.event_type)
+        return {
+            "team_id": event.team_id,
+            "type": str(event_type or ""),
+            "outcome": event.outcome or "",
+            "x": event.coordinates.x,
+            "y": event.coordinates.y,
+            "frame_id": int(round(event.timestamp * FPS)),
+        }
+
+    def _store_usage(
+        self,
+        match_id: str,
+        team_ids: List[str],
+        sequence_features: List[SequenceFeatures],
+        vectors: np.ndarray
+    ) -> None:
+        usages = PatternUsage.aggregate(team_ids, self.model.assign(vectors), sequence_features)
+        self.usage_repository.save_match_usage(match_id, self.model.version, usages)
@@ -5,14 +5,24 @@ Use Case for calculating tactical metrics for a match.
 Follows "Feature + Action + er" naming convention.
 """
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple, Union
 import logging
 
-from src.domain.entities.player_trajectory import PlayerTrajectory, FramePosition
-from src.domain.entities.match_frame import MatchFrame, PlayerPosition, BallPosition
+import numpy as np
+
+from src.application.services.parallel_metrics_executor import (
+    ParallelMetricsExecutor, can_fork_workers
+)
 from src.domain.entities.tactical_match import TacticalMatch, MatchEvent, EventType
 from src.domain.ports.metrics_repository import MetricsRepository
-from src.domain.services.trajectory_smoother import TrajectoryPoint
+from src.domain.ports.metrics_state_store_port import MetricsStateStore
+from src.domain.ports.pitch_control_store_port import PitchControlStore
+from src.domain.services.physical_metrics_engine import PhysicalMetricsEngine
+from src.domain.services.pitch_control_engine import PitchControlEngine, FrameTensor
+from src.domain.services.time_sync import TimeSync, SyncConfig
+from src.domain.value_objects.expected_threat_grid import ExpectedThreatGrid
+from src.domain.value_objects.metrics_state import MetricsState, TeamEventCounters
+from src.domain.value_objects.tracking_table import TrackingTable
 
 logger = logging.getLogger(__name__)
 
@@ -37,19 +47,58 @@ class MetricsCalculator:
     3. Persisting results via MetricsRepository.
     """
     
-    def __init__(self, metrics_repository: MetricsRepository):
+    PITCH_CONTROL_MODES = ("sampled", "events")
+    # Event types that anchor pitch control in "events" mode (turnovers
+    # are interceptions and tackles)
+    ANCHOR_EVENT_TYPES = ("pass", "shot", "interception", "tackle")
+    
+    def __init__(
+        self,
+        metrics_repository: MetricsRepository,
+        pitch_control_sample_rate: int = 25,
+        pitch_control_store: Optional[PitchControlStore] = None,
+        max_workers: int = 1,
+        metrics_state_store: Optional[MetricsStateStore] = None,
+        pitch_control_mode: str = "sampled",
+        max_anchor_gap_frames: int = 12,
+        xt_grid: Optional[ExpectedThreatGrid] = None
+    ):
         """
         Initialize with injected repository.
         
         Args:
             metrics_repository: Port for persisting metrics
+            pitch_control_sample_rate: Compute pitch control every N frames
+                (25 = 1 Hz, 5 = 5 Hz at 25 fps)
+            pitch_control_store: Optional port for persisting pitch control
+                surfaces in bulk; without it frames go to the repository
+            max_workers: Worker processes for the parallel execution mode
+                (players, time blocks and periods are split across them);
+                1 runs everything in-process
+            metrics_state_store: Port for running state, required by `append`
+            pitch_control_mode: "sampled" computes pitch control every
+                `pitch_control_sample_rate` frames; "events" only at the
+                frames of passes, shots and turnovers, stored per event
+            max_anchor_gap_frames: In "events" mode, events further than
+                this from any tracked frame get no surface (12 = 0.5 s)
+            xt_grid: xT grid of the match's competition (None: the
+                standard 12x8 grid)
         """
+        if pitch_control_mode not in self.PITCH_CONTROL_MODES:
+            raise ValueError(f"Unknown pitch_control_mode: {pitch_control_mode}")
         self.metrics_repository = metrics_repository
+        self.pitch_control_sample_rate = pitch_control_sample_rate
+        self.pitch_control_store = pitch_control_store
+        self.max_workers = max_workers
+        self.metrics_state_store = metrics_state_store
+        self.pitch_control_mode = pitch_control_mode
+        self.max_anchor_gap_frames = max_anchor_gap_frames
+        self.xt_grid = xt_grid
     
     def execute(
         self,
         match_id: str,
-        tracking_data: List[Dict[str, Any]],
+        tracking_data: Union[TrackingTable, List[Dict[str, Any]]],
         event_data: List[Dict[str, Any]],
         sync_offset_seconds: float = 0.0
     ) -> MetricsResult:
@@ -58,184 +107,266 @@ class MetricsCalculator:
         
         Args:
             match_id: Match identifier
-            tracking_data: Raw tracking data
+            tracking_data: Columnar TrackingTable, or raw list of row dicts
             event_data: Raw event data
             sync_offset_seconds: Time offset for syncing video with match time
+                (aligns event timestamps with tracking frames)
             
         Returns:
             MetricsResult summary
         """
-        # 1. Physical Metrics
-        player_trajectories = self._build_player_trajectories(tracking_data)
-        for trajectory in player_trajectories:
-            metrics = trajectory.calculate_physical_metrics()
-            
-            self.metrics_repository.save_physical_stats(
-                match_id=match_id,
-                player_id=trajectory.player_id,
-                total_distance=metrics.total_distance,
-                max_speed=metrics.max_speed,
-                sprint_count=metrics.sprint_count,
-                avg_speed=metrics.avg_speed
-            )
+        if not isinstance(tracking_data, TrackingTable):
+            tracking_data = TrackingTable.from_records(tracking_data)
         
-        # 2. Pitch Control
-        match_frames = self._build_match_frames(tracking_data, sample_rate=25)
-        for frame in match_frames:
-            pitch_control = frame.calculate_pitch_control()
-            
-            self.metrics_repository.save_pitch_control_frame(
-                match_id=match_id,
-                frame_id=frame.frame_id,
-                home_control=pitch_control.home_control,
-                away_control=pitch_control.away_control
-            )
+        executor = self._executor()
+        
+        # 1. Physical Metrics (all players in one vectorized pass)
+        if executor is not None:
+            physical_metrics = executor.physical_metrics(tracking_data)
+        else:
+            physical_metrics = PhysicalMetricsEngine().calculate(tracking_data)
         
-        # 3. Tactical Metrics (PPDA)
+        # 2. Events
         # If no event data provided (video-only), infer events from tracking
         if not event_data:
             logger.info("No event data provided, using heuristic event detection")
-            from src.application.use_cases.event_detector import (
-                HeuristicEventDetector, InferredEventType
+            if executor is not None:
+                event_data = executor.infer_events(tracking_data)
+            else:
+                event_data = [
+                    event
+                    for period in np.unique(tracking_data.period)
+                    for event in infer_event_data(
+                        tracking_data.take(tracking_data.period == period)
+                    )
+                ]
+            logger.info(f"Inferred {len(event_data)} events from tracking data")
+        
+        # 3. Pitch Control (sampled or event frames, batched over a frame tensor)
+        event_ids = None
+        if self.pitch_control_mode == "events":
+            event_ids, anchor_frames = self._event_anchor_frames(
+                event_data, tracking_data, sync_offset_seconds
             )
-            
-            # Convert tracking data to TrajectoryPoints
-            trajectory_points = [
-                TrajectoryPoint(
-                    frame_id=d["frame_id"],
-                    object_id=d["player_id"],
-                    x=d["x"],
-                    y=d["y"],
-                    timestamp=d.get("timestamp", 0),
-                    object_type=d.get("object_type", "player"),
-                    confidence=d.get("confidence", 1.0)
+            frames = FrameTensor.from_tracking(tracking_data, frame_ids=anchor_frames)
+        else:
+            frames = FrameTensor.from_tracking(tracking_data, sample_rate=self.pitch_control_sample_rate)
+        engine = PitchControlEngine()
+        if executor is not None:
+            home_control = executor.pitch_control(frames, engine)
+        else:
+            home_control = engine.compute(frames.positions, frames.teams)
+        away_control = engine.away_control(home_control, frames.teams)
+        surface_frame_ids = frames.frame_ids
+        if event_ids is not None:
+            # One surface per event (events sharing a frame share its surface)
+            surface_index = np.searchsorted(frames.frame_ids, anchor_frames)
+            surface_frame_ids = anchor_frames
+            home_control = home_control[surface_index]
+            away_control = away_control[surface_index]
+        if self.pitch_control_store is not None:
+            self.pitch_control_store.save_surfaces(
+                match_id, surface_frame_ids, home_control, away_control, event_ids=event_ids
+            )
+        else:
+            for i, frame_id in enumerate(surface_frame_ids):
+                self.metrics_repository.save_pitch_control_frame(
+                    match_id=match_id,
+                    frame_id=int(frame_id),
+                    home_control=home_control[i],
+                    away_control=away_control[i]
                 )
-                for d in tracking_data
-            ]
-            
-            # Detect events
-            detector = HeuristicEventDetector()
-            inferred_events = detector.detect_events(trajectory_points)
-            
-            # Convert inferred events to format expected by TacticalMatch
-            event_data = []
-            for ie in inferred_events:
-                event_type_map = {
-                    InferredEventType.PASS_COMPLETE: "pass",
-                    InferredEventType.PRESSURE: "defensive_action",
-                    InferredEventType.LOSS_OF_POSSESSION: "interception",
-                }
-                if ie.event_type in event_type_map:
-                    event_data.append({
-                        "event_id": f"inferred_{ie.frame_start}",
-                        "event_type": event_type_map[ie.event_type],
-                        "team_id": ie.team_id,
-                        "player_id": str(ie.actors[0]) if ie.actors else "unknown",
-                        "timestamp": ie.frame_start * 0.04,  # 25fps
-                        "x": ie.location[0],
-                        "y": ie.location[1]
-                    })
-            
-            logger.info(f"Inferred {len(event_data)} events from tracking data")
         
+        # 4. Tactical Metrics (PPDA)
         tactical_match = self._build_tactical_match(match_id, event_data)
         
         ppda_home = tactical_match.calculate_ppda("home", "away")
         ppda_away = tactical_match.calculate_ppda("away", "home")
         
-        self.metrics_repository.save_ppda(
-            match_id=match_id,
-            team_id="home",
-            passes_allowed=ppda_home.passes_allowed,
-            defensive_actions=ppda_home.defensive_actions,
-            ppda=ppda_home.ppda
+        # 5. Persist physical stats and PPDA in one transaction
+        self.metrics_repository.save_match_metrics_bulk(
+            match_id,
+            _physical_rows(physical_metrics),
+            [
+                {
+                    "team_id": team_id,
+                    "passes_allowed": ppda.passes_allowed,
+                    "defensive_actions": ppda.defensive_actions,
+                    "ppda": ppda.ppda
+                }
+                for team_id, ppda in (("home", ppda_home), ("away", ppda_away))
+            ]
         )
         
-        self.metrics_repository.save_ppda(
+        return MetricsResult(
             match_id=match_id,
-            team_id="away",
-            passes_allowed=ppda_away.passes_allowed,
-            defensive_actions=ppda_away.defensive_actions,
-            ppda=ppda_away.ppda
+            players_processed=len(physical_metrics),
+            frames_processed=len(frames.frame_ids),
+            events_processed=len(event_data)
         )
+    
+    def append(
+        self,
+        match_id: str,
+        tracking_block: Union[TrackingTable, List[Dict[str, Any]]],
+        event_data: List[Dict[str, Any]]
+    ) -> MetricsResult:
+        """
+        Incremental mode: fold a newly appended block of frames into the
+        match's running metrics state and persist the updated totals.
+        
+        Costs O(block) regardless of how much of the match was processed
+        before. Blocks must arrive in frame order; frames already folded in
+        for a player are skipped. Pitch control is frame-local and is not
+        part of the running state.
+        
+        Events inferred from tracking continue from the possession stored
+        in the state, so possession changes across block boundaries are
+        counted; blocks should then hold whole frames. Totals match
+        `execute` on the concatenated data except for tracks clipped as
+        outliers (see PhysicalMetricsEngine.update).
+        
+        Args:
+            match_id: Match identifier
+            tracking_block: New tracking rows
+            event_data: Events of the block (inferred from tracking if empty)
+            
+        Returns:
+            MetricsResult with cumulative counts
+        """
+        if self.metrics_state_store is None:
+            raise ValueError("Incremental metrics require a metrics_state_store")
+        if not isinstance(tracking_block, TrackingTable):
+            tracking_block = TrackingTable.from_records(tracking_block)
+        
+        state = self.metrics_state_store.get_state(match_id) or MetricsState(match_id)
+        
+        # 1. Physical Metrics (running per-player state)
+        engine = PhysicalMetricsEngine()
+        engine.update(state.players, tracking_block)
+        physical_metrics = engine.snapshot(state.players)
+        
+        # 2. Tactical Metrics (running per-team event counters)
+        if not event_data:
+            event_data = self._infer_block_events(tracking_block, state)
+        block_match = self._build_tactical_match(match_id, event_data)
+        for team_id, opponent in (("home", "away"), ("away", "home")):
+            counters = state.teams.setdefault(team_id, TeamEventCounters())
+            counters.passes_in_attacking_two_thirds += block_match.calculate_ppda(
+                opponent, team_id
+            ).passes_allowed
+            counters.defensive_actions += block_match.calculate_ppda(
+                team_id, opponent
+            ).defensive_actions
+        
+        ppda_rows = []
+        for team_id, opponent in (("home", "away"), ("away", "home")):
+            passes_allowed = state.teams[opponent].passes_in_attacking_two_thirds
+            defensive_actions = state.teams[team_id].defensive_actions
+            ppda_rows.append({
+                "team_id": team_id,
+                "passes_allowed": passes_allowed,
+                "defensive_actions": defensive_actions,
+                "ppda": float('inf') if defensive_actions == 0 else passes_allowed / defensive_actions
+            })
+        self.metrics_repository.save_match_metrics_bulk(
+            match_id, _physical_rows(physical_metrics), ppda_rows
+        )
+        
+        state.frames_processed += len(np.unique(tracking_block.frame_id))
+        state.events_processed += len(event_data)
+        self.metrics_state_store.save_state(state)
         
         return MetricsResult(
             match_id=match_id,
-            players_processed=len(player_trajectories),
-            frames_processed=len(match_frames),
-            events_processed=len(event_data)
+            players_processed=len(physical_metrics),
+            frames_processed=state.frames_processed,
+            events_processed=state.events_processed
         )
     
-    def _build_player_trajectories(
+    def _infer_block_events(
         self,
-        tracking_data: List[Dict[str, Any]]
-    ) -> List[PlayerTrajectory]:
-        """Build PlayerTrajectory entities from raw data."""
-        # Group by player
-        player_frames_dict: Dict[str, List[FramePosition]] = {}
+        tracking_block: TrackingTable,
+        state: MetricsState
+    ) -> List[Dict[str, Any]]:
+        """
+        Infer a block's events period by period, continuing from and
+        updating the possession kept in `state`.
+        """
+        from src.application.use_cases.event_detector import (
+            HeuristicEventDetector, PossessionState
+        )
         
-        for data in tracking_data:
-            player_id = data["player_id"]
-            frame = FramePosition(
-                frame_id=data["frame_id"],
-                x=data["x"],
-                y=data["y"],
-                timestamp=data["timestamp"]
+        detector = HeuristicEventDetector()
+        event_data = []
+        for period in np.unique(tracking_block.period):
+            period = int(period)
+            # Possession does not carry over into a new period
+            carried = dict(state.possession or {})
+            possession = None
+            if carried.pop("period", None) == period:
+                possession = PossessionState(**carried)
+            inferred_events, possession = detector.detect_tracking_block(
+                tracking_block.take(tracking_block.period == period), possession
             )
-            
-            if player_id not in player_frames_dict:
-                player_frames_dict[player_id] = []
-            player_frames_dict[player_id].append(frame)
-        
-        return [
-            PlayerTrajectory(player_id, frames)
-            for player_id, frames in player_frames_dict.items()
-        ]
+            event_data.extend(_event_dicts(inferred_events))
+            state.possession = {
+                "period": period,
+                "player_id": _plain(possession.player_id),
+                "team_id": _plain(possession.team_id),
+                "start_frame": int(possession.start_frame),
+                "x": float(possession.x),
+                "y": float(possession.y),
+            }
+        return event_data
     
-    def _build_match_frames(
+    def _event_anchor_frames(
         self,
-        tracking_data: List[Dict[str, Any]],
-        sample_rate: int = 25
-    ) -> List[MatchFrame]:
-        """Build MatchFrame entities from raw data (sampled)."""
-        frames_dict: Dict[int, List[Dict[str, Any]]] = {}
+        event_data: List[Dict[str, Any]],
+        tracking_data: TrackingTable,
+        sync_offset_seconds: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Frames at which to compute pitch control for anchor events.
         
-        for data in tracking_data:
-            frame_id = data["frame_id"]
-            if frame_id not in frames_dict:
-                frames_dict[frame_id] = []
-            frames_dict[frame_id].append(data)
+        Inferred events carry their frame; other events are aligned from
+        their match timestamp with TimeSync. Each event is snapped to the
+        nearest tracked frame within `max_anchor_gap_frames`.
         
-        match_frames = []
-        for frame_id in sorted(frames_dict.keys()):
-            if frame_id % sample_rate != 0:
-                continue
-            
-            # Separate players from ball
-            player_data = [d for d in frames_dict[frame_id] if d.get("object_type", "player") != "ball"]
-            ball_data = [d for d in frames_dict[frame_id] if d.get("object_type") == "ball"]
-            
-            players = [
-                PlayerPosition(
-                    player_id=d["player_id"],
-                    team_id=d.get("team_id", "unknown"),
-                    x=d["x"],
-                    y=d["y"],
-                    vx=d.get("vx", 0.0),
-                    vy=d.get("vy", 0.0)
-                )
-                for d in player_data
-            ]
-            
-            # Use actual ball position if available, otherwise center of pitch
-            if ball_data:
-                ball = BallPosition(x=ball_data[0]["x"], y=ball_data[0]["y"])
-            else:
-                ball = BallPosition(x=52.5, y=34.0)  # Default to center
-            
-            match_frames.append(MatchFrame(frame_id, players, ball))
+        Returns:
+            (event_ids, frame_ids) sorted by frame
+        """
+        anchors = [e for e in event_data if e["event_type"] in self.ANCHOR_EVENT_TYPES]
+        time_sync = TimeSync(SyncConfig(sync_offset_seconds=sync_offset_seconds))
+        synced = time_sync.match_times_to_frames([e["timestamp"] for e in anchors])
+        wanted = np.array(
+            [e.get("frame_id", frame) for e, frame in zip(anchors, synced)], dtype=np.int64
+        )
+        event_ids = np.array([str(e["event_id"]) for e in anchors], dtype=str)
+        
+        tracked = np.unique(tracking_data.frame_id)
+        if len(tracked) == 0 or len(wanted) == 0:
+            return np.zeros(0, dtype=str), np.zeros(0, dtype=np.int64)
+        right = np.minimum(np.searchsorted(tracked, wanted), len(tracked) - 1)
+        left = np.maximum(right - 1, 0)
+        nearest = np.where(
+            np.abs(tracked[left] - wanted) <= np.abs(tracked[right] - wanted), tracked[left], tracked[right]
+        )
+        keep = np.abs(nearest - wanted) <= self.max_anchor_gap_frames
+        if not keep.all():
+            logger.info(f"{int((~keep).sum())} anchor events have no tracked frame nearby")
         
-        return match_frames
+        order = np.argsort(nearest[keep], kind="stable")
+        return event_ids[keep][order], nearest[keep][order]
+    
+    def _executor(self) -> Optional[ParallelMetricsExecutor]:
+        """Process pool executor for this run, or None to run serially."""
+        if self.max_workers <= 1:
+            return None
+        if not can_fork_workers():
+            logger.warning("Running in a daemonic process, falling back to serial metrics")
+            return None
+        return ParallelMetricsExecutor(self.max_workers)
     
     def _build_tactical_match(
         self,
@@ -247,7 +378,7 @@ class MetricsCalculator:
             MatchEvent(
                 event_id=e["event_id"],
                 event_type=EventType(e["event_type"]),
-                team_id=e["team_id"],
+                team=e["team_id"],
                 player_id=e["player_id"],
                 timestamp=e["timestamp"],
                 x=e["x"],
@@ -256,4 +387,64 @@ class MetricsCalculator:
             for e in event_data
         ]
         
-        return TacticalMatch(match_id, events)
+        return TacticalMatch(match_id, events, xt_grid=self.xt_grid)
+
+
+def _physical_rows(physical_metrics: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Repository rows for per-player physical metrics."""
+    return [
+        {
+            "player_id": player_id,
+            "total_distance": metrics.total_distance,
+            "max_speed": metrics.max_speed,
+            "sprint_count": metrics.sprint_count,
+            "avg_speed": metrics.avg_speed
+        }
+        for player_id, metrics in physical_metrics.items()
+    ]
+
+
+def infer_event_data(tracking_data: TrackingTable) -> List[Dict[str, Any]]:
+    """
+    Infer TacticalMatch event dicts from tracking with the heuristic detector.
+    
+    Args:
+        tracking_data: Tracking rows (one period at a time)
+        
+    Returns:
+        Raw event dicts (pass, defensive_action, interception)
+    """
+    from src.application.use_cases.event_detector import HeuristicEventDetector
+    
+    # Detect events (vectorized over the columnar table)
+    return _event_dicts(HeuristicEventDetector().detect_tracking_events(tracking_data))
+
+
+def _event_dicts(inferred_events: List[Any]) -> List[Dict[str, Any]]:
+    """Convert inferred events to the format expected by TacticalMatch."""
+    from src.application.use_cases.event_detector import InferredEventType
+    
+    event_type_map = {
+        InferredEventType.PASS_COMPLETE: "pass",
+        InferredEventType.PRESSURE: "defensive_action",
+        InferredEventType.LOSS_OF_POSSESSION: "interception",
+    }
+    event_data = []
+    for ie in inferred_events:
+        if ie.event_type in event_type_map:
+            event_data.append({
+                "event_id": f"inferred_{ie.frame_start}",
+                "event_type": event_type_map[ie.event_type],
+                "frame_id": ie.frame_start,
+                "team_id": ie.team_id,
+                "player_id": str(ie.actors[0]) if ie.actors else "unknown",
+                "timestamp": ie.frame_start * 0.04,  # 25fps
+                "x": ie.location[0],
+                "y": ie.location[1]
+            })
+    return event_data
+
+
+def _plain(value: Any) -> Any:
+    """NumPy scalars as Python values (for the JSON state)."""
+    return value.item() if isinstance(value, np.generic) else value
@@ -79,10 +79,11 @@ class PatternDetector:
             match = self.match_repository.get_match(match_id)
             if match:
                 events = [e.__dict__ for e in match.events]
-            else:
-                events = []
         
         if not events:
+            # A known match without events: record the empty result
+            if events is not None:
+                self._save(match_id, team_id, [])
             return PatternDetectionResult(
                 match_id=match_id,
                 team_id=team_id,
@@ -110,9 +111,8 @@ class PatternDetector:
         # Get patterns
         patterns = self.detector.get_patterns(team_sequences, match_id, team_id)
         
-        # Persist if repository available
-        if self.pattern_repository and patterns:
-            self.pattern_repository.save_patterns(patterns)
+        # Persist if repository available (an empty result clears old patterns)
+        self._save(match_id, team_id, patterns)
         
         return PatternDetectionResult(
             match_id=match_id,
@@ -121,3 +121,8 @@ class PatternDetector:
             sequence_count=len(team_sequences),
             patterns=patterns
         )
+    
+    def _save(self, match_id: str, team_id: str, patterns: List[TacticalPattern]) -> None:
+        """Replace the stored patterns of the match and team, if storing."""
+        if self.pattern_repository:
+            self.pattern_repository.save_patterns(match_id, team_id, patterns)
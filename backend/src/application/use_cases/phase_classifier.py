@@ -9,7 +9,8 @@ from typing import Optional, List, Tuple
 import pandas as pd
 import numpy as np
 
-from src.domain.entities.phase_sequence import PhaseSequence
+from src.domain.entities.phase_sequence import PHASES, PhaseSequence
+from src.domain.services.phase_hmm import PhaseHMM
 from src.domain.value_objects.phase_features import PhaseFeatures
 from src.domain.ports.phase_classifier_port import PhaseClassifierPort
 from src.domain.ports.phase_repository import PhaseRepository
@@ -17,6 +18,11 @@ from src.domain.ports.object_storage_port import ObjectStoragePort
 
 logger = logging.getLogger(__name__)
 
+# "frames": classify every frame independently.
+# "windowed": classify rolling-window means at step_seconds and decode
+# the window labels with a sticky phase HMM (Viterbi).
+PHASE_INFERENCE_MODES = ("frames", "windowed")
+
 
 class PhaseClassifier:
     """
@@ -29,11 +35,18 @@ class PhaseClassifier:
     4. Persisting results (Infra <-> Domain)
     """
     
+    FPS = 25.0
+    
     def __init__(
         self, 
         ml_engine: PhaseClassifierPort, 
         repository: PhaseRepository,
-        object_storage: ObjectStoragePort
+        object_storage: ObjectStoragePort,
+        mode: str = "frames",
+        step_seconds: float = 1.0,
+        window_seconds: float = 2.0,
+        mean_phase_seconds: float = 10.0,
+        hmm: Optional[PhaseHMM] = None
     ):
         """
         Initialize with injected dependencies.
@@ -42,10 +55,27 @@ class PhaseClassifier:
             ml_engine: ML Model adapter (PhaseClassifierPort)
             repository: Database adapter (PhaseRepository)
             object_storage: File storage adapter (ObjectStoragePort)
+            mode: One of PHASE_INFERENCE_MODES
+            step_seconds: Windowed mode: one classification per step
+            window_seconds: Windowed mode: rolling feature window
+            mean_phase_seconds: Windowed mode: expected phase length,
+                sets the HMM switch probability
+            hmm: Windowed mode: decoder override
         """
+        if mode not in PHASE_INFERENCE_MODES:
+            raise ValueError(f"mode must be one of {PHASE_INFERENCE_MODES}, got {mode!r}")
+        if step_seconds <= 0 or window_seconds < step_seconds:
+            raise ValueError("step_seconds must be > 0 and window_seconds >= step_seconds")
+        
         self.ml_engine = ml_engine
         self.repository = repository
         self.object_storage = object_storage
+        self.mode = mode
+        self.step_frames = max(1, round(step_seconds * self.FPS))
+        self.window_frames = max(self.step_frames, round(window_seconds * self.FPS))
+        self.hmm = hmm or PhaseHMM.from_mean_duration(
+            len(PHASES), mean_phase_seconds / step_seconds
+        )
     
     def execute(self, match_id: str, team_id: str = "home") -> PhaseSequence:
         """
@@ -99,64 +129,45 @@ class PhaseClassifier:
         team_id: str
     ) -> PhaseSequence:
         """Internal helper to process dataframe into classified sequence."""
-        sequence = PhaseSequence(match_id=match_id, team_id=team_id, fps=25.0)
+        # Feature Extraction: one pass over the whole table
+        frame_ids, feature_matrix = self._extract_features(df)
         
-        frame_ids = sorted(df['frame_id'].unique())
-        batch_size = 500
-        all_features = []
+        if self.mode == "windowed":
+            phases, confidences = self._classify_windowed(frame_ids, feature_matrix)
+        else:
+            # Classification: one probability pass over the whole matrix
+            phases, confidences = self.ml_engine.classify_batch_with_confidence(feature_matrix)
         
-        # Feature Extraction Loop
-        prev_ball_pos = (52.5, 34.0)
-        
-        for frame_id in frame_ids:
-            # Extract positions (Domain helper could be used here if extracted to Utils)
-            # For now, inline or private helper is fine to keep Use Case self-contained
-            # or delegate to a Domain Service if complex.
-            home_pos, away_pos, ball_pos = self._extract_positions(df, frame_id)
-            
-            ball_velocity = (
-                (ball_pos[0] - prev_ball_pos[0]) * 25.0,
-                (ball_pos[1] - prev_ball_pos[1]) * 25.0
-            )
-            prev_ball_pos = ball_pos
-            
-            features = PhaseFeatures.from_tracking_frame(
-                home_positions=home_pos,
-                away_positions=away_pos,
-                ball_position=ball_pos,
-                ball_velocity=ball_velocity
-            )
-            all_features.append((frame_id, features))
-            
-        # Classification Loop
-        for i in range(0, len(all_features), batch_size):
-            batch = all_features[i:i + batch_size]
-            features_list = [f for _, f in batch]
-            phases = self.ml_engine.classify_batch(features_list)
-            
-            for (frame_id, features), phase in zip(batch, phases):
-                phase_with_conf, confidence = self.ml_engine.classify_with_confidence(features)
-                sequence.add_frame_phase(
-                    frame_id=frame_id,
-                    phase=phase,
-                    confidence=confidence
-                )
+        sequence = PhaseSequence.from_arrays(
+            match_id=match_id,
+            team_id=team_id,
+            frame_ids=frame_ids,
+            phases=phases,
+            confidences=confidences,
+            fps=self.FPS
+        )
         
         return sequence
 
-    def _extract_positions(self, df: pd.DataFrame, frame_id: int) -> Tuple[List, List, Tuple]:
-        """Helper to extract positions from dataframe row."""
-        frame_data = df[df['frame_id'] == frame_id]
-        if frame_data.empty:
-            return [], [], (52.5, 34.0)
-            
-        home_data = frame_data[frame_data['team'] == 'home']
-        away_data = frame_data[frame_data['team'] == 'away']
+    def _classify_windowed(
+        self,
+        frame_ids: np.ndarray,
+        feature_matrix: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Classify window means, smooth with the HMM and spread back to frames."""
+        window_of_frame, window_features = PhaseFeatures.windowed(
+            frame_ids, feature_matrix, self.step_frames, self.window_frames
+        )
+        proba = self.ml_engine.classify_proba(window_features)
+        path = self.hmm.decode(proba)
+        logger.info(
+            f"Windowed phase inference: {len(frame_ids)} frames -> {len(window_features)} windows"
+        )
         
-        home_pos = [(row['x'], row['y']) for _, row in home_data.iterrows()]
-        away_pos = [(row['x'], row['y']) for _, row in away_data.iterrows()]
-        
-        ball_x = frame_data['ball_x'].iloc[0] if 'ball_x' in frame_data.columns else 52.5
-        ball_y = frame_data['ball_y'].iloc[0] if 'ball_y' in frame_data.columns else 34.0
-        
-        return home_pos, away_pos, (ball_x, ball_y)
+        codes = path[window_of_frame].astype(np.int8)
+        confidences = proba[window_of_frame, codes]
+        return codes, confidences
+    
+    def _extract_features(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Helper to build the (frames x features) matrix from the dataframe."""
+        return PhaseFeatures.from_columns(df)
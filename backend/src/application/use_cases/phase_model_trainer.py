@@ -0,0 +1,82 @@
+"""
+PhaseModelTrainer - Application Layer
+
+Use Case for fitting the phase classifier on the feature store built by
+PhaseFeatureExtractor, one match file in memory at a time.
+Follows "Feature + Action + er" naming convention.
+"""
+from dataclasses import dataclass, field
+from typing import Iterator, List, Tuple
+import logging
+
+import numpy as np
+
+from src.application.use_cases.phase_feature_extractor import PhaseFeatureExtractor
+from src.domain.ports.object_storage_port import ObjectStoragePort
+from src.domain.ports.phase_classifier_port import PhaseClassifierPort
+from src.domain.value_objects.game_phase import GamePhase
+from src.domain.value_objects.phase_features import PhaseFeatures
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PhaseModelTrainingResult:
+    """Result of training the phase classifier over many matches."""
+    matches_used: int
+    metrics: dict = field(default_factory=dict)
+
+
+class PhaseModelTrainer:
+    """
+    Use Case: Train the phase classifier across a season of matches.
+
+    Orchestrates:
+    1. Streaming the per-match feature files from the feature store.
+    2. Incremental fitting via PhaseClassifierPort.train_incremental.
+    Persisting/publishing the model is left to the caller.
+    """
+
+    def __init__(
+        self,
+        ml_engine: PhaseClassifierPort,
+        feature_store: ObjectStoragePort
+    ):
+        """
+        Initialize with injected ports.
+
+        Args:
+            ml_engine: Classifier to train
+            feature_store: Storage holding phase_features/{match_id}.parquet
+        """
+        self.ml_engine = ml_engine
+        self.feature_store = feature_store
+
+    def execute(self, match_ids: List[str], epochs: int = 1) -> PhaseModelTrainingResult:
+        """
+        Train on the stored features of the given matches.
+
+        Args:
+            match_ids: Matches whose features were extracted
+            epochs: Passes over the data for incremental estimators
+
+        Returns:
+            PhaseModelTrainingResult with training metrics
+
+        Raises:
+            ValueError: If no matches are given or they hold no rows
+        """
+        if not match_ids:
+            raise ValueError("No phase training features available")
+
+        metrics = self.ml_engine.train_incremental(lambda: self._batches(match_ids), epochs=epochs)
+        logger.info(f"Trained phase classifier on {len(match_ids)} matches: {metrics}")
+
+        return PhaseModelTrainingResult(matches_used=len(match_ids), metrics=metrics)
+
+    def _batches(self, match_ids: List[str]) -> Iterator[Tuple[np.ndarray, List[GamePhase]]]:
+        """One (features, labels) batch per match, read lazily."""
+        for match_id in match_ids:
+            df = self.feature_store.get_parquet(PhaseFeatureExtractor.feature_key(match_id))
+            features = df[PhaseFeatures.feature_names()].to_numpy(dtype=np.float64)
+            yield features, [GamePhase.from_string(label) for label in df["label"]]
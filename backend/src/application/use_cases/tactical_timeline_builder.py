@@ -0,0 +1,141 @@
+"""
+TacticalTimelineBuilder - Application Layer
+
+Use Case for rolling-window tactical metrics of a stored match.
+Follows "Feature + Action + er" naming convention.
+"""
+from typing import Dict, List, Optional
+import logging
+
+from src.application.use_cases.expected_threat_trainer import ExpectedThreatTrainer
+from src.domain.entities.event import Event, EventType as IngestedEventType
+from src.domain.entities.tactical_match import (
+    TacticalMatch, TacticalTimeline, MatchEvent, EventType
+)
+from src.domain.ports.match_repository import MatchRepository
+from src.domain.ports.xt_grid_store_port import ExpectedThreatGridStore
+
+logger = logging.getLogger(__name__)
+
+
+# Ingested event types that feed tactical metrics (others are ignored)
+EVENT_TYPE_MAP = {
+    IngestedEventType.PASS: EventType.PASS,
+    IngestedEventType.SHOT: EventType.SHOT,
+    IngestedEventType.CARRY: EventType.CARRY,
+    IngestedEventType.DRIBBLE: EventType.DRIBBLE,
+    IngestedEventType.TACKLE: EventType.TACKLE,
+    IngestedEventType.INTERCEPTION: EventType.INTERCEPTION,
+    IngestedEventType.CLEARANCE: EventType.DEFENSIVE_ACTION,
+}
+
+
+class TacticalTimelineBuilder:
+    """
+    Use Case: Build PPDA / pressing / xT time series for a match.
+
+    Orchestrates:
+    1. Loading the match's events via MatchRepository.
+    2. Converting them into a TacticalMatch with home/away teams and
+       the competition's fitted xT grid (standard grid if none).
+       Ingested event coordinates are team-relative (every team attacks
+       towards x = 105, as in StatsBomb data), and the match is told so.
+    3. Computing rolling windows via TacticalMatch.rolling_metrics.
+    """
+
+    def __init__(
+        self,
+        match_repository: MatchRepository,
+        grid_store: Optional[ExpectedThreatGridStore] = None
+    ):
+        """
+        Initialize with injected ports.
+
+        Args:
+            match_repository: Port for reading stored matches
+            grid_store: Optional port for fitted xT grids
+        """
+        self.match_repository = match_repository
+        self.grid_store = grid_store
+
+    def execute(
+        self,
+        match_id: str,
+        window_seconds: float = 300.0,
+        step_seconds: float = 60.0,
+        max_windows: Optional[int] = None
+    ) -> Optional[TacticalTimeline]:
+        """
+        Compute rolling tactical metrics for a stored match.
+
+        Args:
+            match_id: Match identifier
+            window_seconds: Window length in seconds
+            step_seconds: Step between windows in seconds
+            max_windows: Refuse timelines with more windows than this
+
+        Returns:
+            TacticalTimeline, or None if the match does not exist
+
+        Raises:
+            ValueError: If the timeline would exceed max_windows
+        """
+        match = self.match_repository.get_match(match_id)
+        if match is None:
+            return None
+
+        events = self._to_match_events(match.events, match.home_team_id, match.away_team_id)
+        logger.info(f"Building tactical timeline for {match_id} from {len(events)} events")
+        xt_grid = None
+        if self.grid_store is not None:
+            xt_grid = ExpectedThreatTrainer(self.match_repository, self.grid_store).get_grid(
+                match.competition
+            )
+        tactical_match = TacticalMatch(
+            match_id, events, xt_grid=xt_grid, team_relative_coordinates=True
+        )
+        return tactical_match.rolling_metrics(
+            window_seconds, step_seconds, max_windows
+        )
+
+    def _to_match_events(
+        self,
+        events: List[Event],
+        home_team_id: str,
+        away_team_id: str
+    ) -> List[MatchEvent]:
+        """
+        Convert ingested events to "home"/"away" MatchEvents.
+
+        Event team ids may be provider ids rather than the match's team
+        names; those are assigned in order of appearance (the first team
+        to act is home, as in the StatsBomb ingestion).
+        """
+        sides: Dict[Optional[str], str] = {home_team_id: "home", away_team_id: "away"}
+        unassigned = ["home", "away"]
+        result = []
+        for event in events:
+            event_type = EVENT_TYPE_MAP.get(event.event_type)
+            if event_type is None:
+                continue
+            if event.team_id not in sides:
+                sides[event.team_id] = unassigned.pop(0) if unassigned else "unknown"
+            side = sides[event.team_id]
+            if side in unassigned:
+                unassigned.remove(side)
+            end = event.end_coordinates or event.coordinates
+            result.append(MatchEvent(
+                event_id=event.event_id,
+                event_type=event_type,
+                team=side,
+                player_id=event.player_id,
+                minute=int(event.timestamp // 60),
+                timestamp=event.timestamp,
+                x=event.coordinates.x,
+                y=event.coordinates.y,
+                start_x=event.coordinates.x,
+                start_y=event.coordinates.y,
+                end_x=end.x,
+                end_y=end.y
+            ))
+        return result
@@ -39,6 +39,8 @@ class Event:
         player_id: ID of the player who performed the event.
         end_coordinates: End location for events like passes (optional).
         team_id: ID of the team (optional).
+        outcome: Provider outcome, e.g. "Incomplete" for a failed pass or
+            "Goal" for a shot (optional; None for successful passes).
     """
 
     event_id: str
@@ -48,6 +50,7 @@ class Event:
     player_id: str
     end_coordinates: Optional[Coordinates] = None
     team_id: Optional[str] = None
+    outcome: Optional[str] = None
 
     def __repr__(self) -> str:
         return f"Event({self.event_type.value} at {self.timestamp:.1f}s by {self.player_id})"
@@ -138,10 +138,9 @@ class MatchFrame:
         }
     
     def _create_grid(self) -> tuple[np.ndarray, np.ndarray]:
-        """Create spatial grid coordinates."""
-        x = np.linspace(0, self.pitch_length, self.grid_width)
-        y = np.linspace(0, self.pitch_width, self.grid_height)
-        return np.meshgrid(x, y)
+        """Create spatial grid coordinates (shared, cached per resolution)."""
+        from src.domain.services.pitch_control_engine import pitch_grid
+        return pitch_grid(self.pitch_length, self.pitch_width, self.grid_width, self.grid_height)
     
     def _calculate_team_control(
         self,
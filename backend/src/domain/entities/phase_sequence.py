@@ -3,8 +3,12 @@ PhaseSequence Entity - Domain Layer
 
 Rich entity containing a sequence of game phases for a match.
 """
-from dataclasses import dataclass, field
-from typing import List, Tuple, Optional
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
 from src.domain.value_objects.game_phase import GamePhase
 from src.domain.value_objects.phase_features import PhaseFeatures
 
@@ -28,6 +32,96 @@ class PhaseTransition:
 
 
 @dataclass
+class PhaseSegment:
+    """A run of consecutive frames in the same phase."""
+    start_frame: int
+    end_frame: int  # Inclusive
+    phase: GamePhase
+    confidence: float = 1.0  # Mean over the run
+
+
+@dataclass
+class PhaseTimeline:
+    """
+    Phase segments of a sequence (or a frame range of it) for display.
+    
+    Carries the sequence metadata alongside the segments so a timeline
+    can be served without loading per-frame phases.
+    """
+    match_id: str
+    team_id: str
+    fps: float = 25.0
+    total_frames: int = 0
+    segments: List[PhaseSegment] = field(default_factory=list)
+    statistics: dict = field(default_factory=dict)
+    
+    def clip(self, start_frame: int, end_frame: Optional[int] = None) -> "PhaseTimeline":
+        """Segments overlapping [start_frame, end_frame], cut to that range."""
+        last = end_frame if end_frame is not None else float("inf")
+        segments = [
+            PhaseSegment(
+                start_frame=max(seg.start_frame, start_frame),
+                end_frame=min(seg.end_frame, last),
+                phase=seg.phase,
+                confidence=seg.confidence
+            )
+            for seg in self.segments
+            if seg.end_frame >= start_frame and seg.start_frame <= last
+        ]
+        return replace(self, segments=segments)
+    
+    def merged(self, min_frames: int = 1) -> "PhaseTimeline":
+        """
+        Merge adjacent segments of the same phase, bridging frame gaps.
+        
+        Segments shorter than min_frames are absorbed by the segment
+        before them (the first one by the segment after it), which
+        downsamples flickering classifications into a readable timeline.
+        Confidences are frame-weighted means of the merged segments.
+        """
+        kept: List[PhaseSegment] = []
+        # Frames behind each kept segment's confidence, and frames it covers
+        # including absorbed short segments (what min_frames is checked on)
+        weights: List[int] = []
+        spans: List[int] = []
+        for seg in self.segments:
+            length = seg.end_frame - seg.start_frame + 1
+            if kept and seg.phase == kept[-1].phase:
+                last = kept[-1]
+                last.confidence = (
+                    (last.confidence * weights[-1] + seg.confidence * length)
+                    / (weights[-1] + length)
+                )
+                last.end_frame = seg.end_frame
+                weights[-1] += length
+                spans[-1] += length
+            elif kept and length < min_frames:
+                kept[-1].end_frame = seg.end_frame
+                spans[-1] += length
+            else:
+                kept.append(replace(seg))
+                weights.append(length)
+                spans.append(length)
+        
+        if len(kept) > 1 and spans[0] < min_frames:
+            kept[1].start_frame = kept[0].start_frame
+            kept = kept[1:]
+        return replace(self, segments=kept)
+
+
+PHASES: Tuple[GamePhase, ...] = tuple(GamePhase)
+"""Phase code -> GamePhase; a phase's code is its position in this tuple."""
+
+_PHASE_CODE = {phase: code for code, phase in enumerate(PHASES)}
+_UNKNOWN_CODE = _PHASE_CODE[GamePhase.UNKNOWN]
+
+
+def encode_phases(phases: Iterable[GamePhase]) -> np.ndarray:
+    """Encode GamePhases as int8 codes (see PHASES)."""
+    return np.fromiter((_PHASE_CODE[phase] for phase in phases), dtype=np.int8)
+
+
+@dataclass(eq=False)
 class PhaseSequence:
     """
     Rich entity containing phase classifications for a match.
@@ -36,12 +130,105 @@ class PhaseSequence:
     - Storing phase labels per frame
     - Detecting phase transitions
     - Calculating phase statistics
+    
+    Frames are held as parallel NumPy arrays sorted by frame_id (frame
+    ids, phase codes, confidences). Single appends are buffered and merged
+    on the next read, so lookups are binary searches and statistics are
+    vectorized over the whole match.
     """
     
     match_id: str
     team_id: str  # Which team's perspective (home/away)
-    frame_phases: List[FramePhase] = field(default_factory=list)
     fps: float = 25.0
+    _frame_ids: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.int64), init=False, repr=False
+    )
+    _codes: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.int8), init=False, repr=False
+    )
+    _confidences: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.float64), init=False, repr=False
+    )
+    _pending: List[Tuple[int, int, float]] = field(default_factory=list, init=False, repr=False)
+    _features: Dict[int, PhaseFeatures] = field(default_factory=dict, init=False, repr=False)
+    
+    @classmethod
+    def from_arrays(
+        cls,
+        match_id: str,
+        team_id: str,
+        frame_ids: ArrayLike,
+        phases: Union[ArrayLike, Sequence[GamePhase]],
+        confidences: Optional[ArrayLike] = None,
+        fps: float = 25.0,
+    ) -> "PhaseSequence":
+        """
+        Build a sequence from per-frame columns in one go.
+        
+        Args:
+            match_id: Match identifier
+            team_id: Team perspective
+            frame_ids: Frame of each classification (any order)
+            phases: GamePhases, or their int codes (see PHASES)
+            confidences: Confidence per frame (default 1.0)
+            fps: Frames per second
+        """
+        sequence = cls(match_id=match_id, team_id=team_id, fps=fps)
+        frame_ids = np.asarray(frame_ids, dtype=np.int64)
+        phases = list(phases) if not isinstance(phases, np.ndarray) else phases
+        if len(phases) and isinstance(phases[0], GamePhase):
+            codes = encode_phases(phases)
+        else:
+            codes = np.asarray(phases, dtype=np.int8)
+        if confidences is None:
+            confidences = np.ones(len(frame_ids))
+        confidences = np.asarray(confidences, dtype=np.float64)
+        if not len(frame_ids) == len(codes) == len(confidences):
+            raise ValueError("frame_ids, phases and confidences must have the same length")
+        
+        order = np.argsort(frame_ids, kind="stable")
+        sequence._frame_ids = frame_ids[order]
+        sequence._codes = codes[order]
+        sequence._confidences = confidences[order]
+        return sequence
+    
+    @classmethod
+    def from_segments(
+        cls,
+        match_id: str,
+        team_id: str,
+        start_frames: ArrayLike,
+        end_frames: ArrayLike,
+        phases: Union[ArrayLike, Sequence[GamePhase]],
+        confidences: Optional[ArrayLike] = None,
+        fps: float = 25.0,
+    ) -> "PhaseSequence":
+        """
+        Expand run-length segments (see segment_arrays) back into frames.
+        
+        Every frame of a segment gets the segment's phase and mean
+        confidence.
+        """
+        start_frames = np.asarray(start_frames, dtype=np.int64)
+        lengths = np.asarray(end_frames, dtype=np.int64) - start_frames + 1
+        if np.any(lengths < 1):
+            raise ValueError("Segments must end at or after their start frame")
+        if confidences is None:
+            confidences = np.ones(len(start_frames))
+        phases = list(phases) if not isinstance(phases, np.ndarray) else phases
+        if len(phases) and isinstance(phases[0], GamePhase):
+            phases = encode_phases(phases)
+        
+        # frame = segment start + offset within the segment
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return cls.from_arrays(
+            match_id=match_id,
+            team_id=team_id,
+            frame_ids=np.repeat(start_frames, lengths) + offsets,
+            phases=np.repeat(np.asarray(phases, dtype=np.int8), lengths),
+            confidences=np.repeat(np.asarray(confidences, dtype=np.float64), lengths),
+            fps=fps,
+        )
     
     def add_frame_phase(
         self, 
@@ -51,53 +238,123 @@ class PhaseSequence:
         features: Optional[PhaseFeatures] = None
     ) -> None:
         """Add a phase classification for a frame."""
-        self.frame_phases.append(FramePhase(
-            frame_id=frame_id,
-            phase=phase,
-            confidence=confidence,
-            features=features
-        ))
-        # Keep sorted by frame_id
-        self.frame_phases.sort(key=lambda fp: fp.frame_id)
+        self._pending.append((frame_id, _PHASE_CODE[phase], confidence))
+        if features is not None:
+            self._features[frame_id] = features
+    
+    def _merge_pending(self) -> None:
+        """Fold buffered appends into the sorted arrays (stable, so ties keep insertion order)."""
+        if not self._pending:
+            return
+        frame_ids, codes, confidences = zip(*self._pending)
+        self._pending = []
+        frame_ids = np.concatenate([self._frame_ids, np.asarray(frame_ids, dtype=np.int64)])
+        codes = np.concatenate([self._codes, np.asarray(codes, dtype=np.int8)])
+        confidences = np.concatenate([self._confidences, np.asarray(confidences, dtype=np.float64)])
+        order = np.argsort(frame_ids, kind="stable")
+        self._frame_ids = frame_ids[order]
+        self._codes = codes[order]
+        self._confidences = confidences[order]
+    
+    @property
+    def frame_ids(self) -> np.ndarray:
+        """Sorted frame ids (read-only view)."""
+        self._merge_pending()
+        return self._readonly(self._frame_ids)
+    
+    @property
+    def phase_codes(self) -> np.ndarray:
+        """Phase code per frame, aligned with frame_ids (see PHASES)."""
+        self._merge_pending()
+        return self._readonly(self._codes)
+    
+    @property
+    def confidences(self) -> np.ndarray:
+        """Confidence per frame, aligned with frame_ids."""
+        self._merge_pending()
+        return self._readonly(self._confidences)
+    
+    @property
+    def frame_phases(self) -> List[FramePhase]:
+        """All frames as FramePhase objects, sorted by frame_id."""
+        return self._frame_phases(0, len(self))
     
     def get_phase_at_frame(self, frame_id: int) -> GamePhase:
         """Get the phase at a specific frame."""
-        for fp in self.frame_phases:
-            if fp.frame_id == frame_id:
-                return fp.phase
+        frame_ids = self.frame_ids
+        idx = int(np.searchsorted(frame_ids, frame_id, side="left"))
+        if idx < len(frame_ids) and frame_ids[idx] == frame_id:
+            return PHASES[self._codes[idx]]
         return GamePhase.UNKNOWN
     
     def get_phases_in_range(self, start_frame: int, end_frame: int) -> List[FramePhase]:
         """Get all frame phases in a range."""
-        return [
-            fp for fp in self.frame_phases 
-            if start_frame <= fp.frame_id <= end_frame
-        ]
+        frame_ids = self.frame_ids
+        start = int(np.searchsorted(frame_ids, start_frame, side="left"))
+        stop = int(np.searchsorted(frame_ids, end_frame, side="right"))
+        return self._frame_phases(start, stop)
     
     def calculate_phase_transitions(self) -> List[PhaseTransition]:
         """
         Detect all phase transitions in the sequence.
         
+        UNKNOWN frames (other than the first) are skipped, so the phase
+        either side of an UNKNOWN gap is compared directly.
+        
         Returns:
             List of PhaseTransition objects
         """
-        if len(self.frame_phases) < 2:
+        codes = self.phase_codes
+        if len(codes) < 2:
             return []
         
-        transitions = []
-        prev_phase = self.frame_phases[0].phase
+        known = np.concatenate([[0], np.flatnonzero(codes[1:] != _UNKNOWN_CODE) + 1])
+        known_codes = codes[known]
+        changes = np.flatnonzero(known_codes[1:] != known_codes[:-1]) + 1
         
-        for fp in self.frame_phases[1:]:
-            if fp.phase != prev_phase and fp.phase != GamePhase.UNKNOWN:
-                transitions.append(PhaseTransition(
-                    frame_id=fp.frame_id,
-                    from_phase=prev_phase,
-                    to_phase=fp.phase,
-                    timestamp=fp.frame_id / self.fps
-                ))
-                prev_phase = fp.phase
+        return [
+            PhaseTransition(
+                frame_id=int(self._frame_ids[known[i]]),
+                from_phase=PHASES[known_codes[i - 1]],
+                to_phase=PHASES[known_codes[i]],
+                timestamp=float(self._frame_ids[known[i]] / self.fps)
+            )
+            for i in changes
+        ]
+    
+    def segment_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Run-length encode the sequence.
         
-        return transitions
+        A segment is a maximal run of frames with consecutive ids and the
+        same phase, so from_segments restores the frames and phases
+        exactly (confidences become the run mean).
+        
+        Returns:
+            (start_frames, end_frames, phase_codes, mean_confidences)
+        """
+        frame_ids, codes = self.frame_ids, self._codes
+        if len(frame_ids) == 0:
+            return (
+                np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64),
+                np.empty(0, dtype=np.int8), np.empty(0, dtype=np.float64)
+            )
+        
+        breaks = (np.diff(frame_ids) != 1) | (codes[1:] != codes[:-1])
+        starts = np.concatenate([[0], np.flatnonzero(breaks) + 1])
+        ends = np.append(starts[1:], len(frame_ids)) - 1
+        mean_confidences = np.add.reduceat(self._confidences, starts) / (ends - starts + 1)
+        return frame_ids[starts], frame_ids[ends], codes[starts], mean_confidences
+    
+    def to_segments(self) -> List[PhaseSegment]:
+        """Run-length segments as PhaseSegment objects."""
+        starts, ends, codes, confidences = self.segment_arrays()
+        return [
+            PhaseSegment(start_frame=start, end_frame=end, phase=PHASES[code], confidence=confidence)
+            for start, end, code, confidence in zip(
+                starts.tolist(), ends.tolist(), codes.tolist(), confidences.tolist()
+            )
+        ]
     
     def get_phase_durations(self) -> dict[GamePhase, float]:
         """
@@ -106,22 +363,14 @@ class PhaseSequence:
         Returns:
             Dict mapping GamePhase to seconds
         """
-        durations: dict[GamePhase, float] = {phase: 0.0 for phase in GamePhase}
-        
-        if not self.frame_phases:
-            return durations
-        
-        for i in range(len(self.frame_phases) - 1):
-            current = self.frame_phases[i]
-            next_frame = self.frame_phases[i + 1]
-            frame_duration = (next_frame.frame_id - current.frame_id) / self.fps
-            durations[current.phase] += frame_duration
-        
-        # Add last frame duration (assume 1 frame)
-        if self.frame_phases:
-            durations[self.frame_phases[-1].phase] += 1.0 / self.fps
+        frame_ids = self.frame_ids
+        if len(frame_ids) == 0:
+            return {phase: 0.0 for phase in GamePhase}
         
-        return durations
+        # Each frame lasts until the next one; the last frame lasts 1 frame
+        frame_durations = np.append(np.diff(frame_ids), 1) / self.fps
+        totals = np.bincount(self._codes, weights=frame_durations, minlength=len(PHASES))
+        return {phase: float(totals[code]) for code, phase in enumerate(PHASES)}
     
     def get_phase_percentages(self) -> dict[GamePhase, float]:
         """
@@ -158,7 +407,30 @@ class PhaseSequence:
         return len(self.calculate_phase_transitions())
     
     def __len__(self) -> int:
-        return len(self.frame_phases)
+        return len(self._frame_ids) + len(self._pending)
+    
+    def _frame_phases(self, start: int, stop: int) -> List[FramePhase]:
+        """FramePhase objects for the sorted positions [start, stop)."""
+        self._merge_pending()
+        return [
+            FramePhase(
+                frame_id=frame_id,
+                phase=PHASES[code],
+                confidence=confidence,
+                features=self._features.get(frame_id)
+            )
+            for frame_id, code, confidence in zip(
+                self._frame_ids[start:stop].tolist(),
+                self._codes[start:stop].tolist(),
+                self._confidences[start:stop].tolist(),
+            )
+        ]
+    
+    @staticmethod
+    def _readonly(array: np.ndarray) -> np.ndarray:
+        view = array.view()
+        view.flags.writeable = False
+        return view
     
     def __repr__(self) -> str:
         return f"PhaseSequence(match={self.match_id}, frames={len(self)})"
@@ -7,6 +7,10 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from enum import Enum
 
+import numpy as np
+
+from src.domain.value_objects.event_table import EventTable
+
 
 class EventType(Enum):
     """Event types for tactical analysis."""
@@ -79,6 +83,39 @@ class XTChainResult:
     average_xt_per_action: float
 
 
+@dataclass
+class TacticalMetrics:
+    """Value object bundling every tactical metric of a match (per team)."""
+    ppda: Dict[str, PPDAResult]
+    pressing: Dict[str, PressureMetrics]
+    xt: Dict[str, XTChainResult]
+
+
+@dataclass
+class TacticalTimeline:
+    """
+    Value object for rolling-window tactical metrics.
+    
+    Window i covers timestamps in [window_start[i], window_end[i]).
+    Per-team arrays are aligned with the windows; ppda is inf where the
+    team made no defensive action.
+    """
+    window_start: np.ndarray  # (W,) seconds
+    window_end: np.ndarray  # (W,) seconds
+    passes_allowed: Dict[str, np.ndarray]  # opponent passes in attacking 2/3
+    defensive_actions: Dict[str, np.ndarray]
+    ppda: Dict[str, np.ndarray]
+    pressing: Dict[str, np.ndarray]  # (W, 3): defensive, middle, attacking third
+    xt: Dict[str, np.ndarray]  # xT gained by progressive actions
+
+
+PROGRESSIVE_EVENT_TYPES = (EventType.PASS, EventType.CARRY, EventType.DRIBBLE, EventType.SHOT)
+DEFENSIVE_EVENT_TYPES = (
+    EventType.DEFENSIVE_ACTION, EventType.TACKLE, EventType.INTERCEPTION, EventType.PRESSURE
+)
+PRESSURE_EVENT_TYPES = (EventType.PRESSURE, EventType.DEFENSIVE_ACTION, EventType.TACKLE)
+
+
 class TacticalMatch:
     """
     Rich domain entity for tactical match analysis.
@@ -93,7 +130,9 @@ class TacticalMatch:
         events: List[MatchEvent],
         home_team: str = "home",
         away_team: str = "away",
-        pitch_length: float = 105.0
+        pitch_length: float = 105.0,
+        xt_grid=None,
+        team_relative_coordinates: bool = False
     ):
         """
         Initialize tactical match.
@@ -104,6 +143,12 @@ class TacticalMatch:
             home_team: Home team identifier
             away_team: Away team identifier
             pitch_length: Pitch length for zone calculations
+            xt_grid: Optional ExpectedThreatGrid (e.g. fitted for the
+                competition); defaults to the standard 12x8 grid
+            team_relative_coordinates: Every team's events are given as if
+                it attacked towards x = pitch_length (event providers such
+                as StatsBomb). False: absolute coordinates, home attacking
+                towards x = pitch_length and away the other way (tracking)
         """
         self.match_id = match_id
         self.events = events
@@ -111,9 +156,23 @@ class TacticalMatch:
         self.away_team = away_team
         self.pitch_length = pitch_length
         self.third_length = pitch_length / 3.0
+        self.team_relative_coordinates = team_relative_coordinates
         
         # Lazy-loaded xT grid
-        self._xt_grid = None
+        self._xt_grid = xt_grid
+        
+        # Columnar view of self.events, rebuilt when the list changes
+        self._event_table: Optional[EventTable] = None
+        self._event_table_key = None
+    
+    @property
+    def event_table(self) -> EventTable:
+        """Columnar, indexed view of the events (built lazily)."""
+        key = (id(self.events), len(self.events))
+        if self._event_table is None or self._event_table_key != key:
+            self._event_table = EventTable.from_events(self.events, EventType)
+            self._event_table_key = key
+        return self._event_table
     
     @property
     def xt_grid(self):
@@ -136,42 +195,7 @@ class TacticalMatch:
         Returns:
             XTChainResult with annotated events and totals
         """
-        progressive_events = {EventType.PASS, EventType.CARRY, EventType.DRIBBLE, EventType.SHOT}
-        
-        xt_events = []
-        total_xt = 0.0
-        
-        for event in self.events:
-            if event.team != team or event.event_type not in progressive_events:
-                continue
-            
-            # Get xT values at start and end positions
-            start_xt = self.xt_grid.get_threat_at_pitch_location(
-                event.start_x, event.start_y
-            )
-            end_xt = self.xt_grid.get_threat_at_pitch_location(
-                event.end_x, event.end_y
-            )
-            xt_change = end_xt - start_xt
-            
-            xt_events.append(XTEvent(
-                event_id=event.event_id,
-                event_type=event.event_type,
-                player_id=event.player_id,
-                start_xt=start_xt,
-                end_xt=end_xt,
-                xt_change=xt_change
-            ))
-            
-            total_xt += xt_change
-        
-        avg_xt = total_xt / len(xt_events) if xt_events else 0.0
-        
-        return XTChainResult(
-            events=xt_events,
-            total_xt=total_xt,
-            average_xt_per_action=avg_xt
-        )
+        return self._xt_chain(self.event_table.rows(team, PROGRESSIVE_EVENT_TYPES))
     
     def calculate_ppda(self, defending_team: str, attacking_team: str) -> PPDAResult:
         """
@@ -186,27 +210,16 @@ class TacticalMatch:
         Returns:
             PPDAResult with PPDA metric
         """
+        table = self.event_table
+        
         # Count opposition passes in attacking 2/3
-        passes_allowed = sum(
-            1 for e in self.events
-            if (e.team == attacking_team and
-                e.event_type == EventType.PASS and
-                self._in_attacking_two_thirds(e.x or e.start_x, attacking_team))
-        )
+        passes = table.rows(attacking_team, (EventType.PASS,))
+        passes_allowed = int(np.count_nonzero(
+            self._in_attacking_two_thirds_mask(table.x[passes], attacking_team)
+        ))
         
         # Count defensive actions
-        defensive_event_types = {
-            EventType.DEFENSIVE_ACTION,
-            EventType.TACKLE,
-            EventType.INTERCEPTION,
-            EventType.PRESSURE
-        }
-        
-        defensive_actions = sum(
-            1 for e in self.events
-            if (e.team == defending_team and
-                e.event_type in defensive_event_types)
-        )
+        defensive_actions = len(table.rows(defending_team, DEFENSIVE_EVENT_TYPES))
         
         ppda = float('inf') if defensive_actions == 0 else passes_allowed / defensive_actions
         
@@ -226,27 +239,11 @@ class TacticalMatch:
         Returns:
             PressureMetrics with zone breakdown
         """
-        pressure_types = {
-            EventType.PRESSURE,
-            EventType.DEFENSIVE_ACTION,
-            EventType.TACKLE
-        }
-        
-        defensive_third = 0
-        middle_third = 0
-        attacking_third = 0
-        
-        for event in self.events:
-            if event.team != team or event.event_type not in pressure_types:
-                continue
-            
-            zone = self._get_zone(event.x or event.start_x)
-            if zone == "defensive":
-                defensive_third += 1
-            elif zone == "middle":
-                middle_third += 1
-            elif zone == "attacking":
-                attacking_third += 1
+        table = self.event_table
+        rows = table.rows(team, PRESSURE_EVENT_TYPES)
+        defensive_third, middle_third, attacking_third = np.bincount(
+            self._zone_index(table.x[rows]), minlength=3
+        ).tolist()
         
         return PressureMetrics(
             defensive_third_presses=defensive_third,
@@ -255,21 +252,243 @@ class TacticalMatch:
             total_presses=defensive_third + middle_third + attacking_third
         )
     
+    def compute_all(self) -> TacticalMetrics:
+        """
+        Compute PPDA, pressing by thirds and xT for both teams at once.
+        
+        Counts come from one bincount per metric over the whole event
+        table (keyed by team code) instead of one scan per metric and team.
+        
+        Returns:
+            TacticalMetrics keyed by home/away team
+        """
+        table = self.event_table
+        teams = (self.home_team, self.away_team)
+        n_teams = len(table.teams)
+        
+        def per_team(rows: np.ndarray, mask: Optional[np.ndarray] = None) -> np.ndarray:
+            codes = table.team_code[rows] if mask is None else table.team_code[rows][mask]
+            return np.bincount(codes, minlength=n_teams)
+        
+        # PPDA: passes in each team's attacking 2/3, defensive actions per team
+        passes = table.rows(types=(EventType.PASS,))
+        home_code = table.team_code_of(self.home_team)
+        in_two_thirds = np.where(
+            (table.team_code[passes] == home_code) | self.team_relative_coordinates,
+            table.x[passes] > self.third_length,
+            table.x[passes] < 2 * self.third_length
+        )
+        passes_in_two_thirds = per_team(passes, in_two_thirds)
+        defensive_actions = per_team(table.rows(types=DEFENSIVE_EVENT_TYPES))
+        
+        # Pressing: (team, zone) counts in one bincount
+        presses = table.rows(types=PRESSURE_EVENT_TYPES)
+        zone_counts = np.bincount(
+            table.team_code[presses] * 3 + self._zone_index(table.x[presses]),
+            minlength=n_teams * 3
+        ).reshape(n_teams, 3)
+        
+        # xT: deltas of all progressive events at once
+        progressive = table.rows(types=PROGRESSIVE_EVENT_TYPES)
+        xt_chains = self._xt_chains(progressive)
+        
+        ppda, pressing, xt = {}, {}, {}
+        for team, opponent in (teams, teams[::-1]):
+            code = table.team_code_of(team)
+            opponent_code = table.team_code_of(opponent)
+            allowed = int(passes_in_two_thirds[opponent_code]) if opponent_code >= 0 else 0
+            actions = int(defensive_actions[code]) if code >= 0 else 0
+            ppda[team] = PPDAResult(
+                passes_allowed=allowed,
+                defensive_actions=actions,
+                ppda=float('inf') if actions == 0 else allowed / actions
+            )
+            zones = zone_counts[code].tolist() if code >= 0 else [0, 0, 0]
+            pressing[team] = PressureMetrics(
+                defensive_third_presses=zones[0],
+                middle_third_presses=zones[1],
+                attacking_third_presses=zones[2],
+                total_presses=sum(zones)
+            )
+            xt[team] = xt_chains.get(team, XTChainResult(events=[], total_xt=0.0, average_xt_per_action=0.0))
+        
+        return TacticalMetrics(ppda=ppda, pressing=pressing, xt=xt)
+    
+    def rolling_metrics(
+        self,
+        window_seconds: float = 300.0,
+        step_seconds: float = 60.0,
+        max_windows: Optional[int] = None
+    ) -> TacticalTimeline:
+        """
+        PPDA, pressing by thirds and xT over sliding time windows.
+        
+        Events are sorted by timestamp once; every metric is then a
+        cumulative sum over the sorted rows, and each window's value is the
+        difference of two prefix sums found by binary search. Cost is
+        O(n log n + windows) instead of one full pass per window.
+        
+        Args:
+            window_seconds: Window length (e.g. 300 = 5 minutes)
+            step_seconds: Offset between consecutive windows (e.g. 60)
+            max_windows: Refuse timelines with more windows than this
+            
+        Returns:
+            TacticalTimeline for home and away teams
+            
+        Raises:
+            ValueError: On non-positive lengths or too many windows
+        """
+        if window_seconds <= 0 or step_seconds <= 0:
+            raise ValueError("window_seconds and step_seconds must be positive")
+        
+        table = self.event_table
+        order = np.argsort(table.timestamp, kind="stable")
+        timestamps = table.timestamp[order]
+        team_code = table.team_code[order]
+        type_code = table.type_code[order]
+        x = table.x[order]
+        
+        # Windows from kick-off until the last event is covered
+        last = float(timestamps[-1]) if len(timestamps) else 0.0
+        n_windows = int(np.floor(max(last - window_seconds, 0.0) / step_seconds)) + 1
+        if (n_windows - 1) * step_seconds + window_seconds <= last:
+            n_windows += 1
+        if max_windows is not None and n_windows > max_windows:
+            raise ValueError(
+                f"Timeline needs {n_windows} windows (max {max_windows}); increase step_seconds"
+            )
+        window_start = np.arange(n_windows) * float(step_seconds)
+        window_end = window_start + window_seconds
+        lo = np.searchsorted(timestamps, window_start, side="left")
+        hi = np.searchsorted(timestamps, window_end, side="left")
+        
+        def windowed(values: np.ndarray) -> np.ndarray:
+            prefix = np.concatenate(([0], np.cumsum(values)))
+            return prefix[hi] - prefix[lo]
+        
+        is_pass = type_code == table.type_codes((EventType.PASS,))[0]
+        is_defensive = np.isin(type_code, table.type_codes(DEFENSIVE_EVENT_TYPES))
+        is_pressure = np.isin(type_code, table.type_codes(PRESSURE_EVENT_TYPES))
+        is_progressive = np.isin(type_code, table.type_codes(PROGRESSIVE_EVENT_TYPES))
+        zone = self._zone_index(x)
+        
+        xt_delta = np.zeros(len(order))
+        rows = order[is_progressive]
+        start_xt, end_xt = self._xt_lookup(rows)
+        xt_delta[is_progressive] = end_xt - start_xt
+        
+        teams = (self.home_team, self.away_team)
+        passes_in_two_thirds = {}
+        timeline = TacticalTimeline(
+            window_start=window_start,
+            window_end=window_end,
+            passes_allowed={},
+            defensive_actions={},
+            ppda={},
+            pressing={},
+            xt={}
+        )
+        for team in teams:
+            is_team = team_code == table.team_code_of(team)
+            passes_in_two_thirds[team] = windowed(
+                is_team & is_pass & self._in_attacking_two_thirds_mask(x, team)
+            )
+            timeline.defensive_actions[team] = windowed(is_team & is_defensive)
+            timeline.pressing[team] = np.column_stack([
+                windowed(is_team & is_pressure & (zone == z)) for z in range(3)
+            ])
+            timeline.xt[team] = windowed(np.where(is_team, xt_delta, 0.0))
+        
+        for team, opponent in (teams, teams[::-1]):
+            allowed = passes_in_two_thirds[opponent]
+            actions = timeline.defensive_actions[team]
+            timeline.passes_allowed[team] = allowed
+            with np.errstate(divide="ignore", invalid="ignore"):
+                timeline.ppda[team] = np.where(actions > 0, allowed / np.maximum(actions, 1), np.inf)
+        
+        return timeline
+    
     def get_events_by_type(self, event_type: EventType) -> List[MatchEvent]:
         """Filter events by type."""
-        return [e for e in self.events if e.event_type == event_type]
+        return [self.events[i] for i in self.event_table.rows(types=(event_type,))]
     
     def get_events_by_team(self, team: str) -> List[MatchEvent]:
         """Filter events by team."""
-        return [e for e in self.events if e.team == team]
+        return [self.events[i] for i in self.event_table.rows(team)]
     
     def _in_attacking_two_thirds(self, x: float, team: str) -> bool:
         """Check if position is in attacking 2/3 of pitch."""
-        if team == self.home_team:
+        if team == self.home_team or self.team_relative_coordinates:
             return x > self.third_length
         else:
             return x < (2 * self.third_length)
     
+    def _in_attacking_two_thirds_mask(self, x: np.ndarray, team: str) -> np.ndarray:
+        """Vectorized _in_attacking_two_thirds for one team."""
+        if team == self.home_team or self.team_relative_coordinates:
+            return x > self.third_length
+        return x < (2 * self.third_length)
+    
+    def _zone_index(self, x: np.ndarray) -> np.ndarray:
+        """Vectorized _get_zone: 0 defensive, 1 middle, 2 attacking."""
+        return np.searchsorted(
+            np.array([self.third_length, 2 * self.third_length]), x, side="right"
+        )
+    
+    def _xt_chain(self, rows: np.ndarray) -> XTChainResult:
+        """xT chain result for the events at `rows` (all of one team)."""
+        start_xt, end_xt = self._xt_lookup(rows)
+        return self._xt_result(rows, start_xt, end_xt)
+    
+    def _xt_chains(self, rows: np.ndarray) -> Dict[str, XTChainResult]:
+        """xT chain results of every team, from one lookup over `rows`."""
+        start_xt, end_xt = self._xt_lookup(rows)
+        team_codes = self.event_table.team_code[rows]
+        results = {}
+        for code, team in enumerate(self.event_table.teams):
+            mask = team_codes == code
+            results[team] = self._xt_result(rows[mask], start_xt[mask], end_xt[mask])
+        return results
+    
+    def _xt_lookup(self, rows: np.ndarray):
+        """Grid xT at the start and end locations of the events at `rows`."""
+        table = self.event_table
+        return (
+            self.xt_grid.get_threat_at_pitch_locations(table.start_x[rows], table.start_y[rows]),
+            self.xt_grid.get_threat_at_pitch_locations(table.end_x[rows], table.end_y[rows])
+        )
+    
+    def _xt_result(
+        self,
+        rows: np.ndarray,
+        start_xt: np.ndarray,
+        end_xt: np.ndarray
+    ) -> XTChainResult:
+        """Annotate the events at `rows` with their xT values."""
+        xt_events = []
+        total_xt = 0.0
+        for i, start, end in zip(rows.tolist(), start_xt.tolist(), end_xt.tolist()):
+            event = self.events[i]
+            xt_change = end - start
+            xt_events.append(XTEvent(
+                event_id=event.event_id,
+                event_type=event.event_type,
+                player_id=event.player_id,
+                start_xt=start,
+                end_xt=end,
+                xt_change=xt_change
+            ))
+            total_xt += xt_change
+        
+        avg_xt = total_xt / len(xt_events) if xt_events else 0.0
+        
+        return XTChainResult(
+            events=xt_events,
+            total_xt=total_xt,
+            average_xt_per_action=avg_xt
+        )
+    
     def _get_zone(self, x: float) -> str:
         """Get pitch zone (defensive/middle/attacking third)."""
         if x < self.third_length:
@@ -0,0 +1,66 @@
+"""
+LeaguePatternModelPort - Domain Layer
+
+Port for a pattern clustering model shared by every match of a league.
+"""
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+import numpy as np
+
+
+class LeaguePatternModelPort(ABC):
+    """
+    Abstract interface for incremental league-level pattern clustering.
+    
+    Unlike PatternDetectorPort, which refits per match, the model is
+    updated match by match and keeps its cluster identities, so a
+    cluster label means the same pattern in every match. It remembers
+    which matches it learned from, so none is fed twice.
+    """
+    
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """Number of updates applied so far (0 = not fitted)."""
+        ...
+    
+    @property
+    @abstractmethod
+    def n_clusters(self) -> int:
+        """Number of league patterns."""
+        ...
+    
+    @abstractmethod
+    def is_fitted(self) -> bool:
+        """Check whether the model can assign sequences."""
+        ...
+    
+    @abstractmethod
+    def partial_fit(self, features: np.ndarray, match_ids: Sequence[str] = ()) -> None:
+        """
+        Update the clusters with a batch of sequence feature vectors.
+        
+        Args:
+            features: (n_sequences, n_features) SequenceFeatures vectors
+            match_ids: Matches the batch came from, recorded as seen
+        """
+        ...
+    
+    @abstractmethod
+    def has_seen(self, match_id: str) -> bool:
+        """Check whether a match's sequences were already used to update the clusters."""
+        ...
+    
+    @abstractmethod
+    def assign(self, features: np.ndarray) -> np.ndarray:
+        """
+        Assign sequences to existing clusters without changing them.
+        
+        Args:
+            features: (n_sequences, n_features) SequenceFeatures vectors
+            
+        Returns:
+            (n_sequences,) cluster labels
+        """
+        ...
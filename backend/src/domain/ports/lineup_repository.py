@@ -4,7 +4,7 @@ LineupRepository Port - Domain Layer
 Abstract interface for lineup persistence.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 
 
@@ -38,6 +38,14 @@ class LineupRepository(ABC):
         """
         ...
     
+    def get_lineup(self, match_id: str) -> Dict[int, PlayerMappingDTO]:
+        """
+        Get all player mappings for a match keyed by track ID.
+        
+        Implementations may serve this from a cache.
+        """
+        return {m.track_id: m for m in self.get_mappings(match_id)}
+    
     @abstractmethod
     def get_player_name(self, match_id: str, track_id: int) -> Optional[str]:
         """
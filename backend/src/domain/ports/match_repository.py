@@ -6,7 +6,7 @@ This is a Domain Port and MUST NOT import any external libraries.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 from src.domain.entities.match import Match
 
@@ -41,3 +41,32 @@ class MatchRepository(ABC):
             match: The Match aggregate to save.
         """
         ...
+
+    def list_match_ids(self, competition: Optional[str] = None) -> List[str]:
+        """
+        List stored match identifiers, optionally for one competition.
+
+        Only persistent repositories support listing; read-only provider
+        adapters keep this default.
+
+        Args:
+            competition: Competition name to filter by.
+
+        Returns:
+            Match identifiers.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support listing matches")
+
+    def get_competition(self, match_id: str) -> Optional[str]:
+        """
+        Competition of a stored match, without loading its events where
+        the adapter can avoid it.
+
+        Args:
+            match_id: Unique identifier for the match.
+
+        Returns:
+            Competition name, or None if unknown or the match is missing.
+        """
+        match = self.get_match(match_id)
+        return match.competition if match else None
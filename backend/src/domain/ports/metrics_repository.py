@@ -4,7 +4,7 @@ Metrics Repository Port - Domain Layer
 Interface for persisting tactical metrics (Ports & Adapters pattern).
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Dict, List
 import numpy as np
 
 
@@ -51,6 +51,43 @@ class MetricsRepository(ABC):
         """Save PPDA metrics for a team."""
         pass
 
+    def save_physical_stats_bulk(self, match_id: str, rows: List[Dict[str, Any]]) -> None:
+        """
+        Save physical statistics for many players of one match.
+        
+        Each row holds player_id, total_distance, max_speed, sprint_count
+        and avg_speed. Adapters should override this with a single
+        round-trip; the default falls back to one save per row.
+        """
+        for row in rows:
+            self.save_physical_stats(match_id=match_id, **row)
+    
+    def save_ppda_bulk(self, match_id: str, rows: List[Dict[str, Any]]) -> None:
+        """
+        Save PPDA metrics for several teams of one match.
+        
+        Each row holds team_id, passes_allowed, defensive_actions and ppda.
+        The default falls back to one save per row.
+        """
+        for row in rows:
+            self.save_ppda(match_id=match_id, **row)
+    
+    def save_match_metrics_bulk(
+        self,
+        match_id: str,
+        physical_rows: List[Dict[str, Any]],
+        ppda_rows: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Save a match's physical stats and PPDA together.
+        
+        Adapters with transactions should commit both or neither, so a
+        failure never leaves new physical stats next to stale PPDA. The
+        default saves them one after the other.
+        """
+        self.save_physical_stats_bulk(match_id, physical_rows)
+        self.save_ppda_bulk(match_id, ppda_rows)
+
     # --- Read Methods ---
     
     @abstractmethod
@@ -0,0 +1,43 @@
+"""
+MetricsStateStore Port - Domain Layer
+
+Interface for persisting running metrics state (Ports & Adapters pattern).
+
+The state lets metrics be updated block by block as tracking data is
+appended, instead of recomputing from the full match each time.
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.domain.value_objects.metrics_state import MetricsState
+
+
+class MetricsStateStore(ABC):
+    """
+    Port (interface) for running metrics state persistence.
+    
+    Infrastructure layer will provide concrete implementation.
+    """
+    
+    @abstractmethod
+    def get_state(self, match_id: str) -> Optional[MetricsState]:
+        """
+        Load the running state of a match.
+        
+        Args:
+            match_id: Match identifier
+            
+        Returns:
+            MetricsState, or None if nothing was processed yet
+        """
+        pass
+    
+    @abstractmethod
+    def save_state(self, state: MetricsState) -> None:
+        """
+        Save (replace) the running state of a match.
+        
+        Args:
+            state: State to persist
+        """
+        pass
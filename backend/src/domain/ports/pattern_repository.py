@@ -17,12 +17,31 @@ class PatternRepository(ABC):
     """
     
     @abstractmethod
-    def save_patterns(self, patterns: List[TacticalPattern]) -> None:
+    def save_patterns(self, match_id: str, team_id: str, patterns: List[TacticalPattern]) -> None:
         """
-        Save discovered patterns.
+        Replace the patterns of a match and team with a detection result.
+        
+        An empty list clears earlier patterns; either way the run is
+        recorded as completed.
+        
+        Args:
+            match_id: Match identifier
+            team_id: Team the patterns were detected for
+            patterns: List of TacticalPattern entities (may be empty)
+        """
+        ...
+    
+    @abstractmethod
+    def has_detected(self, match_id: str, team_id: str) -> bool:
+        """
+        Whether a detection run has completed for a match and team.
         
         Args:
-            patterns: List of TacticalPattern entities
+            match_id: Match identifier
+            team_id: Team identifier
+            
+        Returns:
+            True once save_patterns ran for them, even with no patterns
         """
         ...
     
@@ -0,0 +1,70 @@
+"""
+PatternUsageRepository - Domain Layer
+
+Port for per-match league pattern usage.
+"""
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from src.domain.value_objects.pattern_usage import PatternUsage
+
+
+class PatternUsageRepository(ABC):
+    """
+    Abstract interface for league pattern usage storage.
+    
+    Usage is stored per match so a match can be re-assigned on its own;
+    reads aggregate over the requested matches.
+    """
+    
+    @abstractmethod
+    def save_match_usage(self, match_id: str, model_version: int, usages: List[PatternUsage]) -> None:
+        """
+        Replace the stored usage of a match.
+        
+        Args:
+            match_id: Match identifier
+            model_version: League model version the sequences were assigned with
+            usages: One PatternUsage per (team, cluster) seen in the match
+        """
+        ...
+    
+    @abstractmethod
+    def get_team_usage(
+        self,
+        team_id: str,
+        competition: Optional[str] = None,
+        season: Optional[str] = None
+    ) -> List[PatternUsage]:
+        """
+        A team's usage of every league pattern, summed over its matches.
+        
+        Args:
+            team_id: Team identifier
+            competition: Optional competition filter
+            season: Optional season filter
+            
+        Returns:
+            One PatternUsage per cluster, most used first
+        """
+        ...
+    
+    @abstractmethod
+    def get_pattern_usage(
+        self,
+        cluster_label: int,
+        competition: Optional[str] = None,
+        season: Optional[str] = None
+    ) -> List[PatternUsage]:
+        """
+        Every team's usage of one league pattern, summed over matches.
+        
+        Args:
+            cluster_label: League pattern
+            competition: Optional competition filter
+            season: Optional season filter
+            
+        Returns:
+            One PatternUsage per team, most used first
+        """
+        ...
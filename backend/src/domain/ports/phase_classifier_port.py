@@ -4,12 +4,15 @@ PhaseClassifierPort - Domain Layer
 Interface for ML-based phase classification.
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Callable, Iterable, List, Tuple
 import numpy as np
 
 from src.domain.value_objects.game_phase import GamePhase
 from src.domain.value_objects.phase_features import PhaseFeatures
 
+# Re-iterable source of (features, labels) training batches
+TrainingBatches = Callable[[], Iterable[Tuple[np.ndarray, List[GamePhase]]]]
+
 
 class PhaseClassifierPort(ABC):
     """
@@ -60,6 +63,52 @@ class PhaseClassifierPort(ABC):
         """
         pass
     
+    def classify_batch_with_confidence(
+        self, features: np.ndarray
+    ) -> Tuple[List[GamePhase], np.ndarray]:
+        """
+        Classify a feature matrix with confidence scores in one call.
+        
+        The default falls back to classify_with_confidence row by row;
+        adapters that can score a whole matrix at once should override it.
+        
+        Args:
+            features: 2D numpy array of shape (n_samples, n_features)
+            
+        Returns:
+            Tuple of (predicted GamePhases, float64 confidences 0-1)
+        """
+        results = [
+            self.classify_with_confidence(PhaseFeatures.from_vector(row))
+            for row in features
+        ]
+        phases = [phase for phase, _ in results]
+        confidences = np.array([confidence for _, confidence in results], dtype=np.float64)
+        return phases, confidences
+    
+    def classify_proba(self, features: np.ndarray) -> np.ndarray:
+        """
+        Phase probabilities for a feature matrix.
+        
+        Columns follow GamePhase declaration order (phase codes). The
+        default spreads each row's confidence onto its predicted phase and
+        the remainder evenly over the others; probabilistic adapters
+        should override it.
+        
+        Args:
+            features: 2D numpy array of shape (n_samples, n_features)
+            
+        Returns:
+            (n_samples, len(GamePhase)) float64 probabilities
+        """
+        phases, confidences = self.classify_batch_with_confidence(features)
+        n_phases = len(GamePhase)
+        codes = np.array([list(GamePhase).index(phase) for phase in phases], dtype=np.int64)
+        rest = (1.0 - confidences) / max(n_phases - 1, 1)
+        proba = np.repeat(rest[:, None], n_phases, axis=1)
+        proba[np.arange(len(codes)), codes] = confidences
+        return proba
+    
     @abstractmethod
     def train(
         self, 
@@ -78,6 +127,29 @@ class PhaseClassifierPort(ABC):
         """
         pass
     
+    def train_incremental(self, batches: TrainingBatches, epochs: int = 1) -> dict:
+        """
+        Train from batches that need not fit in memory together.
+        
+        `batches` is called once per pass over the data. The default
+        concatenates every batch and calls train; adapters with
+        incremental estimators should stream instead.
+        
+        Args:
+            batches: Callable returning an iterable of (features, labels)
+            epochs: Passes over the data (incremental adapters only)
+            
+        Returns:
+            Training metrics dict
+        """
+        features, labels = [], []
+        for batch_features, batch_labels in batches():
+            features.append(batch_features)
+            labels.extend(batch_labels)
+        if not features:
+            raise ValueError("Cannot train on empty data")
+        return self.train(np.vstack(features), labels)
+    
     @abstractmethod
     def is_trained(self) -> bool:
         """Check if the model has been trained."""
@@ -6,7 +6,7 @@ Interface for storing and retrieving phase classification data.
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from src.domain.entities.phase_sequence import PhaseSequence, PhaseTransition
+from src.domain.entities.phase_sequence import PhaseSequence, PhaseTimeline, PhaseTransition
 from src.domain.value_objects.game_phase import GamePhase
 
 
@@ -68,6 +68,55 @@ class PhaseRepository(ABC):
         """
         pass
     
+    def get_phase_timeline(
+        self,
+        match_id: str,
+        team_id: str = "home",
+        start: float = 0,
+        end: Optional[float] = None,
+        in_seconds: bool = False
+    ) -> Optional[PhaseTimeline]:
+        """
+        Get the phase segments overlapping a frame or time range.
+        
+        Segments are returned whole (not clipped to the range); the
+        default implementation loads the full sequence, adapters should
+        answer from stored segments.
+        
+        Args:
+            match_id: Match identifier
+            team_id: Team perspective
+            start: First frame (or second) of the range, inclusive
+            end: Last frame (or second), inclusive; None for all remaining
+            in_seconds: Interpret start/end as match seconds
+            
+        Returns:
+            PhaseTimeline, None if the match is not classified
+        """
+        sequence = self.get_phase_sequence(match_id, team_id)
+        if sequence is None:
+            return None
+        scale = sequence.fps if in_seconds else 1
+        timeline = PhaseTimeline(
+            match_id=match_id,
+            team_id=team_id,
+            fps=sequence.fps,
+            total_frames=len(sequence),
+            segments=sequence.to_segments(),
+            statistics={
+                "transition_count": sequence.get_transition_count(),
+                "phase_percentages": {
+                    phase.value: pct for phase, pct in sequence.get_phase_percentages().items()
+                },
+                "dominant_phase": sequence.get_dominant_phase().value
+            }
+        )
+        timeline.segments = [
+            seg for seg in timeline.segments
+            if seg.end_frame >= start * scale and (end is None or seg.start_frame <= end * scale)
+        ]
+        return timeline
+    
     @abstractmethod
     def get_transitions(
         self,
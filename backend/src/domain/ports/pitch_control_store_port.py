@@ -0,0 +1,74 @@
+"""
+PitchControlStore Port - Domain Layer
+
+Interface for persisting pitch control surfaces (Ports & Adapters pattern).
+
+Surfaces are dense (frames x H x W) arrays, too large for relational
+storage; implementations keep them as compressed array blocks.
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+@dataclass
+class PitchControlSlice:
+    """Value object for a frame range of stored pitch control surfaces."""
+    frame_ids: np.ndarray  # (F,) int
+    home_control: np.ndarray  # (F, H, W) float32
+    away_control: np.ndarray  # (F, H, W) float32
+    grid_width: int
+    grid_height: int
+    event_ids: Optional[np.ndarray] = None  # (F,) str, for event-anchored surfaces
+
+
+class PitchControlStore(ABC):
+    """
+    Port (interface) for pitch control surface persistence.
+    
+    Infrastructure layer will provide concrete implementation.
+    """
+    
+    @abstractmethod
+    def save_surfaces(
+        self,
+        match_id: str,
+        frame_ids: np.ndarray,
+        home_control: np.ndarray,
+        away_control: np.ndarray,
+        event_ids: Optional[Sequence[str]] = None
+    ) -> None:
+        """
+        Save all pitch control surfaces of a match, replacing earlier ones.
+        
+        Args:
+            match_id: Match identifier
+            frame_ids: (F,) frame identifiers, ascending (repeated when
+                several events share a frame)
+            home_control: (F, H, W) home control probabilities
+            away_control: (F, H, W) away control probabilities
+            event_ids: Optional (F,) event each surface was computed for
+        """
+        pass
+    
+    @abstractmethod
+    def get_surfaces(
+        self,
+        match_id: str,
+        start_frame: int = 0,
+        end_frame: Optional[int] = None
+    ) -> Optional[PitchControlSlice]:
+        """
+        Read stored surfaces for frames in [start_frame, end_frame].
+        
+        Args:
+            match_id: Match identifier
+            start_frame: First frame to include
+            end_frame: Last frame to include (None = until the end)
+            
+        Returns:
+            PitchControlSlice, or None if the match has no stored surfaces
+        """
+        pass
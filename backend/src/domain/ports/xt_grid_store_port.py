@@ -0,0 +1,51 @@
+"""
+ExpectedThreatGridStore Port - Domain Layer
+
+Interface for persisting fitted xT grids (Ports & Adapters pattern).
+
+Grids are fitted per competition and grid resolution, so they are keyed
+by (competition, width, height).
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.domain.value_objects.expected_threat_grid import ExpectedThreatGrid
+
+
+class ExpectedThreatGridStore(ABC):
+    """
+    Port (interface) for fitted xT grid persistence.
+    
+    Infrastructure layer will provide concrete implementation.
+    """
+    
+    @abstractmethod
+    def get_grid(
+        self,
+        competition: str,
+        width: int,
+        height: int
+    ) -> Optional[ExpectedThreatGrid]:
+        """
+        Load the grid fitted for a competition at a resolution.
+        
+        Args:
+            competition: Competition name
+            width: Number of horizontal zones
+            height: Number of vertical zones
+            
+        Returns:
+            ExpectedThreatGrid, or None if none was fitted yet
+        """
+        pass
+    
+    @abstractmethod
+    def save_grid(self, competition: str, grid: ExpectedThreatGrid) -> None:
+        """
+        Save (replace) a competition's grid at the grid's resolution.
+        
+        Args:
+            competition: Competition name
+            grid: Fitted grid
+        """
+        pass
@@ -0,0 +1,185 @@
+"""
+Expected Threat Fitter - Domain Service
+
+Learns an xT surface from event data (Karun Singh's formulation):
+
+    xT(z) = P(shot | z) * P(goal | shot, z)
+          + P(move | z) * sum_z' T(z -> z') * xT(z')
+
+where T holds the probabilities of successful moves between zones (failed
+moves end the possession and contribute nothing). The transition matrix is
+assembled as a sparse (zones x zones) matrix from per-event zone indices
+and the fixed point is found by value iteration, at any grid resolution.
+
+Event locations must be oriented in the attacking direction (left to
+right), as in StatsBomb data.
+"""
+from typing import Iterable
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from src.domain.entities.event import Event, EventType
+from src.domain.value_objects.expected_threat_grid import ExpectedThreatGrid
+
+
+class ExpectedThreatFitter:
+    """
+    Domain service fitting ExpectedThreatGrid surfaces from events.
+    """
+
+    MOVE_TYPES = {EventType.PASS, EventType.CARRY, EventType.DRIBBLE}
+    SHOT_TYPES = {EventType.SHOT}
+    GOAL_OUTCOME = "Goal"
+
+    def __init__(
+        self,
+        width: int = 12,
+        height: int = 8,
+        pitch_length: float = 105.0,
+        pitch_width: float = 68.0,
+        tolerance: float = 1e-6,
+        max_iterations: int = 200
+    ):
+        """
+        Initialize fitter.
+
+        Args:
+            width: Number of horizontal zones
+            height: Number of vertical zones
+            pitch_length: Pitch length (meters)
+            pitch_width: Pitch width (meters)
+            tolerance: Stop when no zone value changes by more than this
+            max_iterations: Upper bound on value iteration sweeps
+        """
+        self.width = width
+        self.height = height
+        self.pitch_length = pitch_length
+        self.pitch_width = pitch_width
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+
+    def fit_events(self, events: Iterable[Event]) -> ExpectedThreatGrid:
+        """
+        Fit an xT grid from domain events.
+
+        Moves are passes, carries and dribbles; a move is successful when
+        it has an end location and no outcome (providers only record
+        outcomes for failed passes). Moves without an end location are
+        ignored. Shots with outcome "Goal" count as goals.
+
+        Args:
+            events: Events of one or more matches
+
+        Returns:
+            Fitted ExpectedThreatGrid
+        """
+        events = list(events)
+        moves = [
+            e for e in events
+            if e.event_type in self.MOVE_TYPES and e.end_coordinates is not None
+        ]
+        shots = [e for e in events if e.event_type in self.SHOT_TYPES]
+
+        return self.fit(
+            move_start_x=[e.coordinates.x for e in moves],
+            move_start_y=[e.coordinates.y for e in moves],
+            move_end_x=[e.end_coordinates.x for e in moves],
+            move_end_y=[e.end_coordinates.y for e in moves],
+            move_success=[e.outcome is None for e in moves],
+            shot_x=[e.coordinates.x for e in shots],
+            shot_y=[e.coordinates.y for e in shots],
+            shot_goal=[e.outcome == self.GOAL_OUTCOME for e in shots],
+        )
+
+    def fit(
+        self,
+        move_start_x: ArrayLike,
+        move_start_y: ArrayLike,
+        move_end_x: ArrayLike,
+        move_end_y: ArrayLike,
+        move_success: ArrayLike,
+        shot_x: ArrayLike,
+        shot_y: ArrayLike,
+        shot_goal: ArrayLike
+    ) -> ExpectedThreatGrid:
+        """
+        Fit an xT grid from columnar move and shot data.
+
+        Args:
+            move_start_x, move_start_y: Move start locations (meters)
+            move_end_x, move_end_y: Move end locations (meters)
+            move_success: Whether each move kept possession
+            shot_x, shot_y: Shot locations (meters)
+            shot_goal: Whether each shot was scored
+
+        Returns:
+            Fitted ExpectedThreatGrid (height x width)
+        """
+        from scipy import sparse
+
+        n_zones = self.width * self.height
+        template = ExpectedThreatGrid(
+            grid=np.zeros((self.height, self.width)),
+            width=self.width,
+            height=self.height,
+            pitch_length=self.pitch_length,
+            pitch_width=self.pitch_width
+        )
+
+        move_start = self._zone_index(template, move_start_x, move_start_y)
+        move_end = self._zone_index(template, move_end_x, move_end_y)
+        success = np.asarray(move_success, dtype=bool)
+        shot_zone = self._zone_index(template, shot_x, shot_y)
+        goal = np.asarray(shot_goal, dtype=float)
+
+        moves = np.bincount(move_start, minlength=n_zones).astype(float)
+        shots = np.bincount(shot_zone, minlength=n_zones).astype(float)
+        goals = np.bincount(shot_zone, weights=goal, minlength=n_zones)
+        actions = moves + shots
+
+        p_shot = self._ratio(shots, actions)
+        p_move = self._ratio(moves, actions)
+        p_goal = self._ratio(goals, shots)
+
+        # Successful move counts z -> z' (duplicates are summed), normalised by
+        # all moves from z and weighted by P(move | z)
+        counts = sparse.csr_matrix(
+            (np.ones(int(success.sum())), (move_start[success], move_end[success])),
+            shape=(n_zones, n_zones)
+        )
+        transition = sparse.diags(self._ratio(p_move, moves)) @ counts
+        reward = p_shot * p_goal
+
+        xt = np.zeros(n_zones)
+        for _ in range(self.max_iterations):
+            updated = reward + transition @ xt
+            converged = np.max(np.abs(updated - xt)) < self.tolerance
+            xt = updated
+            if converged:
+                break
+
+        return ExpectedThreatGrid(
+            grid=xt.reshape(self.height, self.width),
+            width=self.width,
+            height=self.height,
+            pitch_length=self.pitch_length,
+            pitch_width=self.pitch_width
+        )
+
+    def _zone_index(
+        self,
+        grid: ExpectedThreatGrid,
+        x: ArrayLike,
+        y: ArrayLike
+    ) -> np.ndarray:
+        """Flat (row-major) zone index of each location."""
+        zone_x, zone_y = grid.pitch_to_zones(x, y)
+        return (zone_y * self.width + zone_x).astype(np.intp).reshape(-1)
+
+    @staticmethod
+    def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        """Element-wise division with 0 where the denominator is 0."""
+        out = np.zeros_like(numerator, dtype=float)
+        np.divide(numerator, denominator, out=out, where=denominator > 0)
+        return out
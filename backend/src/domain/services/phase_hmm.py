@@ -0,0 +1,96 @@
+"""
+Phase HMM - Domain Service
+
+Temporal decoding of per-window phase probabilities.
+
+Classifier outputs for consecutive windows are treated as (scaled)
+emission likelihoods of a hidden phase that rarely changes, and the most
+likely phase path is recovered with the Viterbi algorithm. This removes
+the one-window flickers that independent classification produces.
+"""
+from typing import Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# Floor for probabilities before taking logs (a 0 would forbid a state)
+MIN_PROBABILITY = 1e-6
+
+
+class PhaseHMM:
+    """
+    Hidden Markov model over game phases.
+
+    States are phase codes (column order of the probability matrices
+    passed to decode). The transition matrix is "sticky": a phase is kept
+    with probability 1 - switch_prob per step, and a switch goes to any
+    other phase with equal probability.
+    """
+
+    def __init__(
+        self,
+        n_states: int,
+        switch_prob: float = 0.1,
+        initial: Optional[ArrayLike] = None
+    ):
+        """
+        Initialize HMM.
+
+        Args:
+            n_states: Number of phases
+            switch_prob: Probability of leaving the current phase per step
+            initial: Prior over the first step's phase (default uniform)
+        """
+        if n_states < 1:
+            raise ValueError("n_states must be >= 1")
+        if not 0.0 < switch_prob < 1.0:
+            raise ValueError("switch_prob must be in (0, 1)")
+
+        self.n_states = n_states
+        self.switch_prob = switch_prob
+        if n_states == 1:
+            transition = np.ones((1, 1))
+        else:
+            transition = np.full((n_states, n_states), switch_prob / (n_states - 1))
+            np.fill_diagonal(transition, 1.0 - switch_prob)
+        self.log_transition = np.log(transition)
+
+        initial = np.full(n_states, 1.0 / n_states) if initial is None else np.asarray(initial, dtype=np.float64)
+        self.log_initial = np.log(np.maximum(initial, MIN_PROBABILITY))
+
+    @classmethod
+    def from_mean_duration(cls, n_states: int, mean_duration_steps: float) -> "PhaseHMM":
+        """Sticky HMM whose phases last mean_duration_steps on average."""
+        return cls(n_states, switch_prob=1.0 / max(mean_duration_steps, 1.0 + 1e-9))
+
+    def decode(self, probabilities: ArrayLike) -> np.ndarray:
+        """
+        Most likely phase path (Viterbi).
+
+        Args:
+            probabilities: (T, n_states) per-step phase probabilities
+
+        Returns:
+            (T,) int64 state path
+        """
+        log_emission = np.log(np.maximum(np.asarray(probabilities, dtype=np.float64), MIN_PROBABILITY))
+        n_steps = len(log_emission)
+        if n_steps == 0:
+            return np.empty(0, dtype=np.int64)
+        if log_emission.shape[1] != self.n_states:
+            raise ValueError(f"expected {self.n_states} columns, got {log_emission.shape[1]}")
+
+        states = np.arange(self.n_states)
+        backpointers = np.empty((n_steps, self.n_states), dtype=np.int64)
+        score = self.log_initial + log_emission[0]
+        for t in range(1, n_steps):
+            # candidates[i, j]: best path ending in i, then moving to j
+            candidates = score[:, None] + self.log_transition
+            backpointers[t] = np.argmax(candidates, axis=0)
+            score = candidates[backpointers[t], states] + log_emission[t]
+
+        path = np.empty(n_steps, dtype=np.int64)
+        path[-1] = np.argmax(score)
+        for t in range(n_steps - 1, 0, -1):
+            path[t - 1] = backpointers[t, path[t]]
+        return path
@@ -0,0 +1,401 @@
+"""
+Physical Metrics Engine - Domain Service
+
+Batch computation of physical metrics for every player of a match in one
+pass over a columnar TrackingTable.
+
+Produces the same PhysicalMetrics as PlayerTrajectory.calculate_physical_metrics,
+but replaces the per-player object graph and per-frame Python loops with
+segment-wise NumPy operations:
+- velocities from np.diff over player-sorted columns
+- Savitzky-Golay smoothing expressed as linear operators per segment length
+- sprints via run-length encoding of the threshold mask
+- totals/maxima via np.add.reduceat / np.maximum.reduceat
+
+It can also run incrementally: `update` folds an appended block of frames
+into per-player running state in O(block) time, and `snapshot` turns that
+state into the same PhysicalMetrics a full recompute would give (except
+for tracks clipped as outliers, see `update`).
+"""
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from src.domain.entities.player_trajectory import PlayerTrajectory, PhysicalMetrics
+from src.domain.value_objects.metrics_state import PlayerRunningState
+from src.domain.value_objects.tracking_table import TrackingTable, factorize
+
+
+class PhysicalMetricsEngine:
+    """
+    Domain service computing PhysicalMetrics for all players at once.
+
+    Parameters mirror PlayerTrajectory so both paths stay interchangeable.
+    """
+
+    # Same constants as PlayerTrajectory._get_velocities / calculate_physical_metrics
+    SAVGOL_WINDOW = 11
+    SAVGOL_POLYORDER = 3
+    OUTLIER_SPEED_KMH = 45.0
+
+    def __init__(self, fps: float = 25.0, sprint_threshold: float = 25.0):
+        """
+        Initialize engine.
+
+        Args:
+            fps: Frames per second
+            sprint_threshold: Speed threshold for sprint detection (km/h)
+        """
+        self.fps = fps
+        self.sprint_threshold = sprint_threshold
+        self._operators: Dict[int, np.ndarray] = {}
+
+    def calculate(self, tracking: TrackingTable) -> Dict[Any, PhysicalMetrics]:
+        """
+        Calculate physical metrics for every object in the table.
+
+        Args:
+            tracking: Columnar tracking data
+
+        Returns:
+            Mapping player_id -> PhysicalMetrics, in first-appearance order
+        """
+        if len(tracking) == 0:
+            return {}
+
+        player_ids, codes = factorize(tracking.player_id)
+
+        # Sort rows by (player, frame); lexsort is stable like sorted()
+        order = np.lexsort((tracking.frame_id, codes))
+        x = tracking.x[order]
+        y = tracking.y[order]
+        t = tracking.timestamp[order]
+        starts = np.flatnonzero(np.r_[True, np.diff(codes[order]) != 0])
+        lengths = np.diff(np.append(starts, len(order)))
+
+        velocities = self._velocities(x, y, t, starts, lengths)
+
+        # Sanity check: clip teleporting tracks (> 45 km/h) and recompute
+        outlier_ms = self.OUTLIER_SPEED_KMH / 3.6
+        flagged = np.flatnonzero(np.maximum.reduceat(velocities, starts) > outlier_ms)
+        for seg in flagged:
+            rows = slice(starts[seg], starts[seg] + lengths[seg])
+            x[rows], y[rows] = self._clip_segment(x[rows], y[rows], self.OUTLIER_SPEED_KMH)
+            velocities[rows] = self._velocities(
+                x[rows], y[rows], t[rows], np.array([0]), np.array([lengths[seg]])
+            )
+
+        total_distance = np.add.reduceat(velocities / self.fps, starts) / 1000.0
+        max_speed = np.maximum.reduceat(velocities, starts) * 3.6
+        avg_speed = np.add.reduceat(velocities, starts) / lengths * 3.6
+        sprint_count = self._count_runs(velocities > self.sprint_threshold / 3.6, starts)
+
+        return {
+            player_ids[seg]: PhysicalMetrics(
+                total_distance=float(total_distance[seg]),
+                max_speed=float(max_speed[seg]),
+                sprint_count=int(sprint_count[seg]),
+                avg_speed=float(avg_speed[seg])
+            )
+            for seg in range(len(starts))
+        }
+
+    def update(
+        self,
+        states: Dict[Any, PlayerRunningState],
+        block: TrackingTable
+    ) -> None:
+        """
+        Fold a block of appended tracking rows into running player state.
+        
+        Rows at or before a player's last processed frame are ignored, so
+        re-delivered blocks are harmless. Each player's new rows are
+        smoothed together with the last SAVGOL_WINDOW + 1 positions kept in
+        its state; smoothed speeds whose window lies entirely in known data
+        are committed, the trailing half-window stays provisional.
+        
+        Results match `calculate` on the concatenated data, except for
+        tracks above the outlier speed: the check only looks at speeds
+        being committed, and flagged tracks are clipped block by block
+        (from the last kept position) rather than over the whole track.
+        
+        Args:
+            states: player_id -> PlayerRunningState, updated in place
+            block: New tracking rows (any order)
+        """
+        if len(block) == 0:
+            return
+        
+        player_ids, codes = factorize(block.player_id)
+        order = np.lexsort((block.frame_id, codes))
+        codes = codes[order]
+        frames = block.frame_id[order]
+        bounds = np.flatnonzero(np.r_[True, np.diff(codes) != 0, True])
+        
+        # Concatenate [kept tail + new rows] per player into one segmented signal
+        players: List[Tuple[Any, PlayerRunningState, int]] = []
+        xs: List[np.ndarray] = []
+        ys: List[np.ndarray] = []
+        ts: List[np.ndarray] = []
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            player_id = player_ids[codes[lo]]
+            state = states.setdefault(player_id, PlayerRunningState())
+            rows = order[lo:hi][frames[lo:hi] > state.last_frame]
+            if len(rows) == 0:
+                continue
+            players.append((player_id, state, len(rows)))
+            xs.append(np.r_[state.tail_x, block.x[rows]])
+            ys.append(np.r_[state.tail_y, block.y[rows]])
+            ts.append(np.r_[state.tail_t, block.timestamp[rows]])
+            state.last_frame = int(block.frame_id[rows[-1]])
+        if not players:
+            return
+        
+        lengths = np.array([len(x) for x in xs])
+        starts = np.r_[0, np.cumsum(lengths)[:-1]]
+        x = np.concatenate(xs)
+        y = np.concatenate(ys)
+        t = np.concatenate(ts)
+        velocities = self._velocities(x, y, t, starts, lengths)
+        
+        outlier_ms = self.OUTLIER_SPEED_KMH / 3.6
+        for seg, (player_id, state, n_new) in enumerate(players):
+            rows = slice(starts[seg], starts[seg] + lengths[seg])
+            n_tail = lengths[seg] - n_new
+            commit = self._commit_rows(state, n_new)
+            if np.any(velocities[rows][commit] > outlier_ms):
+                # Kept tail positions are final: clip new rows from the last of them
+                first = starts[seg] + max(n_tail - 1, 0)
+                clip = slice(first, rows.stop)
+                x[clip], y[clip] = self._clip_segment(x[clip], y[clip], self.OUTLIER_SPEED_KMH)
+                velocities[rows] = self._velocities(
+                    x[rows], y[rows], t[rows], np.array([0]), np.array([lengths[seg]])
+                )
+            self._advance(state, x[rows], y[rows], t[rows], velocities[rows], n_new)
+    
+    def snapshot(self, states: Dict[Any, PlayerRunningState]) -> Dict[Any, PhysicalMetrics]:
+        """
+        Current PhysicalMetrics of every player in running state.
+        
+        Args:
+            states: player_id -> PlayerRunningState
+            
+        Returns:
+            Mapping player_id -> PhysicalMetrics
+        """
+        threshold = self.sprint_threshold / 3.6
+        result = {}
+        for player_id, state in states.items():
+            if state.rows == 0:
+                continue
+            provisional = np.asarray(state.provisional_speeds, dtype=float)
+            speed_sum = state.speed_sum + float(provisional.sum())
+            mask = provisional > threshold
+            prev = np.r_[state.in_sprint, mask[:-1]]
+            result[player_id] = PhysicalMetrics(
+                total_distance=speed_sum / self.fps / 1000.0,
+                max_speed=max(state.max_speed, float(provisional.max(initial=0.0))) * 3.6,
+                sprint_count=state.sprint_count + int(np.count_nonzero(mask & ~prev)),
+                avg_speed=speed_sum / state.rows * 3.6
+            )
+        return result
+    
+    def _advance(
+        self,
+        state: PlayerRunningState,
+        x: np.ndarray,
+        y: np.ndarray,
+        t: np.ndarray,
+        speeds: np.ndarray,
+        n_new: int
+    ) -> None:
+        """
+        Commit the rows whose smoothed speed became final and keep the rest.
+        
+        `x`, `y`, `t` and `speeds` cover one player's [tail + new] positions.
+        """
+        commit = self._commit_rows(state, n_new)
+        offset = state.rows - len(state.tail_x)
+        state.rows += n_new
+        
+        committed = speeds[commit]
+        if len(committed):
+            mask = committed > self.sprint_threshold / 3.6
+            prev = np.r_[state.in_sprint, mask[:-1]]
+            state.sprint_count += int(np.count_nonzero(mask & ~prev))
+            state.in_sprint = bool(mask[-1])
+            state.speed_sum += float(committed.sum())
+            state.max_speed = max(state.max_speed, float(committed.max()))
+            state.committed_rows = commit.stop + offset
+        
+        state.provisional_speeds = speeds[commit.stop:].tolist()
+        keep = self.SAVGOL_WINDOW + 1
+        state.tail_x = x[-keep:].tolist()
+        state.tail_y = y[-keep:].tolist()
+        state.tail_t = t[-keep:].tolist()
+    
+    def _commit_rows(self, state: PlayerRunningState, n_new: int) -> slice:
+        """
+        Local rows (in [tail + new]) whose smoothed speed becomes final.
+        
+        With m = total positions - 1 signal samples, rows [0, m - half) are
+        final once m reaches the window length; later rows (tail fit and
+        the padded last row) can still change with more data.
+        """
+        half = self.SAVGOL_WINDOW // 2
+        offset = state.rows - len(state.tail_x)
+        signal_length = state.rows + n_new - 1
+        final_end = signal_length - half if signal_length >= self.SAVGOL_WINDOW else 0
+        return slice(state.committed_rows - offset, max(final_end, state.committed_rows) - offset)
+    
+    def _velocities(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        t: np.ndarray,
+        starts: np.ndarray,
+        lengths: np.ndarray
+    ) -> np.ndarray:
+        """
+        Smoothed speed (m/s) per row, segment by segment.
+
+        Each segment of n positions yields n-1 raw speeds, which are
+        smoothed and padded with their last value, exactly as in
+        PlayerTrajectory._get_velocities.
+        """
+        dx = np.diff(x)
+        dy = np.diff(y)
+        dt = np.diff(t)
+        dt = np.where(dt == 0, 1e-6, dt)
+        raw = np.sqrt(dx**2 + dy**2) / dt
+
+        # Drop the cross-segment differences: raw speeds of segment s live
+        # at rows [start_s, start_s + n_s - 1) of the padded output
+        valid = np.ones(len(x), dtype=bool)
+        valid[starts + lengths - 1] = False
+        speeds = np.zeros(len(x))
+        speeds[valid] = raw[valid[:-1]]
+
+        out = np.zeros(len(x))
+        signal_lengths = lengths - 1
+        self._smooth_long(speeds, out, starts, signal_lengths)
+        self._smooth_short(speeds, out, starts, signal_lengths)
+
+        # Pad each signal with its last value (single-frame tracks stay 0)
+        last = starts + lengths - 1
+        has_signal = lengths > 1
+        out[last[has_signal]] = out[last[has_signal] - 1]
+        return out
+
+    def _smooth_long(
+        self,
+        speeds: np.ndarray,
+        out: np.ndarray,
+        starts: np.ndarray,
+        signal_lengths: np.ndarray
+    ) -> None:
+        """Smooth all signals with at least SAVGOL_WINDOW samples."""
+        w = self.SAVGOL_WINDOW
+        half = w // 2
+        long_segments = signal_lengths >= w
+        if not np.any(long_segments):
+            return
+
+        operator = self._operator(w)
+        seg_starts = starts[long_segments]
+        seg_lengths = signal_lengths[long_segments]
+
+        # Interior: one correlation over the concatenated signal; windows that
+        # straddle segments are never written back
+        windows = np.lib.stride_tricks.sliding_window_view(speeds, w)
+        interior_rows = self._interior_rows(seg_starts, seg_lengths, half)
+        out[interior_rows] = windows[interior_rows - half] @ operator[half]
+
+        # Edges: polynomial fit over the first/last window of each segment
+        head = seg_starts[:, None] + np.arange(w)
+        tail = (seg_starts + seg_lengths - w)[:, None] + np.arange(w)
+        out[head[:, :half]] = speeds[head] @ operator[:half].T
+        out[tail[:, -half:]] = speeds[tail] @ operator[-half:].T
+
+    def _interior_rows(
+        self,
+        seg_starts: np.ndarray,
+        seg_lengths: np.ndarray,
+        half: int
+    ) -> np.ndarray:
+        """Row indices of every segment's interior, built without a loop."""
+        counts = seg_lengths - 2 * half
+        total = int(counts.sum())
+        seg_offsets = np.repeat(seg_starts + half - np.r_[0, np.cumsum(counts)[:-1]], counts)
+        return np.arange(total) + seg_offsets
+
+    def _smooth_short(
+        self,
+        speeds: np.ndarray,
+        out: np.ndarray,
+        starts: np.ndarray,
+        signal_lengths: np.ndarray
+    ) -> None:
+        """Smooth signals shorter than the window, batched per length."""
+        for n in np.unique(signal_lengths[(signal_lengths > 0) & (signal_lengths < self.SAVGOL_WINDOW)]):
+            seg_starts = starts[signal_lengths == n]
+            rows = seg_starts[:, None] + np.arange(n)
+            out[rows] = speeds[rows] @ self._operator(int(n)).T
+
+    def _operator(self, n: int) -> np.ndarray:
+        """
+        Linear operator of PlayerTrajectory's smoother for length-n signals.
+
+        The Savitzky-Golay filter (and its moving-average fallback) is linear,
+        so its action on a length-n signal is the matrix whose columns are the
+        smoothed unit vectors. Built once per length and cached.
+        """
+        if n not in self._operators:
+            smoother = PlayerTrajectory("", [], fps=self.fps)
+            basis = np.eye(n)
+            self._operators[n] = np.column_stack([
+                smoother._smooth_signal_savgol(
+                    basis[j], window_length=self.SAVGOL_WINDOW, polyorder=self.SAVGOL_POLYORDER
+                )
+                for j in range(n)
+            ])
+        return self._operators[n]
+
+    def _clip_segment(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        max_speed_kmh: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Limit per-frame displacement, as PlayerTrajectory.clip_outliers does.
+
+        Each position is clipped relative to the already-clipped previous
+        one, so this is an inherently sequential scan. It only runs for the
+        few tracks flagged as outliers.
+        """
+        max_displacement = (max_speed_kmh / 3.6) / self.fps
+        xs = x.tolist()
+        ys = y.tolist()
+        for i in range(1, len(xs)):
+            dx = xs[i] - xs[i - 1]
+            dy = ys[i] - ys[i - 1]
+            distance = (dx**2 + dy**2) ** 0.5
+            if distance > max_displacement and distance > 0:
+                scale = max_displacement / distance
+                xs[i] = xs[i - 1] + dx * scale
+                ys[i] = ys[i - 1] + dy * scale
+        return np.array(xs), np.array(ys)
+
+    def _count_runs(self, mask: np.ndarray, starts: np.ndarray) -> np.ndarray:
+        """
+        Number of True runs per segment (run-length encoding of the mask).
+
+        A run starts wherever the mask rises; segment starts always break
+        runs so a sprint never spans two players.
+        """
+        prev = np.r_[False, mask[:-1]]
+        prev[starts] = False
+        run_starts = np.flatnonzero(mask & ~prev)
+        segment = np.searchsorted(starts, run_starts, side="right") - 1
+        return np.bincount(segment, minlength=len(starts))
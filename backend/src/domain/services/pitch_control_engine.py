@@ -0,0 +1,229 @@
+"""
+Pitch Control Engine - Domain Service
+
+Batched, tensorised version of MatchFrame.calculate_pitch_control.
+
+Evaluates the same influence model (time-to-reach = reaction time +
+distance / max speed, influence = exp(-time / 2), team control = max over
+its players, normalised between teams) for many frames at once:
+
+    positions (frames x players x 2)  ->  home control (frames x H x W)
+
+Work is split into frame chunks whose broadcast intermediates stay under a
+configurable memory cap, and the spatial grid is built once and cached.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+
+from src.domain.value_objects.tracking_table import TrackingTable
+
+HOME = 0
+AWAY = 1
+NO_TEAM = -1
+
+
+@lru_cache(maxsize=16)
+def pitch_grid(
+    pitch_length: float,
+    pitch_width: float,
+    grid_width: int,
+    grid_height: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cached (H x W) grid coordinates, identical to MatchFrame's meshgrid.
+
+    The returned arrays are read-only because they are shared.
+    """
+    x = np.linspace(0, pitch_length, grid_width)
+    y = np.linspace(0, pitch_width, grid_height)
+    x_grid, y_grid = np.meshgrid(x, y)
+    x_grid.setflags(write=False)
+    y_grid.setflags(write=False)
+    return x_grid, y_grid
+
+
+@dataclass(frozen=True)
+class FrameTensor:
+    """
+    Dense per-frame player layout for batched spatial computations.
+
+    Players are packed into slots per frame; unused slots have NaN
+    positions and team NO_TEAM.
+    """
+    frame_ids: np.ndarray  # (F,) int64
+    positions: np.ndarray  # (F, P, 2) float32, NaN where empty
+    teams: np.ndarray  # (F, P) int8: HOME, AWAY or NO_TEAM
+    ball: np.ndarray  # (F, 2) float32, NaN where the ball was not seen
+
+    @classmethod
+    def from_tracking(
+        cls,
+        tracking: TrackingTable,
+        sample_rate: int = 1,
+        frame_ids: Optional[np.ndarray] = None
+    ) -> "FrameTensor":
+        """
+        Pack a TrackingTable into a frame tensor.
+
+        Args:
+            tracking: Columnar tracking data
+            sample_rate: Keep only frames where frame_id % sample_rate == 0
+            frame_ids: Keep only these frames instead (e.g. event frames)
+        """
+        if frame_ids is not None:
+            rows = tracking.take(np.isin(tracking.frame_id, frame_ids))
+        else:
+            rows = tracking.take(tracking.frame_id % sample_rate == 0)
+        rows = rows.take(np.argsort(rows.frame_id, kind="stable"))
+        frame_ids, frame_index = np.unique(rows.frame_id, return_inverse=True)
+        n_frames = len(frame_ids)
+
+        is_ball = rows.object_type == "ball"
+        ball = np.full((n_frames, 2), np.nan, dtype=np.float32)
+        ball_rows = np.flatnonzero(is_ball)
+        # First ball observation of each frame wins (matches MatchFrame building)
+        first_ball = ball_rows[np.unique(frame_index[ball_rows], return_index=True)[1]]
+        ball[frame_index[first_ball]] = np.column_stack((rows.x[first_ball], rows.y[first_ball]))
+
+        player_rows = np.flatnonzero(~is_ball)
+        player_frame = frame_index[player_rows]
+        frame_start = np.searchsorted(player_frame, np.arange(n_frames))
+        slot = np.arange(len(player_rows)) - frame_start[player_frame]
+        n_slots = int(slot.max()) + 1 if len(slot) else 0
+
+        positions = np.full((n_frames, n_slots, 2), np.nan, dtype=np.float32)
+        positions[player_frame, slot, 0] = rows.x[player_rows]
+        positions[player_frame, slot, 1] = rows.y[player_rows]
+
+        team_ids = rows.team_id[player_rows]
+        teams = np.full((n_frames, n_slots), NO_TEAM, dtype=np.int8)
+        teams[player_frame, slot] = np.where(
+            team_ids == "home", HOME, np.where(team_ids == "away", AWAY, NO_TEAM)
+        )
+
+        return cls(frame_ids=frame_ids, positions=positions, teams=teams, ball=ball)
+
+
+class PitchControlEngine:
+    """
+    Domain service computing pitch control for batches of frames.
+
+    Equivalent to MatchFrame.calculate_pitch_control frame by frame, but
+    evaluated as one broadcast over (frames x players x H x W) per chunk.
+    """
+
+    # Broadcast temporaries per chunk: one (f, P, H, W) float32 sum at a time
+    _TEMPORARIES = 1
+
+    def __init__(
+        self,
+        pitch_length: float = 105.0,
+        pitch_width: float = 68.0,
+        grid_width: int = 32,
+        grid_height: int = 24,
+        reaction_time: float = 0.7,
+        max_speed: float = 5.0,
+        max_chunk_bytes: int = 64 * 1024 * 1024
+    ):
+        """
+        Initialize engine.
+
+        Args:
+            pitch_length: Pitch length (meters)
+            pitch_width: Pitch width (meters)
+            grid_width: Grid resolution (width)
+            grid_height: Grid resolution (height)
+            reaction_time: Player reaction time (seconds)
+            max_speed: Maximum player speed (m/s)
+            max_chunk_bytes: Memory cap for one chunk's broadcast intermediates
+        """
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.reaction_time = reaction_time
+        self.max_speed = max_speed
+        self.max_chunk_bytes = max_chunk_bytes
+        x_grid, y_grid = pitch_grid(pitch_length, pitch_width, grid_width, grid_height)
+        self._x_grid = x_grid.astype(np.float32)
+        self._y_grid = y_grid.astype(np.float32)
+
+    def compute(
+        self,
+        positions: np.ndarray,
+        teams: np.ndarray,
+        velocities: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Calculate home-team pitch control for every frame.
+
+        Away control is `1 - home` wherever at least one player is on the
+        pitch (both are 0 for empty frames).
+
+        Args:
+            positions: (F, P, 2) player positions in meters, NaN for empty slots
+            teams: (P,) or (F, P) team codes (HOME, AWAY, NO_TEAM)
+            velocities: Optional (F, P, 2) velocities (m/s). Players are then
+                evaluated at their position projected over the reaction time.
+
+        Returns:
+            (F, H, W) float32 array of home control probabilities
+        """
+        positions = np.asarray(positions, dtype=np.float32)
+        n_frames, n_players = positions.shape[:2]
+        teams = np.broadcast_to(np.asarray(teams), (n_frames, n_players))
+        if velocities is not None:
+            positions = positions + np.asarray(velocities, dtype=np.float32) * self.reaction_time
+
+        result = np.zeros((n_frames, self.grid_height, self.grid_width), dtype=np.float32)
+        chunk = self.frames_per_chunk(n_players)
+        for start in range(0, n_frames, chunk):
+            end = min(start + chunk, n_frames)
+            result[start:end] = self._compute_chunk(positions[start:end], teams[start:end])
+        return result
+
+    def away_control(self, home_control: np.ndarray, teams: np.ndarray) -> np.ndarray:
+        """
+        Away-team control matching a `compute` result.
+
+        Args:
+            home_control: (F, H, W) output of `compute`
+            teams: Team codes passed to `compute`
+
+        Returns:
+            (F, H, W) float32 array, zero for frames without players
+        """
+        teams = np.broadcast_to(np.asarray(teams), home_control.shape[:1] + np.shape(teams)[-1:])
+        occupied = np.any((teams == HOME) | (teams == AWAY), axis=1)
+        return np.where(occupied[:, None, None], 1.0 - home_control, 0.0).astype(np.float32)
+
+    def frames_per_chunk(self, n_players: int) -> int:
+        """Largest frame count whose intermediates fit in max_chunk_bytes."""
+        per_frame = max(n_players, 1) * self.grid_height * self.grid_width * 4 * self._TEMPORARIES
+        return max(1, self.max_chunk_bytes // per_frame)
+
+    def _compute_chunk(self, positions: np.ndarray, teams: np.ndarray) -> np.ndarray:
+        """Pitch control for one chunk of frames."""
+        present = ~np.isnan(positions[..., 0])
+        home = self._team_control(positions, present & (teams == HOME))
+        away = self._team_control(positions, present & (teams == AWAY))
+        return home / (home + away + 1e-10)
+
+    def _team_control(self, positions: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """
+        Max player influence for one team.
+
+        Influence decreases monotonically with distance, so the team's max
+        influence is the influence of its closest player. The grid is
+        separable, so squared x and y offsets are computed on the grid axes
+        and only summed in the (f, P, H, W) broadcast.
+        """
+        px = np.where(mask, positions[..., 0], np.inf)[..., None]  # (f, P, 1)
+        py = np.where(mask, positions[..., 1], np.inf)[..., None]
+        dx2 = (self._x_grid[0] - px) ** 2  # (f, P, W)
+        dy2 = (self._y_grid[:, 0] - py) ** 2  # (f, P, H)
+        closest_sq = np.min(dy2[..., :, None] + dx2[..., None, :], axis=1, initial=np.inf)
+
+        time_to_reach = self.reaction_time + np.sqrt(closest_sq) / self.max_speed
+        return np.exp(-time_to_reach / 2.0)
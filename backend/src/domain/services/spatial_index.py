@@ -0,0 +1,146 @@
+"""
+Spatial Index - Domain Service
+
+Batched nearest-neighbour, radius and pairwise-distance queries over the
+objects of one frame or of a block of frames.
+
+Positions are held as a dense (frames x slots x 2) array (NaN marks an
+empty slot) and every query is one broadcast over the block, answering
+all frames at once. With the ~25 objects of a football frame this beats
+building a tree per frame; queries that need a subset of the objects
+(one team, everyone but the ball carrier, ...) pass a (frames x slots)
+mask instead of rebuilding the index.
+"""
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+class FrameSpatialIndex:
+    """
+    Domain service answering spatial queries for a block of frames.
+
+    Distances are Euclidean, in the units of the positions (meters).
+    Empty or masked-out slots are at infinite distance.
+    """
+
+    def __init__(self, positions: ArrayLike):
+        """
+        Initialize index.
+
+        Args:
+            positions: (F, P, 2) object positions, NaN for empty slots
+        """
+        positions = np.asarray(positions, dtype=np.float64)
+        if positions.ndim != 3 or positions.shape[2] != 2:
+            raise ValueError(f"positions must have shape (frames, slots, 2), got {positions.shape}")
+        self.positions = positions
+        self.occupied = ~np.isnan(positions).any(axis=2)
+
+    @classmethod
+    def from_points(cls, points: Sequence[Tuple[float, float]]) -> "FrameSpatialIndex":
+        """Single-frame index over (x, y) points."""
+        return cls(np.asarray(points, dtype=np.float64).reshape(1, -1, 2))
+
+    @property
+    def n_frames(self) -> int:
+        return self.positions.shape[0]
+
+    @property
+    def n_slots(self) -> int:
+        return self.positions.shape[1]
+
+    def take(self, frames: ArrayLike) -> "FrameSpatialIndex":
+        """Index over a subset of frames (indices or boolean mask)."""
+        return FrameSpatialIndex(self.positions[frames])
+
+    def distances(self, centres: ArrayLike, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Distance from each frame's centre to each slot.
+
+        Args:
+            centres: (F, 2) query point per frame, or one (2,) point for all
+            mask: Optional (F, P) slots to consider
+
+        Returns:
+            (F, P) distances, inf for empty or masked-out slots (and for
+            every slot when the centre is NaN)
+        """
+        centres = np.broadcast_to(np.asarray(centres, dtype=np.float64), (self.n_frames, 2))
+        dx = self.positions[:, :, 0] - centres[:, None, 0]
+        dy = self.positions[:, :, 1] - centres[:, None, 1]
+        distances = np.sqrt(dx ** 2 + dy ** 2)
+        distances[~self._usable(mask) | np.isnan(distances)] = np.inf
+        return distances
+
+    def nearest(
+        self,
+        centres: ArrayLike,
+        k: int = 1,
+        mask: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The k slots closest to each frame's centre.
+
+        Ties go to the lower slot. Frames with fewer than k usable slots
+        are padded with slot -1 at distance inf.
+
+        Args:
+            centres: (F, 2) query point per frame, or one (2,) point for all
+            k: Number of neighbours
+            mask: Optional (F, P) slots to consider
+
+        Returns:
+            (slots, distances), each (F, k), closest first
+        """
+        distances = self.distances(centres, mask)
+        if self.n_slots == 0:
+            return (
+                np.full((self.n_frames, k), -1, dtype=np.intp),
+                np.full((self.n_frames, k), np.inf)
+            )
+        if k == 1:
+            slots = np.argmin(distances, axis=1)[:, None]
+        else:
+            slots = np.argsort(distances, axis=1, kind="stable")[:, :k]
+        nearest = np.take_along_axis(distances, slots, axis=1)
+        if slots.shape[1] < k:
+            pad = k - slots.shape[1]
+            slots = np.pad(slots, ((0, 0), (0, pad)), constant_values=-1)
+            nearest = np.pad(nearest, ((0, 0), (0, pad)), constant_values=np.inf)
+        slots = np.where(np.isinf(nearest), -1, slots)
+        return slots, nearest
+
+    def within(
+        self,
+        centres: ArrayLike,
+        radius: float,
+        mask: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Slots within `radius` (inclusive) of each frame's centre.
+
+        Returns:
+            (F, P) boolean array
+        """
+        return self.distances(centres, mask) <= radius
+
+    def pairwise(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Distances between every pair of slots in each frame.
+
+        Returns:
+            (F, P, P) distances, inf where either slot is empty or masked out
+        """
+        usable = self._usable(mask)
+        delta = self.positions[:, :, None, :] - self.positions[:, None, :, :]
+        distances = np.sqrt((delta ** 2).sum(axis=3))
+        distances[~(usable[:, :, None] & usable[:, None, :])] = np.inf
+        return distances
+
+    def _usable(self, mask: Optional[np.ndarray]) -> np.ndarray:
+        """Occupied slots, restricted to the mask."""
+        if mask is None:
+            return self.occupied
+        return self.occupied & np.asarray(mask, dtype=bool)
@@ -7,6 +7,9 @@ Used for aligning video tracking data with event data (e.g., StatsBomb).
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 
 @dataclass
 class SyncConfig:
@@ -74,6 +77,19 @@ class TimeSync:
         video_time = match_time_seconds + self.config.sync_offset_seconds
         return round(video_time * self.config.fps)
     
+    def match_times_to_frames(self, match_times_seconds: ArrayLike) -> np.ndarray:
+        """
+        Vectorized match_time_to_frame.
+        
+        Args:
+            match_times_seconds: Times since kick-off
+            
+        Returns:
+            int64 array of frame numbers (rounded to nearest frame)
+        """
+        video_times = np.asarray(match_times_seconds, dtype=np.float64) + self.config.sync_offset_seconds
+        return np.rint(video_times * self.config.fps).astype(np.int64)
+    
     def event_minute_to_frame(self, minute: int, second: int = 0) -> int:
         """
         Convert event time (minute:second) to frame number.
@@ -6,9 +6,13 @@ from .bounding_box import BoundingBox
 from .keypoint import Keypoint
 from .homography_matrix import HomographyMatrix
 from .tracking_frame import TrackingFrame, PlayerPosition, BallPosition
+from .tracking_table import TrackingTable
+from .event_table import EventTable
+from .metrics_state import MetricsState, PlayerRunningState, TeamEventCounters
 from .expected_threat_grid import ExpectedThreatGrid
 from .game_phase import GamePhase
 from .phase_features import PhaseFeatures
+from .pattern_usage import PatternUsage
 
 __all__ = [
     "Coordinates", 
@@ -20,9 +24,15 @@ __all__ = [
     "TrackingFrame",
     "PlayerPosition",
     "BallPosition",
+    "TrackingTable",
+    "EventTable",
+    "MetricsState",
+    "PlayerRunningState",
+    "TeamEventCounters",
     "ExpectedThreatGrid",
     "GamePhase",
     "PhaseFeatures",
+    "PatternUsage",
 ]
 
 
@@ -0,0 +1,115 @@
+"""
+EventTable Value Object - Domain Layer
+
+Columnar representation of a match's tactical events.
+
+One row per MatchEvent, stored as parallel NumPy arrays, with team and
+event-type codes plus precomputed row indices per team and per type, so
+metrics select their events without scanning the whole event list.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Sequence
+
+import numpy as np
+
+from src.domain.value_objects.tracking_table import factorize
+
+
+@dataclass(frozen=True)
+class EventTable:
+    """
+    Value object holding tactical events column by column.
+
+    `type_code` indexes `event_types` (the EventType members, in
+    declaration order); `team_code` indexes `teams`.
+    """
+
+    event_types: List[Any]  # EventType members
+    teams: List[Any]  # team identifiers, first-appearance order
+    type_code: np.ndarray  # int64
+    team_code: np.ndarray  # int64
+    x: np.ndarray  # float64, x or start_x (location used by zone metrics)
+    start_x: np.ndarray  # float64
+    start_y: np.ndarray
+    end_x: np.ndarray
+    end_y: np.ndarray
+    timestamp: np.ndarray  # float64, seconds
+    team_rows: Dict[Any, np.ndarray]  # team -> ascending row indices
+    type_rows: Dict[Any, np.ndarray]  # EventType -> ascending row indices
+
+    def __len__(self) -> int:
+        return len(self.type_code)
+
+    @classmethod
+    def from_events(cls, events: Sequence[Any], event_types: Iterable[Any]) -> "EventTable":
+        """
+        Build a table from MatchEvent objects.
+
+        Args:
+            events: MatchEvent list
+            event_types: Every EventType member (fixes the type codes)
+        """
+        event_types = list(event_types)
+        type_lookup = {t: i for i, t in enumerate(event_types)}
+        n = len(events)
+
+        teams, team_code = factorize(np.array([e.team for e in events], dtype=object))
+        type_code = np.fromiter((type_lookup[e.event_type] for e in events), dtype=np.int64, count=n)
+
+        def column(values: Iterable[Any]) -> np.ndarray:
+            return np.fromiter(values, dtype=np.float64, count=n)
+
+        x = column((e.x or 0.0) for e in events)
+        start_x = column(e.start_x for e in events)
+
+        return cls(
+            event_types=event_types,
+            teams=teams,
+            type_code=type_code,
+            team_code=team_code,
+            # Same fallback as `e.x or e.start_x`
+            x=np.where(x != 0.0, x, start_x),
+            start_x=start_x,
+            start_y=column(e.start_y for e in events),
+            end_x=column(e.end_x for e in events),
+            end_y=column(e.end_y for e in events),
+            timestamp=column(e.timestamp for e in events),
+            team_rows=cls._group_rows(team_code, teams),
+            type_rows=cls._group_rows(type_code, event_types),
+        )
+
+    def rows(self, team: Any = None, types: Iterable[Any] = None) -> np.ndarray:
+        """
+        Ascending row indices of events matching a team and/or types.
+
+        Starts from the precomputed index of the team (or of the types) and
+        only filters those rows.
+        """
+        if team is not None:
+            rows = self.team_rows.get(team, np.zeros(0, dtype=np.int64))
+            if types is None:
+                return rows
+            return rows[np.isin(self.type_code[rows], self.type_codes(types))]
+        if types is None:
+            return np.arange(len(self))
+        parts = [self.type_rows[t] for t in types if t in self.type_rows]
+        return np.sort(np.concatenate(parts)) if parts else np.zeros(0, dtype=np.int64)
+
+    def type_codes(self, types: Iterable[Any]) -> np.ndarray:
+        """Codes of the given EventType members."""
+        return np.array([self.event_types.index(t) for t in types], dtype=np.int64)
+
+    def team_code_of(self, team: Any) -> int:
+        """Code of a team, or -1 if it has no events."""
+        return self.teams.index(team) if team in self.team_rows else -1
+
+    @staticmethod
+    def _group_rows(codes: np.ndarray, labels: List[Any]) -> Dict[Any, np.ndarray]:
+        """Row indices per code, from one stable sort."""
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(labels) + 1))
+        return {
+            label: order[bounds[i]:bounds[i + 1]]
+            for i, label in enumerate(labels)
+            if bounds[i + 1] > bounds[i]
+        }
@@ -9,6 +9,7 @@ Based on Karun Singh's original xT model.
 from dataclasses import dataclass, field
 from typing import Tuple
 import numpy as np
+from numpy.typing import ArrayLike
 
 
 # Pre-computed xT values for a 12x8 grid
@@ -128,5 +129,63 @@ class ExpectedThreatGrid:
         
         return end_xt - start_xt
     
+    def pitch_to_zones(self, x: ArrayLike, y: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized pitch_to_zone for arrays of coordinates.
+        
+        Args:
+            x: Pitch x coordinates (0-105m)
+            y: Pitch y coordinates (0-68m)
+            
+        Returns:
+            Tuple of (zone_x, zone_y) int arrays, clamped to the grid
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        # Truncation toward zero, like int(), before clamping
+        zone_x = np.trunc(x / self.pitch_length * self.width)
+        zone_y = np.trunc(y / self.pitch_width * self.height)
+        zone_x = np.clip(np.nan_to_num(zone_x), 0, self.width - 1).astype(np.intp)
+        zone_y = np.clip(np.nan_to_num(zone_y), 0, self.height - 1).astype(np.intp)
+        return zone_x, zone_y
+    
+    def get_threat_at_pitch_locations(self, x: ArrayLike, y: ArrayLike) -> np.ndarray:
+        """
+        Vectorized get_threat_at_pitch_location.
+        
+        Args:
+            x: Pitch x coordinates (0-105m)
+            y: Pitch y coordinates (0-68m)
+            
+        Returns:
+            Array of xT values with the broadcast shape of x and y
+        """
+        zone_x, zone_y = self.pitch_to_zones(x, y)
+        return self.grid[zone_y, zone_x]
+    
+    def calculate_xt_changes(
+        self,
+        from_x: ArrayLike,
+        from_y: ArrayLike,
+        to_x: ArrayLike,
+        to_y: ArrayLike
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_xt_change for many actions at once.
+        
+        Args:
+            from_x: Starting x coordinates
+            from_y: Starting y coordinates
+            to_x: Ending x coordinates
+            to_y: Ending y coordinates
+            
+        Returns:
+            Array of xT deltas (positive = xT gained)
+        """
+        return (
+            self.get_threat_at_pitch_locations(to_x, to_y)
+            - self.get_threat_at_pitch_locations(from_x, from_y)
+        )
+    
     def __hash__(self):
         return hash((self.width, self.height, self.pitch_length, self.pitch_width))
@@ -0,0 +1,102 @@
+"""
+MetricsState Value Objects - Domain Layer
+
+Running state for incremental metrics calculation.
+
+Holds everything needed to fold a new block of tracking frames (and its
+events) into a match's metrics without revisiting earlier frames:
+per-player kinematics accumulators, per-team event counters and the event
+detector's possession state.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class PlayerRunningState:
+    """
+    Per-player accumulators for physical metrics.
+
+    Smoothed speeds are only final once the smoothing window no longer
+    reaches the end of the track; those rows are folded into the
+    committed_* accumulators. The last few rows stay provisional and are
+    recomputed when the next block arrives.
+    """
+    rows: int = 0  # positions seen
+    last_frame: int = -1
+    committed_rows: int = 0  # smoothed speed rows that are final
+    speed_sum: float = 0.0  # sum of committed speeds (m/s)
+    max_speed: float = 0.0  # max committed speed (m/s)
+    sprint_count: int = 0  # sprints started in committed rows
+    in_sprint: bool = False  # last committed row above the sprint threshold
+    provisional_speeds: List[float] = field(default_factory=list)  # m/s
+    tail_x: List[float] = field(default_factory=list)  # last positions (meters)
+    tail_y: List[float] = field(default_factory=list)
+    tail_t: List[float] = field(default_factory=list)  # their timestamps (seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PlayerRunningState":
+        return cls(**data)
+
+
+@dataclass
+class TeamEventCounters:
+    """Per-team event counts behind PPDA."""
+    passes_in_attacking_two_thirds: int = 0
+    defensive_actions: int = 0
+
+
+@dataclass
+class MetricsState:
+    """
+    Running metrics state of one match.
+
+    Attributes:
+        match_id: Match identifier
+        players: player_id -> PlayerRunningState
+        teams: team_id -> TeamEventCounters
+        frames_processed: Distinct frames folded in so far
+        events_processed: Events folded in so far
+        possession: Ball possession at the end of the last block, for
+            events inferred from tracking (period, player_id, team_id,
+            start_frame, x, y), or None
+    """
+    match_id: str
+    players: Dict[Any, PlayerRunningState] = field(default_factory=dict)
+    teams: Dict[str, TeamEventCounters] = field(default_factory=dict)
+    frames_processed: int = 0
+    events_processed: int = 0
+    possession: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly form (player ids keep their type)."""
+        return {
+            "match_id": self.match_id,
+            "players": [
+                {"player_id": player_id, **state.to_dict()}
+                for player_id, state in self.players.items()
+            ],
+            "teams": {team: dict(c.__dict__) for team, c in self.teams.items()},
+            "frames_processed": self.frames_processed,
+            "events_processed": self.events_processed,
+            "possession": self.possession,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MetricsState":
+        players = {}
+        for entry in data.get("players", []):
+            entry = dict(entry)
+            player_id = entry.pop("player_id")
+            players[player_id] = PlayerRunningState.from_dict(entry)
+        return cls(
+            match_id=data["match_id"],
+            players=players,
+            teams={team: TeamEventCounters(**c) for team, c in data.get("teams", {}).items()},
+            frames_processed=data.get("frames_processed", 0),
+            events_processed=data.get("events_processed", 0),
+            possession=data.get("possession"),
+        )
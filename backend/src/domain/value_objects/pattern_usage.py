@@ -0,0 +1,125 @@
+"""
+PatternUsage - Domain Layer
+
+Value Object counting how often a team used one league-level pattern.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from src.domain.value_objects.sequence_features import SequenceFeatures
+
+
+@dataclass(frozen=True)
+class PatternUsage:
+    """
+    Value Object: A team's sequences in one league pattern cluster.
+
+    Holds sums rather than averages so usages of the same team and
+    cluster from different matches combine by addition.
+    """
+    team_id: str
+    cluster_label: int
+    occurrence_count: int = 0
+    success_count: int = 0  # Ended in shot or goal
+    goal_count: int = 0
+    total_duration_seconds: float = 0.0
+    total_event_count: float = 0.0
+    total_xt_progression: float = 0.0
+    match_count: int = 1
+
+    @classmethod
+    def aggregate(
+        cls,
+        team_ids: Sequence[str],
+        cluster_labels: Sequence[int],
+        features: Sequence[SequenceFeatures]
+    ) -> List["PatternUsage"]:
+        """
+        One usage per (team, cluster) from per-sequence assignments.
+
+        Args:
+            team_ids: Team of each sequence
+            cluster_labels: Assigned cluster of each sequence
+            features: Features of each sequence
+
+        Returns:
+            PatternUsage list ordered by team then cluster
+        """
+        if len(features) == 0:
+            return []
+
+        teams, team_index = np.unique(np.asarray(team_ids, dtype=object).astype(str), return_inverse=True)
+        labels = np.asarray(cluster_labels, dtype=np.int64)
+        keys, group = np.unique(np.stack([team_index, labels], axis=1), axis=0, return_inverse=True)
+        group = group.ravel()
+
+        success = np.array([f.ended_in_shot or f.ended_in_goal for f in features], dtype=np.float64)
+        goals = np.array([f.ended_in_goal for f in features], dtype=np.float64)
+        sums = {
+            name: np.bincount(group, weights=values, minlength=len(keys))
+            for name, values in (
+                ("success", success),
+                ("goals", goals),
+                ("duration", np.array([f.duration_seconds for f in features], dtype=np.float64)),
+                ("events", np.array([f.event_count for f in features], dtype=np.float64)),
+                ("xt", np.array([f.xt_progression for f in features], dtype=np.float64)),
+            )
+        }
+        counts = np.bincount(group, minlength=len(keys))
+
+        return [
+            cls(
+                team_id=str(teams[team]),
+                cluster_label=int(label),
+                occurrence_count=int(counts[i]),
+                success_count=int(sums["success"][i]),
+                goal_count=int(sums["goals"][i]),
+                total_duration_seconds=float(sums["duration"][i]),
+                total_event_count=float(sums["events"][i]),
+                total_xt_progression=float(sums["xt"][i]),
+            )
+            for i, (team, label) in enumerate(keys)
+        ]
+
+    @property
+    def avg_duration_seconds(self) -> float:
+        return self.total_duration_seconds / self.occurrence_count if self.occurrence_count else 0.0
+
+    @property
+    def avg_event_count(self) -> float:
+        return self.total_event_count / self.occurrence_count if self.occurrence_count else 0.0
+
+    @property
+    def avg_xt_progression(self) -> float:
+        return self.total_xt_progression / self.occurrence_count if self.occurrence_count else 0.0
+
+    @property
+    def per_match(self) -> float:
+        """Average occurrences per match the team played."""
+        return self.occurrence_count / self.match_count if self.match_count else 0.0
+
+    @property
+    def success_rate(self) -> float:
+        """Share of sequences ending in a shot or goal."""
+        return self.success_count / self.occurrence_count if self.occurrence_count else 0.0
+
+    @property
+    def goal_rate(self) -> float:
+        return self.goal_count / self.occurrence_count if self.occurrence_count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API response."""
+        return {
+            "team_id": self.team_id,
+            "cluster_label": self.cluster_label,
+            "occurrence_count": self.occurrence_count,
+            "match_count": self.match_count,
+            "per_match": round(self.per_match, 2),
+            "success_rate": round(self.success_rate, 3),
+            "goal_rate": round(self.goal_rate, 3),
+            "avg_duration_seconds": round(self.avg_duration_seconds, 2),
+            "avg_event_count": round(self.avg_event_count, 1),
+            "avg_xt_progression": round(self.avg_xt_progression, 4),
+        }
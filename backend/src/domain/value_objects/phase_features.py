@@ -4,8 +4,11 @@ PhaseFeatures Value Object - Domain Layer
 Feature vector extracted from tracking data for phase classification.
 """
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Any, Mapping, Optional, Tuple
 import numpy as np
+from numpy.typing import ArrayLike
+
+from src.domain.services.spatial_index import FrameSpatialIndex
 
 
 @dataclass(frozen=True)
@@ -90,6 +93,197 @@ class PhaseFeatures:
         """Return number of features."""
         return 15
     
+    @classmethod
+    def from_vector(cls, vector: ArrayLike) -> "PhaseFeatures":
+        """Build features from one row of a feature matrix (inverse of to_vector)."""
+        return cls(*(float(v) for v in vector))
+    
+    @classmethod
+    def from_arrays(
+        cls,
+        frame_id: ArrayLike,
+        team: ArrayLike,
+        x: ArrayLike,
+        y: ArrayLike,
+        ball_x: Optional[ArrayLike] = None,
+        ball_y: Optional[ArrayLike] = None,
+        fps: float = 25.0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Extract features for every frame of a tracking table at once.
+        
+        Rows are grouped by (frame, team) in a single sort and every
+        feature is a segment reduction over those groups, giving the same
+        values as calling from_tracking_frame frame by frame. Rows whose
+        team is neither "home" nor "away" only contribute the ball.
+        
+        Args:
+            frame_id: Frame of each row
+            team: "home" / "away" label of each row
+            x, y: Player position of each row
+            ball_x, ball_y: Ball position repeated on each row (the first
+                row of a frame wins); centre spot when omitted
+            fps: Frame rate used for ball velocity
+            
+        Returns:
+            (frame_ids, features): sorted unique frame ids and the
+            (frames x num_features()) float64 feature matrix
+        """
+        frame_id = np.asarray(frame_id, dtype=np.int64)
+        team = np.asarray(team, dtype=object)
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        
+        frame_ids, first_row, frame_index = np.unique(
+            frame_id, return_index=True, return_inverse=True
+        )
+        n_frames = len(frame_ids)
+        features = np.empty((n_frames, cls.num_features()), dtype=np.float64)
+        if n_frames == 0:
+            return frame_ids, features
+        
+        # Ball position (first row of each frame) and velocity
+        ball = np.column_stack([
+            np.asarray(ball_x, dtype=np.float64)[first_row] if ball_x is not None
+            else np.full(n_frames, 52.5),
+            np.asarray(ball_y, dtype=np.float64)[first_row] if ball_y is not None
+            else np.full(n_frames, 34.0),
+        ])
+        previous = np.vstack([[52.5, 34.0], ball[:-1]])
+        velocity = (ball - previous) * fps
+        
+        # One group per (frame, side): side 0 = home, 1 = away
+        is_home, is_away = team == "home", team == "away"
+        keep = is_home | is_away
+        side = is_away[keep].astype(np.int64)
+        group = frame_index[keep] * 2 + side
+        gx, gy = x[keep], y[keep]
+        n_groups = 2 * n_frames
+        
+        counts = np.bincount(group, minlength=n_groups)
+        present = counts > 0
+        safe_counts = np.maximum(counts, 1)
+        mean_x = np.bincount(group, gx, n_groups) / safe_counts
+        mean_y = np.bincount(group, gy, n_groups) / safe_counts
+        var_x = np.bincount(group, (gx - mean_x[group]) ** 2, n_groups) / safe_counts
+        var_y = np.bincount(group, (gy - mean_y[group]) ** 2, n_groups) / safe_counts
+        spread_x = np.where(counts > 1, np.sqrt(var_x), 0.0)
+        spread_y = np.where(counts > 1, np.sqrt(var_y), 0.0)
+        centroid_x = np.where(present, mean_x, 52.5)
+        centroid_y = np.where(present, mean_y, 34.0)
+        
+        # Defensive lines: mean x of the 4 deepest players (all if fewer),
+        # lowest x for home, highest x for away
+        order = np.lexsort((gx, group))
+        sorted_group = group[order]
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        rank = np.arange(len(order)) - starts[sorted_group]
+        deepest = np.where(
+            sorted_group % 2 == 0,
+            rank < 4,
+            rank >= counts[sorted_group] - 4,
+        )
+        line_group = sorted_group[deepest]
+        line_sum = np.bincount(line_group, gx[order][deepest], n_groups)
+        line_count = np.bincount(line_group, minlength=n_groups)
+        line = line_sum / np.maximum(line_count, 1)
+        line[~present] = 52.5  # an empty side stands on the centre spot, as for centroids
+        
+        # Possession: closest player of each side to the ball
+        distance = np.sqrt(
+            (gx - ball[frame_index[keep], 0]) ** 2 + (gy - ball[frame_index[keep], 1]) ** 2
+        )
+        distance[np.isnan(distance)] = np.inf
+        ball_distance = np.full(n_groups, 100.0)
+        if present.any():
+            ball_distance[present] = np.minimum.reduceat(distance[order], starts[present])
+        ball_distance = ball_distance.reshape(n_frames, 2)
+        with np.errstate(over="ignore", invalid="ignore"):
+            home_poss_prob = 1.0 / (1.0 + np.exp(-(ball_distance[:, 1] - ball_distance[:, 0]) / 2.0))
+        
+        home, away = slice(0, None, 2), slice(1, None, 2)
+        features[:, 0] = centroid_x[home]
+        features[:, 1] = centroid_y[home]
+        features[:, 2] = centroid_x[away]
+        features[:, 3] = centroid_y[away]
+        features[:, 4] = spread_x[home]
+        features[:, 5] = spread_y[home]
+        features[:, 6] = spread_x[away]
+        features[:, 7] = spread_y[away]
+        features[:, 8:10] = ball
+        features[:, 10:12] = velocity
+        features[:, 12] = line[home]
+        features[:, 13] = line[away]
+        features[:, 14] = home_poss_prob
+        return frame_ids, features
+    
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        from_arrays over a column mapping (dict of arrays or DataFrame).
+        
+        Uses frame_id, team, x, y and, when present, ball_x / ball_y.
+        """
+        return cls.from_arrays(
+            frame_id=np.asarray(columns["frame_id"]),
+            team=np.asarray(columns["team"]),
+            x=np.asarray(columns["x"]),
+            y=np.asarray(columns["y"]),
+            ball_x=np.asarray(columns["ball_x"]) if "ball_x" in columns else None,
+            ball_y=np.asarray(columns["ball_y"]) if "ball_y" in columns else None,
+        )
+    
+    @staticmethod
+    def windowed(
+        frame_ids: ArrayLike,
+        features: np.ndarray,
+        step_frames: int,
+        window_frames: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Downsample a per-frame feature matrix to rolling-window means.
+        
+        Frames are split into tiles of step_frames consecutive frame ids;
+        each tile that has frames gets the mean feature vector over a
+        window of window_frames frame ids centred on the tile.
+        
+        Args:
+            frame_ids: Sorted frame id of each row of `features`
+            features: (frames x num_features()) matrix from from_arrays
+            step_frames: Tile length (e.g. 25 for 1 Hz at 25 fps)
+            window_frames: Averaging window (default step_frames)
+            
+        Returns:
+            (window_of_frame, window_features): tile index of every frame
+            and the (tiles x num_features()) matrix, tiles in frame order
+        """
+        if step_frames < 1:
+            raise ValueError("step_frames must be >= 1")
+        window_frames = step_frames if window_frames is None else window_frames
+        if window_frames < step_frames:
+            raise ValueError("window_frames must be >= step_frames")
+        
+        frame_ids = np.asarray(frame_ids, dtype=np.int64)
+        if len(frame_ids) == 0:
+            return np.empty(0, dtype=np.int64), np.empty((0, features.shape[1]))
+        
+        tiles, window_of_frame = np.unique(
+            (frame_ids - frame_ids[0]) // step_frames, return_inverse=True
+        )
+        centre = frame_ids[0] + tiles * step_frames + (step_frames - 1) / 2.0
+        lo = np.searchsorted(frame_ids, centre - (window_frames - 1) / 2.0, side="left")
+        hi = np.searchsorted(frame_ids, centre + (window_frames - 1) / 2.0, side="right")
+        
+        # Prefix sums over finite values, so one NaN frame only drops out
+        # of its own windows instead of poisoning every later one
+        finite = np.isfinite(features)
+        zeros = np.zeros((1, features.shape[1]))
+        sums = np.vstack([zeros, np.cumsum(np.where(finite, features, 0.0), axis=0)])
+        counts = np.vstack([zeros, np.cumsum(finite, axis=0)])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            window_features = (sums[hi] - sums[lo]) / (counts[hi] - counts[lo])
+        return window_of_frame, window_features
+    
     @classmethod
     def from_tracking_frame(
         cls,
@@ -129,14 +323,12 @@ class PhaseFeatures:
         away_def_line = np.mean(away_sorted_x) if away_sorted_x else 90.0
         
         # Calculate possession probability
-        home_ball_dist = min(
-            np.sqrt((p[0] - ball_position[0])**2 + (p[1] - ball_position[1])**2)
-            for p in home_positions
-        ) if home_positions else 100.0
-        away_ball_dist = min(
-            np.sqrt((p[0] - ball_position[0])**2 + (p[1] - ball_position[1])**2)
-            for p in away_positions
-        ) if away_positions else 100.0
+        home_ball_dist = FrameSpatialIndex.from_points(home_positions).nearest(
+            ball_position
+        )[1][0, 0] if home_positions else 100.0
+        away_ball_dist = FrameSpatialIndex.from_points(away_positions).nearest(
+            ball_position
+        )[1][0, 0] if away_positions else 100.0
         
         # Sigmoid-based possession probability
         dist_diff = away_ball_dist - home_ball_dist
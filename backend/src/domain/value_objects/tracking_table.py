@@ -0,0 +1,152 @@
+"""
+TrackingTable Value Object - Domain Layer
+
+Columnar representation of a match's tracking data.
+
+One row per (frame, object) observation, stored as parallel NumPy arrays
+instead of a list of dicts. This is the in-memory form of the tracking
+parquet written by the vision pipeline.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Mapping, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class TrackingTable:
+    """
+    Value object holding tracking observations column by column.
+
+    All columns have the same length. Coordinates are in metric pitch
+    units (0-105m x 0-68m).
+    """
+
+    frame_id: np.ndarray  # int64
+    player_id: np.ndarray  # object (track/player identifiers)
+    x: np.ndarray  # float64, meters
+    y: np.ndarray  # float64, meters
+    timestamp: np.ndarray  # float64, seconds
+    object_type: np.ndarray  # object ("player", "ball", ...)
+    team_id: np.ndarray  # object ("home", "away", "unknown")
+    confidence: np.ndarray  # float64
+    period: np.ndarray  # int64 (1 = first half, 2 = second half, ...)
+
+    COLUMNS = (
+        "frame_id", "player_id", "x", "y",
+        "timestamp", "object_type", "team_id", "confidence", "period"
+    )
+
+    def __len__(self) -> int:
+        return len(self.frame_id)
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Any]) -> "TrackingTable":
+        """
+        Build a table from a column mapping (dict of arrays or DataFrame).
+
+        Optional columns fall back to the same defaults the dict-based
+        pipeline uses: timestamp 0.0, object_type "player",
+        team_id "unknown", confidence 1.0, period 1.
+        """
+        frame_id = np.asarray(columns["frame_id"], dtype=np.int64)
+        n = len(frame_id)
+
+        def optional(name: str, default: Any, dtype: Any) -> np.ndarray:
+            if name in columns:
+                return np.asarray(columns[name], dtype=dtype)
+            return np.full(n, default, dtype=dtype)
+
+        return cls(
+            frame_id=frame_id,
+            player_id=np.asarray(columns["player_id"], dtype=object),
+            x=np.asarray(columns["x"], dtype=np.float64),
+            y=np.asarray(columns["y"], dtype=np.float64),
+            timestamp=optional("timestamp", 0.0, np.float64),
+            object_type=optional("object_type", "player", object),
+            team_id=optional("team_id", "unknown", object),
+            confidence=optional("confidence", 1.0, np.float64),
+            period=optional("period", 1, np.int64),
+        )
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> "TrackingTable":
+        """Build a table from the legacy list-of-dicts payload."""
+        columns: Dict[str, List[Any]] = {
+            "frame_id": [r["frame_id"] for r in records],
+            "player_id": [r["player_id"] for r in records],
+            "x": [r["x"] for r in records],
+            "y": [r["y"] for r in records],
+            "timestamp": [r.get("timestamp", 0.0) for r in records],
+            "object_type": [r.get("object_type", "player") for r in records],
+            "team_id": [r.get("team_id", "unknown") for r in records],
+            "confidence": [r.get("confidence", 1.0) for r in records],
+            "period": [r.get("period", 1) for r in records],
+        }
+        return cls.from_columns(columns)
+
+    @classmethod
+    def concat(cls, tables: List["TrackingTable"]) -> "TrackingTable":
+        """Stack tables row-wise, in order."""
+        return cls(**{
+            name: np.concatenate([getattr(t, name) for t in tables]) for name in cls.COLUMNS
+        })
+
+    def take(self, indices: np.ndarray) -> "TrackingTable":
+        """Return a new table with the rows at `indices` (or a boolean mask)."""
+        return TrackingTable(**{name: getattr(self, name)[indices] for name in self.COLUMNS})
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Yield rows as dicts (for consumers still on the record API)."""
+        for i in range(len(self)):
+            yield {
+                "frame_id": int(self.frame_id[i]),
+                "player_id": self.player_id[i],
+                "x": float(self.x[i]),
+                "y": float(self.y[i]),
+                "timestamp": float(self.timestamp[i]),
+                "object_type": self.object_type[i],
+                "team_id": self.team_id[i],
+                "confidence": float(self.confidence[i]),
+                "period": int(self.period[i]),
+            }
+
+
+def factorize(values: np.ndarray) -> Tuple[List[Any], np.ndarray]:
+    """
+    Encode values as dense integer codes ordered by first appearance.
+
+    Args:
+        values: Object or numeric array (e.g. TrackingTable.player_id)
+
+    Returns:
+        (unique values, int64 code per row)
+    """
+    if values.dtype == object:
+        # Hash-based and O(n); sorting Python objects is far slower. Missing
+        # values keep their own code and come back as the original object.
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        uniques = uniques.tolist()
+        for code in np.flatnonzero(pd.isna(uniques)):
+            uniques[code] = values[np.argmax(codes == code)]
+        return uniques, codes.astype(np.int64)
+
+    try:
+        uniques, first, codes = np.unique(values, return_index=True, return_inverse=True)
+    except TypeError:
+        # Mixed, non-comparable types: fall back to a hash map
+        index: Dict[Any, int] = {}
+        codes = np.fromiter(
+            (index.setdefault(v, len(index)) for v in values.tolist()),
+            dtype=np.int64, count=len(values)
+        )
+        return list(index), codes
+
+    # Renumber so code order follows first appearance
+    rank = np.empty(len(uniques), dtype=np.int64)
+    rank[np.argsort(first, kind="stable")] = np.arange(len(uniques))
+    ordered: List[Any] = [None] * len(uniques)
+    for value, r in zip(uniques.tolist(), rank.tolist()):
+        ordered[r] = value
+    return ordered, rank[codes.ravel()]
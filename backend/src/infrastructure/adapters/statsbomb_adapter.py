@@ -18,6 +18,18 @@ from src.infrastructure.storage.minio_adapter import MinIOAdapter
 logger = logging.getLogger(__name__)
 
 
+# End location and outcome columns per StatsBomb event type
+STATSBOMB_END_LOCATION = {
+    "Pass": "pass_end_location",
+    "Carry": "carry_end_location",
+}
+STATSBOMB_OUTCOME = {
+    "Pass": "pass_outcome",
+    "Shot": "shot_outcome",
+    "Dribble": "dribble_outcome",
+}
+
+
 # Mapping from StatsBomb event types to our domain EventType
 STATSBOMB_EVENT_MAP = {
     "Pass": EventType.PASS,
@@ -121,6 +133,16 @@ class StatsBombAdapter(MatchRepository):
         # Transform coordinates from StatsBomb (120x80) to Metric (105x68)
         coords = Coordinates.from_statsbomb(location[0], location[1])
 
+        end_coords = None
+        end_location = row.get(STATSBOMB_END_LOCATION.get(event_type_str, ""))
+        if isinstance(end_location, (list, tuple)) and len(end_location) >= 2:
+            end_coords = Coordinates.from_statsbomb(end_location[0], end_location[1])
+
+        # Missing outcome means success for passes (StatsBomb convention)
+        outcome = row.get(STATSBOMB_OUTCOME.get(event_type_str, ""))
+        if outcome is not None and not isinstance(outcome, str):
+            outcome = None if pd.isna(outcome) else str(outcome)
+
         return Event(
             event_id=str(row.get("id", "")),
             event_type=STATSBOMB_EVENT_MAP[event_type_str],
@@ -128,4 +150,6 @@ class StatsBombAdapter(MatchRepository):
             coordinates=coords,
             player_id=str(row.get("player_id", "unknown")),
             team_id=str(row.get("team_id", "")),
+            end_coordinates=end_coords,
+            outcome=outcome,
         )
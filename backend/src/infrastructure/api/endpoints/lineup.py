@@ -4,7 +4,7 @@ Lineup API Endpoints - Infrastructure Layer
 Endpoints for managing player-track ID mappings.
 Allows users to associate tracked player IDs with actual player names.
 """
-from typing import Optional, List
+from typing import Dict, Optional, List
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 import logging
@@ -150,6 +150,20 @@ def get_player_name(match_id: str, track_id: int) -> Optional[str]:
         return None
 
 
+def get_lineup(match_id: str) -> Dict[int, PlayerMappingDTO]:
+    """
+    Get the whole lineup of a match keyed by track ID.
+    
+    Used to label many events at once with a single (cached) lookup.
+    """
+    try:
+        repo = _get_repo()
+        return repo.get_lineup(match_id)
+    except Exception as e:
+        logger.warning(f"Failed to get lineup: {e}")
+        return {}
+
+
 def get_team_by_track(match_id: str, track_id: int) -> Optional[str]:
     """
     Get team (home/away) by track ID.
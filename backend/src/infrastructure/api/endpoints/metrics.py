@@ -3,10 +3,13 @@ Metrics API Endpoints - Infrastructure Layer
 
 Endpoints for tactical metrics calculation.
 """
-from fastapi import APIRouter
+from typing import Optional
+
+import numpy as np
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-from src.infrastructure.worker.celery_app import celery_app
+from src.infrastructure.worker.celery_app import send_task_checked, TaskPayloadTooLargeError
 
 router = APIRouter(prefix="/api/v1", tags=["metrics"])
 
@@ -16,6 +19,7 @@ class MetricsRequest(BaseModel):
     match_id: str
     tracking_data: list = []  # Optional - will fetch from storage if empty
     event_data: list = []
+    tracking_key: Optional[str] = None  # Storage key of the tracking parquet
 
 
 @router.post("/calculate-metrics")
@@ -24,17 +28,140 @@ async def calculate_metrics(request: MetricsRequest):
     Start an async tactical metrics calculation job.
     
     Calculates distances, speeds, pitch control, PPDA, etc.
-    If tracking_data is empty, fetches from storage.
+    If tracking_data is empty, the worker loads the tracking parquet from
+    storage (tracking_key, or the match's default key). Inline payloads
+    larger than the broker cap are rejected with 413.
     
     Returns immediately with a job_id for status polling.
     """
-    task = celery_app.send_task(
-        'calculate_match_metrics',  # Uses shared_task name
-        args=[request.match_id, request.tracking_data, request.event_data]
-    )
+    try:
+        task = send_task_checked(
+            'calculate_match_metrics',  # Uses shared_task name
+            args=[request.match_id, request.tracking_data, request.event_data],
+            kwargs={"tracking_key": request.tracking_key}
+        )
+    except TaskPayloadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     
     return {
         "job_id": task.id,
         "status": "PENDING",
         "message": f"Metrics calculation started for match {request.match_id}",
     }
+
+
+# Upper bound on surfaces returned by one request (~770 KB of JSON at 24x32)
+MAX_PITCH_CONTROL_FRAMES = 500
+
+
+@router.get("/matches/{match_id}/pitch-control")
+async def get_pitch_control(
+    match_id: str,
+    start_frame: int = 0,
+    end_frame: Optional[int] = None,
+    step: int = 1
+):
+    """
+    Get precomputed pitch control surfaces for a frame range.
+    
+    Reads the compressed blocks written by the metrics job; nothing is
+    recomputed. Away control is 1 - home_control for frames with players.
+    
+    Query params:
+    - start_frame: First frame to include (default: 0)
+    - end_frame: Last frame to include (default: all)
+    - step: Return every Nth stored surface (default: 1)
+    
+    Event-anchored surfaces also return the event id of each surface.
+    """
+    from src.infrastructure.storage.pitch_control_store import MinIOPitchControlStore
+    
+    if step < 1:
+        raise HTTPException(status_code=400, detail="step must be >= 1")
+    
+    surfaces = MinIOPitchControlStore().get_surfaces(match_id, start_frame, end_frame)
+    if surfaces is None:
+        raise HTTPException(status_code=404, detail="No pitch control stored for match")
+    
+    frame_ids = surfaces.frame_ids[::step]
+    if len(frame_ids) > MAX_PITCH_CONTROL_FRAMES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Range holds {len(frame_ids)} surfaces (max {MAX_PITCH_CONTROL_FRAMES}); "
+                   f"narrow the frame range or increase step"
+        )
+    
+    response = {
+        "match_id": match_id,
+        "grid_width": surfaces.grid_width,
+        "grid_height": surfaces.grid_height,
+        "frame_ids": frame_ids.tolist(),
+        "home_control": surfaces.home_control[::step].round(3).tolist()
+    }
+    if surfaces.event_ids is not None:
+        response["event_ids"] = surfaces.event_ids[::step].tolist()
+    return response
+
+
+# Upper bound on windows returned by one timeline request (a 120-minute
+# match at a 15 s step fits)
+MAX_TIMELINE_WINDOWS = 500
+
+
+@router.get("/matches/{match_id}/tactical-timeline")
+async def get_tactical_timeline(
+    match_id: str,
+    window_seconds: float = 300.0,
+    step_seconds: float = 60.0
+):
+    """
+    Get rolling-window PPDA, pressing intensity and xT for a match.
+    
+    Computed on the fly from the stored events with prefix sums, so the
+    whole series costs about as much as the match-level metrics. xT uses
+    the grid fitted for the match's competition when there is one.
+    
+    Query params:
+    - window_seconds: Window length (default: 300 = 5 minutes)
+    - step_seconds: Step between window starts (default: 60)
+    
+    Requests needing more than MAX_TIMELINE_WINDOWS windows are rejected
+    with 400.
+    
+    PPDA is null for windows where the team made no defensive action.
+    Pressing is [defensive third, middle third, attacking third].
+    """
+    from src.application.use_cases.tactical_timeline_builder import TacticalTimelineBuilder
+    from src.infrastructure.db.repositories.postgres_match_repo import PostgresMatchRepo
+    from src.infrastructure.storage.xt_grid_store import MinIOExpectedThreatGridStore
+    
+    if window_seconds <= 0 or step_seconds <= 0:
+        raise HTTPException(status_code=400, detail="window_seconds and step_seconds must be > 0")
+    
+    try:
+        timeline = TacticalTimelineBuilder(PostgresMatchRepo(), MinIOExpectedThreatGridStore()).execute(
+            match_id, window_seconds, step_seconds, max_windows=MAX_TIMELINE_WINDOWS
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if timeline is None:
+        raise HTTPException(status_code=404, detail="Match not found")
+    
+    teams = {}
+    for team, ppda in timeline.ppda.items():
+        teams[team] = {
+            "ppda": [None if np.isinf(v) else round(float(v), 2) for v in ppda],
+            "passes_allowed": timeline.passes_allowed[team].tolist(),
+            "defensive_actions": timeline.defensive_actions[team].tolist(),
+            "pressing": timeline.pressing[team].tolist(),
+            "xt": timeline.xt[team].round(4).tolist(),
+        }
+    
+    return {
+        "match_id": match_id,
+        "window_seconds": window_seconds,
+        "step_seconds": step_seconds,
+        "window_start": timeline.window_start.tolist(),
+        "window_end": timeline.window_end.tolist(),
+        "teams": teams
+    }
@@ -5,12 +5,11 @@ Endpoints for tactical pattern detection and querying.
 """
 from typing import Optional, List
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-from src.application.use_cases.pattern_detector import PatternDetector
-from src.infrastructure.db.repositories.postgres_match_repo import PostgresMatchRepo
-from src.infrastructure.ml.sklearn_pattern_detector import SklearnPatternDetector
+from src.infrastructure.db.repositories.postgres_pattern_repo import PostgresPatternRepo
+from src.infrastructure.db.repositories.postgres_pattern_usage_repo import PostgresPatternUsageRepo
 from src.infrastructure.worker.celery_app import celery_app
 
 router = APIRouter(prefix="/api/v1", tags=["patterns"])
@@ -31,6 +30,13 @@ class DetectPatternsResponse(BaseModel):
     message: str
 
 
+class UpdateLeaguePatternsRequest(BaseModel):
+    """Request body for updating the league pattern model."""
+    match_ids: Optional[List[str]] = None
+    competition: Optional[str] = None
+    n_clusters: int = 12
+
+
 @router.post("/patterns/detect", response_model=DetectPatternsResponse)
 async def detect_patterns(request: DetectPatternsRequest):
     """
@@ -87,35 +93,25 @@ async def get_match_patterns(match_id: str, team_id: str = "home"):
     """
     Get discovered patterns for a match.
     
-    Returns patterns if pattern detection has been run, empty list otherwise.
+    Read-only: returns the patterns stored by the last detection job
+    (an empty list if it found none). Returns 404 if detection has not
+    run (or not finished) for the match; start it with POST /patterns/detect.
     """
-    # For now, run synchronously for GET requests
-    # In production, this would query the pattern repository
-    try:
-        detector = SklearnPatternDetector()
-        match_repo = PostgresMatchRepo()
-        
-        use_case = PatternDetector(
-            detector=detector,
-            match_repository=match_repo
+    repository = PostgresPatternRepo()
+    patterns = repository.get_patterns(match_id, team_id)
+    if not patterns and not repository.has_detected(match_id, team_id):
+        raise HTTPException(
+            status_code=404,
+            detail=f"No patterns stored for match {match_id} ({team_id}). "
+                   "Run pattern detection first."
         )
-        
-        result = use_case.execute(match_id=match_id, team_id=team_id)
-        
-        return {
-            "match_id": match_id,
-            "team_id": team_id,
-            "pattern_count": result.pattern_count,
-            "sequence_count": result.sequence_count,
-            "patterns": [p.to_dict() for p in result.patterns]
-        }
-    except Exception as e:
-        return {
-            "match_id": match_id,
-            "team_id": team_id,
-            "pattern_count": 0,
-            "error": str(e)
-        }
+    
+    return {
+        "match_id": match_id,
+        "team_id": team_id,
+        "pattern_count": len(patterns),
+        "patterns": [p.to_dict() for p in patterns]
+    }
 
 
 @router.get("/patterns/{pattern_id}/examples")
@@ -125,9 +121,80 @@ async def get_pattern_examples(pattern_id: str, limit: int = 10):
     
     Returns sequence IDs that belong to this pattern cluster.
     """
-    # Placeholder - would query pattern repository
+    pattern = PostgresPatternRepo().get_pattern_by_id(pattern_id)
+    if pattern is None:
+        raise HTTPException(status_code=404, detail=f"Pattern {pattern_id} not found")
+    
     return {
         "pattern_id": pattern_id,
-        "examples": [],
-        "message": "Pattern examples require running pattern detection first"
+        "examples": pattern.example_sequences[:limit]
+    }
+
+
+@router.post("/league-patterns/update")
+async def update_league_patterns(request: UpdateLeaguePatternsRequest):
+    """
+    Start updating the league pattern model.
+    
+    Updates the league clusters with the given matches (default: every
+    stored match of the competition) that the model has not learned
+    from yet, then stores the usage of every given match with the new
+    clusters; already seen matches are only re-assigned. Usage of
+    matches left out of the request keeps its older model version, so
+    omit match_ids to bring a whole competition to the same version.
+    """
+    task = celery_app.send_task(
+        'update_league_patterns',
+        args=[request.match_ids, request.competition, request.n_clusters]
+    )
+    
+    return {
+        "job_id": task.id,
+        "status": "PENDING",
+        "message": "League pattern update started"
+    }
+
+
+@router.get("/league-patterns/teams/{team_id}")
+async def get_team_league_patterns(
+    team_id: str,
+    competition: Optional[str] = None,
+    season: Optional[str] = None
+):
+    """
+    How often a team uses each league pattern across its matches.
+    
+    Cluster labels are shared by every match, so counts add up across
+    a season. Returns 404 if none of the team's matches are assigned.
+    """
+    usage = PostgresPatternUsageRepo().get_team_usage(team_id, competition, season)
+    if not usage:
+        raise HTTPException(status_code=404, detail=f"No league pattern usage for team {team_id}")
+    
+    return {
+        "team_id": team_id,
+        "competition": competition,
+        "season": season,
+        "patterns": [u.to_dict() for u in usage]
+    }
+
+
+@router.get("/league-patterns/{cluster_label}/teams")
+async def get_league_pattern_teams(
+    cluster_label: int,
+    competition: Optional[str] = None,
+    season: Optional[str] = None
+):
+    """
+    Which teams use a league pattern, and how often.
+    """
+    usage = PostgresPatternUsageRepo().get_pattern_usage(cluster_label, competition, season)
+    if not usage:
+        raise HTTPException(status_code=404, detail=f"No usage of league pattern {cluster_label}")
+    
+    return {
+        "cluster_label": cluster_label,
+        "competition": competition,
+        "season": season,
+        "teams": [u.to_dict() for u in usage]
     }
@@ -3,7 +3,10 @@ Phase Classification API Endpoints - Infrastructure Layer
 
 Endpoints for game phase classification and querying.
 """
-from fastapi import APIRouter
+import math
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 from src.infrastructure.worker.celery_app import celery_app
@@ -23,6 +26,15 @@ class TrainClassifierRequest(BaseModel):
     model_name: str = "phase_classifier"
 
 
+class TrainSeasonClassifierRequest(BaseModel):
+    """Request body for multi-match classifier training."""
+    match_ids: List[str]
+    model_name: str = "phase_classifier"
+    frame_step: int = 5
+    estimator: Literal["forest", "sgd"] = "sgd"
+    epochs: int = 3
+
+
 @router.post("/matches/{match_id}/classify-phases")
 async def classify_match_phases(match_id: str, request: PhaseClassificationRequest = None):
     """
@@ -105,6 +117,87 @@ async def get_match_phases(
     }
 
 
+@router.get("/matches/{match_id}/phases/timeline")
+async def get_phase_timeline(
+    match_id: str,
+    team_id: str = "home",
+    start_frame: int = 0,
+    end_frame: Optional[int] = None,
+    start_time: Optional[float] = None,
+    end_time: Optional[float] = None,
+    min_duration: float = 0.0
+):
+    """
+    Get the phase timeline of a match as merged segments.
+    
+    One database query; returns one entry per phase segment instead of
+    one per frame. Adjacent segments of the same phase are merged.
+    
+    Query params:
+    - start_frame / end_frame: Frame range (inclusive, default: all)
+    - start_time / end_time: Range in match seconds (overrides frames)
+    - min_duration: Absorb segments shorter than this many seconds into
+      their neighbour (0 = no downsampling)
+    - team_id: Perspective (home/away)
+    """
+    from src.infrastructure.storage.phase_repository import phase_repository
+    
+    if min_duration < 0:
+        raise HTTPException(status_code=400, detail="min_duration must be >= 0")
+    
+    in_seconds = start_time is not None or end_time is not None
+    if in_seconds:
+        start, end = start_time or 0.0, end_time
+    else:
+        start, end = start_frame, end_frame
+    if end is not None and end < start:
+        raise HTTPException(status_code=400, detail="range end must not precede its start")
+    
+    timeline = phase_repository.get_phase_timeline(match_id, team_id, start, end, in_seconds)
+    if timeline is None:
+        return {
+            "match_id": match_id,
+            "team_id": team_id,
+            "status": "not_classified",
+            "message": "Phase data not yet available. Run classify-phases first.",
+            "segments": []
+        }
+    
+    fps = timeline.fps
+    if in_seconds:
+        first = math.ceil(start * fps)
+        last = math.floor(end * fps) if end is not None else None
+    else:
+        first, last = start, end
+    timeline = timeline.clip(first, last).merged(min_frames=math.ceil(min_duration * fps))
+    stats = timeline.statistics
+    
+    return {
+        "match_id": match_id,
+        "team_id": team_id,
+        "status": "classified",
+        "fps": fps,
+        "total_frames": timeline.total_frames,
+        "segment_count": len(timeline.segments),
+        "segments": [
+            {
+                "start_frame": seg.start_frame,
+                "end_frame": seg.end_frame,
+                "start_time": seg.start_frame / fps,
+                "end_time": (seg.end_frame + 1) / fps,
+                "phase": seg.phase.value,
+                "confidence": seg.confidence
+            }
+            for seg in timeline.segments
+        ],
+        "statistics": {
+            "transition_count": stats.get("transition_count", 0),
+            "phase_percentages": stats.get("phase_percentages", {}),
+            "dominant_phase": stats.get("dominant_phase", "unknown")
+        }
+    }
+
+
 @router.get("/matches/{match_id}/phases/transitions")
 async def get_phase_transitions(match_id: str, team_id: str = "home"):
     """
@@ -161,3 +254,35 @@ async def train_phase_classifier(request: TrainClassifierRequest):
         "status": "PENDING",
         "message": f"Classifier training started from {request.training_data_path}",
     }
+
+
+@router.post("/classifiers/phase/train-season")
+async def train_phase_classifier_season(request: TrainSeasonClassifierRequest):
+    """
+    Start training the phase classifier on many matches.
+    
+    Each match needs stored tracking data and phase labels
+    (phase_labels/{match_id}.parquet). Features are extracted per match
+    in parallel, then one model is trained and published as a new version.
+    """
+    if not request.match_ids:
+        raise HTTPException(status_code=400, detail="match_ids must not be empty")
+    if request.frame_step < 1 or request.epochs < 1:
+        raise HTTPException(status_code=400, detail="frame_step and epochs must be >= 1")
+    
+    task = celery_app.send_task(
+        'train_phase_classifier_season',
+        args=[
+            request.match_ids,
+            f"/app/models/{request.model_name}.joblib",
+            request.frame_step,
+            request.estimator,
+            request.epochs
+        ]
+    )
+    
+    return {
+        "job_id": task.id,
+        "status": "PENDING",
+        "message": f"Classifier training started over {len(request.match_ids)} matches",
+    }
@@ -11,7 +11,11 @@ from src.infrastructure.db.models import (
     EventModel, 
     PhaseSequenceModel, 
     FramePhaseModel, 
-    PhaseTransitionModel
+    PhaseSegmentModel,
+    PhaseTransitionModel,
+    TacticalPatternModel,
+    PatternDetectionRunModel,
+    PatternUsageModel
 )
 
 def init_db():
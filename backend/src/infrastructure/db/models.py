@@ -71,6 +71,8 @@ class PhaseSequenceModel(Base):
     match = relationship("MatchModel", back_populates="phase_sequences")
     # Relationship to frame phases
     frame_phases = relationship("FramePhaseModel", back_populates="sequence", cascade="all, delete-orphan")
+    # Relationship to run-length phase segments
+    segments = relationship("PhaseSegmentModel", back_populates="sequence", cascade="all, delete-orphan")
     
     # Composite unique constraint
     __table_args__ = (
@@ -82,8 +84,8 @@ class FramePhaseModel(Base):
     """
     SQLAlchemy model for individual frame phase classifications.
     
-    Stores phase label per frame. For large matches, consider using
-    a more efficient storage format (e.g., binary blob, partitioning).
+    Stores phase label per frame. Optional: phase_segments is the primary
+    storage and frames are only written when the repository is asked to.
     """
     __tablename__ = "frame_phases"
     
@@ -102,6 +104,31 @@ class FramePhaseModel(Base):
     )
 
 
+class PhaseSegmentModel(Base):
+    """
+    SQLAlchemy model for run-length encoded phase classifications.
+    
+    One row per run of consecutive frames in the same phase: a few
+    hundred rows per match instead of one per frame.
+    """
+    __tablename__ = "phase_segments"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    sequence_id = Column(Integer, ForeignKey("phase_sequences.id"), nullable=False, index=True)
+    start_frame = Column(Integer, nullable=False)
+    end_frame = Column(Integer, nullable=False)  # Inclusive
+    phase = Column(String, nullable=False)  # GamePhase value
+    confidence = Column(Float, default=1.0)  # Mean over the segment
+    
+    # Relationship to sequence
+    sequence = relationship("PhaseSequenceModel", back_populates="segments")
+    
+    # Index for efficient frame range queries
+    __table_args__ = (
+        Index('ix_phase_segment_seq_start', 'sequence_id', 'start_frame'),
+    )
+
+
 class PhaseTransitionModel(Base):
     """
     SQLAlchemy model for phase transitions (precomputed).
@@ -119,6 +146,84 @@ class PhaseTransitionModel(Base):
     to_phase = Column(String, nullable=False)
 
 
+class TacticalPatternModel(Base):
+    """
+    SQLAlchemy model for TacticalPattern entity.
+    
+    Written by the pattern detection task; read by the patterns API, so
+    serving patterns never re-runs clustering.
+    """
+    __tablename__ = "tactical_patterns"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    pattern_id = Column(String, unique=True, nullable=False, index=True)
+    match_id = Column(String, ForeignKey("matches.match_id"), nullable=False)
+    team_id = Column(String, nullable=False)
+    cluster_label = Column(Integer, nullable=False)
+    label = Column(String, nullable=False)
+    description = Column(String, nullable=True)
+    occurrence_count = Column(Integer, default=0)
+    success_count = Column(Integer, default=0)
+    goal_count = Column(Integer, default=0)
+    avg_duration_seconds = Column(Float, default=0.0)
+    avg_event_count = Column(Float, default=0.0)
+    avg_xt_progression = Column(Float, default=0.0)
+    example_sequences = Column(JSON, nullable=True)  # Sequence IDs
+    centroid = Column(JSON, nullable=True)  # Cluster centre in feature space
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        Index('ix_tactical_pattern_match_team', 'match_id', 'team_id'),
+    )
+
+
+class PatternDetectionRunModel(Base):
+    """
+    SQLAlchemy model for completed pattern detection runs.
+    
+    One row per (match, team), written with the patterns themselves, so
+    a run that found no patterns is told apart from one that never ran.
+    """
+    __tablename__ = "pattern_detection_runs"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    match_id = Column(String, ForeignKey("matches.match_id"), nullable=False)
+    team_id = Column(String, nullable=False)
+    pattern_count = Column(Integer, default=0)
+    completed_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        Index('ix_pattern_detection_run_match_team', 'match_id', 'team_id', unique=True),
+    )
+
+
+class PatternUsageModel(Base):
+    """
+    SQLAlchemy model for league pattern usage.
+    
+    One row per (match, team, league cluster) with summed statistics;
+    season-level questions are answered by summing over matches.
+    """
+    __tablename__ = "pattern_usage"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    match_id = Column(String, ForeignKey("matches.match_id"), nullable=False)
+    team_id = Column(String, nullable=False, index=True)
+    cluster_label = Column(Integer, nullable=False)
+    model_version = Column(Integer, nullable=False)  # League model version used to assign
+    occurrence_count = Column(Integer, default=0)
+    success_count = Column(Integer, default=0)
+    goal_count = Column(Integer, default=0)
+    total_duration_seconds = Column(Float, default=0.0)
+    total_event_count = Column(Float, default=0.0)
+    total_xt_progression = Column(Float, default=0.0)
+    
+    __table_args__ = (
+        Index('ix_pattern_usage_match_team_cluster', 'match_id', 'team_id', 'cluster_label', unique=True),
+        Index('ix_pattern_usage_cluster', 'cluster_label'),
+    )
+
+
 class PhysicalStatsModel(Base):
     """
     SQLAlchemy model for player physical statistics.
@@ -2,9 +2,14 @@
 PostgresLineupRepository - Infrastructure Layer
 
 SQLAlchemy implementation of LineupRepository port.
+
+Lineups are read in full, once per match, and kept in a per-process cache
+with a TTL; writes through this repository invalidate the match's entry.
 """
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
+import threading
+import time
 
 from sqlalchemy.orm import Session
 from sqlalchemy import delete
@@ -21,6 +26,17 @@ class PostgresLineupRepository(LineupRepository):
     PostgreSQL implementation of LineupRepository.
     """
     
+    # Seconds a loaded lineup is served without re-reading the database
+    # (bounds staleness when another process edits the lineup)
+    CACHE_TTL_SECONDS = 300.0
+    
+    # match_id -> (load time, track_id -> mapping), shared by all instances
+    _cache: Dict[str, Tuple[float, Dict[int, PlayerMappingDTO]]] = {}
+    _cache_lock = threading.Lock()
+    # Bumped on every invalidation; a load started under an older generation
+    # may have read rows a concurrent write has since replaced
+    _generation = 0
+    
     def save_mappings(self, match_id: str, mappings: List[PlayerMappingDTO]) -> None:
         """
         Save player mappings for a match.
@@ -54,52 +70,37 @@ class PostgresLineupRepository(LineupRepository):
             raise
         finally:
             db.close()
+            self.invalidate(match_id)
     
     def get_mappings(self, match_id: str) -> List[PlayerMappingDTO]:
         """Get all player mappings for a match."""
-        db: Session = next(get_session())
-        try:
-            models = db.query(PlayerMappingModel).filter(
-                PlayerMappingModel.match_id == match_id
-            ).all()
-            
-            return [
-                PlayerMappingDTO(
-                    track_id=m.track_id,
-                    player_name=m.player_name,
-                    jersey_number=m.jersey_number,
-                    team=m.team
-                )
-                for m in models
-            ]
-        finally:
-            db.close()
+        return list(self.get_lineup(match_id).values())
+    
+    def get_lineup(self, match_id: str) -> Dict[int, PlayerMappingDTO]:
+        """Get the match's lineup by track ID, from the cache when fresh."""
+        cls = type(self)
+        now = time.monotonic()
+        with cls._cache_lock:
+            cached = cls._cache.get(match_id)
+            generation = cls._generation
+        if cached is not None and now - cached[0] < self.CACHE_TTL_SECONDS:
+            return dict(cached[1])
+        
+        lineup = self._load_lineup(match_id)
+        with cls._cache_lock:
+            if cls._generation == generation:
+                cls._cache[match_id] = (now, lineup)
+        return dict(lineup)
     
     def get_player_name(self, match_id: str, track_id: int) -> Optional[str]:
         """Get player name by track ID."""
-        db: Session = next(get_session())
-        try:
-            model = db.query(PlayerMappingModel).filter(
-                PlayerMappingModel.match_id == match_id,
-                PlayerMappingModel.track_id == track_id
-            ).first()
-            
-            return model.player_name if model else None
-        finally:
-            db.close()
+        mapping = self.get_lineup(match_id).get(track_id)
+        return mapping.player_name if mapping else None
     
     def get_team(self, match_id: str, track_id: int) -> Optional[str]:
         """Get team by track ID."""
-        db: Session = next(get_session())
-        try:
-            model = db.query(PlayerMappingModel).filter(
-                PlayerMappingModel.match_id == match_id,
-                PlayerMappingModel.track_id == track_id
-            ).first()
-            
-            return model.team if model else None
-        finally:
-            db.close()
+        mapping = self.get_lineup(match_id).get(track_id)
+        return mapping.team if mapping else None
     
     def delete_mappings(self, match_id: str) -> None:
         """Delete all mappings for a match."""
@@ -117,3 +118,34 @@ class PostgresLineupRepository(LineupRepository):
             raise
         finally:
             db.close()
+            self.invalidate(match_id)
+    
+    @classmethod
+    def invalidate(cls, match_id: Optional[str] = None) -> None:
+        """Drop a match's cached lineup (or every lineup if None)."""
+        with cls._cache_lock:
+            cls._generation += 1
+            if match_id is None:
+                cls._cache.clear()
+            else:
+                cls._cache.pop(match_id, None)
+    
+    def _load_lineup(self, match_id: str) -> Dict[int, PlayerMappingDTO]:
+        """Read a match's lineup in one query."""
+        db: Session = next(get_session())
+        try:
+            models = db.query(PlayerMappingModel).filter(
+                PlayerMappingModel.match_id == match_id
+            ).all()
+            
+            return {
+                m.track_id: PlayerMappingDTO(
+                    track_id=m.track_id,
+                    player_name=m.player_name,
+                    jersey_number=m.jersey_number,
+                    team=m.team
+                )
+                for m in models
+            }
+        finally:
+            db.close()
@@ -59,14 +59,21 @@ class PostgresMatchRepo(MatchRepository):
                 # Create Coordinates value object
                 coordinates = Coordinates(x=event_model.x, y=event_model.y)
                 
+                metadata = event_model.event_metadata or {}
+                end_coordinates = None
+                if metadata.get("end_x") is not None and metadata.get("end_y") is not None:
+                    end_coordinates = Coordinates(x=metadata["end_x"], y=metadata["end_y"])
+                
                 # Reconstruct Event entity
                 event = Event(
                     event_id=str(event_model.id),
                     event_type=event_type,
                     timestamp=event_model.timestamp,
                     coordinates=coordinates,
-                    player_id=event_model.event_metadata.get("player_id", "unknown") if event_model.event_metadata else "unknown",
-                    team_id=event_model.event_metadata.get("team_id") if event_model.event_metadata else None
+                    player_id=metadata.get("player_id", "unknown"),
+                    team_id=metadata.get("team_id"),
+                    end_coordinates=end_coordinates,
+                    outcome=metadata.get("outcome")
                 )
                 events.append(event)
             
@@ -75,7 +82,8 @@ class PostgresMatchRepo(MatchRepository):
                 match_id=match_model.match_id,
                 home_team_id=match_model.match_metadata.get("home_team_id", "unknown") if match_model.match_metadata else "unknown",
                 away_team_id=match_model.match_metadata.get("away_team_id", "unknown") if match_model.match_metadata else "unknown",
-                events=events
+                events=events,
+                competition=(match_model.match_metadata or {}).get("competition")
             )
         finally:
             if not self.session:
@@ -126,6 +134,8 @@ class PostgresMatchRepo(MatchRepository):
                     if event.end_coordinates:
                         event_metadata["end_x"] = event.end_coordinates.x
                         event_metadata["end_y"] = event.end_coordinates.y
+                    if event.outcome:
+                        event_metadata["outcome"] = event.outcome
                     
                     event_model = EventModel(
                         match_id=match.match_id,
@@ -145,6 +155,46 @@ class PostgresMatchRepo(MatchRepository):
             if not self.session:
                 session.close()
 
+    def list_match_ids(self, competition: Optional[str] = None) -> List[str]:
+        """
+        List stored match IDs, optionally for one competition.
+        
+        Args:
+            competition: Competition name stored in match metadata.
+        
+        Returns:
+            Match identifiers, oldest first.
+        """
+        session = self.session or SessionLocal()
+        try:
+            query = session.query(MatchModel.match_id)
+            if competition is not None:
+                query = query.filter(
+                    MatchModel.match_metadata["competition"].as_string() == competition
+                )
+            return [row.match_id for row in query.order_by(MatchModel.created_at).all()]
+        finally:
+            if not self.session:
+                session.close()
+
+    def get_competition(self, match_id: str) -> Optional[str]:
+        """
+        Competition stored in a match's metadata (events are not loaded).
+        
+        Args:
+            match_id: Unique identifier for the match.
+        
+        Returns:
+            Competition name, or None if unknown or the match is missing.
+        """
+        session = self.session or SessionLocal()
+        try:
+            row = session.query(MatchModel.match_metadata).filter_by(match_id=match_id).first()
+            return (row.match_metadata or {}).get("competition") if row else None
+        finally:
+            if not self.session:
+                session.close()
+
     def list_matches(self, limit: int = 20, offset: int = 0) -> List[Match]:
         """
         List all matches from the database.
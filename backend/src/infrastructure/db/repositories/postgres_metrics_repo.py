@@ -4,7 +4,7 @@ PostgresMetricsRepository - Infrastructure Layer
 Postgres implementation of MetricsRepository port.
 """
 import logging
-from typing import List, Dict, Optional
+from typing import Any, Callable, List, Dict, Optional
 import numpy as np
 
 from sqlalchemy.orm import Session
@@ -16,6 +16,9 @@ from src.infrastructure.db.models import PhysicalStatsModel, PPDAStatsModel
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT statement; keeps bind parameters well under Postgres' 65535 limit
+BULK_INSERT_CHUNK = 5000
+
 
 class PostgresMetricsRepository(MetricsRepositoryPort):
     """
@@ -56,8 +59,8 @@ class PostgresMetricsRepository(MetricsRepositoryPort):
         """
         Pitch control frames are NOT persisted to Postgres.
         
-        They are large arrays better suited for object storage or specialized
-        time-series databases. This method logs a warning and no-ops.
+        They are large arrays stored as compressed blocks in object storage
+        by MinIOPitchControlStore. This method logs and no-ops.
         """
         logger.debug(f"Pitch control frame {frame_id} for {match_id} not persisted (by design)")
     
@@ -127,6 +130,97 @@ class PostgresMetricsRepository(MetricsRepositoryPort):
         self.session.execute(stmt)
         self.session.commit()
     
+    def save_physical_stats_bulk(self, match_id: str, rows: List[Dict[str, Any]]) -> None:
+        """
+        Save physical statistics for all players of a match.
+        
+        Uses multi-row INSERT ... ON CONFLICT DO UPDATE statements inside a
+        single transaction instead of one upsert and commit per player.
+        """
+        self._commit(lambda: self._upsert_physical(match_id, rows))
+    
+    def save_ppda_bulk(self, match_id: str, rows: List[Dict[str, Any]]) -> None:
+        """
+        Save PPDA metrics for all teams of a match in one transaction.
+        """
+        self._commit(lambda: self._upsert_ppda(match_id, rows))
+    
+    def save_match_metrics_bulk(
+        self,
+        match_id: str,
+        physical_rows: List[Dict[str, Any]],
+        ppda_rows: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Save physical stats and PPDA of a match in one transaction.
+        """
+        def upsert():
+            self._upsert_physical(match_id, physical_rows)
+            self._upsert_ppda(match_id, ppda_rows)
+        self._commit(upsert)
+    
+    def _upsert_physical(self, match_id: str, rows: List[Dict[str, Any]]) -> None:
+        values = [
+            {
+                "match_id": match_id,
+                "player_id": str(row["player_id"]),
+                "total_distance": float(row["total_distance"]),
+                "max_speed": float(row["max_speed"]),
+                "sprint_count": int(row["sprint_count"]),
+                "avg_speed": float(row["avg_speed"])
+            }
+            for row in rows
+        ]
+        self._bulk_upsert(
+            PhysicalStatsModel,
+            values,
+            index_elements=['match_id', 'player_id'],
+            update_columns=['total_distance', 'max_speed', 'sprint_count', 'avg_speed']
+        )
+    
+    def _upsert_ppda(self, match_id: str, rows: List[Dict[str, Any]]) -> None:
+        values = [
+            {
+                "match_id": match_id,
+                "team_id": row["team_id"],
+                "passes_allowed": int(row["passes_allowed"]),
+                "defensive_actions": int(row["defensive_actions"]),
+                "ppda": float(row["ppda"])
+            }
+            for row in rows
+        ]
+        self._bulk_upsert(
+            PPDAStatsModel,
+            values,
+            index_elements=['match_id', 'team_id'],
+            update_columns=['passes_allowed', 'defensive_actions', 'ppda']
+        )
+    
+    def _commit(self, work: Callable[[], None]) -> None:
+        """Run `work` and commit once; roll everything back on failure."""
+        try:
+            work()
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+    
+    def _bulk_upsert(
+        self,
+        model,
+        values: List[Dict[str, Any]],
+        index_elements: List[str],
+        update_columns: List[str]
+    ) -> None:
+        """Upsert rows in chunks of BULK_INSERT_CHUNK (the caller commits)."""
+        for start in range(0, len(values), BULK_INSERT_CHUNK):
+            stmt = pg_insert(model).values(values[start:start + BULK_INSERT_CHUNK])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=index_elements,
+                set_={column: stmt.excluded[column] for column in update_columns}
+            )
+            self.session.execute(stmt)
+    
     def get_physical_stats(self, match_id: str, team_id: str = None) -> List[dict]:
         """
         Get physical statistics for a match.
@@ -0,0 +1,176 @@
+"""
+PostgreSQL implementation of PatternRepository port.
+"""
+
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from src.domain.entities.tactical_pattern import TacticalPattern
+from src.domain.ports.pattern_repository import PatternRepository
+from src.infrastructure.db.database import SessionLocal
+from src.infrastructure.db.models import PatternDetectionRunModel, TacticalPatternModel
+
+
+class PostgresPatternRepo(PatternRepository):
+    """
+    PostgreSQL adapter for PatternRepository.
+    
+    Saving replaces every stored pattern of the same match and team, so
+    re-running detection never mixes clusters from different fits, and
+    records the run in pattern_detection_runs.
+    """
+
+    def __init__(self, session: Optional[Session] = None):
+        """
+        Initialize repository with optional session.
+        
+        Args:
+            session: SQLAlchemy session. If None, creates a new session per operation.
+        """
+        self.session = session
+
+    def save_patterns(self, match_id: str, team_id: str, patterns: List[TacticalPattern]) -> None:
+        """
+        Replace a match and team's patterns and record the run, in one
+        transaction.
+        
+        Args:
+            match_id: Match identifier
+            team_id: Team the patterns were detected for
+            patterns: List of TacticalPattern entities (may be empty)
+        """
+        session = self.session or SessionLocal()
+        try:
+            for model in (TacticalPatternModel, PatternDetectionRunModel):
+                session.query(model).filter_by(
+                    match_id=match_id, team_id=team_id
+                ).delete(synchronize_session=False)
+            session.add_all([self._to_model(pattern) for pattern in patterns])
+            session.add(PatternDetectionRunModel(
+                match_id=match_id, team_id=team_id, pattern_count=len(patterns)
+            ))
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            if not self.session:
+                session.close()
+
+    def get_patterns(self, match_id: str, team_id: str = None) -> List[TacticalPattern]:
+        """
+        Fetch stored patterns of a match, most frequent first.
+        
+        Args:
+            match_id: Match identifier
+            team_id: Optional team filter
+        
+        Returns:
+            List of TacticalPattern entities (empty if detection has not run)
+        """
+        session = self.session or SessionLocal()
+        try:
+            query = session.query(TacticalPatternModel).filter_by(match_id=match_id)
+            if team_id:
+                query = query.filter_by(team_id=team_id)
+            models = query.order_by(
+                TacticalPatternModel.occurrence_count.desc(),
+                TacticalPatternModel.cluster_label
+            ).all()
+            return [self._to_entity(model) for model in models]
+        finally:
+            if not self.session:
+                session.close()
+
+    def has_detected(self, match_id: str, team_id: str) -> bool:
+        """
+        Whether a detection run has completed for a match and team.
+        
+        Args:
+            match_id: Match identifier
+            team_id: Team identifier
+        
+        Returns:
+            True once patterns (possibly none) were saved for them
+        """
+        session = self.session or SessionLocal()
+        try:
+            return session.query(PatternDetectionRunModel.id).filter_by(
+                match_id=match_id, team_id=team_id
+            ).first() is not None
+        finally:
+            if not self.session:
+                session.close()
+
+    def get_pattern_by_id(self, pattern_id: str) -> Optional[TacticalPattern]:
+        """
+        Fetch a single pattern.
+        
+        Args:
+            pattern_id: Pattern identifier
+        
+        Returns:
+            TacticalPattern or None
+        """
+        session = self.session or SessionLocal()
+        try:
+            model = session.query(TacticalPatternModel).filter_by(pattern_id=pattern_id).first()
+            return self._to_entity(model) if model else None
+        finally:
+            if not self.session:
+                session.close()
+
+    def get_pattern_examples(self, pattern_id: str, limit: int = 10) -> List[str]:
+        """
+        Example sequence IDs of a pattern.
+        
+        Args:
+            pattern_id: Pattern identifier
+            limit: Maximum examples to return
+        
+        Returns:
+            List of sequence IDs (empty if the pattern is unknown)
+        """
+        pattern = self.get_pattern_by_id(pattern_id)
+        return pattern.example_sequences[:limit] if pattern else []
+
+    @staticmethod
+    def _to_model(pattern: TacticalPattern) -> TacticalPatternModel:
+        return TacticalPatternModel(
+            pattern_id=pattern.pattern_id,
+            match_id=pattern.match_id,
+            team_id=pattern.team_id,
+            cluster_label=int(pattern.cluster_label),
+            label=pattern.label,
+            description=pattern.description,
+            occurrence_count=pattern.occurrence_count,
+            success_count=pattern.success_count,
+            goal_count=pattern.goal_count,
+            avg_duration_seconds=float(pattern.avg_duration_seconds),
+            avg_event_count=float(pattern.avg_event_count),
+            avg_xt_progression=float(pattern.avg_xt_progression),
+            example_sequences=list(pattern.example_sequences),
+            centroid=[float(v) for v in pattern.centroid] if pattern.centroid is not None else None,
+            created_at=pattern.created_at
+        )
+
+    @staticmethod
+    def _to_entity(model: TacticalPatternModel) -> TacticalPattern:
+        return TacticalPattern(
+            pattern_id=model.pattern_id,
+            match_id=model.match_id,
+            team_id=model.team_id,
+            cluster_label=model.cluster_label,
+            label=model.label,
+            description=model.description,
+            occurrence_count=model.occurrence_count or 0,
+            success_count=model.success_count or 0,
+            goal_count=model.goal_count or 0,
+            avg_duration_seconds=model.avg_duration_seconds or 0.0,
+            avg_event_count=model.avg_event_count or 0.0,
+            avg_xt_progression=model.avg_xt_progression or 0.0,
+            example_sequences=list(model.example_sequences or []),
+            centroid=model.centroid,
+            created_at=model.created_at
+        )
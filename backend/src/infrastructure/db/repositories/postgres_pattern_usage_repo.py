@@ -0,0 +1,151 @@
+"""
+PostgreSQL implementation of PatternUsageRepository port.
+"""
+
+from typing import Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Query, Session
+
+from src.domain.ports.pattern_usage_repository import PatternUsageRepository
+from src.domain.value_objects.pattern_usage import PatternUsage
+from src.infrastructure.db.database import SessionLocal
+from src.infrastructure.db.models import MatchModel, PatternUsageModel
+
+
+class PostgresPatternUsageRepo(PatternUsageRepository):
+    """
+    PostgreSQL adapter for PatternUsageRepository.
+    
+    Season aggregates are GROUP BY sums over the per-match rows, so
+    adding a match is one small write and nothing is recomputed.
+    """
+
+    def __init__(self, session: Optional[Session] = None):
+        """
+        Initialize repository with optional session.
+        
+        Args:
+            session: SQLAlchemy session. If None, creates a new session per operation.
+        """
+        self.session = session
+
+    def save_match_usage(self, match_id: str, model_version: int, usages: List[PatternUsage]) -> None:
+        """Replace the stored usage rows of a match."""
+        session = self.session or SessionLocal()
+        try:
+            session.query(PatternUsageModel).filter_by(match_id=match_id).delete(synchronize_session=False)
+            session.add_all([
+                PatternUsageModel(
+                    match_id=match_id,
+                    team_id=usage.team_id,
+                    cluster_label=usage.cluster_label,
+                    model_version=model_version,
+                    occurrence_count=usage.occurrence_count,
+                    success_count=usage.success_count,
+                    goal_count=usage.goal_count,
+                    total_duration_seconds=usage.total_duration_seconds,
+                    total_event_count=usage.total_event_count,
+                    total_xt_progression=usage.total_xt_progression
+                )
+                for usage in usages
+            ])
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            if not self.session:
+                session.close()
+
+    def get_team_usage(
+        self,
+        team_id: str,
+        competition: Optional[str] = None,
+        season: Optional[str] = None
+    ) -> List[PatternUsage]:
+        """A team's usage of every league pattern, most used first."""
+        return self._aggregate(
+            PatternUsageModel.team_id == team_id, competition, season
+        )
+
+    def get_pattern_usage(
+        self,
+        cluster_label: int,
+        competition: Optional[str] = None,
+        season: Optional[str] = None
+    ) -> List[PatternUsage]:
+        """Every team's usage of one league pattern, most used first."""
+        return self._aggregate(
+            PatternUsageModel.cluster_label == cluster_label, competition, season
+        )
+
+    def _aggregate(self, condition, competition: Optional[str], season: Optional[str]) -> List[PatternUsage]:
+        """
+        Sum usage rows matching `condition` per (team, cluster).
+        
+        match_count is the number of matches the team has usage rows in,
+        so per-match rates include matches where the pattern never occurred.
+        """
+        session = self.session or SessionLocal()
+        try:
+            rows = self._filtered(
+                session.query(
+                    PatternUsageModel.team_id,
+                    PatternUsageModel.cluster_label,
+                    func.sum(PatternUsageModel.occurrence_count).label("occurrence_count"),
+                    func.sum(PatternUsageModel.success_count).label("success_count"),
+                    func.sum(PatternUsageModel.goal_count).label("goal_count"),
+                    func.sum(PatternUsageModel.total_duration_seconds).label("total_duration_seconds"),
+                    func.sum(PatternUsageModel.total_event_count).label("total_event_count"),
+                    func.sum(PatternUsageModel.total_xt_progression).label("total_xt_progression"),
+                ),
+                competition,
+                season
+            ).filter(condition).group_by(
+                PatternUsageModel.team_id, PatternUsageModel.cluster_label
+            ).all()
+            if not rows:
+                return []
+
+            teams = {row.team_id for row in rows}
+            match_counts: Dict[str, int] = dict(self._filtered(
+                session.query(
+                    PatternUsageModel.team_id,
+                    func.count(PatternUsageModel.match_id.distinct())
+                ),
+                competition,
+                season
+            ).filter(PatternUsageModel.team_id.in_(teams)).group_by(PatternUsageModel.team_id).all())
+
+            usages = [
+                PatternUsage(
+                    team_id=row.team_id,
+                    cluster_label=row.cluster_label,
+                    occurrence_count=int(row.occurrence_count or 0),
+                    success_count=int(row.success_count or 0),
+                    goal_count=int(row.goal_count or 0),
+                    total_duration_seconds=float(row.total_duration_seconds or 0.0),
+                    total_event_count=float(row.total_event_count or 0.0),
+                    total_xt_progression=float(row.total_xt_progression or 0.0),
+                    match_count=int(match_counts.get(row.team_id, 0))
+                )
+                for row in rows
+            ]
+            usages.sort(key=lambda u: (-u.occurrence_count, u.team_id, u.cluster_label))
+            return usages
+        finally:
+            if not self.session:
+                session.close()
+
+    @staticmethod
+    def _filtered(query: Query, competition: Optional[str], season: Optional[str]) -> Query:
+        """Restrict usage rows to matches of a competition and/or season."""
+        if competition is None and season is None:
+            return query
+        query = query.join(MatchModel, MatchModel.match_id == PatternUsageModel.match_id)
+        if competition is not None:
+            query = query.filter(MatchModel.match_metadata["competition"].as_string() == competition)
+        if season is not None:
+            query = query.filter(MatchModel.match_metadata["season"].as_string() == season)
+        return query
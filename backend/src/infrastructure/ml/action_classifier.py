@@ -10,6 +10,7 @@ from typing import List, Optional, Tuple
 from enum import Enum
 import logging
 
+from src.domain.services.spatial_index import FrameSpatialIndex
 from src.domain.services.trajectory_smoother import TrajectoryPoint
 
 logger = logging.getLogger(__name__)
@@ -226,11 +227,10 @@ class HeuristicActionClassifier:
         avg_y = sum(p[1] for p in last_positions) / len(last_positions)
         
         # Calculate average distance from center
-        distances = [
-            ((p[0] - avg_x)**2 + (p[1] - avg_y)**2)**0.5 
-            for p in last_positions
-        ]
-        avg_distance = sum(distances) / len(distances)
+        distances = FrameSpatialIndex.from_points(
+            [(p[0], p[1]) for p in last_positions]
+        ).distances((avg_x, avg_y))
+        avg_distance = float(distances.mean())
         
         # If players are clustered (avg distance < 5m)
         if avg_distance < 5.0:
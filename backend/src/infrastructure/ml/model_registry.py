@@ -0,0 +1,110 @@
+"""
+ModelRegistry - Infrastructure Layer
+
+Per-process cache of ML models loaded from disk.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from prometheus_client import Counter, Histogram
+
+from src.infrastructure.ml.sklearn_league_pattern_model import SklearnLeaguePatternModel
+from src.infrastructure.ml.sklearn_phase_classifier import SklearnPhaseClassifier
+
+logger = logging.getLogger(__name__)
+
+# Metrics
+model_load_duration = Histogram(
+    'model_load_duration_seconds',
+    'Time to load a model file from disk',
+    ['model']
+)
+
+model_loads_total = Counter(
+    'model_loads_total',
+    'Model file loads by reason',
+    ['model', 'reason']
+)
+
+# (mtime_ns, size) of a model file; a published model changes it
+ModelVersion = Tuple[int, int]
+
+
+class ModelRegistry:
+    """
+    Per-process model cache keyed by file path.
+    
+    Each worker process loads a model once and reuses it across tasks.
+    Every lookup stats the file, and a new mtime or size (a newly
+    published model) triggers a reload, so models can be swapped
+    without restarting workers. Models are memory-mapped read-only, so
+    prefork workers share the pages of the large arrays.
+    """
+    
+    _cache: Dict[str, Tuple[ModelVersion, Any]] = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def get(cls, path: str, loader: Callable[[str], Any]) -> Optional[Any]:
+        """
+        Get the model at `path`, loading or reloading it if needed.
+        
+        Args:
+            path: Model file
+            loader: Builds the model from the file
+            
+        Returns:
+            The model, None if the file does not exist
+        """
+        version = cls.version(path)
+        with cls._lock:
+            if version is None:
+                cls._cache.pop(path, None)
+                return None
+            
+            cached = cls._cache.get(path)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            
+            name = os.path.basename(path)
+            start = time.perf_counter()
+            model = loader(path)
+            duration = time.perf_counter() - start
+            
+            model_load_duration.labels(model=name).observe(duration)
+            model_loads_total.labels(model=name, reason="reload" if cached else "initial").inc()
+            logger.info(f"Loaded model {path} (mtime_ns={version[0]}) in {duration:.3f}s")
+            
+            cls._cache[path] = (version, model)
+            return model
+    
+    @classmethod
+    def get_phase_classifier(cls, path: str) -> Optional[SklearnPhaseClassifier]:
+        """Get the memory-mapped SklearnPhaseClassifier stored at `path`."""
+        return cls.get(path, lambda p: SklearnPhaseClassifier.from_file(p, mmap_mode="r"))
+    
+    @classmethod
+    def get_league_pattern_model(cls, path: str) -> Optional[SklearnLeaguePatternModel]:
+        """Get the SklearnLeaguePatternModel stored at `path` (read-only use)."""
+        return cls.get(path, SklearnLeaguePatternModel.from_file)
+    
+    @staticmethod
+    def version(path: str) -> Optional[ModelVersion]:
+        """Current (mtime_ns, size) of the model file, None if missing."""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    @classmethod
+    def invalidate(cls, path: Optional[str] = None) -> None:
+        """Drop one cached model, or all of them."""
+        with cls._lock:
+            if path is None:
+                cls._cache.clear()
+            else:
+                cls._cache.pop(path, None)
@@ -0,0 +1,131 @@
+"""
+SklearnLeaguePatternModel - Infrastructure Layer
+
+ML adapter implementing LeaguePatternModelPort with MiniBatchKMeans.
+"""
+from typing import Optional, Sequence, Set
+import os
+
+import joblib
+import numpy as np
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.preprocessing import StandardScaler
+
+from src.domain.ports.league_pattern_model_port import LeaguePatternModelPort
+
+
+class SklearnLeaguePatternModel(LeaguePatternModelPort):
+    """
+    League pattern clustering trained with MiniBatchKMeans.partial_fit.
+
+    The scaler is fitted on the first batch and then frozen: rescaling
+    later would move every centre at once and break the meaning of the
+    cluster labels already stored. The first batch must therefore hold
+    at least n_clusters sequences and should span several matches.
+    
+    The ids of the matches fed to partial_fit are saved with the model,
+    so later updates can skip them.
+    """
+
+    def __init__(
+        self,
+        n_clusters: int = 12,
+        batch_size: int = 1024,
+        random_state: int = 42
+    ):
+        """
+        Initialize model.
+
+        Args:
+            n_clusters: Number of league patterns
+            batch_size: MiniBatchKMeans batch size
+            random_state: Random seed for reproducibility
+        """
+        self.model = MiniBatchKMeans(
+            n_clusters=n_clusters,
+            batch_size=batch_size,
+            random_state=random_state,
+            n_init=3
+        )
+        self.scaler: Optional[StandardScaler] = None
+        self._version = 0
+        self.seen_match_ids: Set[str] = set()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def n_clusters(self) -> int:
+        return self.model.n_clusters
+
+    def is_fitted(self) -> bool:
+        return self._version > 0
+
+    def partial_fit(self, features: np.ndarray, match_ids: Sequence[str] = ()) -> None:
+        """Update the centres with one batch (fits the scaler on the first)."""
+        features = np.asarray(features, dtype=np.float64)
+        if len(features) == 0:
+            return
+        if self.scaler is None:
+            if len(features) < self.n_clusters:
+                raise ValueError(
+                    f"First batch needs at least {self.n_clusters} sequences, got {len(features)}"
+                )
+            self.scaler = StandardScaler().fit(features)
+        self.model.partial_fit(self.scaler.transform(features))
+        self._version += 1
+        self.seen_match_ids.update(match_ids)
+    
+    def has_seen(self, match_id: str) -> bool:
+        return match_id in self.seen_match_ids
+
+    def assign(self, features: np.ndarray) -> np.ndarray:
+        """Nearest existing centre of each sequence."""
+        if not self.is_fitted():
+            raise ValueError("League pattern model is not fitted")
+        features = np.asarray(features, dtype=np.float64)
+        if len(features) == 0:
+            return np.empty(0, dtype=np.int64)
+        return self.model.predict(self.scaler.transform(features)).astype(np.int64)
+
+    def save_model(self, path: str) -> None:
+        """
+        Save model, scaler, version and seen match ids to disk.
+
+        Written to a temporary file that is then renamed over `path`, so
+        readers never see a partially written model.
+        """
+        if not self.is_fitted():
+            raise ValueError("Cannot save unfitted model")
+
+        os.makedirs(os.path.dirname(path) if os.path.dirname(path) else ".", exist_ok=True)
+
+        model_data = {
+            "model": self.model,
+            "scaler": self.scaler,
+            "version": self._version,
+            "seen_match_ids": sorted(self.seen_match_ids),
+        }
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        try:
+            joblib.dump(model_data, tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def load_model(self, path: str) -> None:
+        """Load model, scaler, version and seen match ids from disk."""
+        model_data = joblib.load(path)
+        self.model = model_data["model"]
+        self.scaler = model_data["scaler"]
+        self._version = model_data["version"]
+        self.seen_match_ids = set(model_data.get("seen_match_ids", []))
+
+    @classmethod
+    def from_file(cls, path: str) -> "SklearnLeaguePatternModel":
+        """Create a model from a saved file."""
+        model = cls()
+        model.load_model(path)
+        return model
@@ -96,7 +96,8 @@ class SklearnPatternDetector(PatternDetectorPort):
             if cluster_label == -1:  # Skip noise in DBSCAN
                 continue
             
-            pattern_id = str(uuid.uuid4())[:8]
+            # Full UUID: pattern_id is unique across every stored pattern
+            pattern_id = str(uuid.uuid4())
             
             # Get centroid if available
             centroid = None
@@ -3,25 +3,33 @@ SklearnPhaseClassifier - Infrastructure Layer
 
 Scikit-learn implementation of PhaseClassifierPort.
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import numpy as np
 from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import SGDClassifier
 from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import cross_val_score
 import joblib
 import os
 
-from src.domain.ports.phase_classifier_port import PhaseClassifierPort
+from src.domain.ports.phase_classifier_port import PhaseClassifierPort, TrainingBatches
 from src.domain.value_objects.game_phase import GamePhase
 from src.domain.value_objects.phase_features import PhaseFeatures
 
 
+# "forest": RandomForestClassifier, in-memory training only.
+# "sgd": logistic-regression SGDClassifier, supports out-of-core training.
+ESTIMATORS = ("forest", "sgd")
+
+
 class SklearnPhaseClassifier(PhaseClassifierPort):
     """
     RandomForest-based phase classifier.
     
     Uses scikit-learn's RandomForestClassifier with feature scaling.
-    Supports training, inference, and model persistence.
+    Supports training, inference, and model persistence. With
+    estimator="sgd" a linear SGDClassifier is used instead, which can be
+    trained incrementally over data that does not fit in memory.
     """
     
     def __init__(
@@ -29,7 +37,8 @@ class SklearnPhaseClassifier(PhaseClassifierPort):
         n_estimators: int = 100,
         max_depth: Optional[int] = 10,
         random_state: int = 42,
-        model_path: Optional[str] = None
+        model_path: Optional[str] = None,
+        estimator: str = "forest"
     ):
         """
         Initialize the classifier.
@@ -39,14 +48,23 @@ class SklearnPhaseClassifier(PhaseClassifierPort):
             max_depth: Maximum tree depth (None for unlimited)
             random_state: Random seed for reproducibility
             model_path: Optional path to load pre-trained model
+            estimator: One of ESTIMATORS
         """
-        self.model = RandomForestClassifier(
-            n_estimators=n_estimators,
-            max_depth=max_depth,
-            random_state=random_state,
-            class_weight="balanced",  # Handle class imbalance
-            n_jobs=-1  # Use all CPUs
-        )
+        if estimator not in ESTIMATORS:
+            raise ValueError(f"estimator must be one of {ESTIMATORS}, got {estimator!r}")
+        if estimator == "sgd":
+            self.model = SGDClassifier(
+                loss="log_loss",  # Probabilistic, for classify_with_confidence
+                random_state=random_state
+            )
+        else:
+            self.model = RandomForestClassifier(
+                n_estimators=n_estimators,
+                max_depth=max_depth,
+                random_state=random_state,
+                class_weight="balanced",  # Handle class imbalance
+                n_jobs=-1  # Use all CPUs
+            )
         self.scaler = StandardScaler()
         self._is_trained = False
         self._label_mapping = {
@@ -96,6 +114,41 @@ class SklearnPhaseClassifier(PhaseClassifierPort):
         
         return self._reverse_mapping.get(pred, GamePhase.UNKNOWN), confidence
     
+    def classify_batch_with_confidence(
+        self, features: np.ndarray
+    ) -> Tuple[List[GamePhase], np.ndarray]:
+        """Classify a feature matrix with one predict_proba call."""
+        n_samples = len(features)
+        if not self._is_trained or n_samples == 0:
+            return [GamePhase.UNKNOWN] * n_samples, np.zeros(n_samples)
+        
+        X_scaled = self.scaler.transform(np.asarray(features, dtype=np.float32))
+        proba = self.model.predict_proba(X_scaled)
+        best = np.argmax(proba, axis=1)
+        preds = self.model.classes_[best]
+        confidences = proba[np.arange(n_samples), best].astype(np.float64)
+        
+        return [self._reverse_mapping.get(p, GamePhase.UNKNOWN) for p in preds], confidences
+    
+    def classify_proba(self, features: np.ndarray) -> np.ndarray:
+        """Phase probabilities (columns in GamePhase order) from one predict_proba call."""
+        n_samples = len(features)
+        phases = list(GamePhase)
+        proba = np.zeros((n_samples, len(phases)))
+        if not self._is_trained:
+            proba[:, phases.index(GamePhase.UNKNOWN)] = 1.0
+            return proba
+        if n_samples == 0:
+            return proba
+        
+        X_scaled = self.scaler.transform(np.asarray(features, dtype=np.float32))
+        columns = [
+            phases.index(self._reverse_mapping.get(label, GamePhase.UNKNOWN))
+            for label in self.model.classes_
+        ]
+        np.add.at(proba, (slice(None), columns), self.model.predict_proba(X_scaled))
+        return proba
+    
     def train(
         self, 
         features: np.ndarray, 
@@ -129,10 +182,10 @@ class SklearnPhaseClassifier(PhaseClassifierPort):
             self.model, X_scaled, y, cv=min(5, len(features)), scoring="accuracy"
         )
         
-        # Get feature importances
+        # Get feature importances (tree ensembles only)
         importances = dict(zip(
             PhaseFeatures.feature_names(),
-            self.model.feature_importances_
+            getattr(self.model, "feature_importances_", [])
         ))
         
         return {
@@ -143,12 +196,61 @@ class SklearnPhaseClassifier(PhaseClassifierPort):
             "feature_importances": importances,
         }
     
+    def train_incremental(self, batches: TrainingBatches, epochs: int = 1) -> dict:
+        """
+        Train out-of-core when the estimator supports partial_fit.
+        
+        One pass fits the scaler, `epochs` passes fit the model, and a
+        final pass measures training accuracy; only one batch is in
+        memory at a time. Other estimators fall back to in-memory train.
+        """
+        if not hasattr(self.model, "partial_fit"):
+            return super().train_incremental(batches, epochs)
+        
+        classes = np.array(sorted(self._reverse_mapping))
+        self.scaler = StandardScaler()
+        n_samples = n_batches = 0
+        for features, labels in batches():
+            if len(features):
+                self.scaler.partial_fit(features)
+                n_samples += len(features)
+                n_batches += 1
+        if n_samples == 0:
+            raise ValueError("Cannot train on empty data")
+        
+        for _ in range(epochs):
+            for features, labels in batches():
+                if len(features):
+                    y = np.array([self._label_mapping[label] for label in labels])
+                    self.model.partial_fit(self.scaler.transform(features), y, classes=classes)
+        self._is_trained = True
+        
+        correct = 0
+        for features, labels in batches():
+            if len(features):
+                y = np.array([self._label_mapping[label] for label in labels])
+                correct += int(np.sum(self.model.predict(self.scaler.transform(features)) == y))
+        
+        return {
+            "accuracy": correct / n_samples,
+            "n_samples": n_samples,
+            "n_batches": n_batches,
+            "n_features": self.scaler.n_features_in_,
+            "epochs": epochs,
+        }
+    
     def is_trained(self) -> bool:
         """Check if model is trained."""
         return self._is_trained
     
     def save_model(self, path: str) -> None:
-        """Save model and scaler to disk."""
+        """
+        Save model and scaler to disk.
+        
+        Written uncompressed (so it can be memory-mapped) to a temporary
+        file that is then renamed over `path`, so readers never see a
+        partially written model.
+        """
         if not self._is_trained:
             raise ValueError("Cannot save untrained model")
         
@@ -160,16 +262,36 @@ class SklearnPhaseClassifier(PhaseClassifierPort):
             "label_mapping": self._label_mapping,
             "reverse_mapping": self._reverse_mapping,
         }
-        joblib.dump(model_data, path)
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        try:
+            joblib.dump(model_data, tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
     
-    def load_model(self, path: str) -> None:
-        """Load model and scaler from disk."""
+    def load_model(self, path: str, mmap_mode: Optional[str] = None) -> None:
+        """
+        Load model and scaler from disk.
+        
+        Args:
+            path: Model file written by save_model
+            mmap_mode: joblib mmap mode ("r" shares the tree arrays
+                between processes through the page cache)
+        """
         if not os.path.exists(path):
             raise FileNotFoundError(f"Model not found: {path}")
         
-        model_data = joblib.load(path)
+        model_data = joblib.load(path, mmap_mode=mmap_mode)
         self.model = model_data["model"]
         self.scaler = model_data["scaler"]
         self._label_mapping = model_data["label_mapping"]
         self._reverse_mapping = model_data["reverse_mapping"]
         self._is_trained = True
+    
+    @classmethod
+    def from_file(cls, path: str, mmap_mode: Optional[str] = None) -> "SklearnPhaseClassifier":
+        """Create a classifier from a saved model file."""
+        classifier = cls()
+        classifier.load_model(path, mmap_mode=mmap_mode)
+        return classifier
@@ -0,0 +1,65 @@
+"""
+MinIOMetricsStateStore - Infrastructure Layer
+
+MinIO implementation of the MetricsStateStore port.
+
+One JSON document per match (bucket "metrics-state"):
+    {match_id}/state.json
+"""
+import json
+import logging
+from typing import Optional
+
+from minio.error import S3Error
+
+from src.domain.ports.metrics_state_store_port import MetricsStateStore
+from src.domain.value_objects.metrics_state import MetricsState
+from src.infrastructure.storage.minio_adapter import MinIOAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class MinIOMetricsStateStore(MetricsStateStore):
+    """
+    Stores running metrics state as JSON in MinIO.
+    """
+    
+    def __init__(self, storage: Optional[MinIOAdapter] = None):
+        """
+        Initialize store.
+        
+        Args:
+            storage: MinIO adapter (defaults to the "metrics-state" bucket)
+        """
+        self._storage = storage
+    
+    @property
+    def storage(self) -> MinIOAdapter:
+        if self._storage is None:
+            self._storage = MinIOAdapter(bucket="metrics-state")
+        return self._storage
+    
+    def get_state(self, match_id: str) -> Optional[MetricsState]:
+        """Load a match's state, or None if nothing is stored."""
+        try:
+            data = self.storage.get_object(self._state_key(match_id))
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                return None
+            raise
+        return MetricsState.from_dict(json.loads(data))
+    
+    def save_state(self, state: MetricsState) -> None:
+        """Overwrite the match's state document."""
+        self.storage.put_object(
+            self._state_key(state.match_id),
+            json.dumps(state.to_dict()).encode("utf-8"),
+            content_type="application/json"
+        )
+        logger.info(
+            f"Saved metrics state for {state.match_id} "
+            f"({state.frames_processed} frames, {len(state.players)} players)"
+        )
+    
+    def _state_key(self, match_id: str) -> str:
+        return f"{match_id}/state.json"
@@ -3,34 +3,61 @@ PostgresPhaseRepository - Infrastructure Layer
 
 PostgreSQL implementation of PhaseRepository using SQLAlchemy.
 """
-from typing import List, Optional
+from typing import Any, Iterable, List, Optional, Sequence
+import csv
+import io
 import logging
+import os
 
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 
 from src.domain.ports.phase_repository import PhaseRepository
-from src.domain.entities.phase_sequence import PhaseSequence, PhaseTransition, FramePhase
+from src.domain.entities.phase_sequence import (
+    PHASES,
+    PhaseSegment,
+    PhaseSequence,
+    PhaseTimeline,
+    PhaseTransition
+)
 from src.domain.value_objects.game_phase import GamePhase
 from src.infrastructure.db.database import SessionLocal
 from src.infrastructure.db.models import (
     PhaseSequenceModel,
     FramePhaseModel,
+    PhaseSegmentModel,
     PhaseTransitionModel,
     MatchModel
 )
 
 logger = logging.getLogger(__name__)
 
+# Also write one frame_phases row per frame (phase_segments is always written)
+PHASE_STORE_FRAMES = os.getenv("PHASE_STORE_FRAMES", "false").lower() == "true"
+
+# statistics["storage"] marker for sequences saved as segments; older
+# sequences without it are read from frame_phases
+SEGMENT_STORAGE = "segments"
+
 
 class PostgresPhaseRepository(PhaseRepository):
     """
     PostgreSQL implementation for phase storage.
     
     Uses SQLAlchemy ORM for database operations.
-    Stores phase sequences, frame phases, and transitions.
+    Stores phase sequences, run-length phase segments, transitions and,
+    optionally, per-frame phases. Bulk rows are written with COPY.
     """
     
+    def __init__(self, store_frames: bool = PHASE_STORE_FRAMES):
+        """
+        Initialize repository.
+        
+        Args:
+            store_frames: Also write the per-frame frame_phases table
+        """
+        self.store_frames = store_frames
+    
     def _get_session(self) -> Session:
         """Get a new database session."""
         return SessionLocal()
@@ -49,6 +76,7 @@ class PostgresPhaseRepository(PhaseRepository):
             
             if existing:
                 # Delete existing and recreate
+                self._delete_rows(session, existing.id)
                 session.delete(existing)
                 session.flush()
             
@@ -66,6 +94,7 @@ class PostgresPhaseRepository(PhaseRepository):
                 session.flush()
             
             # Create sequence model
+            starts, ends, codes, confidences = sequence.segment_arrays()
             phase_percentages = sequence.get_phase_percentages()
             seq_model = PhaseSequenceModel(
                 match_id=sequence.match_id,
@@ -77,37 +106,54 @@ class PostgresPhaseRepository(PhaseRepository):
                         phase.value: pct for phase, pct in phase_percentages.items()
                     },
                     "transition_count": sequence.get_transition_count(),
-                    "dominant_phase": sequence.get_dominant_phase().value
+                    "dominant_phase": sequence.get_dominant_phase().value,
+                    "segment_count": len(starts),
+                    "storage": SEGMENT_STORAGE
                 }
             )
             session.add(seq_model)
             session.flush()
             
-            # Add frame phases in batches
-            batch_size = 1000
-            for i in range(0, len(sequence.frame_phases), batch_size):
-                batch = sequence.frame_phases[i:i + batch_size]
-                for fp in batch:
-                    frame_model = FramePhaseModel(
-                        sequence_id=seq_model.id,
-                        frame_id=fp.frame_id,
-                        phase=fp.phase.value,
-                        confidence=fp.confidence
+            # Add phase segments
+            phase_values = [phase.value for phase in PHASES]
+            self._copy_rows(
+                session,
+                PhaseSegmentModel.__tablename__,
+                ["sequence_id", "start_frame", "end_frame", "phase", "confidence"],
+                (
+                    (seq_model.id, start, end, phase_values[code], confidence)
+                    for start, end, code, confidence in zip(
+                        starts.tolist(), ends.tolist(), codes.tolist(), confidences.tolist()
                     )
-                    session.add(frame_model)
-                session.flush()
+                )
+            )
+            
+            # Add frame phases (optional)
+            if self.store_frames:
+                self._copy_rows(
+                    session,
+                    FramePhaseModel.__tablename__,
+                    ["sequence_id", "frame_id", "phase", "confidence"],
+                    (
+                        (seq_model.id, frame_id, phase_values[code], confidence)
+                        for frame_id, code, confidence in zip(
+                            sequence.frame_ids.tolist(),
+                            sequence.phase_codes.tolist(),
+                            sequence.confidences.tolist()
+                        )
+                    )
+                )
             
             # Add transitions
-            transitions = sequence.calculate_phase_transitions()
-            for t in transitions:
-                trans_model = PhaseTransitionModel(
-                    sequence_id=seq_model.id,
-                    frame_id=t.frame_id,
-                    timestamp=t.timestamp,
-                    from_phase=t.from_phase.value,
-                    to_phase=t.to_phase.value
+            self._copy_rows(
+                session,
+                PhaseTransitionModel.__tablename__,
+                ["sequence_id", "frame_id", "timestamp", "from_phase", "to_phase"],
+                (
+                    (seq_model.id, t.frame_id, t.timestamp, t.from_phase.value, t.to_phase.value)
+                    for t in sequence.calculate_phase_transitions()
                 )
-                session.add(trans_model)
+            )
             
             session.commit()
             logger.info(f"Saved phase sequence for match {sequence.match_id}")
@@ -137,25 +183,37 @@ class PostgresPhaseRepository(PhaseRepository):
             if not seq_model:
                 return None
             
+            if self._uses_segments(seq_model):
+                segments = session.query(
+                    PhaseSegmentModel.start_frame,
+                    PhaseSegmentModel.end_frame,
+                    PhaseSegmentModel.phase,
+                    PhaseSegmentModel.confidence
+                ).filter(
+                    PhaseSegmentModel.sequence_id == seq_model.id
+                ).order_by(PhaseSegmentModel.start_frame).all()
+                
+                return self._sequence_from_segments(match_id, team_id, seq_model.fps, segments)
+            
+            # Legacy per-frame storage
+            frame_rows = session.query(
+                FramePhaseModel.frame_id,
+                FramePhaseModel.phase,
+                FramePhaseModel.confidence
+            ).filter(
+                FramePhaseModel.sequence_id == seq_model.id
+            ).order_by(FramePhaseModel.frame_id).all()
+            
             # Build domain entity
-            sequence = PhaseSequence(
+            sequence = PhaseSequence.from_arrays(
                 match_id=match_id,
                 team_id=team_id,
+                frame_ids=[row.frame_id for row in frame_rows],
+                phases=[GamePhase.from_string(row.phase) for row in frame_rows],
+                confidences=[row.confidence for row in frame_rows],
                 fps=seq_model.fps
             )
             
-            # Load frame phases
-            frame_models = session.query(FramePhaseModel).filter(
-                FramePhaseModel.sequence_id == seq_model.id
-            ).order_by(FramePhaseModel.frame_id).all()
-            
-            for fm in frame_models:
-                sequence.add_frame_phase(
-                    frame_id=fm.frame_id,
-                    phase=GamePhase.from_string(fm.phase),
-                    confidence=fm.confidence
-                )
-            
             return sequence
             
         finally:
@@ -181,6 +239,38 @@ class PostgresPhaseRepository(PhaseRepository):
             if not seq_model:
                 return []
             
+            if self._uses_segments(seq_model):
+                query = session.query(
+                    PhaseSegmentModel.start_frame,
+                    PhaseSegmentModel.end_frame,
+                    PhaseSegmentModel.phase,
+                    PhaseSegmentModel.confidence
+                ).filter(
+                    and_(
+                        PhaseSegmentModel.sequence_id == seq_model.id,
+                        PhaseSegmentModel.end_frame >= start_frame
+                    )
+                )
+                
+                if end_frame is not None:
+                    query = query.filter(PhaseSegmentModel.start_frame <= end_frame)
+                
+                segments = query.order_by(PhaseSegmentModel.start_frame).all()
+                if not segments:
+                    return []
+                
+                sequence = self._sequence_from_segments(match_id, team_id, seq_model.fps, segments)
+                last_frame = end_frame if end_frame is not None else segments[-1].end_frame
+                return [
+                    {
+                        "frame_id": fp.frame_id,
+                        "phase": fp.phase.value,
+                        "confidence": fp.confidence
+                    }
+                    for fp in sequence.get_phases_in_range(start_frame, last_frame)
+                ]
+            
+            # Legacy per-frame storage
             query = session.query(FramePhaseModel).filter(
                 and_(
                     FramePhaseModel.sequence_id == seq_model.id,
@@ -205,6 +295,71 @@ class PostgresPhaseRepository(PhaseRepository):
         finally:
             session.close()
     
+    def get_phase_timeline(
+        self,
+        match_id: str,
+        team_id: str = "home",
+        start: float = 0,
+        end: Optional[float] = None,
+        in_seconds: bool = False
+    ) -> Optional[PhaseTimeline]:
+        """Get overlapping phase segments with the sequence row in one query."""
+        session = self._get_session()
+        try:
+            scale = PhaseSequenceModel.fps if in_seconds else 1
+            overlaps = and_(
+                PhaseSegmentModel.sequence_id == PhaseSequenceModel.id,
+                PhaseSegmentModel.end_frame >= start * scale
+            )
+            if end is not None:
+                overlaps = and_(overlaps, PhaseSegmentModel.start_frame <= end * scale)
+            
+            rows = session.query(
+                PhaseSequenceModel.fps,
+                PhaseSequenceModel.total_frames,
+                PhaseSequenceModel.statistics,
+                PhaseSegmentModel.start_frame,
+                PhaseSegmentModel.end_frame,
+                PhaseSegmentModel.phase,
+                PhaseSegmentModel.confidence
+            ).outerjoin(
+                PhaseSegmentModel, overlaps
+            ).filter(
+                and_(
+                    PhaseSequenceModel.match_id == match_id,
+                    PhaseSequenceModel.team_id == team_id
+                )
+            ).order_by(PhaseSegmentModel.start_frame).all()
+            
+            if not rows:
+                return None
+            
+            statistics = dict(rows[0].statistics or {})
+            if statistics.get("storage") != SEGMENT_STORAGE:
+                # Legacy per-frame storage: segment the loaded sequence
+                return super().get_phase_timeline(match_id, team_id, start, end, in_seconds)
+            
+            return PhaseTimeline(
+                match_id=match_id,
+                team_id=team_id,
+                fps=rows[0].fps,
+                total_frames=rows[0].total_frames,
+                segments=[
+                    PhaseSegment(
+                        start_frame=row.start_frame,
+                        end_frame=row.end_frame,
+                        phase=GamePhase.from_string(row.phase),
+                        confidence=row.confidence
+                    )
+                    for row in rows
+                    if row.start_frame is not None
+                ],
+                statistics=statistics
+            )
+            
+        finally:
+            session.close()
+    
     def get_transitions(
         self,
         match_id: str,
@@ -267,6 +422,7 @@ class PostgresPhaseRepository(PhaseRepository):
             ).first()
             
             if seq_model:
+                self._delete_rows(session, seq_model.id)
                 session.delete(seq_model)
                 session.commit()
                 return True
@@ -302,6 +458,60 @@ class PostgresPhaseRepository(PhaseRepository):
         finally:
             session.close()
 
+    
+    @staticmethod
+    def _uses_segments(seq_model: PhaseSequenceModel) -> bool:
+        """Whether the sequence was saved as phase segments."""
+        return (seq_model.statistics or {}).get("storage") == SEGMENT_STORAGE
+    
+    @staticmethod
+    def _sequence_from_segments(
+        match_id: str,
+        team_id: str,
+        fps: float,
+        segments: Sequence[Any]
+    ) -> PhaseSequence:
+        """Expand (start_frame, end_frame, phase, confidence) rows into a sequence."""
+        return PhaseSequence.from_segments(
+            match_id=match_id,
+            team_id=team_id,
+            start_frames=[row.start_frame for row in segments],
+            end_frames=[row.end_frame for row in segments],
+            phases=[GamePhase.from_string(row.phase) for row in segments],
+            confidences=[row.confidence for row in segments],
+            fps=fps
+        )
+    
+    @staticmethod
+    def _delete_rows(session: Session, sequence_id: int) -> None:
+        """Bulk-delete a sequence's child rows without loading them."""
+        for model in (PhaseSegmentModel, FramePhaseModel, PhaseTransitionModel):
+            session.query(model).filter(
+                model.sequence_id == sequence_id
+            ).delete(synchronize_session=False)
+    
+    @staticmethod
+    def _copy_rows(
+        session: Session,
+        table: str,
+        columns: List[str],
+        rows: Iterable[Sequence[Any]]
+    ) -> None:
+        """Stream rows into a table with COPY, inside the session's transaction."""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        if buffer.tell() == 0:
+            return
+        buffer.seek(0)
+        
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+        finally:
+            cursor.close()
 
 # Singleton instance for dependency injection
 phase_repository = PostgresPhaseRepository()
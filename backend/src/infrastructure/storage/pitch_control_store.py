@@ -0,0 +1,176 @@
+"""
+MinIOPitchControlStore - Infrastructure Layer
+
+MinIO implementation of the PitchControlStore port.
+
+Layout per match (bucket "pitch-control"):
+    {match_id}/manifest.json       grid shape, block index (frame ranges)
+    {match_id}/block_00000.npz     frame_ids, home (float16), occupied
+                                   [, event_ids for event-anchored surfaces]
+
+Each block covers a fixed number of stored frames and is written with
+np.savez_compressed, so a time-slice read only downloads the blocks that
+overlap the requested range. Away control is not stored: it is 1 - home
+for frames with players on the pitch and 0 otherwise.
+"""
+import io
+import json
+import logging
+from typing import List, Optional, Sequence
+
+import numpy as np
+from minio.error import S3Error
+
+from src.domain.ports.pitch_control_store_port import PitchControlStore, PitchControlSlice
+from src.infrastructure.storage.minio_adapter import MinIOAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class MinIOPitchControlStore(PitchControlStore):
+    """
+    Stores pitch control surfaces as compressed float16 blocks in MinIO.
+    """
+    
+    MANIFEST_VERSION = 1
+    
+    def __init__(
+        self,
+        storage: Optional[MinIOAdapter] = None,
+        block_frames: int = 250
+    ):
+        """
+        Initialize store.
+        
+        Args:
+            storage: MinIO adapter (defaults to the "pitch-control" bucket)
+            block_frames: Stored frames per block (250 = 50 s at 5 Hz)
+        """
+        self._storage = storage
+        self.block_frames = block_frames
+    
+    @property
+    def storage(self) -> MinIOAdapter:
+        if self._storage is None:
+            self._storage = MinIOAdapter(bucket="pitch-control")
+        return self._storage
+    
+    def save_surfaces(
+        self,
+        match_id: str,
+        frame_ids: np.ndarray,
+        home_control: np.ndarray,
+        away_control: np.ndarray,
+        event_ids: Optional[Sequence[str]] = None
+    ) -> None:
+        """Write surfaces block by block, then the manifest."""
+        frame_ids = np.asarray(frame_ids, dtype=np.int64)
+        if event_ids is not None:
+            event_ids = np.asarray(event_ids, dtype=str)
+        home_control = np.asarray(home_control)
+        occupied = np.any(np.asarray(away_control) > 0, axis=(1, 2)) | np.any(home_control > 0, axis=(1, 2))
+        grid_height, grid_width = home_control.shape[1:] if home_control.ndim == 3 else (0, 0)
+        
+        blocks = []
+        for index, start in enumerate(range(0, len(frame_ids), self.block_frames)):
+            end = min(start + self.block_frames, len(frame_ids))
+            key = self._block_key(match_id, index)
+            arrays = {
+                "frame_ids": frame_ids[start:end],
+                "home": home_control[start:end].astype(np.float16),
+                "occupied": occupied[start:end]
+            }
+            if event_ids is not None:
+                arrays["event_ids"] = event_ids[start:end]
+            buffer = io.BytesIO()
+            np.savez_compressed(buffer, **arrays)
+            self.storage.put_object(key, buffer.getvalue())
+            blocks.append({
+                "key": key,
+                "first_frame": int(frame_ids[start]),
+                "last_frame": int(frame_ids[end - 1]),
+                "frames": end - start
+            })
+        
+        manifest = {
+            "version": self.MANIFEST_VERSION,
+            "match_id": match_id,
+            "dtype": "float16",
+            "grid_width": int(grid_width),
+            "grid_height": int(grid_height),
+            "frame_count": int(len(frame_ids)),
+            "anchor": "frames" if event_ids is None else "events",
+            "blocks": blocks
+        }
+        self.storage.put_object(
+            self._manifest_key(match_id),
+            json.dumps(manifest).encode("utf-8"),
+            content_type="application/json"
+        )
+        logger.info(f"Stored {len(frame_ids)} pitch control frames for {match_id} in {len(blocks)} blocks")
+    
+    def get_surfaces(
+        self,
+        match_id: str,
+        start_frame: int = 0,
+        end_frame: Optional[int] = None
+    ) -> Optional[PitchControlSlice]:
+        """Read only the blocks overlapping [start_frame, end_frame]."""
+        manifest = self.get_manifest(match_id)
+        if manifest is None:
+            return None
+        
+        last = end_frame if end_frame is not None else float("inf")
+        frame_parts: List[np.ndarray] = []
+        home_parts: List[np.ndarray] = []
+        occupied_parts: List[np.ndarray] = []
+        event_parts: List[np.ndarray] = []
+        for block in manifest["blocks"]:
+            if block["last_frame"] < start_frame or block["first_frame"] > last:
+                continue
+            with np.load(io.BytesIO(self.storage.get_object(block["key"]))) as data:
+                frames = data["frame_ids"]
+                keep = (frames >= start_frame) & (frames <= last)
+                frame_parts.append(frames[keep])
+                home_parts.append(data["home"][keep].astype(np.float32))
+                occupied_parts.append(data["occupied"][keep])
+                if "event_ids" in data:
+                    event_parts.append(data["event_ids"][keep])
+        
+        grid_shape = (manifest["grid_height"], manifest["grid_width"])
+        if frame_parts:
+            frame_ids = np.concatenate(frame_parts)
+            home = np.concatenate(home_parts)
+            occupied = np.concatenate(occupied_parts)
+        else:
+            frame_ids = np.zeros(0, dtype=np.int64)
+            home = np.zeros((0,) + grid_shape, dtype=np.float32)
+            occupied = np.zeros(0, dtype=bool)
+        event_ids = None
+        if manifest.get("anchor") == "events":
+            event_ids = np.concatenate(event_parts) if event_parts else np.zeros(0, dtype=str)
+        
+        away = np.where(occupied[:, None, None], 1.0 - home, 0.0).astype(np.float32)
+        return PitchControlSlice(
+            frame_ids=frame_ids,
+            home_control=home,
+            away_control=away,
+            grid_width=manifest["grid_width"],
+            grid_height=manifest["grid_height"],
+            event_ids=event_ids
+        )
+    
+    def get_manifest(self, match_id: str) -> Optional[dict]:
+        """Load a match's manifest, or None if nothing is stored."""
+        try:
+            return json.loads(self.storage.get_object(self._manifest_key(match_id)))
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                return None
+            raise
+    
+    def _manifest_key(self, match_id: str) -> str:
+        return f"{match_id}/manifest.json"
+    
+    def _block_key(self, match_id: str, index: int) -> str:
+        return f"{match_id}/block_{index:05d}.npz"
@@ -0,0 +1,103 @@
+"""
+MinIOExpectedThreatGridStore - Infrastructure Layer
+
+MinIO implementation of the ExpectedThreatGridStore port.
+
+Grids live in the "models" bucket:
+    xt/{competition}/{width}x{height}.npz
+
+Loaded grids are also kept in a process-wide cache. Each lookup checks
+the object's ETag, so a refit in another process is picked up without a
+restart while unchanged grids are not downloaded again.
+"""
+import io
+import logging
+import re
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from minio.error import S3Error
+
+from src.domain.ports.xt_grid_store_port import ExpectedThreatGridStore
+from src.domain.value_objects.expected_threat_grid import ExpectedThreatGrid
+from src.infrastructure.storage.minio_adapter import MinIOAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class MinIOExpectedThreatGridStore(ExpectedThreatGridStore):
+    """
+    Stores fitted xT grids as .npz objects in MinIO.
+    """
+    
+    # (competition, width, height) -> (ETag, grid), shared by all instances
+    _cache: Dict[Tuple[str, int, int], Tuple[str, ExpectedThreatGrid]] = {}
+    
+    def __init__(self, storage: Optional[MinIOAdapter] = None):
+        """
+        Initialize store.
+        
+        Args:
+            storage: MinIO adapter (defaults to the "models" bucket)
+        """
+        self._storage = storage
+    
+    @property
+    def storage(self) -> MinIOAdapter:
+        if self._storage is None:
+            self._storage = MinIOAdapter(bucket="models")
+        return self._storage
+    
+    def get_grid(
+        self,
+        competition: str,
+        width: int,
+        height: int
+    ) -> Optional[ExpectedThreatGrid]:
+        """Return the cached grid, (re)loading it when the stored object changed."""
+        cache_key = (competition, width, height)
+        key = self._grid_key(competition, width, height)
+        etag = self.storage.get_object_etag(key)
+        if etag is None:
+            self._cache.pop(cache_key, None)
+            return None
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] == etag:
+            return cached[1]
+        
+        try:
+            data = self.storage.get_object(key)
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                return None
+            raise
+        
+        with np.load(io.BytesIO(data)) as npz:
+            grid = ExpectedThreatGrid(
+                grid=npz["grid"],
+                width=width,
+                height=height,
+                pitch_length=float(npz["pitch_length"]),
+                pitch_width=float(npz["pitch_width"])
+            )
+        self._cache[cache_key] = (etag, grid)
+        return grid
+    
+    def save_grid(self, competition: str, grid: ExpectedThreatGrid) -> None:
+        """Write the grid and refresh the cache entry."""
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            grid=np.asarray(grid.grid, dtype=np.float64),
+            pitch_length=grid.pitch_length,
+            pitch_width=grid.pitch_width
+        )
+        key = self._grid_key(competition, grid.width, grid.height)
+        self.storage.put_object(key, buffer.getvalue())
+        etag = self.storage.get_object_etag(key)
+        self._cache[(competition, grid.width, grid.height)] = (etag, grid)
+        logger.info(f"Saved {grid.width}x{grid.height} xT grid for {competition}")
+    
+    def _grid_key(self, competition: str, width: int, height: int) -> str:
+        slug = re.sub(r"[^a-z0-9]+", "-", competition.lower()).strip("-") or "default"
+        return f"xt/{slug}/{width}x{height}.npz"
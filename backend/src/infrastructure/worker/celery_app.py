@@ -4,12 +4,19 @@ Celery Application Configuration.
 Defines the Celery app and task routing for async workers.
 """
 
+import json
 import os
+from typing import Any, Dict, List, Optional
+
 from celery import Celery
 
 # Redis URL from environment or default
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+# Upper bound for serialized task arguments. Bulk data (tracking tables,
+# pitch control grids) must travel through object storage by reference.
+MAX_TASK_PAYLOAD_BYTES = int(os.getenv("MAX_TASK_PAYLOAD_BYTES", str(256 * 1024)))
+
 # Create Celery app
 celery_app = Celery(
     "afta_worker",
@@ -31,5 +38,47 @@ celery_app.conf.update(
         "src.infrastructure.worker.tasks.vision_tasks.*": {"queue": "gpu_queue"},
         "src.infrastructure.worker.tasks.crewai_tasks.*": {"queue": "default"},
         "run_crewai_analysis": {"queue": "default"},
+        # Consumed by a solo-pool worker: prefork children are daemonic and
+        # cannot start the metrics process pool
+        "calculate_match_metrics": {"queue": "metrics"},
     },
 )
+
+
+class TaskPayloadTooLargeError(ValueError):
+    """Raised when task arguments exceed MAX_TASK_PAYLOAD_BYTES."""
+
+
+def payload_size(args: Optional[List[Any]] = None, kwargs: Optional[Dict[str, Any]] = None) -> int:
+    """Size in bytes of the JSON-encoded task arguments."""
+    return len(json.dumps([args or [], kwargs or {}], default=str).encode("utf-8"))
+
+
+def send_task_checked(
+    name: str,
+    args: Optional[List[Any]] = None,
+    kwargs: Optional[Dict[str, Any]] = None,
+    max_bytes: Optional[int] = None,
+    **options: Any
+):
+    """
+    Send a task by name after enforcing the payload cap.
+
+    Args:
+        name: Registered task name
+        args: Positional task arguments
+        kwargs: Keyword task arguments
+        max_bytes: Override for MAX_TASK_PAYLOAD_BYTES
+        **options: Forwarded to Celery's send_task (countdown, queue, ...)
+
+    Raises:
+        TaskPayloadTooLargeError: If the encoded arguments exceed the cap.
+    """
+    limit = MAX_TASK_PAYLOAD_BYTES if max_bytes is None else max_bytes
+    size = payload_size(args, kwargs)
+    if size > limit:
+        raise TaskPayloadTooLargeError(
+            f"Task '{name}' payload is {size} bytes (limit {limit}). "
+            f"Store large inputs in object storage and pass a reference."
+        )
+    return celery_app.send_task(name, args=args, kwargs=kwargs, **options)
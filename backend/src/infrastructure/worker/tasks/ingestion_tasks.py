@@ -5,7 +5,7 @@ Background tasks for data ingestion, routed to the CPU worker queue.
 """
 
 import logging
-from src.infrastructure.worker.celery_app import celery_app
+from src.infrastructure.worker.celery_app import celery_app, send_task_checked
 from src.infrastructure.adapters.statsbomb_adapter import StatsBombAdapter
 from src.infrastructure.db.repositories.postgres_match_repo import PostgresMatchRepo
 from src.infrastructure.di.container import Container
@@ -68,6 +68,13 @@ def ingest_match_task(self, match_id: str, source: str) -> dict:
             # Don't fail ingestion if indexing fails
             logger.warning(f"RAG indexing failed (non-critical): {index_err}")
 
+        # Record the match's league pattern usage (skipped until a league
+        # model has been trained)
+        try:
+            send_task_checked("assign_league_patterns", args=[match.match_id])
+        except Exception as chain_err:
+            logger.warning(f"League pattern assignment not queued (non-critical): {chain_err}")
+
         return {
             "status": "success",
             "match_id": match.match_id,
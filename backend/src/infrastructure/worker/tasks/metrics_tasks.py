@@ -4,34 +4,56 @@ Metrics Tasks - Infrastructure Layer
 Celery tasks for calculating tactical metrics in the background.
 """
 import logging
-from typing import List, Dict, Any
+import os
+from typing import List, Dict, Any, Optional
 from celery import shared_task
 
 # Application use case
 from src.application.use_cases.metrics_calculator import MetricsCalculator
+from src.application.use_cases.expected_threat_trainer import ExpectedThreatTrainer
 
 # Infrastructure
 from src.infrastructure.db.repositories.postgres_metrics_repo import PostgresMetricsRepository
+from src.infrastructure.db.repositories.postgres_match_repo import PostgresMatchRepo
 from src.infrastructure.di.container import Container
+from src.infrastructure.storage.minio_adapter import MinIOAdapter
+from src.infrastructure.storage.pitch_control_store import MinIOPitchControlStore
+from src.infrastructure.storage.metrics_state_store import MinIOMetricsStateStore
+from src.infrastructure.storage.xt_grid_store import MinIOExpectedThreatGridStore
+from src.domain.value_objects.tracking_table import TrackingTable
 
 logger = logging.getLogger(__name__)
 
+# Worker processes per metrics job (1 = serial, in the Celery worker process).
+# Needs a non-daemonic task process: calculate_match_metrics is routed to the
+# "metrics" queue, consumed by a --pool=solo worker
+METRICS_WORKERS = int(os.getenv("METRICS_WORKERS", "1"))
+# "sampled" (every 5th frame) or "events" (pass/shot/turnover frames only)
+PITCH_CONTROL_MODE = os.getenv("PITCH_CONTROL_MODE", "sampled")
+
 
 @shared_task(name="calculate_match_metrics")
 def calculate_match_metrics_task(
     match_id: str,
-    tracking_data: List[Dict[str, Any]],
-    event_data: List[Dict[str, Any]]
+    tracking_data: Optional[List[Dict[str, Any]]] = None,
+    event_data: Optional[List[Dict[str, Any]]] = None,
+    tracking_key: Optional[str] = None
 ) -> Dict[str, str]:
     """
     Calculate all tactical metrics for a match.
     
     Delegates to application use case for orchestration.
     
+    Tracking data should be passed by reference: the task loads the
+    parquet at `tracking_key` (default "tracking/{match_id}.parquet")
+    in columnar form. Inline `tracking_data` is only meant for small
+    ad-hoc payloads; the publisher enforces the broker payload cap.
+    
     Args:
         match_id: Match identifier
-        tracking_data: List of tracking frames with player positions
+        tracking_data: Optional inline tracking rows
         event_data: List of match events
+        tracking_key: Object storage key of the tracking parquet
         
     Returns:
         Status dictionary with calculation results
@@ -40,9 +62,19 @@ def calculate_match_metrics_task(
     repository = PostgresMetricsRepository()
     
     try:
+        tracking = _load_tracking(match_id, tracking_data, tracking_key)
+        
         # Execute use case
-        use_case = MetricsCalculator(repository)
-        result = use_case.execute(match_id, tracking_data, event_data)
+        # Batched pitch control makes 5 Hz (every 5th frame at 25 fps) affordable
+        use_case = MetricsCalculator(
+            repository,
+            pitch_control_sample_rate=5,
+            pitch_control_store=MinIOPitchControlStore(),
+            max_workers=METRICS_WORKERS,
+            pitch_control_mode=PITCH_CONTROL_MODE,
+            xt_grid=_competition_xt_grid(match_id)
+        )
+        result = use_case.execute(match_id, tracking, event_data or [])
         
         # --- RAG Indexing ---
         try:
@@ -88,3 +120,104 @@ def calculate_match_metrics_task(
         }
     finally:
         repository.close()
+
+
+@shared_task(name="append_match_metrics")
+def append_match_metrics_task(
+    match_id: str,
+    tracking_key: str,
+    event_data: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, str]:
+    """
+    Fold a newly appended block of tracking data into a match's metrics.
+    
+    Uses the running state in the "metrics-state" bucket, so the cost
+    depends on the block size only (partially processed matches,
+    sharded processing, near-live feeds).
+    
+    Nothing in the batch pipeline enqueues it: the producer that writes
+    each tracking block (a live feed ingester, a sharded job) sends
+    "append_match_metrics" once per block after the upload, one block at
+    a time per match and in frame order. Blocks should hold whole frames.
+    
+    Args:
+        match_id: Match identifier
+        tracking_key: Object storage key of the block's tracking parquet
+        event_data: Events of the block (inferred from tracking if empty)
+        
+    Returns:
+        Status dictionary with cumulative counts
+    """
+    repository = PostgresMetricsRepository()
+    
+    try:
+        block = _load_tracking(match_id, None, tracking_key)
+        use_case = MetricsCalculator(
+            repository,
+            metrics_state_store=MinIOMetricsStateStore(),
+            xt_grid=_competition_xt_grid(match_id)
+        )
+        result = use_case.append(match_id, block, event_data or [])
+        
+        return {
+            "status": result.status,
+            "match_id": result.match_id,
+            "players_processed": result.players_processed,
+            "frames_processed": result.frames_processed,
+            "events_processed": result.events_processed
+        }
+    finally:
+        repository.close()
+
+
+@shared_task(name="fit_xt_grid")
+def fit_xt_grid_task(
+    competition: str,
+    width: int = 12,
+    height: int = 8,
+    match_ids: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Fit an xT grid for a competition from ingested event data.
+    
+    Args:
+        competition: Competition name (matches are selected by metadata)
+        width: Number of horizontal zones
+        height: Number of vertical zones
+        match_ids: Optional explicit list of matches to learn from
+        
+    Returns:
+        Status dictionary with fit summary
+    """
+    trainer = ExpectedThreatTrainer(PostgresMatchRepo(), MinIOExpectedThreatGridStore())
+    result = trainer.execute(competition, width=width, height=height, match_ids=match_ids)
+    
+    return {
+        "status": "completed",
+        "competition": result.competition,
+        "width": width,
+        "height": height,
+        "matches_used": result.matches_used,
+        "events_used": result.events_used
+    }
+
+
+def _load_tracking(
+    match_id: str,
+    tracking_data: Optional[List[Dict[str, Any]]],
+    tracking_key: Optional[str]
+) -> TrackingTable:
+    """Resolve the task's tracking input into a columnar TrackingTable."""
+    if tracking_data and not tracking_key:
+        return TrackingTable.from_records(tracking_data)
+    
+    key = tracking_key or f"tracking/{match_id}.parquet"
+    logger.info(f"Loading tracking data for {match_id} from storage: {key}")
+    return MinIOAdapter().get_tracking_table(key)
+
+
+def _competition_xt_grid(match_id: str):
+    """Fitted xT grid of the match's competition (standard grid if none)."""
+    match_repository = PostgresMatchRepo()
+    trainer = ExpectedThreatTrainer(match_repository, MinIOExpectedThreatGridStore())
+    return trainer.get_grid(match_repository.get_competition(match_id))
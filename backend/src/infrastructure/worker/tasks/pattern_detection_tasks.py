@@ -3,17 +3,27 @@ Pattern Detection Tasks - Infrastructure Layer
 
 Celery tasks for asynchronous pattern detection.
 """
-from typing import Optional, Dict, Any, List
+import fcntl
+import os
+from contextlib import contextmanager
+from typing import Iterator, Optional, Dict, Any, List
 
 from celery import shared_task
 
+from src.application.use_cases.league_pattern_trainer import LeaguePatternTrainer
 from src.application.use_cases.pattern_detector import PatternDetector
 from src.infrastructure.db.repositories.postgres_match_repo import PostgresMatchRepo
+from src.infrastructure.db.repositories.postgres_pattern_repo import PostgresPatternRepo
+from src.infrastructure.db.repositories.postgres_pattern_usage_repo import PostgresPatternUsageRepo
 from src.infrastructure.logging import get_logger
+from src.infrastructure.ml.model_registry import ModelRegistry
+from src.infrastructure.ml.sklearn_league_pattern_model import SklearnLeaguePatternModel
 from src.infrastructure.ml.sklearn_pattern_detector import SklearnPatternDetector
 
 logger = get_logger(__name__)
 
+LEAGUE_PATTERN_MODEL_PATH = os.getenv("LEAGUE_PATTERN_MODEL_PATH", "/app/models/league_patterns.joblib")
+
 
 @shared_task(name="detect_tactical_patterns")
 def detect_patterns_task(
@@ -24,6 +34,9 @@ def detect_patterns_task(
     """
     Detect tactical patterns asynchronously.
     
+    Results are stored in the pattern repository, which is what
+    GET /matches/{match_id}/patterns serves.
+    
     Args:
         match_id: Match identifier
         team_id: Team perspective
@@ -42,6 +55,7 @@ def detect_patterns_task(
         # Create Use Case
         use_case = PatternDetector(
             detector=detector,
+            pattern_repository=PostgresPatternRepo(),
             match_repository=match_repo
         )
         
@@ -67,3 +81,115 @@ def detect_patterns_task(
         logger.error(f"Pattern detection failed: {e}")
         raise
 
+
+@shared_task(name="update_league_patterns", queue="default", time_limit=3600)
+def update_league_patterns_task(
+    match_ids: Optional[List[str]] = None,
+    competition: Optional[str] = None,
+    n_clusters: int = 12,
+    model_path: str = LEAGUE_PATTERN_MODEL_PATH
+) -> Dict[str, Any]:
+    """
+    Update the league pattern model with matches and store their usage.
+    
+    Continues from the model at model_path (n_clusters only applies to a
+    new model). Matches the model has already learned from (recorded in
+    the model file) are not fed again but re-assigned with the updated
+    clusters. Each update is saved both to model_path and to a versioned
+    copy next to it, e.g. league_patterns.v42.joblib.
+    
+    Updates of the same model file are serialised by an exclusive lock on
+    "{model_path}.lock" held from loading to saving, so concurrent runs
+    cannot lose each other's matches. An existing versioned copy is never
+    overwritten: the update fails instead (model_path was replaced by an
+    older model since that version was written).
+    
+    Args:
+        match_ids: Matches to add (default: every stored match of the competition)
+        competition: Competition used when match_ids is not given
+        n_clusters: Number of league patterns for a new model
+        model_path: League model file
+    """
+    match_repo = PostgresMatchRepo()
+    if match_ids is None:
+        match_ids = match_repo.list_match_ids(competition)
+    logger.info(f"Updating league patterns with {len(match_ids)} matches")
+    
+    with _exclusive_lock(model_path):
+        # Train a private copy; the registry's instance is shared read-only
+        if os.path.exists(model_path):
+            model = SklearnLeaguePatternModel.from_file(model_path)
+        else:
+            model = SklearnLeaguePatternModel(n_clusters=n_clusters)
+        
+        use_case = LeaguePatternTrainer(
+            model=model,
+            usage_repository=PostgresPatternUsageRepo(),
+            match_repository=match_repo
+        )
+        result = use_case.execute(match_ids, update_model=True)
+        
+        if result.matches_added:
+            root, ext = os.path.splitext(model_path)
+            versioned_path = f"{root}.v{model.version}{ext}"
+            if os.path.exists(versioned_path):
+                raise FileExistsError(
+                    f"League model {versioned_path} already exists; "
+                    f"refusing to overwrite it"
+                )
+            model.save_model(versioned_path)
+            model.save_model(model_path)
+    
+    return {
+        "status": "success",
+        "model_version": result.model_version,
+        "matches_used": result.matches_used,
+        "matches_added": result.matches_added,
+        "sequences_used": result.sequences_used
+    }
+
+
+@shared_task(name="assign_league_patterns", queue="default")
+def assign_league_patterns_task(
+    match_id: str,
+    model_path: str = LEAGUE_PATTERN_MODEL_PATH
+) -> Dict[str, Any]:
+    """
+    Assign a match's sequences to the existing league patterns.
+    
+    Leaves the model unchanged: one nearest-centre lookup per sequence.
+    Sent by ingest_match_task once a match is stored.
+    """
+    model = ModelRegistry.get_league_pattern_model(model_path)
+    if model is None:
+        return {
+            "status": "skipped",
+            "match_id": match_id,
+            "reason": "league_model_missing"
+        }
+    
+    use_case = LeaguePatternTrainer(
+        model=model,
+        usage_repository=PostgresPatternUsageRepo(),
+        match_repository=PostgresMatchRepo()
+    )
+    result = use_case.execute([match_id], update_model=False)
+    
+    return {
+        "status": "success",
+        "match_id": match_id,
+        "model_version": result.model_version,
+        "sequences_used": result.sequences_used
+    }
+
+
+@contextmanager
+def _exclusive_lock(path: str) -> Iterator[None]:
+    """Hold an exclusive lock on "{path}.lock" (blocks until it is free)."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(f"{path}.lock", "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -4,13 +4,20 @@ Phase Classification Tasks - Infrastructure Layer
 Celery tasks for async phase classification.
 Follows "Anemic Handler" pattern: delegates logic to Application Use Cases.
 """
-from celery import shared_task
+from celery import chord, group, shared_task
+from celery.signals import worker_init
+from datetime import datetime, timezone
+import json
 import logging
+import os
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, List
 
+from src.infrastructure.ml.model_registry import ModelRegistry
 from src.infrastructure.ml.sklearn_phase_classifier import SklearnPhaseClassifier
 from src.application.use_cases.phase_classifier import PhaseClassifier
+from src.application.use_cases.phase_feature_extractor import PhaseFeatureExtractor
+from src.application.use_cases.phase_model_trainer import PhaseModelTrainer
 from src.domain.value_objects.game_phase import GamePhase
 from src.domain.value_objects.phase_features import PhaseFeatures
 from src.infrastructure.storage.phase_repository import phase_repository
@@ -18,12 +25,30 @@ from src.infrastructure.storage.minio_adapter import MinIOAdapter
 
 logger = logging.getLogger(__name__)
 
+PHASE_MODEL_PATH = os.getenv("PHASE_MODEL_PATH", "/app/models/phase_classifier.joblib")
+PHASE_INFERENCE_MODE = os.getenv("PHASE_INFERENCE_MODE", "frames")
+
+
+@worker_init.connect
+def preload_phase_model(**kwargs) -> None:
+    """
+    Load the phase model in the worker's main process before the pool forks.
+    
+    sklearn copies tree arrays out of the memory map on load, so sharing
+    across prefork children comes from inheriting this copy-on-write;
+    children only reload once a newer model is published.
+    """
+    try:
+        ModelRegistry.get_phase_classifier(PHASE_MODEL_PATH)
+    except Exception as e:
+        logger.warning(f"Could not preload phase model {PHASE_MODEL_PATH}: {e}")
+
 
 @shared_task(name="classify_match_phases", queue="default", time_limit=600)
 def classify_match_phases_task(
     match_id: str,
     team_id: str = "home",
-    model_path: str = "/app/models/phase_classifier.joblib"
+    model_path: str = PHASE_MODEL_PATH
 ) -> Dict[str, Any]:
     """
     Celery task to classify match phases.
@@ -37,20 +62,24 @@ def classify_match_phases_task(
     
     try:
         # 1. Composition Root: Instantiate Adapters
-        # Note: phase_repository is imported as singleton
-        ml_adapter = SklearnPhaseClassifier(model_path=model_path)
+        # Note: phase_repository is imported as singleton; the model comes
+        # from the per-process registry (loaded once, reloaded on publish)
+        ml_adapter = ModelRegistry.get_phase_classifier(model_path)
         storage_adapter = MinIOAdapter(bucket="tracking-data")
         
         # Infrastructure Self-Healing: Ensure model exists (Production robustness)
-        if not ml_adapter.is_trained():
+        if ml_adapter is None:
             logger.warning("Model not trained. Triggering auto-training fallback.")
+            ml_adapter = SklearnPhaseClassifier()
             _train_fallback_model(ml_adapter, model_path)
+            ml_adapter = ModelRegistry.get_phase_classifier(model_path) or ml_adapter
         
         # 2. Instantiate Use Case
         use_case = PhaseClassifier(
             ml_engine=ml_adapter,
             repository=phase_repository,
-            object_storage=storage_adapter
+            object_storage=storage_adapter,
+            mode=PHASE_INFERENCE_MODE
         )
         
         # 3. Execute
@@ -95,7 +124,7 @@ def classify_match_phases_task(
 @shared_task(name="train_phase_classifier", queue="default", time_limit=1200)
 def train_phase_classifier_task(
     training_data_path: str,
-    model_output_path: str = "/app/models/phase_classifier.joblib"
+    model_output_path: str = PHASE_MODEL_PATH
 ) -> Dict[str, Any]:
     """
     Celery task to train the phase classifier.
@@ -142,6 +171,108 @@ def train_phase_classifier_task(
         return {"status": "error", "message": str(e)}
 
 
+@shared_task(name="train_phase_classifier_season", queue="default")
+def train_phase_classifier_season_task(
+    match_ids: List[str],
+    model_output_path: str = PHASE_MODEL_PATH,
+    frame_step: int = 5,
+    estimator: str = "sgd",
+    epochs: int = 3
+) -> Dict[str, Any]:
+    """
+    Celery task to train the phase classifier on many matches.
+    
+    Fans feature extraction out as one task per match and fits the
+    model once they have all finished (a Celery chord), so extraction
+    runs in parallel across workers and training streams the feature
+    store instead of holding every match in memory.
+    """
+    logger.info(f"Scheduling phase training over {len(match_ids)} matches")
+    workflow = chord(
+        group(extract_phase_features_task.s(match_id, frame_step) for match_id in match_ids),
+        fit_phase_classifier_task.s(model_output_path, estimator, epochs)
+    )
+    result = workflow.apply_async()
+    return {
+        "status": "scheduled",
+        "matches": len(match_ids),
+        "task_id": result.id
+    }
+
+
+@shared_task(name="extract_phase_features", queue="default", time_limit=600)
+def extract_phase_features_task(match_id: str, frame_step: int = 5) -> Dict[str, Any]:
+    """Celery task writing one match's labelled features to the feature store."""
+    try:
+        use_case = PhaseFeatureExtractor(
+            tracking_storage=MinIOAdapter(bucket="tracking-data"),
+            feature_store=MinIOAdapter(bucket="models")
+        )
+        result = use_case.execute(match_id, frame_step)
+        return {"status": "success", "match_id": match_id, "n_rows": result.n_rows}
+    except Exception as e:
+        # A match without tracking or labels must not fail the whole chord
+        logger.warning(f"Phase feature extraction skipped for {match_id}: {e}")
+        return {"status": "skipped", "match_id": match_id, "message": str(e)}
+
+
+@shared_task(name="fit_phase_classifier", queue="default", time_limit=3600)
+def fit_phase_classifier_task(
+    extraction_results: List[Dict[str, Any]],
+    model_output_path: str = PHASE_MODEL_PATH,
+    estimator: str = "sgd",
+    epochs: int = 3
+) -> Dict[str, Any]:
+    """
+    Celery task training on extracted features and publishing the model.
+    
+    The model is saved to model_output_path (atomically, so workers'
+    ModelRegistry picks it up on their next task) and uploaded to the
+    models bucket as phase_classifier/{version}.joblib, with
+    phase_classifier/latest.json pointing at the newest version.
+    """
+    match_ids = [
+        r["match_id"] for r in extraction_results
+        if r.get("status") == "success" and r.get("n_rows", 0) > 0
+    ]
+    logger.info(f"Fitting phase classifier on {len(match_ids)}/{len(extraction_results)} matches")
+    
+    try:
+        feature_store = MinIOAdapter(bucket="models")
+        classifier = SklearnPhaseClassifier(estimator=estimator)
+        result = PhaseModelTrainer(classifier, feature_store).execute(match_ids, epochs=epochs)
+        classifier.save_model(model_output_path)
+        
+        version = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        key = f"phase_classifier/{version}.joblib"
+        with open(model_output_path, "rb") as f:
+            feature_store.put_object(key, f.read())
+        manifest = {
+            "version": version,
+            "key": key,
+            "estimator": estimator,
+            "match_ids": match_ids,
+            "metrics": result.metrics,
+        }
+        feature_store.put_object(
+            "phase_classifier/latest.json",
+            json.dumps(manifest, default=float).encode(),
+            content_type="application/json"
+        )
+        
+        return {
+            "status": "success",
+            "version": version,
+            "model_path": model_output_path,
+            "matches_used": result.matches_used,
+            "metrics": result.metrics
+        }
+    
+    except Exception as e:
+        logger.error(f"Season training failed: {e}", exc_info=True)
+        return {"status": "error", "message": str(e)}
+
+
 def _train_fallback_model(classifier: SklearnPhaseClassifier, path: str):
     """Helper to train a fallback model on synthetic data."""
     features, labels = _generate_synthetic_training_data()
@@ -20,7 +20,7 @@ from src.infrastructure.vision.byte_tracker import ByteTrackerAdapter
 from src.infrastructure.vision.yolo_detector import YOLODetector
 from src.infrastructure.vision.opencv_scene_detector import OpenCVSceneDetector
 from src.infrastructure.ml.action_classifier import HeuristicActionClassifier
-from src.infrastructure.worker.celery_app import celery_app
+from src.infrastructure.worker.celery_app import celery_app, send_task_checked
 from src.infrastructure.adapters.savgol_smoother import SavitzkyGolaySmoother
 
 logger = logging.getLogger(__name__)
@@ -211,9 +211,12 @@ def process_video_task(
         # Highlights mode skips metrics (they would be meaningless for discontinuous clips)
         metrics_triggered = False
         if mode == "full_match":
-            celery_app.send_task(
+            # Tracking data travels by reference: the metrics worker reads the
+            # parquet we just uploaded instead of receiving it through Redis
+            send_task_checked(
                 'calculate_match_metrics',
-                args=[match_id, trajectory_data, []],  # tracking_data, event_data (empty for now)
+                args=[match_id],
+                kwargs={"event_data": [], "tracking_key": trajectory_key},
                 countdown=2  # Small delay to ensure trajectory is saved
             )
             logger.info(f"Chained metrics calculation for match {match_id}")
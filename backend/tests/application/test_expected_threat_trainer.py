@@ -0,0 +1,49 @@
+"""
+Test ExpectedThreatTrainer Use Case.
+"""
+import pytest
+from unittest.mock import Mock
+
+from src.application.use_cases.expected_threat_trainer import ExpectedThreatTrainer
+from src.domain.entities.event import Event, EventType
+from src.domain.entities.match import Match
+from src.domain.ports.match_repository import MatchRepository
+from src.domain.ports.xt_grid_store_port import ExpectedThreatGridStore
+from src.domain.value_objects.coordinates import Coordinates
+
+
+@pytest.fixture
+def match_repo():
+    repo = Mock(spec=MatchRepository)
+    repo.list_match_ids.return_value = ["m1", "m2"]
+    events = [
+        Event("e1", EventType.PASS, 0.0, Coordinates(20, 34), "p1", end_coordinates=Coordinates(90, 34)),
+        Event("e2", EventType.SHOT, 1.0, Coordinates(95, 34), "p1", outcome="Goal"),
+    ]
+    repo.get_match.side_effect = lambda match_id: (
+        Match(match_id, "home", "away", events=list(events)) if match_id == "m1" else None
+    )
+    return repo
+
+
+def test_execute_fits_and_stores_grid(match_repo):
+    store = Mock(spec=ExpectedThreatGridStore)
+    trainer = ExpectedThreatTrainer(match_repo, store)
+
+    result = trainer.execute("World Cup", width=6, height=4)
+
+    match_repo.list_match_ids.assert_called_once_with("World Cup")
+    assert result.matches_used == 1
+    assert result.events_used == 2
+    assert result.grid.grid.shape == (4, 6)
+    store.save_grid.assert_called_once_with("World Cup", result.grid)
+
+
+def test_get_grid_falls_back_to_default():
+    store = Mock(spec=ExpectedThreatGridStore)
+    store.get_grid.return_value = None
+    trainer = ExpectedThreatTrainer(Mock(spec=MatchRepository), store)
+
+    grid = trainer.get_grid("World Cup")
+
+    assert (grid.width, grid.height) == (12, 8)
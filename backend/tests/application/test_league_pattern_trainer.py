@@ -0,0 +1,146 @@
+"""
+Test LeaguePatternTrainer Use Case.
+"""
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.application.use_cases.league_pattern_trainer import LeaguePatternTrainer
+from src.domain.entities.event import Event, EventType
+from src.domain.entities.match import Match
+from src.domain.ports.match_repository import MatchRepository
+from src.domain.ports.pattern_usage_repository import PatternUsageRepository
+from src.domain.value_objects.coordinates import Coordinates
+from src.domain.value_objects.pattern_usage import PatternUsage
+from src.domain.value_objects.sequence_features import SequenceFeatures
+from src.infrastructure.ml.sklearn_league_pattern_model import SklearnLeaguePatternModel
+
+
+def _match(match_id: str, n_events: int = 90, seed: int = 0) -> Match:
+    """Possession alternates between A and B every three events; some end in goals."""
+    rng = np.random.default_rng(seed)
+    events = []
+    for i in range(n_events):
+        team = "A" if (i // 3) % 2 == 0 else "B"
+        last_of_possession = i % 3 == 2
+        events.append(Event(
+            event_id=str(i),
+            event_type=EventType.SHOT if last_of_possession and i % 4 == 0 else EventType.PASS,
+            timestamp=i * 2.0,
+            coordinates=Coordinates(x=float(rng.uniform(0, 105)), y=float(rng.uniform(0, 68))),
+            player_id="p1",
+            team_id=team,
+            outcome="Goal" if last_of_possession and i % 12 == 8 else None
+        ))
+    return Match(match_id=match_id, home_team_id="A", away_team_id="B", events=events)
+
+
+@pytest.fixture
+def match_repo():
+    repo = Mock(spec=MatchRepository)
+    repo.get_match.side_effect = lambda match_id: None if match_id == "missing" else _match(
+        match_id, seed=int(match_id[1:])
+    )
+    return repo
+
+
+@pytest.fixture
+def usage_repo():
+    return Mock(spec=PatternUsageRepository)
+
+
+def _saved(usage_repo):
+    """{match_id: (model_version, usages)} of every save."""
+    return {c.args[0]: (c.args[1], c.args[2]) for c in usage_repo.save_match_usage.call_args_list}
+
+
+def test_each_match_updates_model_and_stores_usage(match_repo, usage_repo):
+    model = SklearnLeaguePatternModel(n_clusters=4)
+
+    result = LeaguePatternTrainer(model, usage_repo, match_repo).execute(["m1", "missing", "m2"])
+
+    assert result.matches_used == 2
+    assert result.matches_added == 2
+    assert result.model_version == 2
+    saved = _saved(usage_repo)
+    # Usage is stored after the last update, with one model version
+    assert {match_id: version for match_id, (version, _) in saved.items()} == {"m1": 2, "m2": 2}
+    usages = saved["m1"][1]
+    assert {u.team_id for u in usages} == {"A", "B"}
+    assert sum(u.occurrence_count for u in usages) == 30
+    assert sum(u.goal_count for u in usages) > 0
+
+
+def test_small_matches_wait_for_enough_sequences(match_repo, usage_repo):
+    """Matches are held back until the first batch covers every cluster."""
+    match_repo.get_match.side_effect = lambda match_id: _match(match_id, n_events=12, seed=int(match_id[1:]))
+    model = SklearnLeaguePatternModel(n_clusters=10)
+
+    result = LeaguePatternTrainer(model, usage_repo, match_repo).execute(["m1", "m2", "m3"])
+
+    # 4 sequences per match: m1 + m2 are still too few, m3 completes the batch
+    assert result.model_version == 1
+    assert set(_saved(usage_repo)) == {"m1", "m2", "m3"}
+
+
+def test_seen_matches_are_only_reassigned(match_repo, usage_repo):
+    """Re-running over stored matches feeds only the new ones to the model."""
+    model = SklearnLeaguePatternModel(n_clusters=4)
+    trainer = LeaguePatternTrainer(model, usage_repo, match_repo)
+    trainer.execute(["m1", "m2"])
+    centres = model.model.cluster_centers_.copy()
+
+    again = trainer.execute(["m1", "m2"])
+
+    assert (again.model_version, again.matches_added, again.matches_used) == (2, 0, 2)
+    np.testing.assert_array_equal(model.model.cluster_centers_, centres)
+
+    usage_repo.reset_mock()
+    result = trainer.execute(["m1", "m2", "m3"])
+
+    assert (result.model_version, result.matches_added) == (3, 1)
+    assert model.has_seen("m3")
+    assert {match_id: version for match_id, (version, _) in _saved(usage_repo).items()} == {
+        "m1": 3, "m2": 3, "m3": 3
+    }
+
+
+def test_assign_only_leaves_model_unchanged(match_repo, usage_repo):
+    model = SklearnLeaguePatternModel(n_clusters=4)
+    trainer = LeaguePatternTrainer(model, usage_repo, match_repo)
+    trainer.execute(["m1", "m2"])
+    centres = model.model.cluster_centers_.copy()
+
+    result = trainer.execute(["m3"], update_model=False)
+
+    assert result.model_version == 2
+    np.testing.assert_array_equal(model.model.cluster_centers_, centres)
+    assert _saved(usage_repo)["m3"][0] == 2
+
+
+def test_assign_only_requires_fitted_model(match_repo, usage_repo):
+    with pytest.raises(ValueError):
+        LeaguePatternTrainer(SklearnLeaguePatternModel(), usage_repo, match_repo).execute(["m1"], update_model=False)
+
+
+def test_usage_aggregate_sums_per_team_and_cluster():
+    def features(duration, goal):
+        return SequenceFeatures(
+            start_zone=1, end_zone=2, zone_progression=1, duration_seconds=duration, event_count=3,
+            pass_count=3, carry_count=0, dribble_count=0, shot_attempted=goal,
+            xt_start=0.0, xt_end=0.1, xt_progression=0.1,
+            ended_in_shot=goal, ended_in_goal=goal, possession_lost=not goal
+        )
+
+    usages = PatternUsage.aggregate(
+        ["B", "A", "A", "B"],
+        [1, 0, 0, 0],
+        [features(4.0, False), features(2.0, True), features(6.0, False), features(8.0, True)]
+    )
+
+    assert [(u.team_id, u.cluster_label, u.occurrence_count) for u in usages] == [
+        ("A", 0, 2), ("B", 0, 1), ("B", 1, 1)
+    ]
+    assert usages[0].avg_duration_seconds == 4.0
+    assert usages[0].goal_rate == 0.5
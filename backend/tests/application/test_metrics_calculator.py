@@ -1,11 +1,13 @@
 """
 Test MetricsCalculator Use Case.
 """
+import json
 import pytest
 from unittest.mock import Mock
 
 from src.application.use_cases.metrics_calculator import MetricsCalculator
 from src.domain.ports.metrics_repository import MetricsRepository
+from src.domain.value_objects.metrics_state import MetricsState
 
 @pytest.fixture
 def mock_repo():
@@ -17,9 +19,9 @@ def test_execute(mock_repo):
     
     # Dummy data
     tracking_data = [
-        {"frame_id": 1, "player_id": "p1", "x": 10, "y": 10, "timestamp": 0.0},
-        {"frame_id": 2, "player_id": "p1", "x": 11, "y": 11, "timestamp": 0.04},
-        {"frame_id": 1, "player_id": "p2", "x": 20, "y": 20, "timestamp": 0.0}, # Team 2
+        {"frame_id": 0, "player_id": "p1", "x": 10, "y": 10, "timestamp": 0.0},
+        {"frame_id": 1, "player_id": "p1", "x": 11, "y": 11, "timestamp": 0.04},
+        {"frame_id": 0, "player_id": "p2", "x": 20, "y": 20, "timestamp": 0.0}, # Team 2
     ]
     # Need team_id inside tracking data for match frames
     tracking_data[0]["team_id"] = "home"
@@ -27,7 +29,7 @@ def test_execute(mock_repo):
     tracking_data[2]["team_id"] = "away"
     
     event_data = [
-        {"event_id": "e1", "event_type": "PASS", "team_id": "home", "player_id": "p1", "timestamp": 0.1, "x": 10, "y": 10}
+        {"event_id": "e1", "event_type": "pass", "team_id": "home", "player_id": "p1", "timestamp": 0.1, "x": 10, "y": 10}
     ]
     
     result = use_case.execute("match_123", tracking_data, event_data)
@@ -37,6 +39,128 @@ def test_execute(mock_repo):
     assert result.players_processed == 2
     
     # Verify repository calls
-    mock_repo.save_physical_stats.assert_called()
-    mock_repo.save_pitch_control_frame.assert_called() # Should be called for frame 1? (Sample rate check)
-    mock_repo.save_ppda.assert_called()
+    mock_repo.save_pitch_control_frame.assert_called()  # frame 0 is on the 25-frame sample grid
+    mock_repo.save_match_metrics_bulk.assert_called_once()
+    match_id, physical_rows, ppda_rows = mock_repo.save_match_metrics_bulk.call_args.args
+    assert match_id == "match_123"
+    assert sorted(row["player_id"] for row in physical_rows) == ["p1", "p2"]
+    assert [row["team_id"] for row in ppda_rows] == ["home", "away"]
+
+def test_append_accumulates_running_state(mock_repo):
+    """Incremental mode folds blocks into stored state and saves cumulative totals."""
+    stored = {}
+    state_store = Mock()
+    state_store.get_state.side_effect = lambda match_id: stored.get(match_id)
+    state_store.save_state.side_effect = lambda state: stored.__setitem__(state.match_id, state)
+    use_case = MetricsCalculator(mock_repo, metrics_state_store=state_store)
+    
+    tracking = [
+        {"frame_id": f, "player_id": "p1", "x": 10 + 0.2 * f, "y": 10, "timestamp": f * 0.04}
+        for f in range(40)
+    ]
+    pressure = {"event_id": "e1", "event_type": "pressure", "team_id": "home",
+                "player_id": "p1", "timestamp": 0.1, "x": 60, "y": 30}
+    
+    use_case.append("match_123", tracking[:20], [pressure])
+    result = use_case.append("match_123", tracking[20:], [dict(pressure, event_id="e2")])
+    
+    assert result.frames_processed == 40
+    assert result.events_processed == 2
+    assert stored["match_123"].players["p1"].rows == 40
+    assert stored["match_123"].teams["home"].defensive_actions == 2
+    _, physical_rows, ppda_rows = mock_repo.save_match_metrics_bulk.call_args.args
+    assert physical_rows[0]["total_distance"] == pytest.approx(40 * 0.2 / 1000)  # last speed is padded
+    assert ppda_rows[0]["defensive_actions"] == 2
+
+def test_append_carries_possession_across_blocks(mock_repo):
+    """A possession change spanning two blocks counts as in a single block."""
+    def run(blocks):
+        stored = {}
+        state_store = Mock()
+        state_store.get_state.side_effect = lambda match_id: stored.get(match_id)
+        state_store.save_state.side_effect = lambda state: stored.__setitem__(
+            state.match_id, MetricsState.from_dict(json.loads(json.dumps(state.to_dict())))
+        )
+        use_case = MetricsCalculator(mock_repo, metrics_state_store=state_store)
+        for block in blocks:
+            use_case.append("match_123", block, [])
+        return stored["match_123"]
+    
+    # Home player 1 has the ball in frames 0-4, away player 7 takes it at frame 5
+    tracking = []
+    for f in range(10):
+        ball_x = 50.0 if f < 5 else 70.0
+        tracking += [
+            {"frame_id": f, "player_id": 99, "object_type": "ball", "x": ball_x, "y": 30.0,
+             "timestamp": f * 0.04},
+            {"frame_id": f, "player_id": 1, "object_type": "home", "x": 50.5, "y": 30.0,
+             "timestamp": f * 0.04},
+            {"frame_id": f, "player_id": 7, "object_type": "away", "x": 70.5, "y": 30.0,
+             "timestamp": f * 0.04},
+        ]
+    
+    whole = run([tracking])
+    split = run([tracking[:15], tracking[15:]])
+    
+    assert whole.events_processed == split.events_processed == 1
+    assert split.teams == whole.teams
+    assert split.possession == {"period": 1, "player_id": 7, "team_id": "away",
+                                "start_frame": 5, "x": 70.5, "y": 30.0}
+
+def test_append_requires_state_store(mock_repo):
+    with pytest.raises(ValueError):
+        MetricsCalculator(mock_repo).append("match_123", [], [])
+
+def test_event_anchored_pitch_control(mock_repo):
+    """Event mode computes surfaces only at anchor events, stored per event."""
+    pitch_control_store = Mock()
+    use_case = MetricsCalculator(
+        mock_repo, pitch_control_store=pitch_control_store, pitch_control_mode="events"
+    )
+    tracking = [
+        {"frame_id": f, "player_id": p, "team_id": team, "x": x + 0.1 * f, "y": 30.0,
+         "timestamp": f * 0.04}
+        for f in range(0, 100)
+        for p, team, x in (("p1", "home", 40.0), ("p2", "away", 60.0))
+    ]
+    event = {"team_id": "home", "player_id": "p1", "x": 40.0, "y": 30.0}
+    event_data = [
+        dict(event, event_id="e1", event_type="pass", timestamp=0.4),  # frame 10
+        dict(event, event_id="e2", event_type="pressure", timestamp=1.0),  # not an anchor
+        dict(event, event_id="e3", event_type="shot", timestamp=0.41),  # also frame 10
+        dict(event, event_id="e4", event_type="interception", timestamp=2.0),  # frame 50
+        dict(event, event_id="e5", event_type="pass", timestamp=60.0),  # no tracking nearby
+    ]
+    
+    result = use_case.execute("match_123", tracking, event_data)
+    
+    assert result.frames_processed == 2
+    args, kwargs = pitch_control_store.save_surfaces.call_args
+    match_id, frame_ids, home, away = args
+    assert list(frame_ids) == [10, 10, 50]
+    assert list(kwargs["event_ids"]) == ["e1", "e3", "e4"]
+    assert home.shape == (3, 24, 32)
+    assert (home[0] == home[1]).all()
+    assert not (home[0] == home[2]).all()
+
+def test_event_anchors_use_sync_offset(mock_repo):
+    """Event timestamps are aligned to frames with the sync offset."""
+    pitch_control_store = Mock()
+    use_case = MetricsCalculator(
+        mock_repo, pitch_control_store=pitch_control_store, pitch_control_mode="events"
+    )
+    tracking = [
+        {"frame_id": f, "player_id": "p1", "team_id": "home", "x": 40.0, "y": 30.0,
+         "timestamp": f * 0.04}
+        for f in range(0, 300)
+    ]
+    event_data = [{"event_id": "e1", "event_type": "pass", "team_id": "home", "player_id": "p1",
+                   "timestamp": 1.0, "x": 40.0, "y": 30.0}]
+    
+    use_case.execute("match_123", tracking, event_data, sync_offset_seconds=4.0)
+    
+    assert list(pitch_control_store.save_surfaces.call_args.args[1]) == [125]
+
+def test_unknown_pitch_control_mode(mock_repo):
+    with pytest.raises(ValueError):
+        MetricsCalculator(mock_repo, pitch_control_mode="every_frame")
@@ -0,0 +1,91 @@
+"""
+Tests for ParallelMetricsExecutor service.
+"""
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.application.services.parallel_metrics_executor import ParallelMetricsExecutor
+from src.application.use_cases.metrics_calculator import MetricsCalculator, infer_event_data
+from src.domain.services.physical_metrics_engine import PhysicalMetricsEngine
+from src.domain.services.pitch_control_engine import FrameTensor, PitchControlEngine
+from src.domain.value_objects.tracking_table import TrackingTable
+
+
+def _tracking(n_frames: int = 120, n_players: int = 10) -> TrackingTable:
+    rng = np.random.default_rng(7)
+    frames = np.repeat(np.arange(n_frames), n_players + 1)
+    slots = np.tile(np.arange(n_players + 1), n_frames)
+    walk = np.cumsum(rng.normal(0, 0.2, size=(len(frames), 2)), axis=0) % [105, 68]
+    return TrackingTable.from_columns({
+        "frame_id": frames,
+        "player_id": np.where(slots == n_players, "ball", [f"p{s}" for s in slots]),
+        "x": walk[:, 0],
+        "y": walk[:, 1],
+        "timestamp": frames * 0.04,
+        "object_type": np.where(slots == n_players, "ball", "player"),
+        "team_id": np.where(slots % 2 == 0, "home", "away"),
+        "period": np.where(frames < n_frames // 2, 1, 2),
+    })
+
+
+@pytest.fixture(scope="module")
+def executor():
+    return ParallelMetricsExecutor(max_workers=3)
+
+
+class TestParallelMetricsExecutor:
+    """Parallel stages must reproduce the serial results exactly."""
+
+    def test_physical_metrics_match_serial(self, executor):
+        tracking = _tracking()
+
+        parallel = executor.physical_metrics(tracking)
+        serial = PhysicalMetricsEngine().calculate(tracking)
+
+        assert list(parallel) == list(serial)
+        for player_id, metrics in serial.items():
+            assert parallel[player_id] == metrics
+
+    def test_pitch_control_matches_serial(self, executor):
+        frames = FrameTensor.from_tracking(_tracking(), sample_rate=5)
+        engine = PitchControlEngine(grid_width=16, grid_height=12)
+
+        np.testing.assert_array_equal(
+            executor.pitch_control(frames, engine),
+            engine.compute(frames.positions, frames.teams)
+        )
+
+    def test_infer_events_runs_per_period(self, executor):
+        tracking = _tracking()
+
+        expected = [
+            event
+            for period in (1, 2)
+            for event in infer_event_data(tracking.take(tracking.period == period))
+        ]
+
+        assert executor.infer_events(tracking) == expected
+
+    def test_player_ranges_balance_rows(self):
+        codes = np.repeat(np.arange(4), [10, 10, 10, 10])
+
+        bounds = ParallelMetricsExecutor(max_workers=2)._player_ranges(codes)
+
+        assert bounds.tolist() == [0, 2, 4]
+
+
+class TestMetricsCalculatorParallelMode:
+    """max_workers > 1 should route every stage through the executor."""
+
+    def test_falls_back_to_serial_in_daemon_process(self, monkeypatch):
+        monkeypatch.setattr(
+            "src.application.use_cases.metrics_calculator.can_fork_workers", lambda: False
+        )
+        calculator = MetricsCalculator(MagicMock(), max_workers=4)
+
+        assert calculator._executor() is None
+
+    def test_serial_mode_has_no_executor(self):
+        assert MetricsCalculator(MagicMock())._executor() is None
@@ -0,0 +1,36 @@
+"""
+Test PatternDetector Use Case.
+"""
+from unittest.mock import Mock
+
+from src.application.use_cases.pattern_detector import PatternDetector
+from src.domain.entities.match import Match
+from src.domain.ports.match_repository import MatchRepository
+from src.domain.ports.pattern_detector_port import PatternDetectorPort
+from src.domain.ports.pattern_repository import PatternRepository
+
+
+def _use_case(match):
+    match_repository = Mock(spec=MatchRepository)
+    match_repository.get_match.return_value = match
+    detector = Mock(spec=PatternDetectorPort)
+    detector.get_patterns.return_value = []
+    return PatternDetector(detector, Mock(spec=PatternRepository), match_repository)
+
+
+def test_empty_result_replaces_stored_patterns():
+    """A match without patterns still overwrites the last run's patterns."""
+    use_case = _use_case(Match("m1", "home-team", "away-team", events=[]))
+
+    result = use_case.execute("m1", team_id="home")
+
+    assert result.pattern_count == 0
+    use_case.pattern_repository.save_patterns.assert_called_once_with("m1", "home", [])
+
+
+def test_unknown_match_stores_nothing():
+    use_case = _use_case(None)
+
+    use_case.execute("missing")
+
+    use_case.pattern_repository.save_patterns.assert_not_called()
@@ -3,6 +3,7 @@ Test PhaseClassifier Use Case.
 """
 import pytest
 from unittest.mock import Mock, MagicMock
+import numpy as np
 import pandas as pd
 
 from src.application.use_cases.phase_classifier import PhaseClassifier
@@ -42,10 +43,12 @@ def test_execute_success(mock_ml_engine, mock_repo, mock_storage):
     # Setup
     use_case = PhaseClassifier(mock_ml_engine, mock_repo, mock_storage)
     
-    # Mock classification result (1 batch of 1 frame needs to return list of labels)
+    # Mock classification result (one call over the whole feature matrix)
     # We have 2 frames in mock df.
-    mock_ml_engine.classify_batch.return_value = [GamePhase.ORGANIZED_ATTACK, GamePhase.ORGANIZED_ATTACK]
-    mock_ml_engine.classify_with_confidence.return_value = (GamePhase.ORGANIZED_ATTACK, 0.9)
+    mock_ml_engine.classify_batch_with_confidence.return_value = (
+        [GamePhase.ORGANIZED_ATTACK, GamePhase.ORGANIZED_ATTACK],
+        np.array([0.9, 0.8]),
+    )
     
     # Execute
     result = use_case.execute("match_123", "home")
@@ -57,7 +60,11 @@ def test_execute_success(mock_ml_engine, mock_repo, mock_storage):
     
     # Verify interactions
     mock_storage.get_parquet.assert_called_once_with("tracking/match_123.parquet")
-    mock_ml_engine.classify_batch.assert_called()
+    mock_ml_engine.classify_batch_with_confidence.assert_called_once()
+    matrix = mock_ml_engine.classify_batch_with_confidence.call_args[0][0]
+    assert matrix.shape == (2, 15)
+    mock_ml_engine.classify_with_confidence.assert_not_called()
+    assert [fp.confidence for fp in result.frame_phases] == [0.9, 0.8]
     mock_repo.save_phase_sequence.assert_called_once()
 
 def test_execute_not_trained(mock_ml_engine, mock_repo, mock_storage):
@@ -77,3 +84,36 @@ def test_execute_missing_tracking(mock_ml_engine, mock_repo, mock_storage):
     
     with pytest.raises(ValueError, match="Tracking data not found"):
         use_case.execute("match_123")
+
+def test_execute_windowed_smooths_flicker(mock_ml_engine, mock_repo, mock_storage):
+    """Windowed mode classifies 1 Hz windows and decodes them with the HMM."""
+    frames = np.arange(250)
+    mock_storage.get_parquet.return_value = pd.DataFrame({
+        'frame_id': frames,
+        'team': 'home',
+        'x': 50.0,
+        'y': 30.0,
+        'ball_x': 60.0,
+        'ball_y': 35.0,
+    })
+    # 10 windows of 25 frames; window 4 flickers to ORGANIZED_DEFENSE
+    proba = np.zeros((10, len(GamePhase)))
+    proba[:, list(GamePhase).index(GamePhase.ORGANIZED_ATTACK)] = 0.8
+    proba[:, list(GamePhase).index(GamePhase.ORGANIZED_DEFENSE)] = 0.2
+    proba[4, list(GamePhase).index(GamePhase.ORGANIZED_ATTACK)] = 0.4
+    proba[4, list(GamePhase).index(GamePhase.ORGANIZED_DEFENSE)] = 0.6
+    mock_ml_engine.classify_proba.return_value = proba
+
+    use_case = PhaseClassifier(mock_ml_engine, mock_repo, mock_storage, mode="windowed")
+    result = use_case.execute("match_123", "home")
+
+    assert mock_ml_engine.classify_proba.call_args[0][0].shape == (10, 15)
+    mock_ml_engine.classify_batch_with_confidence.assert_not_called()
+    assert len(result) == 250
+    assert result.get_transition_count() == 0
+    assert result.get_dominant_phase() == GamePhase.ORGANIZED_ATTACK
+
+
+def test_invalid_mode_raises(mock_ml_engine, mock_repo, mock_storage):
+    with pytest.raises(ValueError, match="mode"):
+        PhaseClassifier(mock_ml_engine, mock_repo, mock_storage, mode="hourly")
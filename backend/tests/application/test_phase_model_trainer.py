@@ -0,0 +1,94 @@
+"""
+Test PhaseFeatureExtractor and PhaseModelTrainer Use Cases.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.application.use_cases.phase_feature_extractor import PhaseFeatureExtractor
+from src.application.use_cases.phase_model_trainer import PhaseModelTrainer
+from src.domain.value_objects.game_phase import GamePhase
+from src.domain.value_objects.phase_features import PhaseFeatures
+from src.infrastructure.ml.sklearn_phase_classifier import SklearnPhaseClassifier
+from tests.fakes import FakeStorageAdapter
+
+ATK, DEF = GamePhase.ORGANIZED_ATTACK, GamePhase.ORGANIZED_DEFENSE
+
+
+def _store_match(storage: FakeStorageAdapter, match_id: str, n_frames: int = 40) -> None:
+    """Home pushed up in the first half of the frames, deep in the second."""
+    rows, labels = [], []
+    for frame_id in range(n_frames):
+        attacking = frame_id < n_frames // 2
+        home_x, away_x, ball_x = (75.0, 40.0, 80.0) if attacking else (25.0, 65.0, 20.0)
+        for i in range(3):
+            rows.append((frame_id, "home", home_x + i, 20.0 + 10 * i, ball_x, 34.0))
+            rows.append((frame_id, "away", away_x + i, 20.0 + 10 * i, ball_x, 34.0))
+        labels.append((frame_id, (ATK if attacking else DEF).value))
+    storage.save_parquet(
+        f"tracking/{match_id}.parquet",
+        pd.DataFrame(rows, columns=["frame_id", "team", "x", "y", "ball_x", "ball_y"])
+    )
+    storage.save_parquet(f"phase_labels/{match_id}.parquet", pd.DataFrame(labels, columns=["frame_id", "label"]))
+
+
+@pytest.fixture
+def tracking_storage():
+    storage = FakeStorageAdapter()
+    _store_match(storage, "m1")
+    _store_match(storage, "m2")
+    return storage
+
+
+def test_extractor_writes_labelled_subsampled_rows(tracking_storage):
+    feature_store = FakeStorageAdapter()
+
+    result = PhaseFeatureExtractor(tracking_storage, feature_store).execute("m1", frame_step=4)
+
+    rows = feature_store.get_parquet("phase_features/m1.parquet")
+    assert result.n_rows == len(rows) == 10
+    assert list(rows["frame_id"]) == list(range(0, 40, 4))
+    assert list(rows.columns) == ["frame_id"] + PhaseFeatures.feature_names() + ["label"]
+    assert set(rows["label"]) == {ATK.value, DEF.value}
+
+
+def test_extractor_drops_unlabelled_and_unknown_frames(tracking_storage):
+    tracking_storage.save_parquet(
+        "phase_labels/m1.parquet",
+        pd.DataFrame({"frame_id": [0, 1, 2], "label": [ATK.value, "not_a_phase", ATK.value]})
+    )
+    feature_store = FakeStorageAdapter()
+
+    result = PhaseFeatureExtractor(tracking_storage, feature_store).execute("m1")
+
+    assert result.n_rows == 2
+    assert list(feature_store.get_parquet(result.key)["frame_id"]) == [0, 2]
+
+
+def test_extractor_requires_labels(tracking_storage):
+    del tracking_storage.storage["phase_labels/m1.parquet"]
+
+    with pytest.raises(ValueError, match="Phase labels not found"):
+        PhaseFeatureExtractor(tracking_storage, FakeStorageAdapter()).execute("m1")
+
+
+def test_trainer_streams_matches_into_incremental_fit(tracking_storage):
+    feature_store = FakeStorageAdapter()
+    extractor = PhaseFeatureExtractor(tracking_storage, feature_store)
+    for match_id in ("m1", "m2"):
+        extractor.execute(match_id)
+    classifier = SklearnPhaseClassifier(estimator="sgd", random_state=0)
+
+    result = PhaseModelTrainer(classifier, feature_store).execute(["m1", "m2"], epochs=3)
+
+    assert result.matches_used == 2
+    assert result.metrics["n_batches"] == 2
+    assert result.metrics["n_samples"] == 80
+    rows = feature_store.get_parquet("phase_features/m1.parquet")
+    predicted = classifier.classify_batch_with_confidence(rows[PhaseFeatures.feature_names()].to_numpy())[0]
+    assert [p.value for p in predicted] == list(rows["label"])
+
+
+def test_trainer_without_matches_raises():
+    with pytest.raises(ValueError):
+        PhaseModelTrainer(SklearnPhaseClassifier(estimator="sgd"), FakeStorageAdapter()).execute([])
@@ -0,0 +1,99 @@
+"""
+Test TacticalTimelineBuilder Use Case.
+"""
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.application.use_cases.tactical_timeline_builder import TacticalTimelineBuilder
+from src.domain.entities.event import Event, EventType
+from src.domain.entities.match import Match
+from src.domain.ports.match_repository import MatchRepository
+from src.domain.ports.xt_grid_store_port import ExpectedThreatGridStore
+from src.domain.value_objects.coordinates import Coordinates
+from src.domain.value_objects.expected_threat_grid import ExpectedThreatGrid
+
+
+def _builder(match, grid_store=None):
+    repo = Mock(spec=MatchRepository)
+    repo.get_match.return_value = match
+    return TacticalTimelineBuilder(repo, grid_store)
+
+
+def test_execute_builds_windows_per_team():
+    events = [
+        Event("e1", EventType.PASS, 10.0, Coordinates(60, 30), "p1", team_id="217"),
+        Event("e2", EventType.PASS, 20.0, Coordinates(70, 30), "p1", team_id="217"),
+        Event("e3", EventType.TACKLE, 30.0, Coordinates(35, 30), "p2", team_id="206"),
+        Event("e4", EventType.FOUL, 40.0, Coordinates(35, 30), "p2", team_id="206"),
+        Event("e5", EventType.CLEARANCE, 400.0, Coordinates(10, 30), "p2", team_id="206"),
+    ]
+    builder = _builder(Match("m1", "Barcelona", "Real Madrid", events=events))
+
+    timeline = builder.execute("m1", window_seconds=300.0, step_seconds=300.0)
+
+    # Provider team ids are assigned home/away in order of appearance
+    assert timeline.window_start.tolist() == [0.0, 300.0]
+    assert timeline.passes_allowed["away"].tolist() == [2, 0]
+    assert timeline.defensive_actions["away"].tolist() == [1, 1]
+    assert timeline.ppda["away"][0] == 2.0
+    assert timeline.defensive_actions["home"].tolist() == [0, 0]
+
+
+def test_execute_uses_match_team_ids_when_they_match():
+    events = [Event("e1", EventType.TACKLE, 5.0, Coordinates(80, 30), "p1", team_id="away-team")]
+    builder = _builder(Match("m1", "home-team", "away-team", events=events))
+
+    timeline = builder.execute("m1")
+
+    assert timeline.defensive_actions["away"].tolist() == [1]
+    assert timeline.defensive_actions["home"].tolist() == [0]
+
+
+def test_execute_returns_none_for_unknown_match():
+    assert _builder(None).execute("missing") is None
+
+
+def test_execute_uses_competition_xt_grid():
+    """A fitted grid for the match's competition replaces the standard one."""
+    events = [
+        Event("e1", EventType.PASS, 10.0, Coordinates(20, 34), "p1", team_id="home-team",
+              end_coordinates=Coordinates(80, 34)),
+    ]
+    match = Match("m1", "home-team", "away-team", competition="La Liga", events=events)
+    fitted = ExpectedThreatGrid(grid=np.tile(np.linspace(0.0, 0.55, 12), (8, 1)))
+    grid_store = Mock(spec=ExpectedThreatGridStore)
+    grid_store.get_grid.return_value = fitted
+
+    standard = _builder(match).execute("m1")
+    timeline = _builder(match, grid_store).execute("m1")
+
+    grid_store.get_grid.assert_called_once_with("La Liga", 12, 8)
+    assert timeline.xt["home"][0] == pytest.approx(fitted.calculate_xt_change(20, 34, 80, 34))
+    assert timeline.xt["home"][0] != pytest.approx(standard.xt["home"][0])
+
+    # No grid fitted for the competition: the standard grid is used
+    grid_store.get_grid.return_value = None
+    assert _builder(match, grid_store).execute("m1").xt["home"][0] == pytest.approx(
+        standard.xt["home"][0]
+    )
+
+
+def test_away_passes_use_team_relative_coordinates():
+    """StatsBomb-shaped away passes attack towards x = 105 like home passes."""
+    events = [
+        Event("e1", EventType.PASS, 10.0, Coordinates(20, 30), "p1", team_id="home-team"),
+        # Away passes deep in the home half (attacking) and in their own third
+        Event("e2", EventType.PASS, 20.0, Coordinates(80, 30), "p2", team_id="away-team"),
+        Event("e3", EventType.PASS, 25.0, Coordinates(90, 30), "p2", team_id="away-team"),
+        Event("e4", EventType.PASS, 30.0, Coordinates(20, 30), "p2", team_id="away-team"),
+        Event("e5", EventType.TACKLE, 40.0, Coordinates(30, 30), "p1", team_id="home-team"),
+    ]
+    builder = _builder(Match("m1", "home-team", "away-team", events=events))
+
+    timeline = builder.execute("m1")
+
+    assert timeline.passes_allowed["home"].tolist() == [2]
+    assert timeline.passes_allowed["away"].tolist() == [0]
+    assert timeline.ppda["home"][0] == 2.0
@@ -0,0 +1,124 @@
+"""
+Microbenchmarks: FrameSpatialIndex vs the per-point loops it replaced.
+
+Not collected by pytest. Run from backend/:
+
+    python tests/benchmarks/bench_spatial_index.py [--frames 25000]
+
+Each case checks that both versions agree before timing them.
+"""
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.domain.services.spatial_index import FrameSpatialIndex  # noqa: E402
+
+
+def _scene(n_frames: int, n_players: int = 22, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    players = rng.uniform([0, 0], [105, 68], size=(n_frames, n_players, 2))
+    ball = rng.uniform([0, 0], [105, 68], size=(n_frames, 2))
+    return players, ball
+
+
+# --- Loops as they were written in the consumers ---------------------------
+
+def closest_player_loop(players, ball):
+    """HeuristicEventDetector._find_closest_player, frame by frame."""
+    result = []
+    for frame_players, (bx, by) in zip(players.tolist(), ball.tolist()):
+        closest, min_distance = None, float("inf")
+        for slot, (x, y) in enumerate(frame_players):
+            distance = ((x - bx) ** 2 + (y - by) ** 2) ** 0.5
+            if distance < min_distance:
+                min_distance, closest = distance, slot
+        result.append(closest)
+    return result
+
+
+def pressure_loop(players, carrier, radius):
+    """HeuristicEventDetector._detect_pressure, frame by frame."""
+    result = []
+    for frame_players, (cx, cy) in zip(players.tolist(), carrier.tolist()):
+        result.append([
+            slot for slot, (x, y) in enumerate(frame_players)
+            if ((x - cx) ** 2 + (y - cy) ** 2) ** 0.5 <= radius
+        ])
+    return result
+
+
+def ball_distance_loop(players, ball):
+    """PhaseFeatures.from_tracking_frame possession distances, per frame."""
+    return [
+        min(np.sqrt((p[0] - b[0]) ** 2 + (p[1] - b[1]) ** 2) for p in frame_players)
+        for frame_players, b in zip(players.tolist(), ball.tolist())
+    ]
+
+
+def centroid_spread_loop(players):
+    """HeuristicActionClassifier._check_celebration, per frame."""
+    result = []
+    for frame_players in players.tolist():
+        avg_x = sum(p[0] for p in frame_players) / len(frame_players)
+        avg_y = sum(p[1] for p in frame_players) / len(frame_players)
+        distances = [((p[0] - avg_x) ** 2 + (p[1] - avg_y) ** 2) ** 0.5 for p in frame_players]
+        result.append(sum(distances) / len(distances))
+    return result
+
+
+# --- Index versions ---------------------------------------------------------
+
+def closest_player_index(players, ball):
+    return FrameSpatialIndex(players).nearest(ball)[0][:, 0].tolist()
+
+
+def pressure_index(players, carrier, radius):
+    within = FrameSpatialIndex(players).within(carrier, radius)
+    return [np.flatnonzero(row).tolist() for row in within]
+
+
+def ball_distance_index(players, ball):
+    return FrameSpatialIndex(players).nearest(ball)[1][:, 0].tolist()
+
+
+def centroid_spread_index(players):
+    return FrameSpatialIndex(players).distances(players.mean(axis=1)).mean(axis=1).tolist()
+
+
+def _time(fn, *args, repeat: int = 3) -> float:
+    return min(timeit.repeat(lambda: fn(*args), number=1, repeat=repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=25_000, help="frames per case (25 fps)")
+    args = parser.parse_args()
+
+    players, ball = _scene(args.frames)
+    cases = [
+        ("closest player", closest_player_loop, closest_player_index, (players, ball)),
+        ("pressure radius", pressure_loop, pressure_index, (players, ball, 5.0)),
+        ("ball distance", ball_distance_loop, ball_distance_index, (players, ball)),
+        ("centroid spread", centroid_spread_loop, centroid_spread_index, (players,)),
+    ]
+
+    print(f"{args.frames} frames x {players.shape[1]} players")
+    print(f"{'case':<18}{'loop (s)':>10}{'index (s)':>11}{'speedup':>9}")
+    for name, loop, index, case_args in cases:
+        expected, actual = loop(*case_args), index(*case_args)
+        if name == "pressure radius":
+            assert expected == actual, name
+        else:
+            np.testing.assert_allclose(expected, actual, err_msg=name)
+        loop_time = _time(loop, *case_args)
+        index_time = _time(index, *case_args)
+        print(f"{name:<18}{loop_time:>10.3f}{index_time:>11.3f}{loop_time / index_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -134,3 +134,32 @@ class TestTacticalMatchXt:
         
         # Backward pass = negative xT
         assert xt_chain.total_xt < 0
+
+
+class TestExpectedThreatGridVectorized:
+    """Array API must agree with the scalar lookups."""
+
+    def test_locations_match_scalar_lookup(self):
+        import numpy as np
+        grid = ExpectedThreatGrid()
+        rng = np.random.default_rng(0)
+        x = rng.uniform(-5, 110, 200)
+        y = rng.uniform(-5, 73, 200)
+
+        result = grid.get_threat_at_pitch_locations(x, y)
+
+        expected = [grid.get_threat_at_pitch_location(a, b) for a, b in zip(x, y)]
+        np.testing.assert_array_equal(result, expected)
+
+    def test_xt_changes_match_scalar_change(self):
+        import numpy as np
+        grid = ExpectedThreatGrid()
+        from_x, from_y = np.array([52.5, 90.0]), np.array([34.0, 10.0])
+        to_x, to_y = np.array([90.0, 30.0]), np.array([34.0, 60.0])
+
+        result = grid.calculate_xt_changes(from_x, from_y, to_x, to_y)
+
+        assert result.tolist() == [
+            grid.calculate_xt_change(52.5, 34.0, 90.0, 34.0),
+            grid.calculate_xt_change(90.0, 10.0, 30.0, 60.0),
+        ]
@@ -1,8 +1,11 @@
 """
 TDD Tests for PhaseSequence entity.
 """
+import numpy as np
 import pytest
-from src.domain.entities.phase_sequence import PhaseSequence, FramePhase, PhaseTransition
+from src.domain.entities.phase_sequence import (
+    PHASES, PhaseSegment, PhaseSequence, PhaseTimeline, FramePhase, PhaseTransition
+)
 from src.domain.value_objects.game_phase import GamePhase
 
 
@@ -100,3 +103,135 @@ class TestPhaseSequence:
         assert empty_sequence.get_phase_durations()[GamePhase.ORGANIZED_ATTACK] == 0.0
         assert empty_sequence.get_dominant_phase() == GamePhase.UNKNOWN
         assert empty_sequence.get_transition_count() == 0
+
+    def test_from_arrays_matches_appends(self):
+        """Bulk construction (unsorted input) should equal one-by-one appends."""
+        rng = np.random.default_rng(0)
+        frame_ids = rng.permutation(2000)
+        codes = rng.integers(0, len(PHASES), size=2000)
+        confidences = rng.uniform(size=2000)
+
+        bulk = PhaseSequence.from_arrays("m", "home", frame_ids, codes, confidences)
+        appended = PhaseSequence(match_id="m", team_id="home")
+        for frame_id, code, confidence in zip(frame_ids, codes, confidences):
+            appended.add_frame_phase(int(frame_id), PHASES[code], float(confidence))
+
+        assert list(bulk.frame_ids) == list(range(2000))
+        assert bulk.frame_phases == appended.frame_phases
+        assert bulk.get_phase_durations() == pytest.approx(appended.get_phase_durations())
+        assert bulk.calculate_phase_transitions() == appended.calculate_phase_transitions()
+
+    def test_transitions_skip_unknown_frames(self):
+        """UNKNOWN frames neither start nor end a transition."""
+        seq = PhaseSequence.from_arrays("m", "home", [0, 1, 2, 3, 4, 5], [
+            GamePhase.ORGANIZED_ATTACK,
+            GamePhase.UNKNOWN,
+            GamePhase.ORGANIZED_ATTACK,
+            GamePhase.UNKNOWN,
+            GamePhase.ORGANIZED_DEFENSE,
+            GamePhase.ORGANIZED_DEFENSE,
+        ])
+
+        transitions = seq.calculate_phase_transitions()
+
+        assert transitions == [PhaseTransition(
+            frame_id=4,
+            from_phase=GamePhase.ORGANIZED_ATTACK,
+            to_phase=GamePhase.ORGANIZED_DEFENSE,
+            timestamp=4 / 25.0,
+        )]
+
+    def test_get_phases_in_range_is_inclusive(self, sequence_with_phases):
+        """Range lookups include both ends."""
+        phases = sequence_with_phases.get_phases_in_range(98, 101)
+
+        assert [fp.frame_id for fp in phases] == [98, 99, 100, 101]
+        assert phases[-1].phase == GamePhase.TRANSITION_ATK_DEF
+
+    def test_from_arrays_length_mismatch_raises(self):
+        """Columns must line up."""
+        with pytest.raises(ValueError):
+            PhaseSequence.from_arrays("m", "home", [0, 1], [GamePhase.UNKNOWN])
+
+    def test_segments_round_trip(self):
+        """Runs break on phase changes and frame gaps; expanding restores frames."""
+        seq = PhaseSequence.from_arrays(
+            "m", "home", [0, 1, 2, 4, 5],
+            [GamePhase.ORGANIZED_ATTACK] * 2 + [GamePhase.ORGANIZED_DEFENSE] * 3,
+            [0.4, 0.6, 1.0, 0.5, 0.7],
+        )
+
+        segments = seq.to_segments()
+        restored = PhaseSequence.from_segments("m", "home", *seq.segment_arrays())
+
+        assert [(s.start_frame, s.end_frame) for s in segments] == [(0, 1), (2, 2), (4, 5)]
+        assert segments[0].confidence == pytest.approx(0.5)
+        assert list(restored.frame_ids) == [0, 1, 2, 4, 5]
+        assert list(restored.phase_codes) == list(seq.phase_codes)
+        assert restored.confidences == pytest.approx([0.5, 0.5, 1.0, 0.6, 0.6])
+
+
+class TestPhaseTimeline:
+    """Test suite for segment timelines."""
+
+    @staticmethod
+    def _timeline(*segments):
+        return PhaseTimeline(match_id="m", team_id="home", segments=[
+            PhaseSegment(start, end, phase, confidence) for start, end, phase, confidence in segments
+        ])
+
+    def test_clip_cuts_segments_to_range(self):
+        timeline = self._timeline(
+            (0, 9, GamePhase.ORGANIZED_ATTACK, 1.0),
+            (10, 19, GamePhase.ORGANIZED_DEFENSE, 1.0),
+            (20, 29, GamePhase.ORGANIZED_ATTACK, 1.0),
+        )
+
+        clipped = timeline.clip(5, 12)
+
+        assert [(s.start_frame, s.end_frame) for s in clipped.segments] == [(5, 9), (10, 12)]
+        assert len(timeline.segments) == 3
+
+    def test_merged_bridges_gaps_and_weights_confidence(self):
+        timeline = self._timeline(
+            (0, 2, GamePhase.ORGANIZED_ATTACK, 1.0),
+            (5, 5, GamePhase.ORGANIZED_ATTACK, 0.2),
+        )
+
+        merged = timeline.merged()
+
+        assert [(s.start_frame, s.end_frame) for s in merged.segments] == [(0, 5)]
+        assert merged.segments[0].confidence == pytest.approx(0.8)
+
+    def test_merged_absorbs_short_segments(self):
+        """A 2-frame flicker disappears and its neighbours join up."""
+        timeline = self._timeline(
+            (0, 1, GamePhase.TRANSITION_DEF_ATK, 1.0),
+            (2, 49, GamePhase.ORGANIZED_ATTACK, 1.0),
+            (50, 51, GamePhase.ORGANIZED_DEFENSE, 1.0),
+            (52, 99, GamePhase.ORGANIZED_ATTACK, 1.0),
+            (100, 149, GamePhase.ORGANIZED_DEFENSE, 1.0),
+        )
+
+        merged = timeline.merged(min_frames=5)
+
+        assert [(s.start_frame, s.end_frame, s.phase) for s in merged.segments] == [
+            (0, 99, GamePhase.ORGANIZED_ATTACK),
+            (100, 149, GamePhase.ORGANIZED_DEFENSE),
+        ]
+
+    def test_merged_keeps_first_segment_grown_past_min_frames(self):
+        """A short first segment that absorbed its neighbour is long enough."""
+        timeline = self._timeline(
+            (0, 5, GamePhase.ORGANIZED_ATTACK, 1.0),
+            (6, 11, GamePhase.ORGANIZED_DEFENSE, 0.5),
+            (12, 111, GamePhase.TRANSITION_ATK_DEF, 1.0),
+        )
+
+        merged = timeline.merged(min_frames=10)
+
+        assert [(s.start_frame, s.end_frame, s.phase) for s in merged.segments] == [
+            (0, 11, GamePhase.ORGANIZED_ATTACK),
+            (12, 111, GamePhase.TRANSITION_ATK_DEF),
+        ]
+        assert merged.segments[0].confidence == pytest.approx(1.0)
@@ -0,0 +1,98 @@
+"""
+Tests for ExpectedThreatFitter domain service.
+"""
+import numpy as np
+import pytest
+
+from src.domain.entities.event import Event, EventType
+from src.domain.services.expected_threat_fitter import ExpectedThreatFitter
+from src.domain.value_objects.coordinates import Coordinates
+
+
+def _event(event_type, x, y, end=None, outcome=None):
+    return Event(
+        event_id=f"{event_type.value}-{x}-{y}",
+        event_type=event_type,
+        timestamp=0.0,
+        coordinates=Coordinates(x, y),
+        player_id="p1",
+        end_coordinates=Coordinates(*end) if end else None,
+        outcome=outcome,
+    )
+
+
+class TestExpectedThreatFitter:
+    """Test suite for value-iteration xT fitting."""
+
+    def test_two_zone_chain_has_closed_form(self):
+        """Shots only from the right zone, moves only left -> right."""
+        fitter = ExpectedThreatFitter(width=2, height=1)
+        events = (
+            # Right zone: 4 shots, 1 goal
+            [_event(EventType.SHOT, 80, 34, outcome="Goal")]
+            + [_event(EventType.SHOT, 80, 34, outcome="Saved")] * 3
+            # Left zone: 3 successful passes to the right, 1 failed
+            + [_event(EventType.PASS, 20, 34, end=(80, 34))] * 3
+            + [_event(EventType.PASS, 20, 34, end=(80, 34), outcome="Incomplete")]
+        )
+
+        grid = fitter.fit_events(events)
+
+        assert grid.grid.shape == (1, 2)
+        assert grid.get_threat(1, 0) == pytest.approx(0.25)
+        assert grid.get_threat(0, 0) == pytest.approx(0.75 * 0.25)
+
+    def test_value_iteration_matches_linear_solve(self):
+        """The fixed point solves xT = r + M xT (dense reference model)."""
+        rng = np.random.default_rng(1)
+        width, height, n_moves, n_shots = 6, 4, 2000, 300
+        columns = dict(
+            move_start_x=rng.uniform(0, 105, n_moves), move_start_y=rng.uniform(0, 68, n_moves),
+            move_end_x=rng.uniform(0, 105, n_moves), move_end_y=rng.uniform(0, 68, n_moves),
+            move_success=rng.random(n_moves) < 0.8,
+            shot_x=rng.uniform(70, 105, n_shots), shot_y=rng.uniform(20, 48, n_shots),
+            shot_goal=rng.random(n_shots) < 0.1,
+        )
+        fitter = ExpectedThreatFitter(width=width, height=height, tolerance=1e-12, max_iterations=1000)
+
+        grid = fitter.fit(**columns)
+
+        def zone(x, y):
+            zx, zy = grid.pitch_to_zone(x, y)
+            return zy * width + zx
+
+        n = width * height
+        moves, shots, goals = np.zeros(n), np.zeros(n), np.zeros(n)
+        successful = np.zeros((n, n))
+        for i in range(n_moves):
+            start = zone(columns["move_start_x"][i], columns["move_start_y"][i])
+            moves[start] += 1
+            if columns["move_success"][i]:
+                successful[start, zone(columns["move_end_x"][i], columns["move_end_y"][i])] += 1
+        for i in range(n_shots):
+            z = zone(columns["shot_x"][i], columns["shot_y"][i])
+            shots[z] += 1
+            goals[z] += columns["shot_goal"][i]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            actions = moves + shots
+            reward = np.nan_to_num(shots / actions) * np.nan_to_num(goals / shots)
+            transition = np.nan_to_num(1 / actions)[:, None] * successful
+        expected = np.linalg.solve(np.eye(n) - transition, reward)
+
+        np.testing.assert_allclose(grid.grid.ravel(), expected, atol=1e-10)
+
+    def test_any_resolution(self):
+        rng = np.random.default_rng(2)
+        grid = ExpectedThreatFitter(width=16, height=12).fit(
+            rng.uniform(0, 105, 100), rng.uniform(0, 68, 100),
+            rng.uniform(0, 105, 100), rng.uniform(0, 68, 100), np.ones(100, dtype=bool),
+            [100.0], [34.0], [True],
+        )
+
+        assert grid.grid.shape == (12, 16)
+        assert grid.get_threat_at_pitch_location(100, 34) > 0
+
+    def test_empty_events_give_zero_grid(self):
+        grid = ExpectedThreatFitter(width=3, height=2).fit_events([])
+
+        np.testing.assert_array_equal(grid.grid, np.zeros((2, 3)))
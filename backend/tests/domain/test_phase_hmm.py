@@ -0,0 +1,50 @@
+"""
+Tests for PhaseHMM Viterbi decoding.
+"""
+import itertools
+
+import numpy as np
+import pytest
+
+from src.domain.services.phase_hmm import PhaseHMM
+
+
+class TestPhaseHMM:
+    """Test suite for temporal phase decoding."""
+
+    def test_single_step_flicker_is_smoothed(self):
+        proba = np.array([[0.8, 0.2]] * 5 + [[0.3, 0.7]] + [[0.8, 0.2]] * 5)
+
+        path = PhaseHMM(2, switch_prob=0.05).decode(proba)
+
+        assert list(path) == [0] * 11
+
+    def test_sustained_change_is_kept(self):
+        proba = np.array([[0.9, 0.1]] * 6 + [[0.1, 0.9]] * 6)
+
+        path = PhaseHMM(2, switch_prob=0.05).decode(proba)
+
+        assert list(path) == [0] * 6 + [1] * 6
+
+    def test_matches_brute_force(self):
+        """Viterbi returns the highest-scoring path over all paths."""
+        rng = np.random.default_rng(1)
+        proba = rng.dirichlet(np.ones(3), size=6)
+        hmm = PhaseHMM(3, switch_prob=0.3)
+
+        def score(path):
+            total = hmm.log_initial[path[0]] + np.log(proba[0, path[0]])
+            for t in range(1, len(path)):
+                total += hmm.log_transition[path[t - 1], path[t]] + np.log(proba[t, path[t]])
+            return total
+
+        best = max(itertools.product(range(3), repeat=6), key=score)
+        assert tuple(hmm.decode(proba)) == best
+
+    def test_empty_and_invalid_input(self):
+        hmm = PhaseHMM.from_mean_duration(3, mean_duration_steps=10)
+
+        assert hmm.switch_prob == pytest.approx(0.1)
+        assert len(hmm.decode(np.empty((0, 3)))) == 0
+        with pytest.raises(ValueError):
+            hmm.decode(np.ones((2, 4)))
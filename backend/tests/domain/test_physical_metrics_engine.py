@@ -0,0 +1,149 @@
+"""
+Tests for PhysicalMetricsEngine domain service.
+
+The batch engine must reproduce PlayerTrajectory.calculate_physical_metrics.
+"""
+import numpy as np
+import pytest
+
+from src.domain.entities.player_trajectory import PlayerTrajectory, FramePosition
+from src.domain.services.physical_metrics_engine import PhysicalMetricsEngine
+from src.domain.value_objects.tracking_table import TrackingTable
+
+
+def _random_tracking(seed: int = 0):
+    """Shuffled rows for players of varied track length, some teleporting."""
+    rng = np.random.default_rng(seed)
+    records = []
+    for p in range(30):
+        n = int(rng.integers(1, 12)) if p % 3 == 0 else int(rng.integers(12, 300))
+        x = np.cumsum(rng.normal(0, 0.3, n)) + 50
+        y = np.cumsum(rng.normal(0, 0.3, n)) + 30
+        if p % 5 == 0 and n > 4:
+            x[n // 2] += 30.0  # tracking glitch -> clipped as outlier
+        for i in range(n):
+            records.append({
+                "frame_id": i, "player_id": f"p{p}",
+                "x": float(x[i]), "y": float(y[i]), "timestamp": i * 0.04,
+            })
+    return [records[i] for i in rng.permutation(len(records))]
+
+
+def _reference(records):
+    frames = {}
+    for r in records:
+        frames.setdefault(r["player_id"], []).append(
+            FramePosition(r["frame_id"], r["x"], r["y"], r["timestamp"])
+        )
+    return {pid: PlayerTrajectory(pid, f).calculate_physical_metrics() for pid, f in frames.items()}
+
+
+class TestPhysicalMetricsEngine:
+    """Test suite for batch physical metrics."""
+
+    def test_matches_player_trajectory(self):
+        """Every player's metrics should equal the per-entity computation."""
+        records = _random_tracking()
+
+        result = PhysicalMetricsEngine().calculate(TrackingTable.from_records(records))
+        expected = _reference(records)
+
+        assert list(result) == list(expected)
+        for player_id, metrics in expected.items():
+            got = result[player_id]
+            assert got.sprint_count == metrics.sprint_count
+            assert got.total_distance == pytest.approx(metrics.total_distance, rel=1e-9)
+            assert got.max_speed == pytest.approx(metrics.max_speed, rel=1e-9)
+            assert got.avg_speed == pytest.approx(metrics.avg_speed, rel=1e-9)
+
+    def test_sprints_do_not_span_players(self):
+        """A sprint ending one track and one starting the next are two runs."""
+        n = 40
+        fast = {"frame_id": np.arange(n), "player_id": ["a"] * n,
+                "x": np.arange(n) * 0.3, "y": np.zeros(n), "timestamp": np.arange(n) * 0.04}
+        records = [
+            {k: (v[i].item() if hasattr(v[i], "item") else v[i]) for k, v in fast.items()}
+            for i in range(n)
+        ]
+        records += [dict(r, player_id="b") for r in records]
+
+        result = PhysicalMetricsEngine().calculate(TrackingTable.from_records(records))
+
+        assert result["a"].sprint_count == 1
+        assert result["b"].sprint_count == 1
+
+    def test_single_frame_player(self):
+        """A lone observation yields zero movement."""
+        table = TrackingTable.from_records([{"frame_id": 0, "player_id": 1, "x": 1.0, "y": 1.0}])
+
+        metrics = PhysicalMetricsEngine().calculate(table)[1]
+
+        assert metrics.total_distance == 0.0
+        assert metrics.sprint_count == 0
+
+    def test_empty_table(self):
+        """No rows, no metrics."""
+        assert PhysicalMetricsEngine().calculate(TrackingTable.from_records([])) == {}
+
+
+class TestIncrementalPhysicalMetrics:
+    """update/snapshot over appended blocks must equal a full recompute."""
+
+    @staticmethod
+    def _smooth_tracking(seed: int = 3):
+        """Frame-ordered rows without outliers, tracks starting at different frames."""
+        rng = np.random.default_rng(seed)
+        records = []
+        for p, n in enumerate([2, 8, 12, 40, 250]):
+            start = int(rng.integers(0, 30))
+            x = np.cumsum(rng.normal(0.2, 0.1, n)) + 10
+            y = np.cumsum(rng.normal(0.0, 0.1, n)) + 30
+            for i in range(n):
+                records.append({
+                    "frame_id": start + i, "player_id": f"p{p}",
+                    "x": float(x[i]), "y": float(y[i]), "timestamp": (start + i) * 0.04,
+                })
+        return sorted(records, key=lambda r: r["frame_id"])
+
+    @pytest.mark.parametrize("block_frames", [1, 7, 50, 1000])
+    def test_blocks_match_full_calculation(self, block_frames):
+        records = self._smooth_tracking()
+        engine = PhysicalMetricsEngine(sprint_threshold=15.0)
+        expected = engine.calculate(TrackingTable.from_records(records))
+
+        states = {}
+        for start in range(0, records[-1]["frame_id"] + 1, block_frames):
+            block = [r for r in records if start <= r["frame_id"] < start + block_frames]
+            engine.update(states, TrackingTable.from_records(block))
+        result = engine.snapshot(states)
+
+        assert set(result) == set(expected)
+        for player_id, metrics in expected.items():
+            got = result[player_id]
+            assert got.sprint_count == metrics.sprint_count
+            assert got.total_distance == pytest.approx(metrics.total_distance, rel=1e-9)
+            assert got.max_speed == pytest.approx(metrics.max_speed, rel=1e-9)
+            assert got.avg_speed == pytest.approx(metrics.avg_speed, rel=1e-9)
+
+    def test_redelivered_frames_are_ignored(self):
+        records = self._smooth_tracking()
+        engine = PhysicalMetricsEngine()
+        states = {}
+        engine.update(states, TrackingTable.from_records(records))
+        before = engine.snapshot(states)
+
+        engine.update(states, TrackingTable.from_records(records[:100]))
+
+        assert engine.snapshot(states) == before
+
+    def test_state_stays_bounded(self):
+        records = self._smooth_tracking()
+        engine = PhysicalMetricsEngine()
+        states = {}
+        for r in records:
+            engine.update(states, TrackingTable.from_records([r]))
+
+        state = states["p4"]
+        assert state.rows == 250
+        assert len(state.tail_x) == engine.SAVGOL_WINDOW + 1
+        assert len(state.provisional_speeds) == engine.SAVGOL_WINDOW // 2 + 1
@@ -0,0 +1,94 @@
+"""
+Tests for PitchControlEngine domain service.
+"""
+import numpy as np
+import pytest
+
+from src.domain.entities.match_frame import MatchFrame, PlayerPosition, BallPosition
+from src.domain.services.pitch_control_engine import (
+    AWAY, HOME, NO_TEAM, FrameTensor, PitchControlEngine,
+)
+from src.domain.value_objects.tracking_table import TrackingTable
+
+
+def _frames(seed: int = 0, n_frames: int = 6, n_players: int = 22):
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform([0, 0], [105, 68], size=(n_frames, n_players, 2))
+    teams = np.array([HOME] * (n_players // 2) + [AWAY] * (n_players - n_players // 2))
+    return positions, teams
+
+
+class TestPitchControlEngine:
+    """Test suite for batched pitch control."""
+
+    def test_matches_match_frame(self):
+        """Each output frame should equal MatchFrame.calculate_pitch_control."""
+        positions, teams = _frames()
+        positions[2, 3] = np.nan  # player missing from one frame
+
+        result = PitchControlEngine().compute(positions, teams)
+
+        assert result.shape == (6, 24, 32)
+        assert result.dtype == np.float32
+        for f in range(len(positions)):
+            players = [
+                PlayerPosition(str(p), "home" if teams[p] == HOME else "away", *positions[f, p])
+                for p in range(positions.shape[1])
+                if not np.isnan(positions[f, p, 0])
+            ]
+            expected = MatchFrame(f, players, BallPosition(52.5, 34.0)).calculate_pitch_control()
+            np.testing.assert_allclose(result[f], expected.home_control, atol=1e-5)
+
+    def test_chunking_does_not_change_result(self):
+        """A tiny memory cap forces one frame per chunk with equal output."""
+        positions, teams = _frames(n_frames=5)
+        engine = PitchControlEngine(max_chunk_bytes=1)
+
+        assert engine.frames_per_chunk(positions.shape[1]) == 1
+        np.testing.assert_array_equal(
+            engine.compute(positions, teams), PitchControlEngine().compute(positions, teams)
+        )
+
+    def test_single_team_controls_everything(self):
+        """With no opponents the present team owns the pitch."""
+        positions = np.array([[[50.0, 30.0]]])
+        engine = PitchControlEngine()
+
+        home = engine.compute(positions, np.array([HOME]))
+
+        assert np.allclose(home, 1.0, atol=1e-6)
+        assert np.allclose(engine.away_control(home, np.array([HOME])), 0.0, atol=1e-6)
+
+    def test_velocity_projects_position(self):
+        """Velocities shift players to where they will be after reacting."""
+        positions = np.array([[[10.0, 34.0], [95.0, 34.0]]])
+        velocities = np.array([[[10.0, 0.0], [0.0, 0.0]]])
+        engine = PitchControlEngine()
+
+        static = engine.compute(positions, np.array([HOME, AWAY]))
+        moving = engine.compute(positions, np.array([HOME, AWAY]), velocities)
+
+        assert moving.mean() > static.mean()
+
+
+class TestFrameTensor:
+    """Test suite for packing tracking rows into frame tensors."""
+
+    def test_from_tracking_packs_slots_and_ball(self):
+        """Players share slots per frame; ball goes to its own column."""
+        table = TrackingTable.from_records([
+            {"frame_id": 5, "player_id": "a", "x": 1.0, "y": 2.0, "team_id": "home"},
+            {"frame_id": 0, "player_id": "b", "x": 3.0, "y": 4.0, "team_id": "away"},
+            {"frame_id": 0, "player_id": "a", "x": 5.0, "y": 6.0, "team_id": "home"},
+            {"frame_id": 0, "player_id": "ball", "x": 7.0, "y": 8.0, "object_type": "ball"},
+            {"frame_id": 3, "player_id": "a", "x": 9.0, "y": 9.0, "team_id": "home"},
+        ])
+
+        tensor = FrameTensor.from_tracking(table, sample_rate=5)
+
+        assert list(tensor.frame_ids) == [0, 5]
+        assert tensor.positions.shape == (2, 2, 2)
+        np.testing.assert_array_equal(tensor.teams, [[AWAY, HOME], [HOME, NO_TEAM]])
+        np.testing.assert_array_equal(tensor.ball[0], [7.0, 8.0])
+        assert np.isnan(tensor.ball[1]).all()
+        assert np.isnan(tensor.positions[1, 1]).all()
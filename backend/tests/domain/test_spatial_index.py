@@ -0,0 +1,87 @@
+"""
+Tests for FrameSpatialIndex domain service.
+"""
+import numpy as np
+import pytest
+
+from src.domain.services.spatial_index import FrameSpatialIndex
+
+
+def _positions(seed: int = 0, n_frames: int = 5, n_slots: int = 23):
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform([0, 0], [105, 68], size=(n_frames, n_slots, 2))
+    positions[1, 4] = np.nan  # empty slot
+    return positions
+
+
+def _brute_force(positions, centre):
+    return [
+        np.hypot(p[0] - centre[0], p[1] - centre[1]) if not np.isnan(p).any() else np.inf
+        for p in positions
+    ]
+
+
+class TestFrameSpatialIndex:
+    """Test suite for batched spatial queries."""
+
+    def test_distances_match_per_point_loop(self):
+        positions = _positions()
+        centres = np.array([[52.5, 34.0]] * 5)
+
+        distances = FrameSpatialIndex(positions).distances(centres)
+
+        for f in range(5):
+            np.testing.assert_allclose(distances[f], _brute_force(positions[f], centres[f]))
+        assert np.isinf(distances[1, 4])
+
+    def test_nearest_k_sorted_and_masked(self):
+        positions = _positions()
+        mask = np.ones(positions.shape[:2], dtype=bool)
+        mask[:, 0] = False
+        index = FrameSpatialIndex(positions)
+
+        slots, distances = index.nearest((30.0, 20.0), k=3, mask=mask)
+
+        for f in range(5):
+            expected = np.array(_brute_force(positions[f], (30.0, 20.0)))
+            expected[0] = np.inf
+            np.testing.assert_array_equal(slots[f], np.argsort(expected, kind="stable")[:3])
+        assert (np.diff(distances, axis=1) >= 0).all()
+
+    def test_nearest_pads_missing_neighbours(self):
+        index = FrameSpatialIndex.from_points([(0.0, 0.0), (3.0, 4.0)])
+
+        slots, distances = index.nearest((0.0, 0.0), k=3)
+
+        assert slots.tolist() == [[0, 1, -1]]
+        assert distances.tolist() == [[0.0, 5.0, np.inf]]
+
+    def test_nearest_ties_go_to_lower_slot(self):
+        index = FrameSpatialIndex.from_points([(1.0, 0.0), (-1.0, 0.0)])
+
+        assert index.nearest((0.0, 0.0))[0].tolist() == [[0]]
+
+    def test_nan_centre_has_no_neighbours(self):
+        index = FrameSpatialIndex.from_points([(1.0, 0.0)])
+
+        slots, distances = index.nearest((np.nan, np.nan))
+
+        assert slots.tolist() == [[-1]]
+        assert not index.within((np.nan, np.nan), 10.0).any()
+
+    def test_within_is_inclusive(self):
+        index = FrameSpatialIndex.from_points([(0.0, 2.0), (0.0, 2.5)])
+
+        assert index.within((0.0, 0.0), 2.0).tolist() == [[True, False]]
+
+    def test_pairwise_symmetric_with_empty_slots(self):
+        positions = _positions(n_slots=6)
+        pairwise = FrameSpatialIndex(positions).pairwise()
+
+        np.testing.assert_allclose(pairwise, np.swapaxes(pairwise, 1, 2))
+        assert np.isinf(pairwise[1, 4]).all()
+        assert pairwise[0, 2, 3] == pytest.approx(np.linalg.norm(positions[0, 2] - positions[0, 3]))
+
+    def test_rejects_bad_shape(self):
+        with pytest.raises(ValueError):
+            FrameSpatialIndex(np.zeros((3, 2)))
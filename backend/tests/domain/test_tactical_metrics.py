@@ -146,3 +146,107 @@ class TestTacticalMatch:
         assert metrics.middle_third_presses == 1
         assert metrics.attacking_third_presses == 1
         assert metrics.total_presses == 3
+    
+    def test_compute_all_matches_individual_metrics(self):
+        """compute_all should agree with the per-metric methods."""
+        rng = np.random.default_rng(0)
+        types = list(EventType)
+        events = [
+            MatchEvent(
+                f"e{i}", types[rng.integers(len(types))], ("home", "away")[i % 2], "p1",
+                x=float(rng.choice([0.0, rng.uniform(0, 105)])),
+                start_x=float(rng.uniform(0, 105)), start_y=float(rng.uniform(0, 68)),
+                end_x=float(rng.uniform(0, 105)), end_y=float(rng.uniform(0, 68))
+            )
+            for i in range(500)
+        ]
+        match = TacticalMatch("match1", events)
+        
+        metrics = match.compute_all()
+        
+        for team, opponent in (("home", "away"), ("away", "home")):
+            assert metrics.ppda[team] == match.calculate_ppda(team, opponent)
+            assert metrics.pressing[team] == match.calculate_pressing_metrics(team)
+            assert metrics.xt[team] == match.calculate_xt_chain(team)
+    
+    def test_event_indices_follow_appended_events(self):
+        """Team/type lookups should see events added after construction."""
+        match = TacticalMatch("match1", [
+            MatchEvent("e1", EventType.PASS, "home", "p1"),
+            MatchEvent("e2", EventType.TACKLE, "away", "p2"),
+        ])
+        assert [e.event_id for e in match.get_events_by_team("home")] == ["e1"]
+        
+        match.events.append(MatchEvent("e3", EventType.PASS, "home", "p1"))
+        
+        assert [e.event_id for e in match.get_events_by_team("home")] == ["e1", "e3"]
+        assert [e.event_id for e in match.get_events_by_type(EventType.PASS)] == ["e1", "e3"]
+        assert match.get_events_by_team("neutral") == []
+    
+    def test_compute_all_without_events(self):
+        metrics = TacticalMatch("match1", []).compute_all()
+        
+        assert metrics.ppda["home"].ppda == float("inf")
+        assert metrics.pressing["away"].total_presses == 0
+        assert metrics.xt["home"].total_xt == 0.0
+    
+    def test_rolling_metrics_match_per_window_recomputation(self):
+        """Each window should equal the metrics of its events alone."""
+        rng = np.random.default_rng(1)
+        types = list(EventType)
+        events = [
+            MatchEvent(
+                f"e{i}", types[rng.integers(len(types))], ("home", "away")[rng.integers(2)], "p1",
+                timestamp=float(rng.uniform(0, 1800)),
+                start_x=float(rng.uniform(0, 105)), start_y=float(rng.uniform(0, 68)),
+                end_x=float(rng.uniform(0, 105)), end_y=float(rng.uniform(0, 68))
+            )
+            for i in range(400)
+        ]
+        
+        timeline = TacticalMatch("match1", events).rolling_metrics(300.0, 120.0)
+        
+        assert timeline.window_start[0] == 0.0
+        assert timeline.window_end[-1] > max(e.timestamp for e in events)
+        for w, (start, end) in enumerate(zip(timeline.window_start, timeline.window_end)):
+            window = TacticalMatch("match1", [e for e in events if start <= e.timestamp < end])
+            for team, opponent in (("home", "away"), ("away", "home")):
+                ppda = window.calculate_ppda(team, opponent)
+                pressing = window.calculate_pressing_metrics(team)
+                assert timeline.passes_allowed[team][w] == ppda.passes_allowed
+                assert timeline.defensive_actions[team][w] == ppda.defensive_actions
+                assert timeline.ppda[team][w] == pytest.approx(ppda.ppda)
+                assert timeline.pressing[team][w].tolist() == [
+                    pressing.defensive_third_presses,
+                    pressing.middle_third_presses,
+                    pressing.attacking_third_presses,
+                ]
+                assert timeline.xt[team][w] == pytest.approx(window.calculate_xt_chain(team).total_xt)
+    
+    def test_rolling_metrics_rejects_non_positive_window(self):
+        with pytest.raises(ValueError):
+            TacticalMatch("match1", []).rolling_metrics(window_seconds=0.0)
+    
+    def test_rolling_metrics_rejects_too_many_windows(self):
+        """max_windows bounds the series before any window is allocated."""
+        events = [MatchEvent("e1", EventType.PASS, "home", "p1", timestamp=5400.0)]
+        match = TacticalMatch("match1", events)
+        
+        with pytest.raises(ValueError, match="windows"):
+            match.rolling_metrics(300.0, 0.01, max_windows=500)
+        assert len(match.rolling_metrics(300.0, 60.0, max_windows=500).window_start) == 87
+    
+    def test_team_relative_coordinates_mirror_away_ppda_zone(self):
+        """With team-relative coordinates away passes count in x > 35 too."""
+        events = [
+            MatchEvent("e1", EventType.PASS, "away", "p2", timestamp=1.0, x=80.0, y=30.0),
+            MatchEvent("e2", EventType.PASS, "away", "p2", timestamp=2.0, x=20.0, y=30.0),
+            MatchEvent("e3", EventType.TACKLE, "home", "p1", timestamp=3.0, x=30.0, y=30.0),
+        ]
+        absolute = TacticalMatch("match1", events)
+        relative = TacticalMatch("match1", events, team_relative_coordinates=True)
+        
+        assert absolute.calculate_ppda("home", "away").passes_allowed == 1  # x = 20
+        assert relative.calculate_ppda("home", "away").passes_allowed == 1  # x = 80
+        assert relative.compute_all().ppda["home"] == relative.calculate_ppda("home", "away")
+        assert relative.rolling_metrics(300.0, 300.0).passes_allowed["home"].tolist() == [1]
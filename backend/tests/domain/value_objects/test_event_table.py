@@ -0,0 +1,41 @@
+"""
+Tests for the EventTable value object.
+"""
+import numpy as np
+
+from src.domain.entities.tactical_match import EventType, MatchEvent
+from src.domain.value_objects.event_table import EventTable
+
+
+def _events():
+    return [
+        MatchEvent("e1", EventType.PASS, "home", "p1", x=10.0),
+        MatchEvent("e2", EventType.TACKLE, "away", "p2", start_x=40.0),
+        MatchEvent("e3", EventType.PASS, "away", "p2", x=70.0),
+        MatchEvent("e4", EventType.PRESSURE, "home", "p1", x=90.0),
+    ]
+
+
+class TestEventTable:
+    """Test suite for columnar events with team/type indices."""
+
+    def test_indices(self):
+        table = EventTable.from_events(_events(), EventType)
+
+        assert table.teams == ["home", "away"]
+        assert table.team_rows["away"].tolist() == [1, 2]
+        assert table.type_rows[EventType.PASS].tolist() == [0, 2]
+        assert EventType.SHOT not in table.type_rows
+
+    def test_location_falls_back_to_start_x(self):
+        table = EventTable.from_events(_events(), EventType)
+
+        np.testing.assert_array_equal(table.x, [10.0, 40.0, 70.0, 90.0])
+
+    def test_rows_by_team_and_types(self):
+        table = EventTable.from_events(_events(), EventType)
+
+        assert table.rows("home", (EventType.PASS, EventType.PRESSURE)).tolist() == [0, 3]
+        assert table.rows(types=(EventType.PASS, EventType.TACKLE)).tolist() == [0, 1, 2]
+        assert table.rows("nobody").tolist() == []
+        assert table.rows().tolist() == [0, 1, 2, 3]
@@ -0,0 +1,109 @@
+"""
+Tests for PhaseFeatures value object.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.domain.value_objects.phase_features import PhaseFeatures
+
+
+def _per_frame_features(df: pd.DataFrame) -> np.ndarray:
+    """Reference: from_tracking_frame called frame by frame."""
+    rows = []
+    prev_ball = (52.5, 34.0)
+    for _, frame in df.groupby("frame_id", sort=True):
+        ball = (frame["ball_x"].iloc[0], frame["ball_y"].iloc[0])
+        home = frame[frame["team"] == "home"]
+        away = frame[frame["team"] == "away"]
+        features = PhaseFeatures.from_tracking_frame(
+            home_positions=list(zip(home["x"], home["y"])),
+            away_positions=list(zip(away["x"], away["y"])),
+            ball_position=ball,
+            ball_velocity=((ball[0] - prev_ball[0]) * 25.0, (ball[1] - prev_ball[1]) * 25.0),
+        )
+        prev_ball = ball
+        rows.append([getattr(features, name) for name in PhaseFeatures.feature_names()])
+    return np.array(rows, dtype=np.float64)
+
+
+class TestPhaseFeaturesFromArrays:
+    """Batch feature extraction must match the per-frame path."""
+
+    def test_matches_from_tracking_frame(self):
+        """Random frames with uneven team sizes, empty teams and referees."""
+        rng = np.random.default_rng(3)
+        records = []
+        for frame_id in rng.permutation(np.arange(0, 120, 2)):
+            ball = rng.uniform([0, 0], [105, 68])
+            n_home, n_away = rng.integers(0, 12, size=2)
+            teams = ["home"] * n_home + ["away"] * n_away + ["referee"]
+            for team in teams:
+                x, y = rng.uniform([0, 0], [105, 68])
+                records.append((frame_id, team, x, y, ball[0], ball[1]))
+        df = pd.DataFrame(records, columns=["frame_id", "team", "x", "y", "ball_x", "ball_y"])
+        df = df.sample(frac=1.0, random_state=0).reset_index(drop=True)
+
+        frame_ids, features = PhaseFeatures.from_arrays(
+            df["frame_id"], df["team"], df["x"], df["y"], df["ball_x"], df["ball_y"]
+        )
+
+        assert list(frame_ids) == sorted(df["frame_id"].unique())
+        assert features.shape == (len(frame_ids), PhaseFeatures.num_features())
+        np.testing.assert_allclose(features, _per_frame_features(df), rtol=1e-9, atol=1e-9)
+
+    def test_defaults_without_ball_columns(self):
+        """Ball falls back to the centre spot and empty teams to defaults."""
+        frame_ids, features = PhaseFeatures.from_arrays(
+            frame_id=[5, 5],
+            team=["home", "home"],
+            x=[10.0, 20.0],
+            y=[30.0, 40.0],
+        )
+
+        row = PhaseFeatures.from_vector(features[0])
+        assert list(frame_ids) == [5]
+        assert (row.ball_x, row.ball_y) == (52.5, 34.0)
+        assert (row.ball_velocity_x, row.ball_velocity_y) == (0.0, 0.0)
+        assert (row.away_centroid_x, row.away_centroid_y) == (52.5, 34.0)
+        assert row.home_defensive_line == pytest.approx(15.0)
+        assert row.away_defensive_line == 52.5
+
+    def test_empty_input(self):
+        """No rows gives an empty matrix with the right width."""
+        frame_ids, features = PhaseFeatures.from_arrays([], [], [], [])
+
+        assert len(frame_ids) == 0
+        assert features.shape == (0, PhaseFeatures.num_features())
+
+    def test_from_vector_round_trip(self):
+        """from_vector inverts to_vector."""
+        features = PhaseFeatures.from_vector(np.arange(15, dtype=np.float64))
+
+        assert features.home_possession_prob == 14.0
+        np.testing.assert_array_equal(features.to_vector(), np.arange(15, dtype=np.float32))
+
+
+class TestPhaseFeaturesWindowed:
+    """Rolling-window downsampling of the feature matrix."""
+
+    def test_window_means_and_frame_mapping(self):
+        frame_ids = np.array([0, 1, 2, 3, 4, 5, 9])
+        features = np.arange(7, dtype=np.float64)[:, None] * np.ones((1, 15))
+
+        window_of_frame, windows = PhaseFeatures.windowed(frame_ids, features, step_frames=2, window_frames=4)
+
+        # Tiles 0-1, 2-3, 4-5 and 8-9 (tile 6-7 has no frames)
+        assert list(window_of_frame) == [0, 0, 1, 1, 2, 2, 3]
+        assert windows.shape == (4, 15)
+        # Tile 2-3 is centred on 2.5 and averages frames 1..4
+        assert windows[1, 0] == pytest.approx(np.mean([1, 2, 3, 4]))
+        assert windows[3, 0] == pytest.approx(6.0)
+
+    def test_nan_frames_drop_out_of_their_windows_only(self):
+        features = np.ones((6, 15))
+        features[1] = np.nan
+
+        _, windows = PhaseFeatures.windowed(np.arange(6), features, step_frames=2)
+
+        assert np.all(windows == 1.0)
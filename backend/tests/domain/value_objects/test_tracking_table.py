@@ -0,0 +1,57 @@
+"""
+Tests for TrackingTable value object.
+"""
+import numpy as np
+import pandas as pd
+
+from src.domain.value_objects.tracking_table import TrackingTable
+
+
+class TestTrackingTable:
+    """Test suite for the columnar tracking representation."""
+
+    def test_from_records_applies_defaults(self):
+        """Missing optional columns should get the legacy defaults."""
+        table = TrackingTable.from_records([
+            {"frame_id": 0, "player_id": 7, "x": 10.0, "y": 20.0},
+            {"frame_id": 1, "player_id": 7, "x": 11.0, "y": 20.5, "object_type": "ball"},
+        ])
+
+        assert len(table) == 2
+        assert table.frame_id.dtype == np.int64
+        assert list(table.timestamp) == [0.0, 0.0]
+        assert list(table.object_type) == ["player", "ball"]
+        assert list(table.team_id) == ["unknown", "unknown"]
+        assert list(table.confidence) == [1.0, 1.0]
+
+    def test_from_columns_accepts_dataframe(self):
+        """A parquet-loaded DataFrame should map column for column."""
+        df = pd.DataFrame({
+            "frame_id": [0, 0, 1],
+            "player_id": [1, 2, 1],
+            "x": [1.0, 2.0, 3.0],
+            "y": [4.0, 5.0, 6.0],
+            "timestamp": [0.0, 0.0, 0.04],
+            "object_type": ["player", "player", "player"],
+        })
+
+        table = TrackingTable.from_columns(df)
+
+        assert len(table) == 3
+        np.testing.assert_array_equal(table.x, [1.0, 2.0, 3.0])
+        assert list(table.team_id) == ["unknown"] * 3
+
+    def test_take_and_iter_records_round_trip(self):
+        """Row selection should keep columns aligned."""
+        records = [
+            {"frame_id": i, "player_id": "p1", "x": float(i), "y": 0.0,
+             "timestamp": i * 0.04, "object_type": "player",
+             "team_id": "home", "confidence": 0.9}
+            for i in range(5)
+        ]
+        table = TrackingTable.from_records(records)
+
+        subset = table.take(table.frame_id % 2 == 0)
+
+        assert [r["frame_id"] for r in subset.iter_records()] == [0, 2, 4]
+        assert list(subset.iter_records())[1] == dict(records[2], period=1)
@@ -0,0 +1,96 @@
+"""
+Unit tests for PostgresLineupRepository lineup caching.
+"""
+import pytest
+from unittest.mock import MagicMock
+
+from src.domain.ports.lineup_repository import PlayerMappingDTO
+from src.infrastructure.db.repositories import postgres_lineup_repo
+from src.infrastructure.db.repositories.postgres_lineup_repo import PostgresLineupRepository
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """Sessions handed out by get_session; each query returns two mappings."""
+    opened = []
+
+    def get_session():
+        session = MagicMock()
+        session.query.return_value.filter.return_value.all.return_value = [
+            MagicMock(track_id=1, player_name="Messi", jersey_number=10, team="home"),
+            MagicMock(track_id=7, player_name="Mbappé", jersey_number=7, team="away"),
+        ]
+        opened.append(session)
+        yield session
+
+    monkeypatch.setattr(postgres_lineup_repo, "get_session", get_session)
+    PostgresLineupRepository.invalidate()
+    yield opened
+    PostgresLineupRepository.invalidate()
+
+
+class TestPostgresLineupRepositoryCache:
+    """Test suite for the per-process lineup cache."""
+
+    def test_lookups_share_one_query(self, sessions):
+        """Names and teams of a match are served from one lineup load."""
+        repo = PostgresLineupRepository()
+
+        assert repo.get_player_name("m1", 1) == "Messi"
+        assert repo.get_team("m1", 7) == "away"
+        assert repo.get_player_name("m1", 99) is None
+        assert PostgresLineupRepository().get_lineup("m1")[7].jersey_number == 7
+
+        assert len(sessions) == 1
+
+    def test_save_and_delete_invalidate(self, sessions):
+        repo = PostgresLineupRepository()
+        repo.get_lineup("m1")
+
+        repo.save_mappings("m1", [PlayerMappingDTO(track_id=1, player_name="Messi", team="home")])
+        repo.get_lineup("m1")
+        repo.delete_mappings("m1")
+        repo.get_lineup("m1")
+
+        # load, save, reload, delete, reload
+        assert len(sessions) == 5
+
+    def test_entries_expire_after_ttl(self, sessions, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr(postgres_lineup_repo.time, "monotonic", lambda: clock[0])
+        repo = PostgresLineupRepository()
+
+        repo.get_lineup("m1")
+        clock[0] += PostgresLineupRepository.CACHE_TTL_SECONDS - 1
+        repo.get_lineup("m1")
+        clock[0] += 2
+        repo.get_lineup("m1")
+
+        assert len(sessions) == 2
+
+    def test_callers_get_a_copy(self, sessions):
+        repo = PostgresLineupRepository()
+
+        repo.get_lineup("m1").pop(1)
+
+        assert repo.get_player_name("m1", 1) == "Messi"
+        assert len(sessions) == 1
+
+    def test_load_racing_a_write_is_not_cached(self, sessions, monkeypatch):
+        """A lineup read before save_mappings committed must not be cached."""
+        repo = PostgresLineupRepository()
+        load = repo._load_lineup
+
+        def load_then_concurrent_save(match_id):
+            lineup = load(match_id)
+            PostgresLineupRepository.invalidate(match_id)
+            return lineup
+
+        monkeypatch.setattr(repo, "_load_lineup", load_then_concurrent_save)
+        repo.get_lineup("m1")
+        monkeypatch.setattr(repo, "_load_lineup", load)
+        repo.get_lineup("m1")
+        repo.get_lineup("m1")
+
+        # the stale first load was dropped, the second one is cached
+        assert len(sessions) == 2
@@ -80,3 +80,16 @@ class TestPostgresMatchRepo:
             repo.save(match)
         
         mock_session.rollback.assert_called_once()
+
+    def test_get_competition_reads_metadata_only(self):
+        """The competition comes from match metadata; missing matches give None."""
+        mock_session = Mock(spec=Session)
+        query = mock_session.query.return_value.filter_by.return_value
+        query.first.return_value = Mock(match_metadata={"competition": "La Liga"})
+        repo = PostgresMatchRepo(session=mock_session)
+
+        assert repo.get_competition("test_123") == "La Liga"
+        mock_session.query.assert_called_once_with(MatchModel.match_metadata)
+
+        query.first.return_value = None
+        assert repo.get_competition("missing") is None
@@ -0,0 +1,88 @@
+"""
+Unit tests for PostgresMetricsRepository bulk persistence.
+"""
+import pytest
+from unittest.mock import Mock
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from src.infrastructure.db.repositories import postgres_metrics_repo
+from src.infrastructure.db.repositories.postgres_metrics_repo import PostgresMetricsRepository
+
+
+def _physical_rows(n):
+    return [
+        {"player_id": i, "total_distance": 10.0, "max_speed": 30.0,
+         "sprint_count": 3, "avg_speed": 7.0}
+        for i in range(n)
+    ]
+
+
+class TestPostgresMetricsRepositoryBulk:
+    """Test suite for multi-row upserts."""
+
+    def test_physical_stats_bulk_single_statement_and_commit(self):
+        """All players go in one multi-row upsert and one commit."""
+        session = Mock(spec=Session)
+        repo = PostgresMetricsRepository(session=session)
+
+        repo.save_physical_stats_bulk("m1", _physical_rows(3))
+
+        session.execute.assert_called_once()
+        session.commit.assert_called_once()
+        stmt = session.execute.call_args[0][0]
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        assert "ON CONFLICT (match_id, player_id) DO UPDATE" in sql
+        assert compiled.params["player_id_m2"] == "2"
+
+    def test_large_batches_are_chunked_in_one_transaction(self, monkeypatch):
+        """Chunks keep statements bounded without extra commits."""
+        monkeypatch.setattr(postgres_metrics_repo, "BULK_INSERT_CHUNK", 2)
+        session = Mock(spec=Session)
+        repo = PostgresMetricsRepository(session=session)
+
+        repo.save_physical_stats_bulk("m1", _physical_rows(5))
+
+        assert session.execute.call_count == 3
+        session.commit.assert_called_once()
+
+    def test_ppda_bulk_rolls_back_on_failure(self):
+        """A failed statement must not leave a half-written match."""
+        session = Mock(spec=Session)
+        session.execute.side_effect = RuntimeError("db down")
+        repo = PostgresMetricsRepository(session=session)
+
+        with pytest.raises(RuntimeError):
+            repo.save_ppda_bulk("m1", [
+                {"team_id": "home", "passes_allowed": 10, "defensive_actions": 5, "ppda": 2.0}
+            ])
+
+        session.rollback.assert_called_once()
+        session.commit.assert_not_called()
+
+    def test_empty_rows_do_nothing(self):
+        """No rows, no round-trip."""
+        session = Mock(spec=Session)
+
+        PostgresMetricsRepository(session=session).save_physical_stats_bulk("m1", [])
+
+        session.execute.assert_not_called()
+
+    def test_match_metrics_commit_once_or_not_at_all(self):
+        """Physical stats and PPDA share one transaction."""
+        session = Mock(spec=Session)
+        session.execute.side_effect = [None, RuntimeError("db down")]
+        repo = PostgresMetricsRepository(session=session)
+        ppda = [{"team_id": "home", "passes_allowed": 10, "defensive_actions": 5, "ppda": 2.0}]
+
+        with pytest.raises(RuntimeError):
+            repo.save_match_metrics_bulk("m1", _physical_rows(2), ppda)
+
+        assert session.execute.call_count == 2
+        session.commit.assert_not_called()
+        session.rollback.assert_called_once()
+
+        session.execute.side_effect = None
+        repo.save_match_metrics_bulk("m1", _physical_rows(2), ppda)
+        session.commit.assert_called_once()
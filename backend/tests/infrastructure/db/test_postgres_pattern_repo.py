@@ -0,0 +1,101 @@
+"""
+Unit tests for PostgresPatternRepo.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.domain.entities.tactical_pattern import TacticalPattern
+from src.infrastructure.db.models import PatternDetectionRunModel, TacticalPatternModel
+from src.infrastructure.db.repositories.postgres_pattern_repo import PostgresPatternRepo
+
+
+def _pattern(pattern_id: str, team_id: str = "home") -> TacticalPattern:
+    pattern = TacticalPattern(
+        pattern_id=pattern_id,
+        match_id="m1",
+        team_id=team_id,
+        cluster_label=2,
+        label="Wing Play",
+        centroid=[0.5, 1.5]
+    )
+    pattern.add_sequence("s1", ended_in_shot=True, ended_in_goal=False, duration=12.0, event_count=6, xt_progression=0.1)
+    return pattern
+
+
+class TestPostgresPatternRepo:
+    """Test suite for PostgresPatternRepo."""
+
+    def test_save_replaces_patterns_of_match_and_team(self):
+        mock_session = Mock(spec=Session)
+        repo = PostgresPatternRepo(session=mock_session)
+
+        repo.save_patterns("m1", "home", [_pattern("p1"), _pattern("p2")])
+
+        deleted = [c.args[0] for c in mock_session.query.call_args_list]
+        assert deleted == [TacticalPatternModel, PatternDetectionRunModel]
+        for c in mock_session.query.return_value.filter_by.call_args_list:
+            assert c.kwargs == {"match_id": "m1", "team_id": "home"}
+        saved = mock_session.add_all.call_args.args[0]
+        assert [m.pattern_id for m in saved] == ["p1", "p2"]
+        assert isinstance(saved[0], TacticalPatternModel)
+        assert saved[0].centroid == [0.5, 1.5]
+        run = mock_session.add.call_args.args[0]
+        assert (run.match_id, run.team_id, run.pattern_count) == ("m1", "home", 2)
+        mock_session.commit.assert_called_once()
+
+    def test_save_empty_result_clears_patterns_and_records_run(self):
+        mock_session = Mock(spec=Session)
+
+        PostgresPatternRepo(session=mock_session).save_patterns("m1", "home", [])
+
+        assert mock_session.query.return_value.filter_by.return_value.delete.call_count == 2
+        assert mock_session.add_all.call_args.args[0] == []
+        assert mock_session.add.call_args.args[0].pattern_count == 0
+        mock_session.commit.assert_called_once()
+
+    def test_has_detected(self):
+        mock_session = Mock(spec=Session)
+        first = mock_session.query.return_value.filter_by.return_value.first
+        repo = PostgresPatternRepo(session=mock_session)
+
+        first.return_value = (1,)
+        assert repo.has_detected("m1", "home")
+        first.return_value = None
+        assert not repo.has_detected("m1", "away")
+
+    def test_save_rolls_back_on_error(self):
+        mock_session = Mock(spec=Session)
+        mock_session.commit.side_effect = RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            PostgresPatternRepo(session=mock_session).save_patterns("m1", "home", [_pattern("p1")])
+
+        mock_session.rollback.assert_called_once()
+
+    def test_round_trip_through_model(self):
+        pattern = _pattern("p1")
+        model = PostgresPatternRepo._to_model(pattern)
+
+        restored = PostgresPatternRepo._to_entity(model)
+
+        assert restored.to_dict() == pattern.to_dict()
+        assert restored.centroid == [0.5, 1.5]
+
+    def test_get_patterns_of_undetected_match_is_empty(self):
+        mock_session = Mock(spec=Session)
+        mock_session.query.return_value.filter_by.return_value.filter_by.return_value \
+            .order_by.return_value.all.return_value = []
+
+        assert PostgresPatternRepo(session=mock_session).get_patterns("m1", "home") == []
+
+    def test_get_pattern_examples(self):
+        mock_session = Mock(spec=Session)
+        mock_session.query.return_value.filter_by.return_value.first.return_value = \
+            PostgresPatternRepo._to_model(_pattern("p1"))
+
+        repo = PostgresPatternRepo(session=mock_session)
+
+        assert repo.get_pattern_examples("p1", limit=1) == ["s1"]
@@ -0,0 +1,50 @@
+"""
+Unit tests for PostgresPatternUsageRepo.
+"""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from sqlalchemy.orm import Session
+
+from src.domain.value_objects.pattern_usage import PatternUsage
+from src.infrastructure.db.models import PatternUsageModel
+from src.infrastructure.db.repositories.postgres_pattern_usage_repo import PostgresPatternUsageRepo
+
+
+class TestPostgresPatternUsageRepo:
+    """Test suite for PostgresPatternUsageRepo."""
+
+    def test_save_replaces_match_rows(self):
+        mock_session = Mock(spec=Session)
+        repo = PostgresPatternUsageRepo(session=mock_session)
+
+        repo.save_match_usage("m1", 7, [PatternUsage("A", 0, occurrence_count=3), PatternUsage("B", 2)])
+
+        mock_session.query.return_value.filter_by.assert_called_once_with(match_id="m1")
+        saved = mock_session.add_all.call_args.args[0]
+        assert all(isinstance(m, PatternUsageModel) for m in saved)
+        assert [(m.team_id, m.cluster_label, m.model_version) for m in saved] == [("A", 0, 7), ("B", 2, 7)]
+        mock_session.commit.assert_called_once()
+
+    def test_team_usage_uses_team_match_count(self):
+        """Per-match rates divide by every match the team was assigned in."""
+        mock_session = MagicMock(spec=Session)
+        grouped = mock_session.query.return_value.filter.return_value.group_by.return_value
+        grouped.all.side_effect = [
+            [
+                MagicMock(team_id="A", cluster_label=3, occurrence_count=6, success_count=2, goal_count=1,
+                          total_duration_seconds=30.0, total_event_count=18.0, total_xt_progression=0.6),
+                MagicMock(team_id="A", cluster_label=1, occurrence_count=9, success_count=0, goal_count=0,
+                          total_duration_seconds=45.0, total_event_count=27.0, total_xt_progression=0.0),
+            ],
+            [("A", 3)],
+        ]
+
+        usages = PostgresPatternUsageRepo(session=mock_session).get_team_usage("A")
+
+        assert [u.cluster_label for u in usages] == [1, 3]
+        assert usages[1].match_count == 3
+        assert usages[1].per_match == 2.0
+        assert usages[1].avg_xt_progression == pytest.approx(0.1)
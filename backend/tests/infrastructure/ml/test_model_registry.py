@@ -0,0 +1,79 @@
+"""
+Tests for the per-process ModelRegistry.
+"""
+import os
+
+import numpy as np
+import pytest
+
+from src.domain.value_objects.game_phase import GamePhase
+from src.infrastructure.ml import model_registry
+from src.infrastructure.ml.model_registry import ModelRegistry
+from src.infrastructure.ml.sklearn_phase_classifier import SklearnPhaseClassifier
+
+
+def _publish(path, seed):
+    rng = np.random.default_rng(seed)
+    phases = [GamePhase.ORGANIZED_ATTACK, GamePhase.ORGANIZED_DEFENSE] * 10
+    classifier = SklearnPhaseClassifier(n_estimators=3, random_state=seed)
+    classifier.train(rng.normal(size=(20, 15)), phases)
+    classifier.save_model(path)
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    ModelRegistry.invalidate()
+    yield
+    ModelRegistry.invalidate()
+
+
+class TestModelRegistry:
+    """Test suite for cached model loading."""
+
+    def test_loads_once_per_version(self, tmp_path):
+        path = str(tmp_path / "phase.joblib")
+        _publish(path, seed=0)
+        loads = model_registry.model_loads_total.labels(model="phase.joblib", reason="initial")
+        before = loads._value.get()
+
+        first = ModelRegistry.get_phase_classifier(path)
+        second = ModelRegistry.get_phase_classifier(path)
+
+        assert first is second
+        assert first.is_trained()
+        assert loads._value.get() == before + 1
+
+    def test_model_arrays_are_memory_mapped(self, tmp_path):
+        path = str(tmp_path / "phase.joblib")
+        _publish(path, seed=0)
+
+        classifier = ModelRegistry.get_phase_classifier(path)
+
+        assert isinstance(classifier.scaler.mean_, np.memmap)
+
+    def test_reloads_when_a_new_model_is_published(self, tmp_path):
+        path = str(tmp_path / "phase.joblib")
+        _publish(path, seed=0)
+        old = ModelRegistry.get_phase_classifier(path)
+
+        _publish(path, seed=1)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        new = ModelRegistry.get_phase_classifier(path)
+        assert new is not old
+        assert new.is_trained()
+
+    def test_missing_file_returns_none(self, tmp_path):
+        assert ModelRegistry.get_phase_classifier(str(tmp_path / "missing.joblib")) is None
+
+    def test_worker_init_preloads_default_model(self, tmp_path, monkeypatch):
+        from src.infrastructure.worker.tasks import phase_classification_tasks
+
+        path = str(tmp_path / "phase.joblib")
+        _publish(path, seed=0)
+        monkeypatch.setattr(phase_classification_tasks, "PHASE_MODEL_PATH", path)
+
+        phase_classification_tasks.preload_phase_model()
+
+        assert path in ModelRegistry._cache
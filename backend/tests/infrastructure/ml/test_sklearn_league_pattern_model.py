@@ -0,0 +1,60 @@
+"""
+Unit tests for SklearnLeaguePatternModel.
+"""
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+from src.infrastructure.ml.sklearn_league_pattern_model import SklearnLeaguePatternModel
+
+
+def _blobs(n_per_blob: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centres = np.array([[0.0] * 15, [10.0] * 15, [-10.0] * 15])
+    return np.vstack([c + rng.normal(scale=0.5, size=(n_per_blob, 15)) for c in centres])
+
+
+class TestSklearnLeaguePatternModel:
+    """Test suite for the incremental league pattern model."""
+
+    def test_partial_fit_keeps_cluster_identity(self):
+        model = SklearnLeaguePatternModel(n_clusters=3, random_state=0)
+        first = _blobs(30, seed=0)
+        model.partial_fit(first)
+        labels_before = model.assign(first[::30])
+
+        for seed in range(1, 5):
+            model.partial_fit(_blobs(20, seed=seed))
+
+        assert model.version == 5
+        assert len(set(labels_before)) == 3
+        np.testing.assert_array_equal(model.assign(first[::30]), labels_before)
+
+    def test_first_batch_must_cover_every_cluster(self):
+        model = SklearnLeaguePatternModel(n_clusters=12)
+
+        with pytest.raises(ValueError):
+            model.partial_fit(np.zeros((5, 15)))
+        assert not model.is_fitted()
+
+    def test_assign_before_fit_raises(self):
+        with pytest.raises(ValueError):
+            SklearnLeaguePatternModel().assign(np.zeros((1, 15)))
+
+    def test_save_and_load_keeps_version(self):
+        model = SklearnLeaguePatternModel(n_clusters=3)
+        model.partial_fit(_blobs(10), match_ids=["m1", "m2"])
+        model.partial_fit(_blobs(10, seed=1), match_ids=["m3"])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "league.joblib")
+            model.save_model(path)
+            loaded = SklearnLeaguePatternModel.from_file(path)
+
+        assert loaded.version == 2
+        assert loaded.seen_match_ids == {"m1", "m2", "m3"}
+        assert loaded.has_seen("m3") and not loaded.has_seen("m4")
+        features = _blobs(5, seed=9)
+        np.testing.assert_array_equal(loaded.assign(features), model.assign(features))
@@ -0,0 +1,23 @@
+"""
+Unit tests for SklearnPatternDetector.
+"""
+import uuid
+
+import numpy as np
+
+from src.infrastructure.ml.sklearn_pattern_detector import SklearnPatternDetector
+
+
+class TestSklearnPatternDetector:
+    """Test suite for pattern creation from fitted clusters."""
+
+    def test_pattern_ids_are_full_uuids(self):
+        """pattern_id is unique in the database, so it must not be truncated."""
+        detector = SklearnPatternDetector()
+        detector.cluster_labels_ = np.array([0, 1, 2])
+
+        patterns = detector.get_patterns([], "m1", "home")
+
+        assert len(patterns) == 3
+        for pattern in patterns:
+            assert str(uuid.UUID(pattern.pattern_id)) == pattern.pattern_id
@@ -136,6 +136,36 @@ class TestSklearnPhaseClassifier:
         assert phase in GamePhase
         assert 0.0 <= confidence <= 1.0
 
+    def test_classify_batch_with_confidence(self, classifier, training_data):
+        """One matrix call should agree with per-row classification."""
+        features, labels = training_data
+        classifier.train(features, labels)
+        
+        phases, confidences = classifier.classify_batch_with_confidence(features[:20])
+        
+        expected = [classifier.classify_with_confidence(PhaseFeatures(*row)) for row in features[:20]]
+        assert phases == [phase for phase, _ in expected]
+        np.testing.assert_allclose(confidences, [conf for _, conf in expected])
+    
+    def test_classify_batch_with_confidence_untrained(self, classifier):
+        """Untrained model returns UNKNOWN with zero confidence."""
+        phases, confidences = classifier.classify_batch_with_confidence(np.zeros((3, 15)))
+        
+        assert phases == [GamePhase.UNKNOWN] * 3
+        assert list(confidences) == [0.0, 0.0, 0.0]
+    
+    def test_classify_proba_columns_follow_game_phase(self, classifier, training_data):
+        """Probability argmax agrees with the predicted phase."""
+        features, labels = training_data
+        classifier.train(features, labels)
+        
+        proba = classifier.classify_proba(features[:20])
+        phases, _ = classifier.classify_batch_with_confidence(features[:20])
+        
+        assert proba.shape == (20, len(GamePhase))
+        np.testing.assert_allclose(proba.sum(axis=1), 1.0)
+        assert [list(GamePhase)[i] for i in proba.argmax(axis=1)] == phases
+    
     def test_save_and_load_model(self, classifier, training_data):
         """Should save and load model correctly."""
         features, labels = training_data
@@ -166,3 +196,41 @@ class TestSklearnPhaseClassifier:
         """Should raise error when saving untrained model."""
         with pytest.raises(ValueError):
             classifier.save_model("model.joblib")
+
+    def test_train_incremental_sgd_streams_batches(self, training_data):
+        """SGD fits batch by batch and can be saved and reloaded."""
+        features, labels = training_data
+        classifier = SklearnPhaseClassifier(estimator="sgd", random_state=0)
+        calls = []
+
+        def batches():
+            calls.append(1)
+            for start in range(0, len(features), 25):
+                yield features[start:start + 25], labels[start:start + 25]
+
+        metrics = classifier.train_incremental(batches, epochs=5)
+
+        # scaler pass + 5 epochs + accuracy pass
+        assert len(calls) == 7
+        assert metrics["n_samples"] == 100
+        assert metrics["n_batches"] == 4
+        assert metrics["accuracy"] > 0.9
+        assert classifier.classify_proba(features[:3]).shape == (3, len(GamePhase))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "sgd.joblib")
+            classifier.save_model(path)
+            loaded = SklearnPhaseClassifier.from_file(path)
+            np.testing.assert_allclose(loaded.classify_proba(features[:10]), classifier.classify_proba(features[:10]))
+
+    def test_train_incremental_forest_falls_back_to_train(self, classifier, training_data):
+        features, labels = training_data
+
+        metrics = classifier.train_incremental(lambda: iter([(features, labels)]))
+
+        assert classifier.is_trained()
+        assert metrics["n_samples"] == 100
+
+    def test_unknown_estimator_raises(self):
+        with pytest.raises(ValueError):
+            SklearnPhaseClassifier(estimator="svm")
@@ -0,0 +1,47 @@
+"""
+Unit tests for MinIOMetricsStateStore.
+"""
+from minio.error import S3Error
+
+from src.domain.value_objects.metrics_state import (
+    MetricsState, PlayerRunningState, TeamEventCounters,
+)
+from src.infrastructure.storage.metrics_state_store import MinIOMetricsStateStore
+
+
+class InMemoryObjects:
+    """Minimal stand-in for MinIOAdapter's raw object API."""
+
+    def __init__(self):
+        self.objects = {}
+
+    def put_object(self, key, data, content_type="application/octet-stream"):
+        self.objects[key] = data
+
+    def get_object(self, key):
+        if key not in self.objects:
+            raise S3Error(code="NoSuchKey", message=key)
+        return self.objects[key]
+
+
+class TestMinIOMetricsStateStore:
+    """Test suite for running metrics state persistence."""
+
+    def test_missing_state_is_none(self):
+        assert MinIOMetricsStateStore(storage=InMemoryObjects()).get_state("m1") is None
+
+    def test_round_trip_keeps_player_id_types(self):
+        store = MinIOMetricsStateStore(storage=InMemoryObjects())
+        state = MetricsState(
+            "m1",
+            players={
+                7: PlayerRunningState(rows=3, last_frame=2, tail_x=[1.0, 2.0, 3.0]),
+                "p2": PlayerRunningState(rows=1, provisional_speeds=[0.0]),
+            },
+            teams={"home": TeamEventCounters(3, 1)},
+            frames_processed=3,
+        )
+
+        store.save_state(state)
+
+        assert store.get_state("m1") == state
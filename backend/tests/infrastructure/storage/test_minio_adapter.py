@@ -6,6 +6,7 @@ import pytest
 from unittest.mock import Mock, MagicMock, patch
 import pandas as pd
 import io
+import os
 
 from src.infrastructure.storage.minio_adapter import MinIOAdapter
 
@@ -65,3 +66,54 @@ class TestMinIOAdapter:
         pd.testing.assert_frame_equal(df_retrieved, df_expected)
         mock_client.get_object.assert_called_once_with("tracking-data", "tracking/test.parquet")
         mock_read_parquet.assert_called_once()
+
+    @patch('src.infrastructure.storage.minio_adapter.Minio')
+    def test_iter_tracking_blocks(self, mock_minio_class):
+        """Tracking parquet is decoded block by block, in row order."""
+        mock_client = Mock()
+        mock_minio_class.return_value = mock_client
+        mock_client.bucket_exists.return_value = True
+        buffer = io.BytesIO()
+        pd.DataFrame({
+            "frame_id": [0, 0, 1, 1, 2],
+            "player_id": [1, 2, 1, 2, 1],
+            "x": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "y": [0.0] * 5,
+        }).to_parquet(buffer, engine='pyarrow', index=False)
+        spooled = []
+        
+        def fget_object(bucket, key, path):
+            spooled.append(path)
+            with open(path, "wb") as f:
+                f.write(buffer.getvalue())
+        mock_client.fget_object.side_effect = fget_object
+        
+        adapter = MinIOAdapter()
+        
+        blocks = list(adapter.iter_tracking_blocks("tracking/test.parquet", block_rows=2))
+        
+        assert [len(b) for b in blocks] == [2, 2, 1]
+        assert blocks[1].x.tolist() == [3.0, 4.0]
+        assert blocks[2].object_type.tolist() == ["player"]
+        # Read from a temporary file, not from an in-memory copy
+        mock_client.get_object.assert_not_called()
+        assert mock_client.fget_object.call_args.args[:2] == ("tracking-data", "tracking/test.parquet")
+        assert not os.path.exists(spooled[0])
+
+    @patch('src.infrastructure.storage.minio_adapter.Minio')
+    def test_get_object_etag(self, mock_minio_class):
+        """ETag comes from stat_object; a missing object has none."""
+        from minio.error import S3Error
+        mock_client = Mock()
+        mock_minio_class.return_value = mock_client
+        mock_client.bucket_exists.return_value = True
+        mock_client.stat_object.return_value = Mock(etag="abc")
+        adapter = MinIOAdapter()
+
+        assert adapter.get_object_etag("xt/a.npz") == "abc"
+        mock_client.stat_object.assert_called_once_with("tracking-data", "xt/a.npz")
+
+        mock_client.stat_object.side_effect = S3Error(
+            code="NoSuchKey", message="missing", resource="", request_id="", host_id="", response=None
+        )
+        assert adapter.get_object_etag("xt/b.npz") is None
@@ -0,0 +1,120 @@
+"""
+Unit tests for PostgresPhaseRepository segment storage.
+"""
+import csv
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.entities.phase_sequence import PhaseSequence
+from src.domain.value_objects.game_phase import GamePhase
+from src.infrastructure.storage.phase_repository import PostgresPhaseRepository
+
+ATK, DEF = GamePhase.ORGANIZED_ATTACK, GamePhase.ORGANIZED_DEFENSE
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    session.query.return_value.filter.return_value.first.return_value = None
+    return session
+
+
+def _repo(session, **kwargs):
+    repo = PostgresPhaseRepository(**kwargs)
+    repo._get_session = lambda: session
+    return repo
+
+
+def _copied(session):
+    """{table: rows} for every COPY issued on the session's connection."""
+    cursor = session.connection.return_value.connection.cursor.return_value
+    copied = {}
+    for call in cursor.copy_expert.call_args_list:
+        sql, buffer = call.args
+        table = sql.split()[1]
+        copied[table] = list(csv.reader(io.StringIO(buffer.getvalue())))
+    return copied
+
+
+class TestPostgresPhaseRepositorySegments:
+    """Test suite for run-length phase storage."""
+
+    def test_save_copies_segments_and_transitions(self, session):
+        """A 6-frame sequence is stored as 2 segment rows, not 6 frame rows."""
+        sequence = PhaseSequence.from_arrays(
+            "m1", "home", range(6), [ATK, ATK, ATK, DEF, DEF, DEF], [1.0, 0.5, 0.6, 0.8, 0.8, 0.8]
+        )
+
+        _repo(session).save_phase_sequence(sequence)
+
+        copied = _copied(session)
+        assert set(copied) == {"phase_segments", "phase_transitions"}
+        segments = copied["phase_segments"]
+        assert [row[1:4] for row in segments] == [
+            ["0", "2", "organized_attack"],
+            ["3", "5", "organized_defense"],
+        ]
+        assert float(segments[0][4]) == pytest.approx(0.7)
+        assert copied["phase_transitions"][0][1:] == [
+            "3", "0.12", "organized_attack", "organized_defense"
+        ]
+        session.commit.assert_called_once()
+
+    def test_save_can_also_copy_frames(self, session):
+        sequence = PhaseSequence.from_arrays("m1", "home", range(4), [ATK] * 4)
+
+        _repo(session, store_frames=True).save_phase_sequence(sequence)
+
+        assert len(_copied(session)["frame_phases"]) == 4
+
+    def test_range_is_answered_from_segments(self, session):
+        """Overlapping segments are expanded and clipped to the range."""
+        seq_model = MagicMock(id=1, fps=25.0, statistics={"storage": "segments"})
+        session.query.return_value.filter.return_value.first.return_value = seq_model
+        session.query.return_value.filter.return_value.filter.return_value \
+            .order_by.return_value.all.return_value = [
+                MagicMock(start_frame=0, end_frame=9, phase="organized_attack", confidence=0.9),
+                MagicMock(start_frame=10, end_frame=19, phase="organized_defense", confidence=0.7),
+            ]
+
+        phases = _repo(session).get_phases_in_range("m1", "home", 8, 11)
+
+        assert phases == [
+            {"frame_id": 8, "phase": "organized_attack", "confidence": 0.9},
+            {"frame_id": 9, "phase": "organized_attack", "confidence": 0.9},
+            {"frame_id": 10, "phase": "organized_defense", "confidence": 0.7},
+            {"frame_id": 11, "phase": "organized_defense", "confidence": 0.7},
+        ]
+
+    def test_failed_copy_rolls_back(self, session):
+        cursor = session.connection.return_value.connection.cursor.return_value
+        cursor.copy_expert.side_effect = RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            _repo(session).save_phase_sequence(PhaseSequence.from_arrays("m1", "home", [0], [ATK]))
+
+        session.rollback.assert_called_once()
+        session.commit.assert_not_called()
+
+    def test_timeline_is_one_joined_query(self, session):
+        """Sequence metadata and overlapping segments come from one SELECT."""
+        row = dict(fps=25.0, total_frames=20, statistics={"storage": "segments", "transition_count": 1})
+        session.query.return_value.outerjoin.return_value.filter.return_value \
+            .order_by.return_value.all.return_value = [
+                MagicMock(**row, start_frame=0, end_frame=9, phase="organized_attack", confidence=0.9),
+                MagicMock(**row, start_frame=10, end_frame=19, phase="organized_defense", confidence=0.7),
+            ]
+
+        timeline = _repo(session).get_phase_timeline("m1", "home", 0.2, 0.5, in_seconds=True)
+
+        assert session.query.call_count == 1
+        assert timeline.total_frames == 20
+        assert [(s.start_frame, s.phase) for s in timeline.segments] == [(0, ATK), (10, DEF)]
+
+    def test_timeline_of_unclassified_match(self, session):
+        session.query.return_value.outerjoin.return_value.filter.return_value \
+            .order_by.return_value.all.return_value = []
+
+        assert _repo(session).get_phase_timeline("m1") is None
@@ -0,0 +1,96 @@
+"""
+Unit tests for MinIOPitchControlStore.
+"""
+import numpy as np
+import pytest
+from minio.error import S3Error
+
+from src.infrastructure.storage.pitch_control_store import MinIOPitchControlStore
+
+
+class InMemoryObjects:
+    """Minimal stand-in for MinIOAdapter's raw object API."""
+
+    def __init__(self):
+        self.objects = {}
+
+    def put_object(self, key, data, content_type="application/octet-stream"):
+        self.objects[key] = data
+
+    def get_object(self, key):
+        if key not in self.objects:
+            raise S3Error(code="NoSuchKey", message=key)
+        return self.objects[key]
+
+
+@pytest.fixture
+def store():
+    return MinIOPitchControlStore(storage=InMemoryObjects(), block_frames=4)
+
+
+def _surfaces(n_frames=10):
+    rng = np.random.default_rng(0)
+    home = rng.uniform(0, 1, size=(n_frames, 24, 32)).astype(np.float32)
+    home[3] = 0.0  # empty frame
+    away = 1.0 - home
+    away[3] = 0.0
+    return np.arange(n_frames) * 5, home, away
+
+
+class TestMinIOPitchControlStore:
+    """Test suite for chunked pitch control persistence."""
+
+    def test_round_trip_in_float16(self, store):
+        """Surfaces come back at float16 precision with derived away control."""
+        frame_ids, home, away = _surfaces()
+        store.save_surfaces("m1", frame_ids, home, away)
+
+        result = store.get_surfaces("m1")
+
+        np.testing.assert_array_equal(result.frame_ids, frame_ids)
+        np.testing.assert_allclose(result.home_control, home, atol=1e-3)
+        np.testing.assert_allclose(result.away_control, away, atol=1e-3)
+        assert (result.grid_height, result.grid_width) == (24, 32)
+
+    def test_writes_blocks_and_manifest(self, store):
+        """Ten frames in blocks of four -> three blocks plus manifest."""
+        store.save_surfaces("m1", *_surfaces())
+
+        manifest = store.get_manifest("m1")
+
+        assert [b["frames"] for b in manifest["blocks"]] == [4, 4, 2]
+        assert manifest["blocks"][1]["first_frame"] == 20
+        assert len(store.storage.objects) == 4
+
+    def test_range_read_only_touches_overlapping_blocks(self, store):
+        """A time slice should download only the blocks it overlaps."""
+        store.save_surfaces("m1", *_surfaces())
+        reads = []
+        original = store.storage.get_object
+        store.storage.get_object = lambda key: reads.append(key) or original(key)
+
+        result = store.get_surfaces("m1", start_frame=22, end_frame=30)
+
+        assert list(result.frame_ids) == [25, 30]
+        assert reads == ["m1/manifest.json", "m1/block_00001.npz"]
+
+    def test_missing_match_returns_none(self, store):
+        """Unknown matches have no surfaces."""
+        assert store.get_surfaces("unknown") is None
+
+    def test_event_ids_round_trip(self, store):
+        """Event-anchored surfaces keep their event ids, including shared frames."""
+        frame_ids, home, away = _surfaces(6)
+        frame_ids = np.array([5, 5, 10, 20, 20, 30])
+        store.save_surfaces("m1", frame_ids, home, away, event_ids=["a", "b", "c", "d", "e", "f"])
+
+        result = store.get_surfaces("m1", start_frame=10, end_frame=20)
+
+        assert list(result.frame_ids) == [10, 20, 20]
+        assert list(result.event_ids) == ["c", "d", "e"]
+        assert store.get_manifest("m1")["anchor"] == "events"
+
+    def test_frame_surfaces_have_no_event_ids(self, store):
+        store.save_surfaces("m1", *_surfaces())
+
+        assert store.get_surfaces("m1").event_ids is None
@@ -0,0 +1,83 @@
+"""
+Unit tests for MinIOExpectedThreatGridStore.
+"""
+import hashlib
+import io
+
+import numpy as np
+import pytest
+from minio.error import S3Error
+
+from src.domain.value_objects.expected_threat_grid import ExpectedThreatGrid
+from src.infrastructure.storage.xt_grid_store import MinIOExpectedThreatGridStore
+
+
+class InMemoryObjects:
+    """Minimal stand-in for MinIOAdapter's raw object API."""
+
+    def __init__(self):
+        self.objects = {}
+        self.reads = 0
+
+    def put_object(self, key, data, content_type="application/octet-stream"):
+        self.objects[key] = data
+
+    def get_object_etag(self, key):
+        return hashlib.md5(self.objects[key]).hexdigest() if key in self.objects else None
+
+    def get_object(self, key):
+        self.reads += 1
+        if key not in self.objects:
+            raise S3Error(code="NoSuchKey", message=key)
+        return self.objects[key]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    MinIOExpectedThreatGridStore._cache.clear()
+    yield
+    MinIOExpectedThreatGridStore._cache.clear()
+
+
+class TestMinIOExpectedThreatGridStore:
+    """Test suite for per-competition xT grid persistence."""
+
+    def test_missing_grid_is_none(self):
+        store = MinIOExpectedThreatGridStore(storage=InMemoryObjects())
+
+        assert store.get_grid("La Liga", 12, 8) is None
+
+    def test_round_trip_is_cached_per_competition(self):
+        objects = InMemoryObjects()
+        grid = ExpectedThreatGrid(grid=np.arange(6.0).reshape(2, 3), width=3, height=2)
+        MinIOExpectedThreatGridStore(storage=objects).save_grid("La Liga", grid)
+        MinIOExpectedThreatGridStore._cache.clear()
+
+        store = MinIOExpectedThreatGridStore(storage=objects)
+        first = store.get_grid("La Liga", 3, 2)
+        second = MinIOExpectedThreatGridStore(storage=objects).get_grid("La Liga", 3, 2)
+
+        assert list(objects.objects) == ["xt/la-liga/3x2.npz"]
+        np.testing.assert_array_equal(first.grid, grid.grid)
+        assert second is first
+        assert objects.reads == 1
+        assert store.get_grid("Serie A", 3, 2) is None
+
+    def test_refit_by_another_process_replaces_cached_grid(self):
+        """The cache is revalidated against the stored object's ETag."""
+        objects = InMemoryObjects()
+        store = MinIOExpectedThreatGridStore(storage=objects)
+        store.save_grid("La Liga", ExpectedThreatGrid(grid=np.zeros((2, 3)), width=3, height=2))
+        assert store.get_grid("La Liga", 3, 2).grid.sum() == 0.0
+
+        # Another worker refits: only the stored object changes
+        buffer = io.BytesIO()
+        np.savez(buffer, grid=np.ones((2, 3)), pitch_length=105.0, pitch_width=68.0)
+        objects.objects["xt/la-liga/3x2.npz"] = buffer.getvalue()
+
+        assert store.get_grid("La Liga", 3, 2).grid.sum() == 6.0
+        assert store.get_grid("La Liga", 3, 2).grid.sum() == 6.0
+        assert objects.reads == 1
+
+        del objects.objects["xt/la-liga/3x2.npz"]
+        assert store.get_grid("La Liga", 3, 2) is None
@@ -0,0 +1,115 @@
+"""
+Unit tests for Metrics Tasks and the task payload cap.
+"""
+import pytest
+from unittest.mock import Mock, patch
+
+from src.application.services.parallel_metrics_executor import can_fork_workers
+from src.application.use_cases.metrics_calculator import MetricsCalculator
+from src.domain.value_objects.tracking_table import TrackingTable
+from src.infrastructure.worker.celery_app import (
+    TaskPayloadTooLargeError,
+    celery_app,
+    payload_size,
+    send_task_checked,
+)
+from src.infrastructure.worker.tasks.metrics_tasks import _load_tracking
+
+
+class TestSendTaskChecked:
+    """Test suite for broker payload enforcement."""
+
+    def test_rejects_oversized_payload(self):
+        """Large inline arguments must never reach the broker."""
+        rows = [{"frame_id": i, "player_id": 1, "x": 0.0, "y": 0.0} for i in range(1000)]
+
+        with patch("src.infrastructure.worker.celery_app.celery_app.send_task") as send:
+            with pytest.raises(TaskPayloadTooLargeError):
+                send_task_checked("calculate_match_metrics", args=["m1", rows], max_bytes=1024)
+            send.assert_not_called()
+
+    def test_sends_small_payload(self):
+        """Reference-sized payloads should be forwarded unchanged."""
+        with patch("src.infrastructure.worker.celery_app.celery_app.send_task") as send:
+            send_task_checked(
+                "calculate_match_metrics",
+                args=["m1"],
+                kwargs={"tracking_key": "tracking/m1.parquet"},
+                countdown=2,
+            )
+
+        send.assert_called_once_with(
+            "calculate_match_metrics",
+            args=["m1"],
+            kwargs={"tracking_key": "tracking/m1.parquet"},
+            countdown=2,
+        )
+        assert payload_size(["m1"], {"tracking_key": "tracking/m1.parquet"}) < 100
+
+
+class TestLoadTracking:
+    """Test suite for resolving the metrics task's tracking input."""
+
+    @patch("src.infrastructure.worker.tasks.metrics_tasks.MinIOAdapter")
+    def test_loads_by_reference(self, mock_minio):
+        """A tracking key should be read from storage in columnar form."""
+        table = TrackingTable.from_records([{"frame_id": 0, "player_id": 1, "x": 0.0, "y": 0.0}])
+        mock_minio.return_value.get_tracking_table.return_value = table
+
+        result = _load_tracking("m1", None, "tracking/m1.parquet")
+
+        assert result is table
+        mock_minio.return_value.get_tracking_table.assert_called_once_with("tracking/m1.parquet")
+
+    @patch("src.infrastructure.worker.tasks.metrics_tasks.MinIOAdapter")
+    def test_defaults_to_match_parquet(self, mock_minio):
+        """Without inline data or a key, the match's tracking parquet is used."""
+        _load_tracking("m1", [], None)
+
+        mock_minio.return_value.get_tracking_table.assert_called_once_with("tracking/m1.parquet")
+
+    @patch("src.infrastructure.worker.tasks.metrics_tasks.MinIOAdapter")
+    def test_inline_rows_are_converted(self, mock_minio):
+        """Small inline payloads are still accepted."""
+        result = _load_tracking("m1", [{"frame_id": 0, "player_id": 1, "x": 1.0, "y": 2.0}], None)
+
+        assert isinstance(result, TrackingTable)
+        assert len(result) == 1
+        mock_minio.assert_not_called()
+
+
+class TestMetricsWorkerPool:
+    """The parallel metrics mode depends on the worker's pool type."""
+
+    def test_metrics_task_routed_to_metrics_queue(self):
+        route = celery_app.amqp.router.route({}, "calculate_match_metrics")
+
+        assert route["queue"].name == "metrics"
+
+    def test_prefork_child_cannot_fork(self):
+        """Prefork pool children are daemonic: the calculator would run serially."""
+        import billiard
+
+        with billiard.Pool(1) as pool:
+            assert pool.apply(can_fork_workers) is False
+
+    def test_solo_worker_runs_parallel_executor(self):
+        """A task on a solo-pool worker gets a process pool and uses it."""
+        from celery import Celery
+        from celery.contrib.testing.worker import start_worker
+
+        app = Celery("metrics-pool-test", broker="memory://", backend="cache+memory://")
+
+        @app.task(name="probe_parallel_metrics")
+        def probe():
+            executor = MetricsCalculator(Mock(), max_workers=2)._executor()
+            if executor is None:
+                return None
+            tracking = TrackingTable.from_records([
+                {"frame_id": f, "player_id": p, "x": 0.5 * f, "y": 0.0, "timestamp": f * 0.04}
+                for f in range(20) for p in (1, 2)
+            ])
+            return len(executor.physical_metrics(tracking))
+
+        with start_worker(app, pool="solo", perform_ping_check=False):
+            assert probe.delay().get(timeout=60) == 2
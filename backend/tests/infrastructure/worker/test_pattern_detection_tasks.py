@@ -0,0 +1,58 @@
+"""
+Unit tests for the league pattern tasks.
+"""
+import fcntl
+import os
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.infrastructure.worker.tasks.pattern_detection_tasks import update_league_patterns_task
+
+TASKS = 'src.infrastructure.worker.tasks.pattern_detection_tasks'
+
+
+@pytest.fixture
+def league_model():
+    """New league model (version 3 after training) and its trainer."""
+    with patch(f'{TASKS}.PostgresMatchRepo'), patch(f'{TASKS}.PostgresPatternUsageRepo'), \
+            patch(f'{TASKS}.SklearnLeaguePatternModel') as mock_model_cls, \
+            patch(f'{TASKS}.LeaguePatternTrainer') as mock_trainer_cls:
+        model = mock_model_cls.return_value
+        model.version = 3
+        model.save_model.side_effect = lambda path: open(path, "wb").write(b"model")
+        mock_trainer_cls.return_value.execute.return_value = Mock(
+            model_version=3, matches_used=1, matches_added=1, sequences_used=10
+        )
+        yield model, mock_trainer_cls.return_value
+
+
+class TestUpdateLeaguePatternsTask:
+    """Serialised updates and versioned model copies."""
+
+    def test_update_holds_the_model_lock_while_training(self, league_model, tmp_path):
+        _, trainer = league_model
+        model_path = str(tmp_path / "league_patterns.joblib")
+
+        def execute(match_ids, update_model):
+            with open(f"{model_path}.lock", "a") as other:
+                with pytest.raises(BlockingIOError):
+                    fcntl.flock(other, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return trainer.execute.return_value
+
+        trainer.execute.side_effect = execute
+        result = update_league_patterns_task(["m1"], model_path=model_path)
+
+        assert result["status"] == "success"
+        assert os.path.exists(tmp_path / "league_patterns.v3.joblib")
+        assert os.path.exists(model_path)
+
+    def test_existing_versioned_model_is_not_overwritten(self, league_model, tmp_path):
+        model_path = str(tmp_path / "league_patterns.joblib")
+        (tmp_path / "league_patterns.v3.joblib").write_bytes(b"published")
+
+        with pytest.raises(FileExistsError):
+            update_league_patterns_task(["m1"], model_path=model_path)
+
+        assert (tmp_path / "league_patterns.v3.joblib").read_bytes() == b"published"
+        assert not os.path.exists(model_path)
@@ -57,3 +57,41 @@ class TestPhaseClassificationTasks:
         # Assert
         assert result["status"] == "error"
         assert "Unexpected failure" in result["message"]
+
+
+class TestSeasonTrainingTasks:
+    """Fan-out extraction and the fit/publish step."""
+
+    @patch('src.infrastructure.worker.tasks.phase_classification_tasks.chord')
+    def test_season_task_fans_out_one_extraction_per_match(self, mock_chord):
+        from src.infrastructure.worker.tasks.phase_classification_tasks import train_phase_classifier_season_task
+
+        result = train_phase_classifier_season_task(["m1", "m2", "m3"], "/tmp/model.joblib")
+
+        header, callback = mock_chord.call_args.args
+        assert len(header.tasks) == 3
+        assert [sig.args for sig in header.tasks][0] == ("m1", 5)
+        assert callback.args == ("/tmp/model.joblib", "sgd", 3)
+        assert result["status"] == "scheduled"
+
+    @patch('src.infrastructure.worker.tasks.phase_classification_tasks.PhaseModelTrainer')
+    @patch('src.infrastructure.worker.tasks.phase_classification_tasks.MinIOAdapter')
+    def test_fit_trains_on_extracted_matches_and_publishes(self, mock_minio, mock_trainer_cls, tmp_path):
+        from src.infrastructure.worker.tasks.phase_classification_tasks import fit_phase_classifier_task
+
+        model_path = str(tmp_path / "model.joblib")
+        mock_trainer_cls.return_value.execute.return_value = Mock(matches_used=1, metrics={"accuracy": 0.9})
+        with patch('src.infrastructure.worker.tasks.phase_classification_tasks.SklearnPhaseClassifier') as mock_sklearn:
+            mock_sklearn.return_value.save_model.side_effect = lambda path: open(path, "wb").write(b"model")
+            result = fit_phase_classifier_task(
+                [
+                    {"status": "success", "match_id": "m1", "n_rows": 10},
+                    {"status": "skipped", "match_id": "m2"},
+                ],
+                model_path
+            )
+
+        assert result["status"] == "success"
+        mock_trainer_cls.return_value.execute.assert_called_once_with(["m1"], epochs=3)
+        keys = [c.args[0] for c in mock_minio.return_value.put_object.call_args_list]
+        assert keys == [f"phase_classifier/{result['version']}.joblib", "phase_classifier/latest.json"]
@@ -248,6 +248,114 @@ class TestHeuristicEventDetector:
         events = detector.detect_events([])
         
         assert events == []
+    
+    def test_loss_of_possession_and_pressure(self):
+        """Opponent taking the ball is a loss; opponents near the carrier press."""
+        detector = HeuristicEventDetector(DetectorConfig(pressure_distance=2.0))
+        
+        points = []
+        for i in range(6):
+            ball_x = 50.0 if i < 3 else 53.0
+            points.extend([
+                TrajectoryPoint(frame_id=i, object_id=99, x=ball_x, y=30.0,
+                                timestamp=i*0.04, object_type="ball"),
+                TrajectoryPoint(frame_id=i, object_id=1, x=50.5, y=30.0,
+                                timestamp=i*0.04, object_type="home"),
+                TrajectoryPoint(frame_id=i, object_id=7, x=52.0 + 0.5 * (i >= 3), y=30.0,
+                                timestamp=i*0.04, object_type="away"),
+            ])
+        
+        events = detector.detect_events(points)
+        
+        # Frames 0-2: away player 7 presses home carrier 1; frame 3: 7 wins
+        # the ball, then home player 1 presses 7 from frame 3 on
+        assert [(e.event_type, e.frame_start) for e in events] == (
+            [(InferredEventType.PRESSURE, i) for i in range(3)]
+            + [(InferredEventType.LOSS_OF_POSSESSION, 0)]
+            + [(InferredEventType.PRESSURE, i) for i in range(3, 6)]
+        )
+        loss = events[3]
+        assert loss.actors == [1, 7]
+        assert loss.frame_end == 3
+        assert loss.team_id == "home"
+        assert events[0].actors == [7, 1] and events[0].team_id == "away"
+        assert events[4].actors == [1, 7] and events[4].team_id == "home"
+    
+    def test_stream_events_matches_whole_match(self):
+        """Streaming over blocks (frames split across them) yields the same events."""
+        import numpy as np
+        from src.domain.value_objects.tracking_table import TrackingTable
+        
+        rng = np.random.default_rng(5)
+        rows = [
+            {"frame_id": f, "player_id": pid, "x": float(rng.uniform(40, 46)),
+             "y": float(rng.uniform(30, 36)),
+             "object_type": "ball" if pid == 99 else ("home", "away")[pid % 2]}
+            for f in range(200)
+            for pid in (99, 1, 2, 3, 4)
+        ]
+        tracking = TrackingTable.from_records(rows)
+        detector = HeuristicEventDetector()
+        
+        expected = detector.detect_tracking_events(tracking)
+        blocks = (tracking.take(np.arange(start, min(start + 37, len(tracking))))
+                  for start in range(0, len(tracking), 37))
+        streamed = list(detector.stream_events(blocks))
+        
+        assert len(expected) > 0
+        assert streamed == expected
+    
+    def test_detect_events_with_names_loads_lineup_once(self, monkeypatch):
+        """Names come from one lineup lookup, with a fallback for unmapped tracks."""
+        from src.domain.ports.lineup_repository import PlayerMappingDTO
+        from src.infrastructure.api.endpoints import lineup
+        
+        lookups = []
+        monkeypatch.setattr(lineup, "get_lineup", lambda match_id: lookups.append(match_id) or {
+            1: PlayerMappingDTO(track_id=1, player_name="Messi", team="home"),
+        })
+        points = []
+        for i in range(6):
+            points.extend([
+                TrajectoryPoint(frame_id=i, object_id=99, x=50.0, y=30.0,
+                                timestamp=i*0.04, object_type="ball"),
+                TrajectoryPoint(frame_id=i, object_id=1, x=50.5, y=30.0,
+                                timestamp=i*0.04, object_type="home"),
+                TrajectoryPoint(frame_id=i, object_id=7, x=51.5, y=30.0,
+                                timestamp=i*0.04, object_type="away"),
+            ])
+        
+        events = HeuristicEventDetector().detect_events_with_names(points, "m1")
+        
+        assert len(events) == 6
+        assert all(e.actor_names == ["Player 7", "Messi"] for e in events)
+        assert lookups == ["m1"]
+    
+    def test_tracking_table_matches_points(self):
+        """The columnar path detects the same events as TrajectoryPoints."""
+        import numpy as np
+        from src.domain.value_objects.tracking_table import TrackingTable
+        
+        rng = np.random.default_rng(3)
+        rows = [
+            {"frame_id": f, "player_id": pid, "x": float(rng.uniform(40, 46)),
+             "y": float(rng.uniform(30, 36)), "timestamp": f * 0.04,
+             "object_type": "ball" if pid == 99 else ("home", "away")[pid % 2]}
+            for f in rng.permutation(150)
+            for pid in (99, 1, 2, 3, 4)
+        ]
+        points = [
+            TrajectoryPoint(frame_id=r["frame_id"], object_id=r["player_id"], x=r["x"],
+                            y=r["y"], timestamp=r["timestamp"], object_type=r["object_type"])
+            for r in rows
+        ]
+        detector = HeuristicEventDetector()
+        
+        from_points = detector.detect_events(points)
+        from_table = detector.detect_tracking_events(TrackingTable.from_records(rows))
+        
+        assert len(from_points) > 0
+        assert from_points == from_table
 
 
 # ==========================================